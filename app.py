@@ -46,6 +46,37 @@ st.markdown(
 # 세션 상태 초기화
 init_session_state()
 
+
+@st.cache_resource(show_spinner=False)
+def warm_sample_results():
+    """시작 시 샘플 시나리오 결과 번들을 준비 (프로세스당 한 번)"""
+    from data.sample_results import ensure_sample_results_bundle
+
+    try:
+        return ensure_sample_results_bundle()
+    except Exception:
+        # 번들 생성 실패 시 각 페이지가 직접 계산
+        return None
+
+
+warm_sample_results()
+
+
+@st.cache_resource(show_spinner=False)
+def start_metrics_exporters():
+    """METRICS_EXPORT_PATH / METRICS_PORT 설정 시 계산 지표 내보내기 시작 (프로세스당 한 번)"""
+    from modules.metrics import start_metrics_exporters_from_env
+
+    try:
+        return start_metrics_exporters_from_env()
+    except (OSError, ValueError) as e:
+        # 포트 충돌 등으로 시작하지 못해도 앱은 계속 동작
+        print(f"지표 내보내기 시작 실패: {e}")
+        return None
+
+
+start_metrics_exporters()
+
 # 홈페이지 접속 시 소득 지출 분석 페이지로 리다이렉트
 st.switch_page("pages/1_소득_지출_분석.py")
 
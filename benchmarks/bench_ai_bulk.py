@@ -0,0 +1,80 @@
+"""
+AI 인사이트 일괄 생성 벤치마크
+
+로컬 스텁 서버(tests/openai_stub.py)를 API 대신 사용하여
+동시 요청 수별 처리량을 측정합니다. 실제 API를 호출하지 않습니다.
+
+실행:
+    python benchmarks/bench_ai_bulk.py --profiles 200 --latency 0.05 --concurrency 1 4 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules import ai_cache, ai_client
+from modules.ai_bulk import format_bulk_stats, run_bulk_insights
+from tests.openai_stub import OpenAIStubServer
+
+
+def make_profiles(count: int, duplicate_ratio: float):
+    """벤치마크용 프로필 생성 (duplicate_ratio 비율만큼 앞 프로필과 같은 입력)"""
+    unique_count = max(1, int(count * (1 - duplicate_ratio)))
+    profiles = []
+    for index in range(count):
+        seed = index % unique_count
+        inputs = {
+            "current_age": 30 + seed % 25,
+            "retirement_age": 60,
+            "salary": 4000 + seed * 10,
+            "monthly_fixed_expense": 120,
+            "monthly_variable_expense": 80,
+            "total_assets": 1000 + seed * 100,
+            "total_debt": 0,
+        }
+        results = {"monthly_savings": 200 + seed}
+        profiles.append((inputs, results))
+    return profiles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AI 인사이트 일괄 생성 벤치마크")
+    parser.add_argument("--profiles", type=int, default=200, help="프로필 수")
+    parser.add_argument("--duplicates", type=float, default=0.2, help="중복 프로필 비율")
+    parser.add_argument("--latency", type=float, default=0.05, help="스텁 응답 지연 (초)")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16], help="동시 요청 수"
+    )
+    args = parser.parse_args()
+
+    profiles = make_profiles(args.profiles, args.duplicates)
+
+    with OpenAIStubServer(chunks=["벤치마크 ", "응답"], response_delay=args.latency) as stub:
+        env = {"OPENAI_API_KEY": "bench-key", "OPENAI_BASE_URL": stub.base_url}
+        with mock.patch.dict(os.environ, env):
+            for concurrency in args.concurrency:
+                # 실행마다 빈 응답 캐시와 동시 호출 제한을 맞춘 클라이언트 관리자 사용
+                with tempfile.TemporaryDirectory() as cache_dir, mock.patch.object(
+                    ai_cache, "_default_cache", ai_cache.AIResponseCache(cache_dir)
+                ), mock.patch.object(
+                    ai_client,
+                    "_default_manager",
+                    ai_client.AIClientManager(
+                        max_concurrency=concurrency,
+                        rate_limit_per_minute=10**6,
+                        rate_limit_burst=10**6,
+                    ),
+                ):
+                    report = run_bulk_insights(profiles, concurrency=concurrency)
+                print(f"concurrency={concurrency:>3} | {format_bulk_stats(report['stats'])}")
+
+
+if __name__ == "__main__":
+    main()
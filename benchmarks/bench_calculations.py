@@ -0,0 +1,492 @@
+"""
+계산 엔진 벤치마크
+
+주요 계산 함수를 입력 크기(예측 기간, 대출/자산 항목 수, 상환 방식,
+시나리오 수)별로 반복 호출하여 호출당 지연 시간과 처리량을 측정합니다.
+결과를 JSON 기준값으로 저장하고, 이후 실행에서 기준값과 비교하여
+느려진 경우(회귀)를 보고합니다.
+
+실행:
+    python benchmarks/bench_calculations.py
+    python benchmarks/bench_calculations.py --quick --save benchmarks/baselines/calculations.json
+    python benchmarks/bench_calculations.py --compare benchmarks/baselines/calculations.json --threshold 0.2
+    python benchmarks/bench_calculations.py --filter future_assets
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.calculations import (
+    calculate_future_assets,
+    calculate_retirement_goal,
+    calculate_risk_score,
+    compare_portfolio_allocations,
+    compare_scenarios,
+    find_required_return_rate,
+)
+from modules.hashing import get_engine_version
+from modules.visualizations import clear_figure_cache, create_retirement_goal_chart
+
+# 기본 기준값 파일
+DEFAULT_BASELINE_PATH = PROJECT_ROOT / "benchmarks" / "baselines" / "calculations.json"
+
+# 회귀로 판단하는 중앙값 지연 시간 증가 비율 (0.2 = 20% 느려짐)
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+# 대출 상환 방식 (전세자금 대출은 is_jeonse로 구분)
+REPAYMENT_TYPES = ("만기 원금 상환", "균등 상환", "분할 상환", "전세자금 대출")
+
+# 비교 시나리오 목록 (시나리오 수만큼 앞에서부터 사용, 부족하면 비율을 바꿔 생성)
+SCENARIO_TEMPLATES = ("지출 {}% 감소", "연봉 {}% 증가", "지출 {}% 증가", "연봉 {}% 감소")
+
+# 함수별 파라미터 그리드 (quick은 빠른 확인용 축소 그리드)
+GRIDS = {
+    "full": {
+        "future_assets": {
+            "horizon": (10, 30, 50),
+            "debt_items": (0, 5, 20),
+            "asset_items": (1, 10, 50),
+            "repayment_type": REPAYMENT_TYPES,
+        },
+        "retirement_goal": {"horizon": (10, 30, 50)},
+        "required_return_rate": {"horizon": (10, 30, 50)},
+        "retirement_goal_chart": {"horizon": (10, 30, 50)},
+        "compare_scenarios": {
+            "horizon": (10, 30),
+            "scenarios": (1, 5, 20),
+            "debt_items": (0, 5),
+        },
+        "risk_score": {"debt_items": (0, 5, 20, 100), "asset_items": (1, 50)},
+        "life_events": {"horizon": (30, 50), "events": (10, 100, 1000)},
+        "portfolio_allocations": {"horizon": (30, 50), "allocations": (1, 11, 101)},
+    },
+    "quick": {
+        "future_assets": {
+            "horizon": (10, 30),
+            "debt_items": (0, 5),
+            "asset_items": (1, 10),
+            "repayment_type": ("만기 원금 상환", "균등 상환"),
+        },
+        "retirement_goal": {"horizon": (10, 30)},
+        "required_return_rate": {"horizon": (30,)},
+        "retirement_goal_chart": {"horizon": (30,)},
+        "compare_scenarios": {"horizon": (10,), "scenarios": (1, 5), "debt_items": (0,)},
+        "risk_score": {"debt_items": (0, 20), "asset_items": (1,)},
+        "life_events": {"horizon": (30,), "events": (10, 100)},
+        "portfolio_allocations": {"horizon": (30,), "allocations": (11,)},
+    },
+}
+
+
+def make_inputs(
+    horizon: int = 30,
+    debt_items: int = 0,
+    asset_items: int = 1,
+    repayment_type: str = "만기 원금 상환",
+    life_events: int = 0,
+) -> Dict[str, Any]:
+    """
+    벤치마크용 입력 데이터 생성 (금액은 원 단위)
+
+    Args:
+        horizon: 은퇴까지 남은 기간 (년)
+        debt_items: 대출 항목 수
+        asset_items: 자산 항목 수
+        repayment_type: 대출 상환 방식 (REPAYMENT_TYPES 중 하나)
+        life_events: 생애 이벤트 수 (기간/일회성 이벤트를 번갈아 생성)
+
+    Returns:
+        Dict[str, Any]: 입력 데이터 딕셔너리
+    """
+    current_age = 30
+    is_jeonse = repayment_type == "전세자금 대출"
+    debts = [
+        {
+            "id": f"debt-{index}",
+            "name": f"대출 {index + 1}",
+            "principal": 10000000 + index * 1000000,
+            "interest_rate": 3.5 + (index % 5) * 0.5,
+            "repayment_type": "만기 원금 상환" if is_jeonse else repayment_type,
+            "monthly_payment": 300000,
+            "remaining_months": 60 + (index % 10) * 24,
+            "is_jeonse": is_jeonse,
+        }
+        for index in range(debt_items)
+    ]
+    assets = [
+        {
+            "id": f"asset-{index}",
+            "type": ("예금", "주식", "채권", "펀드")[index % 4],
+            "amount": 5000000 + index * 500000,
+            "return_rate": 2.0 + (index % 4) * 1.5,
+        }
+        for index in range(asset_items)
+    ]
+    events = [
+        {
+            "id": f"event-{index}",
+            "name": f"이벤트 {index + 1}",
+            "start_age": current_age + 1 + index % (horizon + 20),
+            "end_age": current_age + 5 + index % (horizon + 20) if index % 2 else None,
+            "expense_change": 10000 * (index % 7 - 3),
+            "income_change_rate": -5.0 if index % 5 == 0 else 0.0,
+            "asset_change": 1000000 if index % 3 == 0 else 0,
+            "debt_change": 2000000 if index % 11 == 0 else 0,
+        }
+        for index in range(life_events)
+    ]
+    inputs = {
+        "current_age": current_age,
+        "retirement_age": current_age + horizon,
+        "salary": 50000000,
+        "salary_growth_rate": 3.0,
+        "bonus": 0,
+        "monthly_fixed_expense": 1200000,
+        "monthly_variable_expense": 800000,
+        "total_assets": sum(item["amount"] for item in assets),
+        "total_debt": sum(item["principal"] for item in debts),
+        "inflation_rate": 2.5,
+        "retirement_monthly_expense": 3000000,
+        "retirement_medical_expense": 300000,
+        "asset_items": assets,
+        "debt_items": debts,
+    }
+    if events:
+        inputs["life_events"] = events
+    return inputs
+
+
+def make_scenarios(count: int) -> List[str]:
+    """비교 시나리오 문자열 count개 생성"""
+    return [
+        SCENARIO_TEMPLATES[index % len(SCENARIO_TEMPLATES)].format(
+            5 + 5 * (index // len(SCENARIO_TEMPLATES))
+        )
+        for index in range(count)
+    ]
+
+
+def make_allocations(count: int) -> List[Dict[str, float]]:
+    """주식 비중을 0~100%로 나눈 목표 배분 count개 생성"""
+    if count == 1:
+        return [{"예금": 40, "주식": 60}]
+    return [{"예금": 100 - stock, "주식": stock} for stock in np.linspace(0, 100, count)]
+
+
+def _uncached_retirement_goal_chart(inputs: Dict[str, Any]) -> Any:
+    # 차트 캐시 적중을 피하기 위해 매번 비우고 생성 (실제 생성 비용 측정)
+    clear_figure_cache()
+    return create_retirement_goal_chart(inputs, 1000000, 5.0)
+
+
+# 벤치마크 대상: 이름 → (그리드 파라미터로 (함수, 인자)를 만드는 함수)
+BENCHMARKS: Dict[str, Callable[..., Tuple[Callable, tuple]]] = {
+    "future_assets": lambda horizon, debt_items, asset_items, repayment_type: (
+        calculate_future_assets,
+        (make_inputs(horizon, debt_items, asset_items, repayment_type), horizon),
+    ),
+    "retirement_goal": lambda horizon: (
+        calculate_retirement_goal,
+        (make_inputs(horizon), 1000000, 5.0),
+    ),
+    "required_return_rate": lambda horizon: (
+        find_required_return_rate,
+        (make_inputs(horizon), 1000000),
+    ),
+    "retirement_goal_chart": lambda horizon: (
+        _uncached_retirement_goal_chart,
+        (make_inputs(horizon),),
+    ),
+    "compare_scenarios": lambda horizon, scenarios, debt_items: (
+        compare_scenarios,
+        (make_inputs(horizon, debt_items), make_scenarios(scenarios), horizon),
+    ),
+    "risk_score": lambda debt_items, asset_items: (
+        calculate_risk_score,
+        (make_inputs(30, debt_items, asset_items),),
+    ),
+    "life_events": lambda horizon, events: (
+        calculate_future_assets,
+        (make_inputs(horizon, life_events=events), horizon),
+    ),
+    "portfolio_allocations": lambda horizon, allocations: (
+        compare_portfolio_allocations,
+        (
+            dict(make_inputs(horizon, asset_items=10), portfolio_model={
+                "retirement_allocation": {"예금": 70, "주식": 30},
+            }),
+            make_allocations(allocations),
+            horizon,
+        ),
+    ),
+}
+
+
+def iter_cases(grid: Dict[str, Dict[str, Sequence[Any]]], name_filter: str = ""):
+    """
+    그리드의 모든 파라미터 조합 반환
+
+    Yields:
+        Tuple[str, str, Dict[str, Any]]: (케이스 ID, 벤치마크 이름, 파라미터)
+    """
+    for name, axes in grid.items():
+        keys = list(axes)
+        for values in _product([axes[key] for key in keys]):
+            params = dict(zip(keys, values))
+            case_id = name + "[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]"
+            if name_filter and name_filter not in case_id:
+                continue
+            yield case_id, name, params
+
+
+def _product(axes: List[Sequence[Any]]):
+    if not axes:
+        yield ()
+        return
+    for value in axes[0]:
+        for rest in _product(axes[1:]):
+            yield (value,) + rest
+
+
+def time_call(
+    func: Callable,
+    args: tuple,
+    min_time: float = 0.2,
+    max_calls: int = 2000,
+    warmup: int = 1,
+) -> Dict[str, Any]:
+    """
+    함수를 반복 호출하여 호출당 지연 시간 측정
+
+    Args:
+        func: 측정할 함수
+        args: 함수 인자
+        min_time: 최소 측정 시간 (초)
+        max_calls: 최대 호출 수
+        warmup: 측정 전 호출 수
+
+    Returns:
+        Dict[str, Any]: calls, mean_ms, median_ms, p95_ms, min_ms, throughput_per_s
+    """
+    for _ in range(warmup):
+        func(*args)
+
+    durations = []
+    started = time.perf_counter()
+    while len(durations) < max_calls:
+        call_started = time.perf_counter()
+        func(*args)
+        durations.append(time.perf_counter() - call_started)
+        if time.perf_counter() - started >= min_time and len(durations) >= 3:
+            break
+    elapsed = time.perf_counter() - started
+
+    durations_ms = np.array(durations) * 1000
+    return {
+        "calls": len(durations),
+        "mean_ms": float(durations_ms.mean()),
+        "median_ms": float(np.median(durations_ms)),
+        "p95_ms": float(np.percentile(durations_ms, 95)),
+        "min_ms": float(durations_ms.min()),
+        "throughput_per_s": len(durations) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def run_benchmarks(
+    grid_name: str = "full",
+    name_filter: str = "",
+    min_time: float = 0.2,
+    max_calls: int = 2000,
+) -> Dict[str, Any]:
+    """
+    그리드의 모든 케이스 측정
+
+    Args:
+        grid_name: "full" 또는 "quick"
+        name_filter: 케이스 ID에 포함되어야 하는 문자열 (빈 문자열이면 전체)
+        min_time: 케이스당 최소 측정 시간 (초)
+        max_calls: 케이스당 최대 호출 수
+
+    Returns:
+        Dict[str, Any]: meta (실행 환경), cases (케이스 ID → 파라미터 및 측정값)
+    """
+    cases = {}
+    for case_id, name, params in iter_cases(GRIDS[grid_name], name_filter):
+        func, args = BENCHMARKS[name](**params)
+        cases[case_id] = {
+            "benchmark": name,
+            "params": params,
+            **time_call(func, args, min_time=min_time, max_calls=max_calls),
+        }
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "grid": grid_name,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "engine_version": get_engine_version(),
+        },
+        "cases": cases,
+    }
+
+
+def save_baseline(report: Dict[str, Any], path: Path) -> None:
+    """측정 결과를 JSON 기준값으로 저장"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(report, baseline_file, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """JSON 기준값 불러오기"""
+    with open(path, "r", encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """
+    측정 결과를 기준값과 비교 (중앙값 지연 시간 기준)
+
+    Args:
+        report: run_benchmarks 결과
+        baseline: 기준값 (같은 형식)
+        threshold: 회귀/개선으로 판단하는 변화 비율
+
+    Returns:
+        List[Dict[str, Any]]: 케이스별 case, baseline_ms, current_ms, ratio, status
+            (status: "regression", "improvement", "ok", "new", "missing")
+    """
+    current_cases = report["cases"]
+    baseline_cases = baseline.get("cases", {})
+    rows = []
+    for case_id in sorted(set(current_cases) | set(baseline_cases)):
+        current = current_cases.get(case_id)
+        previous = baseline_cases.get(case_id)
+        if previous is None:
+            rows.append(_comparison_row(case_id, None, current["median_ms"], "new"))
+            continue
+        if current is None:
+            rows.append(_comparison_row(case_id, previous["median_ms"], None, "missing"))
+            continue
+
+        ratio = (
+            current["median_ms"] / previous["median_ms"]
+            if previous["median_ms"] > 0
+            else float("inf")
+        )
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            _comparison_row(case_id, previous["median_ms"], current["median_ms"], status, ratio)
+        )
+    return rows
+
+
+def _comparison_row(
+    case_id: str,
+    baseline_ms: Optional[float],
+    current_ms: Optional[float],
+    status: str,
+    ratio: Optional[float] = None,
+) -> Dict[str, Any]:
+    return {
+        "case": case_id,
+        "baseline_ms": baseline_ms,
+        "current_ms": current_ms,
+        "ratio": ratio,
+        "status": status,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """측정 결과 표 출력"""
+    print(f"{'케이스':<80} {'호출':>6} {'중앙값(ms)':>11} {'p95(ms)':>9} {'처리량(/s)':>11}")
+    for case_id, case in report["cases"].items():
+        print(
+            f"{case_id:<80} {case['calls']:>6} {case['median_ms']:>11.3f} "
+            f"{case['p95_ms']:>9.3f} {case['throughput_per_s']:>11.1f}"
+        )
+
+    # 벤치마크별 요약 (중앙값의 중앙값)
+    by_benchmark: Dict[str, List[float]] = {}
+    for case in report["cases"].values():
+        by_benchmark.setdefault(case["benchmark"], []).append(case["median_ms"])
+    print()
+    for name, medians in by_benchmark.items():
+        print(f"{name:<24} 케이스 {len(medians):>3}개, 중앙값 {statistics.median(medians):.3f}ms")
+
+
+def print_comparison(rows: List[Dict[str, Any]]) -> None:
+    """기준값 비교 결과 출력 (변화가 있는 케이스만)"""
+    changed = [row for row in rows if row["status"] != "ok"]
+    if not changed:
+        print("기준값 대비 변화 없음")
+        return
+    for row in changed:
+        baseline_ms = f"{row['baseline_ms']:.3f}" if row["baseline_ms"] is not None else "-"
+        current_ms = f"{row['current_ms']:.3f}" if row["current_ms"] is not None else "-"
+        ratio = f"x{row['ratio']:.2f}" if row["ratio"] is not None else ""
+        print(f"[{row['status']:>11}] {row['case']:<80} {baseline_ms:>9} → {current_ms:>9} {ratio}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="계산 엔진 벤치마크")
+    parser.add_argument("--quick", action="store_true", help="축소 그리드로 실행")
+    parser.add_argument("--filter", default="", help="케이스 ID 필터 (부분 문자열)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="케이스당 최소 측정 시간 (초)")
+    parser.add_argument("--max-calls", type=int, default=2000, help="케이스당 최대 호출 수")
+    parser.add_argument("--save", nargs="?", const=str(DEFAULT_BASELINE_PATH), help="기준값 저장 경로")
+    parser.add_argument("--compare", nargs="?", const=str(DEFAULT_BASELINE_PATH), help="비교할 기준값 경로")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="회귀 판단 비율"
+    )
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        "quick" if args.quick else "full",
+        name_filter=args.filter,
+        min_time=args.min_time,
+        max_calls=args.max_calls,
+    )
+    print_report(report)
+
+    exit_code = 0
+    if args.compare:
+        rows = compare_to_baseline(report, load_baseline(Path(args.compare)), args.threshold)
+        print()
+        print_comparison(rows)
+        if any(row["status"] == "regression" for row in rows):
+            exit_code = 1
+
+    if args.save:
+        save_baseline(report, Path(args.save))
+        print(f"\n기준값 저장: {args.save}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
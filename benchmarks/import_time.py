@@ -0,0 +1,213 @@
+"""
+모듈 import 시간 벤치마크
+
+모듈마다 새 파이썬 프로세스에서 `python -X importtime -c "import 모듈"`을 실행하고
+stderr 출력을 분석하여 누적 import 시간과 가장 무거운 하위 import를 기록합니다.
+예산(밀리초)을 넘거나 지연 import 대상 패키지(plotly, pandas, openai, dotenv,
+pyarrow)를 import 시점에 불러오면 종료 코드 1로 실패합니다.
+
+실행:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 5 --json import_time.json
+    python benchmarks/import_time.py --modules modules.visualizations --top 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 모듈별 누적 import 시간 예산 (밀리초, numpy 등 필수 의존성 포함)
+IMPORT_BUDGETS_MS = {
+    "modules.formatters": 10,
+    "modules.utils": 20,
+    "modules.metrics": 20,
+    "modules.hashing": 20,
+    "modules.download": 40,
+    "modules.ai_insights": 80,
+    "modules.calculations": 120,
+    "modules.validators": 130,
+    "modules.advanced_insights": 130,
+    "modules.ai_bulk": 150,
+    "modules.visualizations": 150,
+    "data.sample_results": 40,
+}
+
+# 처음 사용할 때만 불러와야 하는 패키지
+LAZY_PACKAGES = frozenset({"plotly", "pandas", "openai", "dotenv", "pyarrow"})
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    -X importtime 출력 분석
+
+    출력 형식: "import time: self [us] | cumulative | imported package"
+    (하위 import는 이름 앞 공백 2칸마다 깊이 1)
+
+    Args:
+        stderr: 파이썬 프로세스의 stderr 출력
+
+    Returns:
+        List[Dict[str, Any]]: name, depth, self_us, cumulative_us 목록 (출력 순서)
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        try:
+            self_value = int(self_us)
+            cumulative_value = int(cumulative_us)
+        except ValueError:
+            # 머리글 줄 ("self [us] | cumulative | imported package")
+            continue
+        stripped = name.lstrip(" ")
+        records.append(
+            {
+                "name": stripped.rstrip(),
+                "depth": (len(name) - len(stripped) - 1) // 2,
+                "self_us": self_value,
+                "cumulative_us": cumulative_value,
+            }
+        )
+    return records
+
+
+def measure_import(module: str, top: int = 5) -> Dict[str, Any]:
+    """
+    새 프로세스에서 모듈 하나의 import 비용 측정
+
+    Args:
+        module: 모듈 이름
+        top: 기록할 가장 무거운 하위 import 수
+
+    Returns:
+        Dict[str, Any]: cumulative_ms, heaviest (이름, 누적 ms), lazy_packages_loaded
+
+    Raises:
+        RuntimeError: import에 실패한 경우
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{completed.stderr[-2000:]}")
+
+    records = parse_importtime(completed.stderr)
+    target_index = next(
+        (
+            index
+            for index in range(len(records) - 1, -1, -1)
+            if records[index]["name"] == module
+        ),
+        None,
+    )
+    if target_index is None:
+        raise RuntimeError(f"{module}의 import 시간을 찾을 수 없습니다.")
+    target = records[target_index]
+
+    # 하위 import는 부모보다 먼저 출력되므로, 대상 바로 앞의 더 깊은 줄들이 하위 트리
+    start = target_index
+    while start > 0 and records[start - 1]["depth"] > target["depth"]:
+        start -= 1
+    subtree = records[start:target_index + 1]
+
+    children = [
+        record for record in subtree if record["depth"] == target["depth"] + 1
+    ]
+    heaviest = sorted(children, key=lambda record: -record["cumulative_us"])[:top]
+    loaded = sorted(
+        {record["name"].split(".")[0] for record in subtree} & LAZY_PACKAGES
+    )
+    return {
+        "cumulative_ms": target["cumulative_us"] / 1000,
+        "heaviest": [
+            (record["name"], record["cumulative_us"] / 1000) for record in heaviest
+        ],
+        "lazy_packages_loaded": loaded,
+    }
+
+
+def run_benchmark(
+    modules: Sequence[str],
+    runs: int = 3,
+    top: int = 5,
+    budgets: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    모듈별 import 시간 측정 후 예산과 비교
+
+    Args:
+        modules: 측정할 모듈 이름 목록
+        runs: 모듈당 측정 횟수 (중앙값 사용)
+        top: 기록할 가장 무거운 하위 import 수
+        budgets: 모듈별 예산 (밀리초, 기본값 IMPORT_BUDGETS_MS)
+
+    Returns:
+        List[Dict[str, Any]]: 모듈별 결과 (module, median_ms, budget_ms,
+            within_budget, heaviest, lazy_packages_loaded, passed)
+    """
+    budgets = IMPORT_BUDGETS_MS if budgets is None else budgets
+    report = []
+    for module in modules:
+        measurements = [measure_import(module, top) for _ in range(max(1, runs))]
+        median_ms = statistics.median(m["cumulative_ms"] for m in measurements)
+        budget_ms = budgets.get(module)
+        within_budget = budget_ms is None or median_ms <= budget_ms
+        lazy_loaded = measurements[-1]["lazy_packages_loaded"]
+        report.append(
+            {
+                "module": module,
+                "median_ms": median_ms,
+                "budget_ms": budget_ms,
+                "within_budget": within_budget,
+                "heaviest": measurements[-1]["heaviest"],
+                "lazy_packages_loaded": lazy_loaded,
+                "passed": within_budget and not lazy_loaded,
+            }
+        )
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="모듈 import 시간 벤치마크")
+    parser.add_argument(
+        "--modules", nargs="+", default=list(IMPORT_BUDGETS_MS), help="측정할 모듈"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="모듈당 측정 횟수")
+    parser.add_argument("--top", type=int, default=5, help="표시할 무거운 하위 import 수")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.modules, runs=args.runs, top=args.top)
+    for item in report:
+        budget = f"{item['budget_ms']:.0f}ms" if item["budget_ms"] is not None else "-"
+        status = "OK" if item["passed"] else "FAIL"
+        print(f"[{status:>4}] {item['module']:<28} {item['median_ms']:8.1f}ms (예산 {budget})")
+        for name, cumulative_ms in item["heaviest"]:
+            print(f"         └ {name:<30} {cumulative_ms:8.1f}ms")
+        if item["lazy_packages_loaded"]:
+            print(f"         ! import 시점에 불러온 패키지: {', '.join(item['lazy_packages_loaded'])}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(report, json_file, ensure_ascii=False, indent=2)
+
+    return 0 if all(item["passed"] for item in report) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
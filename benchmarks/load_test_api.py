@@ -0,0 +1,152 @@
+"""
+계산 API 서버 부하 테스트
+
+로컬에서 modules.api_server를 띄우거나 (--url 생략 시) 실행 중인 서버에
+동시 연결 수별로 요청을 보내 초당 처리량과 지연 시간을 측정합니다.
+각 연결은 keep-alive로 재사용하며, --unique 비율만큼 서로 다른 입력을 보내
+응답 캐시 적중률을 조절합니다.
+
+실행:
+    python benchmarks/load_test_api.py --requests 2000 --concurrency 1 8 32
+    python benchmarks/load_test_api.py --endpoint risk_score --batch 50 --unique 1.0
+    python benchmarks/load_test_api.py --url http://127.0.0.1:8600 --processes
+"""
+
+import argparse
+import gzip
+import http.client
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# 프로젝트 루트를 Python 경로에 추가
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data.sample_data import get_sample_data, get_sample_scenarios
+from modules.api_server import APIService, start_api_server
+
+EXTRA_PARAMS = {
+    "future_assets": {"years": 30},
+    "scenarios": {"scenarios": ["지출 10% 감소", "연봉 5% 증가"], "years": 20},
+    "retirement_goal": {"monthly_contribution": 1000000, "annual_return_rate": 5.0},
+    "required_contribution": {"target_return_rate": 5.0},
+    "required_return_rate": {"monthly_contribution": 1000000},
+}
+
+
+def make_payloads(endpoint: str, count: int, unique_ratio: float):
+    """벤치마크용 요청 본문 생성 (unique_ratio 비율만큼 서로 다른 입력)"""
+    samples = [get_sample_data(name) for name in get_sample_scenarios()]
+    unique_count = max(1, int(count * unique_ratio))
+    payloads = []
+    for index in range(count):
+        seed = index % unique_count
+        inputs = dict(samples[seed % len(samples)])
+        inputs["salary"] = inputs.get("salary", 0) + seed * 10000
+        payloads.append({"inputs": inputs, **EXTRA_PARAMS.get(endpoint, {})})
+    return payloads
+
+
+def run_load(url: str, path: str, bodies, concurrency: int, use_gzip: bool):
+    """동시 연결 concurrency개로 bodies를 모두 보내고 (소요 시간, 지연 목록, 오류 수) 반환"""
+    parts = urlsplit(url)
+    headers = {"Content-Type": "application/json"}
+    if use_gzip:
+        headers["Accept-Encoding"] = "gzip"
+
+    next_index = iter(range(len(bodies)))
+    index_lock = threading.Lock()
+    latencies = []
+    errors = []
+
+    def worker():
+        conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=60)
+        local_latencies = []
+        local_errors = 0
+        while True:
+            with index_lock:
+                index = next(next_index, None)
+            if index is None:
+                break
+            start = time.perf_counter()
+            conn.request("POST", path, body=bodies[index], headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            if response.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            local_latencies.append(time.perf_counter() - start)
+            if response.status != 200:
+                local_errors += 1
+        conn.close()
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, sorted(latencies), sum(errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="계산 API 서버 부하 테스트")
+    parser.add_argument("--url", default=None, help="대상 서버 (생략하면 로컬에서 실행)")
+    parser.add_argument("--endpoint", default="future_assets", help="엔드포인트 이름")
+    parser.add_argument("--requests", type=int, default=2000, help="요청 수")
+    parser.add_argument("--unique", type=float, default=0.1, help="서로 다른 입력 비율")
+    parser.add_argument("--batch", type=int, default=0, help="배치 크기 (0이면 단건 요청)")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 8, 32], help="동시 연결 수"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="로컬 서버 작업자 수")
+    parser.add_argument("--processes", action="store_true", help="로컬 서버 프로세스 풀 사용")
+    parser.add_argument("--no-gzip", action="store_true", help="gzip 응답 요청 안 함")
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.endpoint, args.requests, args.unique)
+    if args.batch > 0:
+        path = f"/v1/{args.endpoint}/batch"
+        bodies = [
+            json.dumps({"items": payloads[i:i + args.batch]}).encode("utf-8")
+            for i in range(0, len(payloads), args.batch)
+        ]
+    else:
+        path = f"/v1/{args.endpoint}"
+        bodies = [json.dumps(payload).encode("utf-8") for payload in payloads]
+
+    for concurrency in args.concurrency:
+        # 실행마다 빈 응답 캐시로 시작 (계산 디스크 캐시는 유지)
+        server = None
+        url = args.url
+        if url is None:
+            service = APIService(workers=args.workers, use_processes=args.processes)
+            server = start_api_server(service=service)
+            url = "http://%s:%d" % server.server_address[:2]
+        try:
+            elapsed, latencies, errors = run_load(
+                url, path, bodies, concurrency, not args.no_gzip
+            )
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+                server.service.close()
+
+        p50 = latencies[len(latencies) // 2] * 1000
+        p95 = latencies[int(len(latencies) * 0.95)] * 1000
+        print(
+            f"concurrency={concurrency:>3} | 요청 {len(bodies)}건 ({len(payloads)}항목) "
+            f"{elapsed:.2f}s | {len(bodies) / elapsed:,.0f} req/s "
+            f"({len(payloads) / elapsed:,.0f} items/s) | "
+            f"p50 {p50:.1f}ms p95 {p95:.1f}ms | 오류 {errors}"
+        )
+
+
+if __name__ == "__main__":
+    main()
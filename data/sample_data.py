@@ -120,3 +120,79 @@ def apply_sample_data(scenario_name: str, session_state) -> None:
     # 샘플 데이터 적용 플래그 설정
     session_state['sample_applied'] = scenario_name
 
+
+def get_sample_form_state(scenario_name: str) -> Dict[str, Any]:
+    """
+    샘플 데이터를 페이지 입력 폼 상태로 변환
+
+    샘플 데이터는 만원 단위이고 페이지 입력 폼(shared.page_input_form)은 원 단위이며
+    월 지출, 총 자산, 총 부채를 항목 목록에서 계산하므로 항목 하나씩으로 바꿉니다.
+    항목 ID가 고정되어 있어 같은 샘플은 항상 같은 입력 데이터가 됩니다.
+
+    Args:
+        scenario_name: 시나리오 이름
+
+    Returns:
+        Dict[str, Any]: 필드 이름별 위젯 값 (세션 상태 키: f"{page_type}_{필드}")
+
+    Raises:
+        KeyError: 시나리오가 존재하지 않을 경우
+    """
+    sample = get_sample_data(scenario_name)
+    return {
+        'current_age': sample['current_age'],
+        'retirement_age': sample['retirement_age'],
+        'marital_status': sample['marital_status'],
+        'salary': sample['salary'] * 10000,
+        'salary_growth_rate': float(sample['salary_growth_rate']),
+        'bonus': sample['bonus'] * 10000,
+        'fixed_expense_items': [
+            {'id': 'sample_fixed', 'category': '주거/통신',
+             'amount': sample['monthly_fixed_expense'] * 10000},
+        ],
+        'variable_expense_items': [
+            {'id': 'sample_variable', 'category': '생활',
+             'amount': sample['monthly_variable_expense'] * 10000},
+        ],
+        'asset_items': [
+            {'id': 'sample_assets', 'type': '기타', 'other_type': '보유 자산',
+             'amount': sample['total_assets'] * 10000, 'return_rate': 0.0},
+        ],
+        'other_debt': sample['total_debt'] * 10000,
+        'inflation_rate': float(sample['inflation_rate']),
+        'retirement_monthly_expense': sample['retirement_monthly_expense'] * 10000,
+        'retirement_medical_expense': sample['retirement_medical_expense'] * 10000,
+    }
+
+
+def get_sample_page_inputs(scenario_name: str) -> Dict[str, Any]:
+    """
+    샘플 폼 상태를 적용했을 때 페이지 입력 폼이 반환하는 입력 데이터
+
+    shared.page_input_form.render_page_input_form과 같은 규칙으로 합계 필드를 계산합니다.
+    사전 계산 결과 번들(data.sample_results)이 이 입력으로 계산하므로,
+    샘플을 적용한 뒤 입력을 바꾸지 않았다면 페이지의 입력 지문과 같습니다.
+
+    Args:
+        scenario_name: 시나리오 이름
+
+    Returns:
+        Dict[str, Any]: 입력 데이터 딕셔너리 (원 단위)
+
+    Raises:
+        KeyError: 시나리오가 존재하지 않을 경우
+    """
+    state = get_sample_form_state(scenario_name)
+    other_debt = state.pop('other_debt')
+    inputs = dict(state)
+    inputs['monthly_fixed_expense'] = sum(item['amount'] for item in state['fixed_expense_items'])
+    inputs['monthly_variable_expense'] = sum(
+        item['amount'] for item in state['variable_expense_items']
+    )
+    inputs['total_assets'] = sum(item['amount'] for item in state['asset_items'])
+    inputs['monthly_investment_items'] = []
+    inputs['monthly_investment_total'] = 0
+    inputs['total_debt'] = other_debt
+    inputs['debt_items'] = []
+    inputs['total_monthly_debt_payment'] = 0
+    return inputs
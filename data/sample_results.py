@@ -0,0 +1,309 @@
+"""
+샘플 시나리오 사전 계산 결과 번들
+
+샘플 시나리오별 계산 결과와 직렬화된 Plotly 차트를 미리 계산하여
+data/ 아래 버전이 있는 아티팩트로 저장합니다.
+
+계산 입력은 샘플을 페이지 입력 폼에 적용했을 때의 입력 데이터(원 단위,
+data.sample_data.get_sample_page_inputs)이므로, 소득 지출 분석 페이지에서 샘플을
+적용하고 입력을 바꾸지 않았다면 get_precomputed_results()가 결과를 찾습니다.
+
+계산 엔진(modules.hashing.ENGINE_MODULES), 시각화 코드(modules.visualizations)나 샘플 데이터(data.sample_data)가
+바뀌면 번들 버전이 달라지므로 자동으로 무효화되고 다시 생성됩니다.
+
+빌드 방법:
+    python -m data.sample_results
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# 프로젝트 루트를 Python 경로에 추가 (python -m 실행 대비)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from data.sample_data import SAMPLE_SCENARIOS, get_sample_page_inputs
+from modules.hashing import fingerprint, get_engine_version, get_source_version
+
+# 번들 파일 형식 버전 (구조가 바뀌면 올림)
+BUNDLE_FORMAT_VERSION = 2
+
+# 번들 파일 경로
+BUNDLE_PATH = Path(__file__).resolve().parent / "sample_results_bundle.json"
+
+# 메모리에 로드된 번들 (프로세스당 한 번만 읽음)
+_loaded_bundle: Optional[Dict[str, Any]] = None
+
+
+def get_bundle_version() -> str:
+    """
+    번들 버전 계산
+
+    계산 엔진 버전, 시각화 소스, 샘플 데이터, 번들 형식이 모두 반영됩니다.
+
+    Returns:
+        str: 번들 버전 문자열
+    """
+    return fingerprint(
+        BUNDLE_FORMAT_VERSION,
+        get_engine_version(),
+        get_source_version("modules.visualizations", "data.sample_data"),
+        SAMPLE_SCENARIOS,
+    )
+
+
+def compute_sample_results(scenario_name: str) -> Dict[str, Any]:
+    """
+    샘플 시나리오 하나의 전체 계산 파이프라인 실행
+
+    소득 지출 분석 페이지와 리스크 페이지가 계산하는 결과를 모두 생성합니다.
+
+    Args:
+        scenario_name: 시나리오 이름
+
+    Returns:
+        Dict[str, Any]: 계산 결과와 직렬화된 차트
+            - input_hash: 샘플 입력 데이터(페이지 입력 폼 형태) 지문
+            - results: 계산 결과 딕셔너리
+            - figures: 차트 이름별 Plotly JSON 문자열
+    """
+    from modules.calculations import (
+        calculate_future_assets,
+        calculate_financial_health_grade,
+        calculate_monthly_savings,
+        calculate_retirement_goal,
+        calculate_retirement_sustainability,
+        calculate_risk_score,
+    )
+    from modules.visualizations import (
+        create_future_assets_chart,
+        create_financial_health_gauge,
+        create_risk_score_chart,
+        create_risk_breakdown_chart,
+        create_retirement_goal_chart,
+    )
+
+    inputs = get_sample_page_inputs(scenario_name)
+    years_to_retirement = inputs["retirement_age"] - inputs["current_age"]
+    inflation_rate = inputs.get("inflation_rate", 2.5)
+
+    future_assets_result = calculate_future_assets(
+        inputs, years_to_retirement, inflation_rate, True, 83
+    )
+    grade_result = calculate_financial_health_grade(inputs)
+    monthly_savings = calculate_monthly_savings(inputs)
+    risk_result = calculate_risk_score(inputs)
+    retirement_result = calculate_retirement_sustainability(inputs)
+
+    # 소득 지출 분석 페이지와 같은 기본 저축액 (50만원 단위 반올림)
+    default_monthly_contribution = (
+        max(500000, (monthly_savings // 500000) * 500000)
+        if monthly_savings > 0
+        else 1000000
+    )
+    retirement_goal = calculate_retirement_goal(
+        inputs, default_monthly_contribution, 5.0, 4.0
+    )
+
+    figures = {
+        "future_assets": create_future_assets_chart(
+            future_assets_result, current_age=inputs.get("current_age")
+        ),
+        "financial_health_gauge": create_financial_health_gauge(grade_result),
+        "risk_score": create_risk_score_chart(risk_result),
+        "risk_breakdown": create_risk_breakdown_chart(risk_result),
+        "retirement_goal": create_retirement_goal_chart(
+            inputs, default_monthly_contribution, 5.0, 4.0
+        ),
+    }
+
+    return {
+        "input_hash": fingerprint(inputs),
+        "results": {
+            "future_assets": future_assets_result,
+            "grade": grade_result,
+            "monthly_savings": monthly_savings,
+            "risk": risk_result,
+            "retirement": retirement_result,
+            "retirement_goal": retirement_goal,
+            "default_monthly_contribution": default_monthly_contribution,
+        },
+        "figures": {
+            name: fig.to_json() if hasattr(fig, "to_json") else None
+            for name, fig in figures.items()
+        },
+    }
+
+
+def build_sample_results_bundle(path: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    모든 샘플 시나리오의 결과 번들을 생성하여 파일로 저장
+
+    Args:
+        path: 저장 경로 (None이면 BUNDLE_PATH)
+
+    Returns:
+        Dict[str, Any]: 생성된 번들
+    """
+    global _loaded_bundle
+
+    path = Path(path) if path is not None else BUNDLE_PATH
+    bundle = {
+        "version": get_bundle_version(),
+        "format": BUNDLE_FORMAT_VERSION,
+        "scenarios": {
+            scenario_name: compute_sample_results(scenario_name)
+            for scenario_name in SAMPLE_SCENARIOS
+        },
+    }
+
+    # 임시 파일에 쓴 뒤 교체하여 동시 읽기 시 깨진 파일을 보지 않도록 함
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(bundle, tmp_file, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if path == BUNDLE_PATH:
+        _loaded_bundle = bundle
+    return bundle
+
+
+def load_sample_results_bundle(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    저장된 결과 번들 로드
+
+    파일이 없거나, 손상되었거나, 버전이 현재 코드와 다르면 None을 반환합니다.
+
+    Args:
+        path: 번들 경로 (None이면 BUNDLE_PATH)
+
+    Returns:
+        Optional[Dict[str, Any]]: 유효한 번들 또는 None
+    """
+    path = Path(path) if path is not None else BUNDLE_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as bundle_file:
+            bundle = json.load(bundle_file)
+    except (OSError, ValueError):
+        return None
+
+    if bundle.get("version") != get_bundle_version():
+        return None
+    return bundle
+
+
+def ensure_sample_results_bundle() -> Dict[str, Any]:
+    """
+    시작 시 호출하는 훅: 유효한 번들을 보장
+
+    메모리나 디스크에 유효한 번들이 있으면 그대로 사용하고,
+    없거나 오래된 경우 다시 생성합니다.
+
+    Returns:
+        Dict[str, Any]: 유효한 번들
+    """
+    global _loaded_bundle
+
+    if _loaded_bundle is not None and _loaded_bundle.get("version") == get_bundle_version():
+        return _loaded_bundle
+
+    bundle = load_sample_results_bundle()
+    if bundle is None:
+        bundle = build_sample_results_bundle()
+    _loaded_bundle = bundle
+    return bundle
+
+
+def get_sample_results(scenario_name: str) -> Optional[Dict[str, Any]]:
+    """
+    샘플 시나리오의 사전 계산 결과 반환
+
+    Args:
+        scenario_name: 시나리오 이름
+
+    Returns:
+        Optional[Dict[str, Any]]: 사전 계산 결과 (시나리오가 없으면 None)
+    """
+    if scenario_name not in SAMPLE_SCENARIOS:
+        return None
+    return ensure_sample_results_bundle()["scenarios"].get(scenario_name)
+
+
+def get_precomputed_results(
+    inputs: Dict[str, Any], scenario_name: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    입력 데이터가 샘플 시나리오와 같으면 사전 계산 결과 반환
+
+    Args:
+        inputs: 입력 데이터 딕셔너리 (페이지 입력 폼 형태)
+        scenario_name: 적용한 샘플 이름 (주면 해당 샘플만 확인, None이면 전체 샘플 확인)
+
+    Returns:
+        Optional[Dict[str, Any]]: 사전 계산 결과 (일치하는 샘플이 없으면 None)
+    """
+    input_hash = fingerprint(inputs)
+    if scenario_name is not None:
+        # 샘플을 적용한 뒤 입력을 바꿨으면 지문이 달라지므로 사용하지 않음
+        entry = get_sample_results(scenario_name)
+        return entry if entry and entry.get("input_hash") == input_hash else None
+
+    for entry in ensure_sample_results_bundle()["scenarios"].values():
+        if entry.get("input_hash") == input_hash:
+            return entry
+    return None
+
+
+def load_sample_figure(scenario_name: str, figure_name: str):
+    """
+    사전 계산된 차트를 Plotly Figure로 복원
+
+    Args:
+        scenario_name: 시나리오 이름
+        figure_name: 차트 이름 (예: "future_assets", "retirement_goal")
+
+    Returns:
+        go.Figure: 복원된 차트 (없으면 None)
+    """
+    return load_precomputed_figure(get_sample_results(scenario_name), figure_name)
+
+
+def load_precomputed_figure(entry: Optional[Dict[str, Any]], figure_name: str):
+    """
+    사전 계산 결과 항목에서 차트를 Plotly Figure로 복원
+
+    Args:
+        entry: get_sample_results / get_precomputed_results 반환값
+        figure_name: 차트 이름
+
+    Returns:
+        go.Figure: 복원된 차트 (없으면 None)
+    """
+    if not entry:
+        return None
+    figure_json = entry.get("figures", {}).get(figure_name)
+    if not figure_json:
+        return None
+
+    import plotly.io as pio
+
+    return pio.from_json(figure_json)
+
+
+if __name__ == "__main__":
+    built = build_sample_results_bundle()
+    print(
+        f"샘플 결과 번들 생성 완료: {BUNDLE_PATH} "
+        f"(버전 {built['version']}, 시나리오 {len(built['scenarios'])}개)"
+    )
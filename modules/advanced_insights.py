@@ -5,18 +5,38 @@
 AI 없이도 동작하는 규칙 기반 인사이트 시스템입니다.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from modules.calculations import (
-    calculate_retirement_goal,
+    cached_calculate_retirement_goal_grid,
+    blend_allocation_returns,
     calculate_future_assets,
     apply_inflation,
 )
 from modules.formatters import format_currency, format_percentage
 
+# 기본 투자 수익률 시나리오 (%) 및 이름
+DEFAULT_RETURN_SCENARIOS = (3.0, 5.0, 7.0, 10.0)  # CMA, 채권, 주식, 고위험 투자
+RETURN_SCENARIO_NAMES = {
+    3.0: "CMA/예금",
+    5.0: "채권/안정형 펀드",
+    7.0: "주식/혼합형 펀드",
+    10.0: "고위험 고수익 투자",
+}
+
+# 자산 배분 시나리오에 사용하는 자산군별 기대 수익률 (%)
+ASSET_CLASS_RETURNS = {
+    "예금": 3.0,
+    "채권": 5.0,
+    "주식": 7.0,
+    "고위험": 10.0,
+}
+
 
 def generate_actionable_insights(
     inputs: Dict[str, Any],
     calculation_results: Dict[str, Any],
+    return_scenarios: Optional[Sequence[float]] = None,
+    allocation_mixes: Optional[Dict[str, Dict[str, float]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     실행 가능한 인사이트 목록 생성
@@ -24,6 +44,9 @@ def generate_actionable_insights(
     Args:
         inputs: 입력 데이터 딕셔너리
         calculation_results: 계산 결과 딕셔너리
+        return_scenarios: 투자 시나리오 수익률 목록 (%) - 기본값 3/5/7/10%
+        allocation_mixes: 자산 배분 시나리오 (이름별 자산군 비중, 예:
+            {"안정형": {"예금": 0.7, "주식": 0.3}}) - 없으면 생략
 
     Returns:
         List[Dict[str, Any]]: 인사이트 목록
@@ -41,7 +64,9 @@ def generate_actionable_insights(
     insights.extend(debt_insights)
 
     # 저축 및 투자 인사이트
-    savings_insights = _analyze_savings_and_investment(inputs, calculation_results)
+    savings_insights = _analyze_savings_and_investment(
+        inputs, calculation_results, return_scenarios, allocation_mixes
+    )
     insights.extend(savings_insights)
 
     # 은퇴 준비도 인사이트
@@ -266,9 +291,17 @@ def _analyze_debt_situation(
 
 
 def _analyze_savings_and_investment(
-    inputs: Dict[str, Any], calculation_results: Dict[str, Any]
+    inputs: Dict[str, Any],
+    calculation_results: Dict[str, Any],
+    return_scenarios: Optional[Sequence[float]] = None,
+    allocation_mixes: Optional[Dict[str, Dict[str, float]]] = None,
 ) -> List[Dict[str, Any]]:
-    """저축 및 투자 분석"""
+    """
+    저축 및 투자 분석
+
+    수익률 시나리오, 자산 배분 시나리오, 저축만 하는 경우(0%)를
+    calculate_retirement_goal_grid 한 번으로 함께 계산합니다.
+    """
     insights = []
 
     monthly_savings = calculation_results.get("monthly_savings", 0)
@@ -299,39 +332,42 @@ def _analyze_savings_and_investment(
 
         if years_to_retirement > 0:
             # 다양한 수익률 시나리오
-            return_scenarios = [3.0, 5.0, 7.0, 10.0]  # CMA, 채권, 주식, 고위험 투자
-            simulations = []
+            if return_scenarios is None:
+                return_scenarios = DEFAULT_RETURN_SCENARIOS
+            return_scenarios = [float(rate) for rate in return_scenarios]
+            mix_names = list(allocation_mixes or {})
+            mix_returns = (
+                blend_allocation_returns(
+                    [allocation_mixes[name] for name in mix_names], ASSET_CLASS_RETURNS
+                ).tolist()
+                if mix_names
+                else []
+            )
 
-            current_assets = inputs.get("total_assets", 0)
             inflation_rate = inputs.get("inflation_rate", 2.5)
 
-            for return_rate in return_scenarios:
-                # 현재 자산과 월 저축액으로 은퇴 시점 자산 계산
-                result = calculate_retirement_goal(
-                    inputs,
-                    monthly_savings,
-                    return_rate,
-                    4.0,  # withdrawal_rate
-                )
-
-                projected_assets = result.get("projected_assets", 0)
-
-                # 인플레이션 반영하여 실질 가치 계산
-                real_value = projected_assets / (
-                    (1 + inflation_rate / 100) ** years_to_retirement
-                )
+            # 수익률 시나리오 + 배분 시나리오 + 현재 패턴(0%)을 한 번에 계산
+            grid = cached_calculate_retirement_goal_grid(
+                inputs,
+                [monthly_savings],
+                return_scenarios + mix_returns + [0.0],
+                4.0,  # withdrawal_rate
+            )
+            projected = grid["projected_assets"][0]
 
-                scenarios = {
-                    3.0: "CMA/예금",
-                    5.0: "채권/안정형 펀드",
-                    7.0: "주식/혼합형 펀드",
-                    10.0: "고위험 고수익 투자",
-                }
+            # 인플레이션 반영하여 실질 가치 계산
+            real_values = projected / ((1 + inflation_rate / 100) ** years_to_retirement)
 
+            simulations = []
+            for index, return_rate in enumerate(return_scenarios):
+                projected_assets = float(projected[index])
+                real_value = float(real_values[index])
                 simulations.append(
                     {
                         "return_rate": return_rate,
-                        "scenario": scenarios.get(return_rate, f"{return_rate}% 투자"),
+                        "scenario": RETURN_SCENARIO_NAMES.get(
+                            return_rate, f"{return_rate}% 투자"
+                        ),
                         "projected_assets": projected_assets,
                         "real_value": real_value,
                         "description": (
@@ -341,33 +377,50 @@ def _analyze_savings_and_investment(
                     }
                 )
 
-            # 현재 패턴 (저축만, 수익률 0%)과 비교
-            result_current = calculate_retirement_goal(
-                inputs, monthly_savings, 0.0, 4.0
-            )
-            projected_current = result_current.get("projected_assets", 0)
+            allocation_simulations = []
+            for offset, (name, mix_return) in enumerate(zip(mix_names, mix_returns)):
+                index = len(return_scenarios) + offset
+                projected_assets = float(projected[index])
+                real_value = float(real_values[index])
+                allocation_simulations.append(
+                    {
+                        "scenario": name,
+                        "allocation": dict(allocation_mixes[name]),
+                        "return_rate": mix_return,
+                        "projected_assets": projected_assets,
+                        "real_value": real_value,
+                        "description": (
+                            f"{name} 배분 (기대 수익률 {mix_return:.1f}%) 시 "
+                            f"은퇴 시점 {format_currency(projected_assets)} 예상 (실질 가치: {format_currency(real_value)})"
+                        ),
+                    }
+                )
 
-            insights.append(
-                {
-                    "title": f"💰 월 {format_currency(monthly_savings)} 여유 자금 투자 시나리오",
-                    "priority": "medium",
-                    "category": "investment",
-                    "message": (
-                        f"현재 월 {format_currency(monthly_savings)}의 여유 자금이 있습니다. "
-                        f"이를 투자에 활용하면 은퇴 시점 자산을 크게 늘릴 수 있습니다."
-                    ),
-                    "action_items": [
-                        "위험 성향에 맞는 투자 상품 선택",
-                        "장기 투자 전략 수립",
-                        "다양한 자산 배분으로 리스크 분산",
-                    ],
-                    "simulations": simulations,
-                    "baseline": {
-                        "description": f"현재 패턴 유지 (저축만): {format_currency(projected_current)}",
-                        "value": projected_current,
-                    },
-                }
-            )
+            # 현재 패턴 (저축만, 수익률 0%)과 비교
+            projected_current = float(projected[-1])
+
+            insight = {
+                "title": f"💰 월 {format_currency(monthly_savings)} 여유 자금 투자 시나리오",
+                "priority": "medium",
+                "category": "investment",
+                "message": (
+                    f"현재 월 {format_currency(monthly_savings)}의 여유 자금이 있습니다. "
+                    f"이를 투자에 활용하면 은퇴 시점 자산을 크게 늘릴 수 있습니다."
+                ),
+                "action_items": [
+                    "위험 성향에 맞는 투자 상품 선택",
+                    "장기 투자 전략 수립",
+                    "다양한 자산 배분으로 리스크 분산",
+                ],
+                "simulations": simulations,
+                "baseline": {
+                    "description": f"현재 패턴 유지 (저축만): {format_currency(projected_current)}",
+                    "value": projected_current,
+                },
+            }
+            if allocation_simulations:
+                insight["allocation_simulations"] = allocation_simulations
+            insights.append(insight)
 
     return insights
 
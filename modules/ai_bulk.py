@@ -0,0 +1,266 @@
+"""
+AI 인사이트 일괄 생성 모듈
+
+상담사가 여러 고객 프로필의 인사이트를 한 번에 생성할 때 사용합니다.
+
+- 같은 프롬프트가 되는 프로필은 한 번만 요청
+- asyncio로 동시 요청 수를 제한하여 실행
+- 완료된 결과를 JSONL 체크포인트 파일에 기록하여 중단 후 이어서 실행
+- 처리량(초당 요청 수) 보고
+
+사용 예:
+    report = run_bulk_insights(profiles, concurrency=8, checkpoint_path="insights.jsonl")
+    for item in report["results"]:
+        print(item["index"], item["insight"])
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from modules.ai_insights import is_ai_enabled, prompt_fingerprint, request_ai_insight
+
+# 기본 동시 요청 수
+DEFAULT_BULK_CONCURRENCY = 4
+
+Profile = Tuple[Dict[str, Any], Dict[str, Any]]
+
+
+def load_checkpoint(checkpoint_path: Union[str, Path]) -> Dict[str, str]:
+    """
+    체크포인트 파일에서 완료된 인사이트 로드
+
+    마지막 줄이 중간에 끊긴 경우(실행 중 종료) 해당 줄은 무시합니다.
+
+    Args:
+        checkpoint_path: JSONL 체크포인트 파일 경로
+
+    Returns:
+        Dict[str, str]: 프롬프트 지문별 인사이트
+    """
+    completed: Dict[str, str] = {}
+    path = Path(checkpoint_path)
+    if not path.exists():
+        return completed
+
+    with open(path, "r", encoding="utf-8") as checkpoint_file:
+        for line in checkpoint_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("key") and record.get("insight"):
+                completed[record["key"]] = record["insight"]
+    return completed
+
+
+class _CheckpointWriter:
+    """완료된 결과를 한 줄씩 추가 기록 (이벤트 루프 스레드에서만 사용)"""
+
+    def __init__(self, checkpoint_path: Optional[Union[str, Path]]):
+        self._file = None
+        if checkpoint_path is not None:
+            path = Path(checkpoint_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 중단으로 마지막 줄이 끊겼으면 줄바꿈을 먼저 써서 새 기록이 붙지 않게 함
+            needs_newline = False
+            if path.exists() and path.stat().st_size > 0:
+                with open(path, "rb") as existing:
+                    existing.seek(-1, os.SEEK_END)
+                    needs_newline = existing.read(1) != b"\n"
+            self._file = open(path, "a", encoding="utf-8")
+            if needs_newline:
+                self._file.write("\n")
+
+    def write(self, key: str, insight: str) -> None:
+        if self._file is None:
+            return
+        record = {"key": key, "insight": insight, "completed_at": time.time()}
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+async def generate_insights_bulk(
+    profiles: Iterable[Profile],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    checkpoint_path: Optional[Union[str, Path]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    generate: Callable[[Dict[str, Any], Dict[str, Any]], str] = request_ai_insight,
+) -> Dict[str, Any]:
+    """
+    여러 프로필의 인사이트를 동시 요청 수를 제한하여 생성
+
+    동시 요청 수는 공유 클라이언트의 AI_MAX_CONCURRENCY 제한도 함께 받습니다.
+
+    Args:
+        profiles: (입력 데이터, 계산 결과) 쌍 목록
+        concurrency: 동시 요청 최대 수
+        checkpoint_path: JSONL 체크포인트 파일 경로 (None이면 기록하지 않음)
+        on_progress: 요청이 끝날 때마다 (완료 수, 전체 고유 요청 수)로 호출
+        generate: 인사이트 생성 함수 (기본값: request_ai_insight)
+
+    Returns:
+        Dict[str, Any]:
+            - results: 프로필 순서대로 index, key, insight, error, source
+              (source: "api", "checkpoint", "duplicate" 중 하나)
+            - stats: 처리 통계 (총 프로필 수, 고유 요청 수, 중복 수, 이어받은 수,
+              성공/실패 수, 소요 시간, 초당 요청 수, 초당 프로필 수)
+    """
+    profiles = list(profiles)
+    started = time.perf_counter()
+
+    # 같은 프롬프트가 되는 프로필은 첫 번째 것만 요청
+    keys: List[str] = [
+        prompt_fingerprint(inputs, results) for inputs, results in profiles
+    ]
+    unique: Dict[str, int] = {}
+    for index, key in enumerate(keys):
+        unique.setdefault(key, index)
+
+    completed = load_checkpoint(checkpoint_path) if checkpoint_path else {}
+    pending = [key for key in unique if key not in completed]
+    outcomes: Dict[str, Tuple[Optional[str], Optional[str]]] = {
+        key: (completed[key], None) for key in unique if key in completed
+    }
+
+    writer = _CheckpointWriter(checkpoint_path)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, concurrency), thread_name_prefix="ai-bulk"
+    )
+    done_count = 0
+
+    async def run_one(key: str) -> None:
+        nonlocal done_count
+        inputs, results = profiles[unique[key]]
+        async with semaphore:
+            try:
+                insight = await loop.run_in_executor(
+                    executor, generate, inputs, results
+                )
+                if insight:
+                    outcomes[key] = (insight, None)
+                    writer.write(key, insight)
+                else:
+                    outcomes[key] = (None, "빈 응답")
+            except Exception as e:
+                outcomes[key] = (None, str(e) or type(e).__name__)
+        done_count += 1
+        if on_progress is not None:
+            on_progress(done_count, len(pending))
+
+    try:
+        await asyncio.gather(*(run_one(key) for key in pending))
+    finally:
+        writer.close()
+        executor.shutdown(wait=False)
+
+    elapsed = time.perf_counter() - started
+    results = []
+    for index, key in enumerate(keys):
+        insight, error = outcomes.get(key, (None, "미실행"))
+        if key in completed:
+            source = "checkpoint"
+        elif unique[key] != index:
+            source = "duplicate"
+        else:
+            source = "api"
+        results.append(
+            {
+                "index": index,
+                "key": key,
+                "insight": insight,
+                "error": error,
+                "source": source,
+            }
+        )
+
+    succeeded = sum(1 for key in pending if outcomes[key][0] is not None)
+    return {
+        "results": results,
+        "stats": {
+            "profiles": len(profiles),
+            "unique_prompts": len(unique),
+            "duplicates": len(profiles) - len(unique),
+            "resumed": len(unique) - len(pending),
+            "requested": len(pending),
+            "succeeded": succeeded,
+            "failed": len(pending) - succeeded,
+            "elapsed_seconds": elapsed,
+            "requests_per_second": len(pending) / elapsed if elapsed > 0 else 0.0,
+            "profiles_per_second": len(profiles) / elapsed if elapsed > 0 else 0.0,
+        },
+    }
+
+
+def run_bulk_insights(
+    profiles: Sequence[Profile],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    checkpoint_path: Optional[Union[str, Path]] = None,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    generate_insights_bulk의 동기 실행 버전
+
+    Args:
+        profiles: (입력 데이터, 계산 결과) 쌍 목록
+        concurrency: 동시 요청 최대 수
+        checkpoint_path: JSONL 체크포인트 파일 경로
+        on_progress: 진행 상황 콜백
+
+    Returns:
+        Dict[str, Any]: generate_insights_bulk 반환값
+
+    Raises:
+        RuntimeError: AI 기능이 비활성화된 경우
+    """
+    if not is_ai_enabled():
+        raise RuntimeError(
+            "OPENAI_API_KEY가 설정되지 않아 AI 인사이트를 생성할 수 없습니다."
+        )
+    return asyncio.run(
+        generate_insights_bulk(
+            profiles,
+            concurrency=concurrency,
+            checkpoint_path=checkpoint_path,
+            on_progress=on_progress,
+        )
+    )
+
+
+def format_bulk_stats(stats: Dict[str, Any]) -> str:
+    """
+    처리 통계를 한 줄 요약 문자열로 변환
+
+    Args:
+        stats: generate_insights_bulk 반환값의 stats
+
+    Returns:
+        str: 요약 문자열
+    """
+    return (
+        f"프로필 {stats['profiles']}개 (고유 {stats['unique_prompts']}개, "
+        f"중복 {stats['duplicates']}개, 이어받음 {stats['resumed']}개) | "
+        f"요청 {stats['requested']}건 성공 {stats['succeeded']}건 실패 {stats['failed']}건 | "
+        f"{stats['elapsed_seconds']:.2f}초, {stats['requests_per_second']:.1f} req/s"
+    )
@@ -0,0 +1,318 @@
+"""
+AI 응답 캐시 모듈
+
+정규화된 프롬프트 입력과 모델 이름의 해시를 키로 AI 응답을 SQLite에 저장합니다.
+같은 입력으로 다시 시뮬레이션하거나 여러 사용자가 같은 샘플을 불러올 때
+API를 다시 호출하지 않습니다.
+
+환경 변수:
+    AI_CACHE_DIR: 캐시 디렉토리 (기본값: 프로젝트 루트의 .cache/ai)
+    AI_CACHE_TTL: 항목 유효 기간 (초, 기본값 7일)
+    AI_CACHE_MAX_BYTES: 응답 전체 최대 크기 (bytes, 기본값 50MB)
+    AI_CACHE_BUCKET_DIGITS: 숫자 입력을 반올림할 유효 자릿수 (0이면 반올림 안 함)
+"""
+
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from modules.hashing import fingerprint
+from modules.lazy_imports import load_dotenv_once
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 기본 설정값
+DEFAULT_AI_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_AI_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access);
+CREATE TABLE IF NOT EXISTS metrics (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def bucket_numbers(value: Any, digits: int) -> Any:
+    """
+    숫자를 유효 자릿수 기준으로 반올림하여 비슷한 입력이 같은 값이 되도록 변환
+
+    예: digits=2이면 52,340,000 → 52,000,000, 3.25 → 3.3, 35 → 35
+
+    Args:
+        value: 변환할 값 (dict/list 내부까지 재귀적으로 처리)
+        digits: 유효 자릿수 (0 이하이면 변환하지 않음)
+
+    Returns:
+        Any: 반올림된 값
+    """
+    if digits <= 0:
+        return value
+    if isinstance(value, dict):
+        return {key: bucket_numbers(item, digits) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [bucket_numbers(item, digits) for item in value]
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return value
+    if value == 0 or not math.isfinite(value):
+        return value
+
+    magnitude = math.floor(math.log10(abs(value)))
+    rounded = round(value, digits - 1 - magnitude)
+    return int(rounded) if isinstance(value, int) else rounded
+
+
+class AIResponseCache:
+    """
+    SQLite 기반 AI 응답 캐시
+
+    - 키: 정규화된 프롬프트 입력 + 모델 이름 (+ 프롬프트 버전)의 해시
+    - 유효 기간(TTL)이 지난 항목은 조회하지 않고 정리 시 삭제
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+    - 적중/미적중 횟수를 DB에 누적 기록
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        bucket_digits: Optional[int] = None,
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 AI_CACHE_DIR 환경 변수 또는 .cache/ai)
+            ttl: 항목 유효 기간 (초)
+            max_bytes: 응답 전체 최대 크기 (bytes)
+            bucket_digits: 숫자 입력 반올림 유효 자릿수 (0이면 사용 안 함)
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv("AI_CACHE_DIR") or PROJECT_ROOT / ".cache" / "ai"
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / "responses.sqlite3"
+        self.ttl = float(
+            ttl if ttl is not None else os.getenv("AI_CACHE_TTL", DEFAULT_AI_CACHE_TTL)
+        )
+        self.max_bytes = int(
+            max_bytes
+            if max_bytes is not None
+            else os.getenv("AI_CACHE_MAX_BYTES", DEFAULT_AI_CACHE_MAX_BYTES)
+        )
+        self.bucket_digits = int(
+            bucket_digits
+            if bucket_digits is not None
+            else os.getenv("AI_CACHE_BUCKET_DIGITS", 0)
+        )
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    self._initialized = True
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return self._connect()
+
+    def make_key(self, payload: Any, model: str, namespace: str = "") -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            payload: 프롬프트에 들어가는 입력 데이터
+            model: 모델 이름
+            namespace: 프롬프트 템플릿 버전 등 추가 구분자
+
+        Returns:
+            str: 캐시 키
+        """
+        return fingerprint(
+            bucket_numbers(payload, self.bucket_digits), model, namespace, length=64
+        )
+
+    def get(self, payload: Any, model: str, namespace: str = "") -> Optional[str]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            payload: 프롬프트에 들어가는 입력 데이터
+            model: 모델 이름
+            namespace: 추가 구분자
+
+        Returns:
+            Optional[str]: 캐시된 응답 (없거나 만료되었으면 None)
+        """
+        key = self.make_key(payload, model, namespace)
+        now = time.time()
+        with closing(self._open()) as conn, conn:
+            row = conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                self._increment(conn, "misses")
+                return None
+            conn.execute(
+                "UPDATE responses SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+            self._increment(conn, "hits")
+            return row[0]
+
+    def set(self, payload: Any, model: str, response: str, namespace: str = "") -> None:
+        """
+        응답 저장 후 크기 제한에 맞게 정리
+
+        Args:
+            payload: 프롬프트에 들어가는 입력 데이터
+            model: 모델 이름
+            response: 저장할 응답
+            namespace: 추가 구분자
+        """
+        key = self.make_key(payload, model, namespace)
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with closing(self._open()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, response, size, created_at, last_access, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, model, response, size, now, now),
+            )
+            self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목 삭제 후 전체 크기가 제한을 넘으면 오래 사용하지 않은 항목부터 삭제"""
+        expired = conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.ttl,)
+        ).rowcount
+        evicted = 0
+
+        total_size = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total_size > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access ASC"
+            ).fetchall()
+            stale_keys = []
+            for key, size in rows:
+                if total_size <= self.max_bytes:
+                    break
+                stale_keys.append((key,))
+                total_size -= size
+            conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+            evicted = len(stale_keys)
+
+        if expired:
+            self._increment(conn, "expired", expired)
+        if evicted:
+            self._increment(conn, "evictions", evicted)
+
+    @staticmethod
+    def _increment(conn: sqlite3.Connection, name: str, amount: int = 1) -> None:
+        conn.execute(
+            "INSERT INTO metrics (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 항목 수, 전체 크기, 적중/미적중/제거 횟수, 적중률
+        """
+        with closing(self._open()) as conn:
+            entries, total_size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            metrics = dict(conn.execute("SELECT name, value FROM metrics").fetchall())
+
+        hits = metrics.get("hits", 0)
+        misses = metrics.get("misses", 0)
+        lookups = hits + misses
+        return {
+            "entries": entries,
+            "bytes": total_size,
+            "hits": hits,
+            "misses": misses,
+            "evictions": metrics.get("evictions", 0),
+            "expired": metrics.get("expired", 0),
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def hottest_keys(self, limit: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        적중 횟수가 많은 항목 목록
+
+        Args:
+            limit: 반환할 최대 개수
+
+        Returns:
+            List[Tuple[str, int, int]]: (키, 적중 횟수, 크기) 목록
+        """
+        with closing(self._open()) as conn:
+            return conn.execute(
+                "SELECT key, hits, size FROM responses ORDER BY hits DESC, last_access DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+    def resize(self, max_bytes: int) -> None:
+        """
+        최대 크기 변경 후 바로 정리
+
+        Args:
+            max_bytes: 응답 전체 최대 크기 (bytes)
+        """
+        self.max_bytes = int(max_bytes)
+        with closing(self._open()) as conn, conn:
+            self._evict(conn, time.time())
+
+    def clear(self) -> None:
+        """모든 항목과 통계 삭제"""
+        with closing(self._open()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+            conn.execute("DELETE FROM metrics")
+
+
+_default_cache: Optional[AIResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_ai_cache() -> AIResponseCache:
+    """
+    환경 변수 설정으로 만든 기본 AI 응답 캐시 반환 (프로세스당 하나)
+
+    Returns:
+        AIResponseCache: 기본 캐시
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            # 설정 환경 변수는 .env 파일에 있을 수 있음
+            load_dotenv_once()
+            _default_cache = AIResponseCache()
+        return _default_cache
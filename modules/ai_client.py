@@ -0,0 +1,423 @@
+"""
+AI API 클라이언트 관리 모듈
+
+프로세스 전체에서 하나의 OpenAI 클라이언트(연결 풀)를 재사용하고,
+요청 제한 시간, 지수 백오프 재시도, 동시 호출 수 제한,
+API 키별 토큰 버킷 속도 제한과 호출 통계를 제공합니다.
+
+환경 변수:
+    AI_REQUEST_TIMEOUT: 요청 제한 시간 (초, 기본값 30)
+    AI_MAX_RETRIES: 최대 재시도 횟수 (기본값 3)
+    AI_BACKOFF_BASE: 첫 재시도 대기 시간 (초, 기본값 0.5)
+    AI_BACKOFF_MAX: 최대 재시도 대기 시간 (초, 기본값 8)
+    AI_MAX_CONCURRENCY: 동시 호출 최대 수 (기본값 4)
+    AI_RATE_LIMIT_PER_MINUTE: API 키별 분당 최대 호출 수 (기본값 60)
+    AI_RATE_LIMIT_BURST: API 키별 순간 최대 호출 수 (기본값 10)
+"""
+
+import hashlib
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from modules.lazy_imports import load_dotenv_once
+
+
+class AIRateLimitTimeout(Exception):
+    """속도 제한 또는 동시 호출 제한 대기 시간 초과"""
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓입니다.
+    호출마다 토큰 하나를 사용하며, 토큰이 없으면 채워질 때까지 기다립니다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate: 초당 충전 토큰 수
+            capacity: 최대 토큰 수 (순간 최대 호출 수)
+            clock: 현재 시각 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def try_acquire(self) -> float:
+        """
+        토큰 하나 사용 시도
+
+        Returns:
+            float: 0이면 사용 성공, 양수이면 토큰이 채워질 때까지 기다려야 하는 시간 (초)
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            if self.rate <= 0:
+                return float("inf")
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            float: 실제 대기한 시간 (초)
+
+        Raises:
+            AIRateLimitTimeout: 제한 시간 안에 토큰을 얻지 못한 경우
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire()
+            if wait == 0:
+                return waited
+            if timeout is not None and waited + wait > timeout:
+                raise AIRateLimitTimeout("API 호출 속도 제한 대기 시간을 초과했습니다.")
+            self._sleep(wait)
+            waited += wait
+
+
+def _is_retryable(error: Exception) -> bool:
+    """재시도할 오류인지 확인 (연결 오류, 시간 초과, 429, 5xx)"""
+    try:
+        import openai
+    except ImportError:
+        return False
+
+    if isinstance(
+        error,
+        (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError),
+    ):
+        return True
+    status_code = getattr(error, "status_code", None)
+    return isinstance(error, openai.APIStatusError) and (
+        status_code in (408, 409, 429) or (status_code or 0) >= 500
+    )
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """응답의 Retry-After 헤더 값 (초)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class AIClientManager:
+    """
+    프로세스 전체에서 공유하는 AI API 클라이언트 관리자
+
+    - (API 키, base_url)별로 OpenAI 클라이언트를 하나만 만들어 연결을 재사용
+    - 재시도는 클라이언트 내장 기능 대신 지수 백오프(지터 포함)로 직접 처리
+    - 전역 세마포어로 동시 호출 수 제한 (스트리밍은 응답을 다 받을 때까지 점유)
+    - API 키별 토큰 버킷으로 호출 속도 제한
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limit_per_minute: Optional[float] = None,
+        rate_limit_burst: Optional[float] = None,
+        acquire_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            timeout: 요청 제한 시간 (초)
+            max_retries: 최대 재시도 횟수
+            backoff_base: 첫 재시도 대기 시간 (초), 재시도마다 두 배
+            backoff_max: 최대 재시도 대기 시간 (초)
+            max_concurrency: 동시 호출 최대 수
+            rate_limit_per_minute: API 키별 분당 최대 호출 수
+            rate_limit_burst: API 키별 순간 최대 호출 수
+            acquire_timeout: 속도/동시 호출 제한 최대 대기 시간 (초, 기본값은 timeout)
+
+        None인 설정은 환경 변수(AI_*) 또는 기본값을 사용합니다.
+        """
+        self.timeout = float(
+            timeout if timeout is not None else os.getenv("AI_REQUEST_TIMEOUT", 30)
+        )
+        self.max_retries = int(
+            max_retries if max_retries is not None else os.getenv("AI_MAX_RETRIES", 3)
+        )
+        self.backoff_base = float(
+            backoff_base
+            if backoff_base is not None
+            else os.getenv("AI_BACKOFF_BASE", 0.5)
+        )
+        self.backoff_max = float(
+            backoff_max if backoff_max is not None else os.getenv("AI_BACKOFF_MAX", 8)
+        )
+        self.max_concurrency = int(
+            max_concurrency
+            if max_concurrency is not None
+            else os.getenv("AI_MAX_CONCURRENCY", 4)
+        )
+        self.rate_limit_per_minute = float(
+            rate_limit_per_minute
+            if rate_limit_per_minute is not None
+            else os.getenv("AI_RATE_LIMIT_PER_MINUTE", 60)
+        )
+        self.rate_limit_burst = float(
+            rate_limit_burst
+            if rate_limit_burst is not None
+            else os.getenv("AI_RATE_LIMIT_BURST", 10)
+        )
+        self.acquire_timeout = (
+            acquire_timeout if acquire_timeout is not None else self.timeout
+        )
+
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._lock = threading.Lock()
+        self._metrics = {
+            "requests": 0,
+            "successes": 0,
+            "failures": 0,
+            "retries": 0,
+            "rate_limit_waits": 0,
+            "rate_limit_wait_seconds": 0.0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "total_latency": 0.0,
+            "clients_created": 0,
+        }
+
+    @staticmethod
+    def _key_id(api_key: str) -> str:
+        """API 키를 그대로 보관하지 않도록 해시로 구분"""
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+    def get_client(
+        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+    ):
+        """
+        (API 키, base_url)별 공유 OpenAI 클라이언트 반환
+
+        Args:
+            api_key: API 키 (None이면 OPENAI_API_KEY)
+            base_url: API 주소 (None이면 OPENAI_BASE_URL 또는 기본 주소)
+
+        Returns:
+            OpenAI: 공유 클라이언트
+        """
+        from openai import OpenAI
+
+        api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        base_url = base_url or os.getenv("OPENAI_BASE_URL") or None
+        client_key = (self._key_id(api_key), base_url)
+
+        with self._lock:
+            client = self._clients.get(client_key)
+            if client is None:
+                client = OpenAI(
+                    api_key=api_key,
+                    base_url=base_url,
+                    timeout=self.timeout,
+                    max_retries=0,
+                )
+                self._clients[client_key] = client
+                self._metrics["clients_created"] += 1
+            return client
+
+    def _bucket(self, api_key: str) -> TokenBucket:
+        key_id = self._key_id(api_key)
+        with self._lock:
+            bucket = self._buckets.get(key_id)
+            if bucket is None:
+                bucket = TokenBucket(
+                    self.rate_limit_per_minute / 60.0, self.rate_limit_burst
+                )
+                self._buckets[key_id] = bucket
+            return bucket
+
+    def _wait_for_rate_limit(self, api_key: str) -> None:
+        waited = self._bucket(api_key).acquire(self.acquire_timeout)
+        if waited:
+            with self._lock:
+                self._metrics["rate_limit_waits"] += 1
+                self._metrics["rate_limit_wait_seconds"] += waited
+
+    @contextmanager
+    def _slot(self):
+        """동시 호출 슬롯 점유"""
+        if not self._semaphore.acquire(timeout=self.acquire_timeout):
+            raise AIRateLimitTimeout("AI 동시 호출 대기 시간을 초과했습니다.")
+        with self._lock:
+            self._metrics["in_flight"] += 1
+            self._metrics["max_in_flight"] = max(
+                self._metrics["max_in_flight"], self._metrics["in_flight"]
+            )
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._metrics["in_flight"] -= 1
+            self._semaphore.release()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        재시도 대기 시간 (지수 백오프 + 전체 지터)
+
+        Args:
+            attempt: 재시도 차수 (0부터)
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+    def _call_with_retries(self, call: Callable[[], Any]) -> Any:
+        for attempt in range(self.max_retries + 1):
+            try:
+                return call()
+            except Exception as error:
+                if attempt >= self.max_retries or not _is_retryable(error):
+                    raise
+                delay = _retry_after(error)
+                if delay is None or delay > self.backoff_max:
+                    delay = self.backoff_delay(attempt)
+                with self._lock:
+                    self._metrics["retries"] += 1
+                time.sleep(delay)
+
+    def _record(self, started: float, success: bool) -> None:
+        with self._lock:
+            self._metrics["successes" if success else "failures"] += 1
+            self._metrics["total_latency"] += time.monotonic() - started
+
+    def chat_completion(self, **kwargs):
+        """
+        Chat Completions API 호출 (속도 제한, 동시 호출 제한, 재시도 적용)
+
+        Args:
+            **kwargs: client.chat.completions.create 인자 (stream 제외)
+
+        Returns:
+            ChatCompletion: API 응답
+        """
+        api_key = os.getenv("OPENAI_API_KEY", "")
+        client = self.get_client(api_key)
+        with self._lock:
+            self._metrics["requests"] += 1
+
+        started = time.monotonic()
+        try:
+            self._wait_for_rate_limit(api_key)
+            with self._slot():
+                response = self._call_with_retries(
+                    lambda: client.chat.completions.create(**kwargs)
+                )
+        except Exception:
+            self._record(started, False)
+            raise
+        self._record(started, True)
+        return response
+
+    def stream_chat_completion(self, **kwargs) -> Iterator[Any]:
+        """
+        Chat Completions API 스트리밍 호출
+
+        연결 단계에서만 재시도하며, 응답을 다 받거나 중간에 닫힐 때까지
+        동시 호출 슬롯을 점유합니다.
+
+        Args:
+            **kwargs: client.chat.completions.create 인자 (stream 제외)
+
+        Yields:
+            ChatCompletionChunk: 응답 조각
+        """
+        api_key = os.getenv("OPENAI_API_KEY", "")
+        client = self.get_client(api_key)
+        with self._lock:
+            self._metrics["requests"] += 1
+
+        started = time.monotonic()
+        success = False
+        try:
+            self._wait_for_rate_limit(api_key)
+            with self._slot():
+                stream = self._call_with_retries(
+                    lambda: client.chat.completions.create(stream=True, **kwargs)
+                )
+                try:
+                    yield from stream
+                    success = True
+                finally:
+                    stream.close()
+        finally:
+            self._record(started, success)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        호출 통계 반환
+
+        Returns:
+            Dict[str, Any]: 요청/성공/실패/재시도 횟수, 동시 호출 수, 평균 지연 시간 등
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+        completed = metrics["successes"] + metrics["failures"]
+        metrics["avg_latency"] = (
+            metrics["total_latency"] / completed if completed else 0.0
+        )
+        metrics["max_concurrency"] = self.max_concurrency
+        return metrics
+
+
+_default_manager: Optional[AIClientManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_ai_client_manager() -> AIClientManager:
+    """
+    프로세스 전체에서 공유하는 클라이언트 관리자 반환
+
+    Returns:
+        AIClientManager: 기본 관리자 (환경 변수 설정 사용)
+    """
+    global _default_manager
+    with _default_manager_lock:
+        if _default_manager is None:
+            # 설정 환경 변수는 .env 파일에 있을 수 있음
+            load_dotenv_once()
+            _default_manager = AIClientManager()
+        return _default_manager
@@ -5,11 +5,51 @@ OpenAI API를 사용하여 재정 상태에 대한 맞춤형 인사이트를 생
 환경 변수로 활성화/비활성화 가능합니다.
 """
 
+import json
+import math
 import os
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterator, List, MutableMapping, Tuple
 
-load_dotenv()
+from modules.ai_cache import get_ai_cache
+from modules.ai_client import get_ai_client_manager
+from modules.hashing import fingerprint, get_source_version
+from modules.lazy_imports import load_dotenv_once
+
+# 인사이트 생성 모델
+AI_MODEL = "gpt-4o-mini"
+
+# 인사이트 생성 제한 시간 기본값 (초, AI_INSIGHT_TIMEOUT 환경 변수로 변경)
+DEFAULT_AI_INSIGHT_TIMEOUT = 60.0
+
+# 백그라운드 인사이트 생성 작업 스레드 풀
+_insight_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ai-insight")
+
+# 세션 상태에 저장하는 인사이트 작업 키
+INSIGHT_JOB_STATE_KEY = "ai_insight_job"
+
+# 프롬프트 데이터(JSON) 토큰 예산 기본값 (AI_PROMPT_TOKEN_BUDGET 환경 변수로 변경)
+DEFAULT_AI_PROMPT_TOKEN_BUDGET = 1500
+
+# 프롬프트에서 제외하는 필드 (식별자, 내부 플래그, 다른 필드와 중복되는 값)
+_REDUNDANT_FIELDS = frozenset({"id", "_normalized"})
+_REDUNDANT_GRADE_FIELDS = frozenset({"details", "monthly_savings"})
+
+# 연도별 추이 체크포인트에 남기는 필드
+_CHECKPOINT_FIELDS = (
+    "year",
+    "age",
+    "assets",
+    "total_debt",
+    "annual_income",
+    "annual_expense",
+    "annual_savings",
+    "is_retired",
+)
+
+SYSTEM_PROMPT = "당신은 노후생활 계획 전문 재정 컨설턴트입니다. 사용자의 재정 상태를 분석하여 노후생활(연금) 준비에 중점을 둔 구체적이고 실행 가능한 조언을 제공합니다. 마크다운 형식으로 구조화된 응답을 제공합니다. 대출 관리보다는 은퇴 목표 자산 달성, 저축 및 투자 전략, 장기 자산 형성 계획에 초점을 맞춥니다. 특히 분산 투자(예금/적금, 주식, 채권, 부동산 등)와 자산 배분의 중요성을 반드시 강조하며, 단일 자산군에 집중하는 위험성을 설명합니다."
 
 
 def is_ai_enabled() -> bool:
@@ -19,48 +59,278 @@ def is_ai_enabled() -> bool:
     Returns:
         bool: OPENAI_API_KEY가 설정되어 있으면 True
     """
+    load_dotenv_once()
     api_key = os.getenv("OPENAI_API_KEY")
     return api_key is not None and api_key.strip() != ""
 
 
-def generate_ai_insight(
+def get_insight_timeout() -> float:
+    """
+    인사이트 생성 제한 시간 (초)
+
+    Returns:
+        float: AI_INSIGHT_TIMEOUT 환경 변수 값 (없으면 60초)
+    """
+    load_dotenv_once()
+    return float(os.getenv("AI_INSIGHT_TIMEOUT", DEFAULT_AI_INSIGHT_TIMEOUT))
+
+
+def get_prompt_token_budget() -> int:
+    """
+    프롬프트 데이터(JSON) 토큰 예산
+
+    Returns:
+        int: AI_PROMPT_TOKEN_BUDGET 환경 변수 값 (없으면 1500)
+    """
+    load_dotenv_once()
+    return int(os.getenv("AI_PROMPT_TOKEN_BUDGET", DEFAULT_AI_PROMPT_TOKEN_BUDGET))
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    로컬 토큰 수 추정 (외부 토크나이저 없이)
+
+    영문/숫자/기호는 약 4글자당 1토큰, 한글 등 비ASCII 문자는
+    글자당 1토큰으로 보수적으로 계산합니다.
+
+    Args:
+        text: 토큰 수를 추정할 문자열
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars))
+
+
+def _compact_value(value: Any) -> Any:
+    """중복 필드 제거, 실수 반올림 (100 이상은 정수, 미만은 소수점 첫째 자리)"""
+    if isinstance(value, dict):
+        return {
+            key: _compact_value(item)
+            for key, item in value.items()
+            if key not in _REDUNDANT_FIELDS and item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [_compact_value(item) for item in value]
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        rounded = round(value) if abs(value) >= 100 else round(value, 1)
+        return int(rounded) if float(rounded).is_integer() else rounded
+    return value
+
+
+def _breakdown_checkpoints(
+    yearly_breakdown: List[Dict[str, Any]], step: int
+) -> List[Dict[str, Any]]:
+    """
+    연도별 추이에서 주요 시점만 추출
+
+    첫해, step년 간격, 은퇴 전환 시점, 자산 최고점, 자산 소진 시점, 마지막 해를 남깁니다.
+    """
+    if not yearly_breakdown:
+        return []
+
+    last = len(yearly_breakdown) - 1
+    selected = {0, last}
+    selected.update(
+        index
+        for index, item in enumerate(yearly_breakdown)
+        if item.get("year", index + 1) % step == 0
+    )
+    selected.add(
+        max(
+            range(len(yearly_breakdown)),
+            key=lambda index: yearly_breakdown[index].get("assets", 0),
+        )
+    )
+    for index in range(1, len(yearly_breakdown)):
+        previous, item = yearly_breakdown[index - 1], yearly_breakdown[index]
+        if item.get("is_retired") and not previous.get("is_retired"):
+            selected.update({index - 1, index})
+        if item.get("assets", 0) <= 0 < previous.get("assets", 0):
+            selected.add(index)
+
+    return [
+        {
+            field: yearly_breakdown[index][field]
+            for field in _CHECKPOINT_FIELDS
+            if field in yearly_breakdown[index]
+        }
+        for index in sorted(selected)
+    ]
+
+
+def _summarize_items_by_type(
+    items: List[Dict[str, Any]], amount_fields: Tuple[str, ...]
+) -> Dict[str, Any]:
+    """항목 목록을 유형별 합계로 요약"""
+    totals: Dict[str, float] = {}
+    for item in items:
+        item_type = item.get("type", "기타")
+        if item_type == "기타" and item.get("other_type"):
+            item_type = f"기타 ({item['other_type']})"
+        amount = next((item[field] for field in amount_fields if item.get(field)), 0)
+        totals[item_type] = totals.get(item_type, 0) + amount
+    return totals
+
+
+def _reduce_expense_items(payload: Dict[str, Any]) -> None:
+    # 고정비/변동비 합계가 이미 있으므로 항목 목록은 제외
+    payload["inputs"].pop("fixed_expense_items", None)
+    payload["inputs"].pop("variable_expense_items", None)
+
+
+def _reduce_asset_items(payload: Dict[str, Any]) -> None:
+    inputs = payload["inputs"]
+    if inputs.get("asset_items"):
+        inputs["asset_items"] = _summarize_items_by_type(
+            inputs["asset_items"], ("value", "amount", "principal", "monthly_amount")
+        )
+    if inputs.get("monthly_investment_items"):
+        inputs["monthly_investment_items"] = _summarize_items_by_type(
+            inputs["monthly_investment_items"], ("monthly_amount",)
+        )
+
+
+def _reduce_checkpoints(payload: Dict[str, Any]) -> None:
+    future_assets = payload["calculation_results"].get("future_assets")
+    if isinstance(future_assets, dict) and "_yearly_breakdown" in future_assets:
+        future_assets["yearly_breakdown"] = _breakdown_checkpoints(
+            future_assets["_yearly_breakdown"], 10
+        )
+
+
+def _reduce_debt_items(payload: Dict[str, Any]) -> None:
+    debt_items = payload["inputs"].get("debt_items")
+    if debt_items:
+        payload["inputs"]["debt_items"] = [
+            {
+                key: item[key]
+                for key in (
+                    "principal",
+                    "interest_rate",
+                    "monthly_payment",
+                    "remaining_months",
+                    "is_jeonse",
+                )
+                if key in item
+            }
+            for item in debt_items
+        ]
+
+
+# 토큰 예산을 넘을 때 차례로 적용하는 축약 단계
+_PAYLOAD_REDUCTIONS = (
+    ("expense_items", _reduce_expense_items),
+    ("asset_items", _reduce_asset_items),
+    ("checkpoints", _reduce_checkpoints),
+    ("debt_items", _reduce_debt_items),
+)
+
+
+def _dump_payload(payload: Dict[str, Any]) -> str:
+    """프롬프트에 넣는 압축 JSON 문자열"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def build_prompt_payload(
     inputs: Dict[str, Any],
     calculation_results: Dict[str, Any],
-    context: str = "재정 상태 분석",
-) -> Optional[str]:
+    token_budget: Optional[int] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
-    OpenAI API를 사용하여 재정 상태 기반 인사이트 생성
+    프롬프트용 압축 입력 데이터 생성
+
+    - 연도별 추이(yearly_breakdown)는 주요 시점(5년 간격, 은퇴 전환, 최고점 등)만 남김
+    - 실수는 반올림하고 식별자, 내부 플래그, 중복 필드는 제외
+    - 토큰 예산을 넘으면 항목 목록 요약, 10년 간격 체크포인트 순으로 더 줄임
 
     Args:
         inputs: 입력 데이터 딕셔너리
         calculation_results: 계산 결과 딕셔너리
-        context: 인사이트 맥락 설명
+        token_budget: JSON 토큰 예산 (None이면 get_prompt_token_budget())
 
     Returns:
-        Optional[str]: 생성된 인사이트 텍스트 (API 호출 실패 시 None)
+        Tuple[Dict[str, Any], Dict[str, Any]]: (압축 데이터, 토큰 보고서)
+            보고서: tokens_before, tokens_after, token_budget, within_budget, reductions
     """
-    if not is_ai_enabled():
-        return None
+    if token_budget is None:
+        token_budget = get_prompt_token_budget()
 
-    try:
-        from openai import OpenAI
+    original = {"inputs": inputs, "calculation_results": calculation_results}
+    tokens_before = estimate_tokens(
+        json.dumps(original, ensure_ascii=False, indent=2, default=str)
+    )
 
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    results = dict(calculation_results)
+    future_assets = results.get("future_assets")
+    if isinstance(future_assets, dict) and future_assets.get("yearly_breakdown"):
+        future_assets = dict(future_assets)
+        breakdown = future_assets["yearly_breakdown"]
+        future_assets["yearly_breakdown"] = _breakdown_checkpoints(breakdown, 5)
+        future_assets["_yearly_breakdown"] = breakdown
+        results["future_assets"] = future_assets
+    grade = results.get("grade")
+    if isinstance(grade, dict):
+        results["grade"] = {
+            key: item
+            for key, item in grade.items()
+            if key not in _REDUNDANT_GRADE_FIELDS
+        }
 
-        # 사용자 입력과 계산 결과를 JSON 형식으로 변환
-        import json
+    payload = {"inputs": dict(inputs), "calculation_results": results}
+    reductions = []
+
+    def compacted() -> Dict[str, Any]:
+        result = _compact_value(payload)
+        future = result["calculation_results"].get("future_assets")
+        if isinstance(future, dict):
+            future.pop("_yearly_breakdown", None)
+        return result
+
+    compact = compacted()
+    for name, reduce in _PAYLOAD_REDUCTIONS:
+        if estimate_tokens(_dump_payload(compact)) <= token_budget:
+            break
+        reduce(payload)
+        reductions.append(name)
+        compact = compacted()
+
+    tokens_after = estimate_tokens(_dump_payload(compact))
+    return compact, {
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_after,
+        "token_budget": token_budget,
+        "within_budget": tokens_after <= token_budget,
+        "reductions": reductions,
+    }
+
+
+def _build_messages(
+    inputs: Dict[str, Any],
+    calculation_results: Dict[str, Any],
+    payload: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, str]]:
+    """
+    인사이트 생성 요청 메시지 구성
 
-        # JSON으로 직렬화 가능한 형태로 정리
-        user_data = {
-            "inputs": inputs,
-            "calculation_results": calculation_results,
-        }
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+        payload: 이미 압축한 프롬프트 데이터 (None이면 새로 압축)
 
-        # JSON 문자열로 변환 (읽기 쉽게 포맷팅)
-        user_data_json = json.dumps(user_data, ensure_ascii=False, indent=2)
+    Returns:
+        List[Dict[str, str]]: Chat Completions API 메시지 목록
+    """
+    # 토큰 예산에 맞게 압축한 JSON (연도별 추이는 주요 시점만 포함)
+    if payload is None:
+        payload = _cache_payload(inputs, calculation_results)
+    user_data_json = _dump_payload(payload)
 
-        # 프롬프트 구성
-        prompt = f"""
+    # 프롬프트 구성
+    prompt = f"""
 다음은 사용자의 재정 상태 입력 데이터와 계산 결과입니다.
 
 ```json
@@ -160,21 +430,129 @@ def generate_ai_insight(
 한국어로 자연스럽고 전문적인 톤으로 작성해주세요. 모든 숫자는 만원 단위로 표시해주세요. **대출 상환보다는 노후생활 자산 형성에 중점**을 두고, **분산 투자와 자산 배분의 중요성을 반드시 강조**해주세요.
 """
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 노후생활 계획 전문 재정 컨설턴트입니다. 사용자의 재정 상태를 분석하여 노후생활(연금) 준비에 중점을 둔 구체적이고 실행 가능한 조언을 제공합니다. 마크다운 형식으로 구조화된 응답을 제공합니다. 대출 관리보다는 은퇴 목표 자산 달성, 저축 및 투자 전략, 장기 자산 형성 계획에 초점을 맞춥니다. 특히 분산 투자(예금/적금, 주식, 채권, 부동산 등)와 자산 배분의 중요성을 반드시 강조하며, 단일 자산군에 집중하는 위험성을 설명합니다.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.7,
-            max_tokens=3000,
-        )
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _cache_payload(
+    inputs: Dict[str, Any], calculation_results: Dict[str, Any]
+) -> Dict[str, Any]:
+    """응답 캐시 키에 사용하는 프롬프트 입력 (실제 프롬프트에 들어가는 압축 데이터)"""
+    return build_prompt_payload(inputs, calculation_results)[0]
+
+
+def _cache_namespace() -> str:
+    """프롬프트 템플릿 버전 (이 모듈 소스가 바뀌면 캐시된 응답을 쓰지 않음)"""
+    return get_source_version("modules.ai_insights")
+
+
+def get_cached_insight(
+    inputs: Dict[str, Any], calculation_results: Dict[str, Any]
+) -> Optional[str]:
+    """
+    캐시된 인사이트 조회 (캐시 오류는 무시하고 None 반환)
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+
+    Returns:
+        Optional[str]: 캐시된 인사이트 텍스트
+    """
+    return _lookup_cached_insight(_cache_payload(inputs, calculation_results))
+
+
+def _lookup_cached_insight(payload: Dict[str, Any]) -> Optional[str]:
+    """압축한 프롬프트 데이터로 캐시 조회 (캐시 오류는 무시하고 None 반환)"""
+    try:
+        return get_ai_cache().get(payload, AI_MODEL, _cache_namespace())
+    except Exception as e:
+        print(f"AI 응답 캐시 조회 실패: {e}")
+        return None
+
+
+def _store_cached_insight(payload: Dict[str, Any], insight: str) -> None:
+    """생성된 인사이트를 압축한 프롬프트 데이터 기준으로 캐시에 저장 (캐시 오류는 무시)"""
+    try:
+        get_ai_cache().set(payload, AI_MODEL, insight, _cache_namespace())
+    except Exception as e:
+        print(f"AI 응답 캐시 저장 실패: {e}")
+
+
+def prompt_fingerprint(
+    inputs: Dict[str, Any], calculation_results: Dict[str, Any]
+) -> str:
+    """
+    실제 프롬프트 내용 기준 지문 (같은 프롬프트가 되는 입력은 같은 값)
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+
+    Returns:
+        str: 프롬프트 지문
+    """
+    return fingerprint(
+        _cache_payload(inputs, calculation_results), AI_MODEL, _cache_namespace()
+    )
+
+
+def request_ai_insight(
+    inputs: Dict[str, Any], calculation_results: Dict[str, Any]
+) -> str:
+    """
+    인사이트 생성 (캐시 우선, 오류는 그대로 전달)
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+
+    Returns:
+        str: 생성된 인사이트 텍스트 (빈 응답이면 빈 문자열)
+    """
+    # 캐시 키와 프롬프트에 같은 압축 데이터 사용 (요청당 한 번만 압축)
+    payload = _cache_payload(inputs, calculation_results)
+    cached = _lookup_cached_insight(payload)
+    if cached is not None:
+        return cached
+
+    # 공유 클라이언트 사용 (연결 재사용, 재시도, 동시 호출/속도 제한 적용)
+    response = get_ai_client_manager().chat_completion(
+        model=AI_MODEL,
+        messages=_build_messages(inputs, calculation_results, payload),
+        temperature=0.7,
+        max_tokens=3000,
+    )
+
+    insight = (response.choices[0].message.content or "").strip()
+    if insight:
+        _store_cached_insight(payload, insight)
+    return insight
+
+
+def generate_ai_insight(
+    inputs: Dict[str, Any],
+    calculation_results: Dict[str, Any],
+    context: str = "재정 상태 분석",
+) -> Optional[str]:
+    """
+    OpenAI API를 사용하여 재정 상태 기반 인사이트 생성
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+        context: 인사이트 맥락 설명
+
+    Returns:
+        Optional[str]: 생성된 인사이트 텍스트 (API 호출 실패 시 None)
+    """
+    if not is_ai_enabled():
+        return None
 
-        insight = response.choices[0].message.content.strip()
-        return insight
+    try:
+        return request_ai_insight(inputs, calculation_results)
 
     except ImportError:
         # openai 패키지가 설치되지 않은 경우
@@ -185,6 +563,233 @@ def generate_ai_insight(
         return None
 
 
+def stream_ai_insight(
+    inputs: Dict[str, Any],
+    calculation_results: Dict[str, Any],
+    timeout: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    인사이트를 스트리밍으로 생성하여 텍스트 조각을 차례로 반환
+
+    캐시된 응답이 있으면 API를 호출하지 않고 한 번에 반환하며,
+    끝까지 받은 응답은 캐시에 저장합니다.
+    API 오류는 호출한 쪽에서 처리하도록 그대로 전달합니다.
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+        timeout: 요청 제한 시간 (초, None이면 get_insight_timeout())
+
+    Yields:
+        str: 생성된 텍스트 조각
+    """
+    if timeout is None:
+        timeout = get_insight_timeout()
+
+    payload = _cache_payload(inputs, calculation_results)
+    cached = _lookup_cached_insight(payload)
+    if cached is not None:
+        yield cached
+        return
+
+    stream = get_ai_client_manager().stream_chat_completion(
+        model=AI_MODEL,
+        messages=_build_messages(inputs, calculation_results, payload),
+        temperature=0.7,
+        max_tokens=3000,
+        timeout=timeout,
+    )
+    chunks = []
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                chunks.append(delta)
+                yield delta
+    finally:
+        # 취소되거나 중간에 끝나면 연결을 바로 닫고 동시 호출 슬롯 반환
+        stream.close()
+
+    # 취소되지 않고 끝까지 받은 응답만 캐시에 저장
+    insight = "".join(chunks).strip()
+    if insight:
+        _store_cached_insight(payload, insight)
+
+
+class InsightJob:
+    """
+    백그라운드 인사이트 생성 작업
+
+    스레드 풀에서 스트리밍 응답을 받아 누적하고, 화면 쪽에서는
+    iter_text()로 지금까지 받은 텍스트를 차례로 가져가 표시합니다.
+    """
+
+    def __init__(
+        self,
+        inputs: Dict[str, Any],
+        calculation_results: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ):
+        self.key = insight_job_key(inputs, calculation_results)
+        self.timeout = timeout if timeout is not None else get_insight_timeout()
+        self.error: Optional[str] = None
+        self._chunks: List[str] = []
+        self._lock = threading.Lock()
+        self._updated = threading.Condition(self._lock)
+        self._cancelled = threading.Event()
+        self._deadline = time.monotonic() + self.timeout
+        self._future = _insight_executor.submit(
+            self._run, inputs, calculation_results
+        )
+
+    def _run(self, inputs: Dict[str, Any], calculation_results: Dict[str, Any]) -> None:
+        try:
+            for chunk in stream_ai_insight(inputs, calculation_results, self.timeout):
+                if self._cancelled.is_set():
+                    break
+                if time.monotonic() > self._deadline:
+                    self.error = "timeout"
+                    break
+                with self._updated:
+                    self._chunks.append(chunk)
+                    self._updated.notify_all()
+        except Exception as e:
+            # API 호출 실패 (API 키 오류, 네트워크 오류, 제한 시간 초과 등)
+            print(f"AI 인사이트 생성 실패: {e}")
+            self.error = str(e) or type(e).__name__
+        finally:
+            with self._updated:
+                self._updated.notify_all()
+
+    @property
+    def done(self) -> bool:
+        """작업 종료 여부 (완료, 오류, 취소 모두 포함)"""
+        return self._future.done()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부"""
+        return self._cancelled.is_set()
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 텍스트"""
+        with self._lock:
+            return "".join(self._chunks)
+
+    def cancel(self) -> None:
+        """작업 취소 (다음 텍스트 조각을 받는 시점에 스트림을 닫음)"""
+        self._cancelled.set()
+        self._future.cancel()
+        with self._updated:
+            self._updated.notify_all()
+
+    def iter_text(self, poll_interval: float = 0.1) -> Iterator[str]:
+        """
+        새 텍스트가 도착할 때마다 누적 텍스트 반환
+
+        작업이 끝나거나 제한 시간이 지나면 멈춥니다.
+        제한 시간이 지나면 작업을 취소하고 error를 "timeout"으로 설정합니다.
+
+        Args:
+            poll_interval: 새 텍스트 대기 간격 (초)
+
+        Yields:
+            str: 지금까지 받은 누적 텍스트
+        """
+        seen = 0
+        while True:
+            with self._updated:
+                if len(self._chunks) == seen and not self._future.done():
+                    self._updated.wait(poll_interval)
+                count = len(self._chunks)
+                text = "".join(self._chunks) if count != seen else None
+
+            if text is not None:
+                seen = count
+                yield text
+
+            if self._future.done() or self.cancelled:
+                with self._lock:
+                    if len(self._chunks) == seen:
+                        return
+                continue
+
+            if time.monotonic() > self._deadline:
+                self.error = "timeout"
+                self.cancel()
+                return
+
+    def result(self) -> Optional[str]:
+        """
+        작업이 끝날 때까지 기다린 뒤 전체 텍스트 반환
+
+        Returns:
+            Optional[str]: 생성된 텍스트 (오류, 취소, 빈 응답이면 None)
+        """
+        for _ in self.iter_text():
+            pass
+        text = self.text.strip()
+        if self.error or self.cancelled or not text:
+            return None
+        return text
+
+
+def insight_job_key(
+    inputs: Dict[str, Any], calculation_results: Dict[str, Any]
+) -> str:
+    """
+    인사이트 작업 키 (입력과 계산 결과의 지문)
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+
+    Returns:
+        str: 작업 키
+    """
+    return fingerprint(inputs, calculation_results, AI_MODEL)
+
+
+def get_insight_job(
+    state: MutableMapping[str, Any],
+    inputs: Dict[str, Any],
+    calculation_results: Dict[str, Any],
+    timeout: Optional[float] = None,
+) -> Optional[InsightJob]:
+    """
+    입력에 해당하는 인사이트 작업을 반환 (없으면 백그라운드에서 시작)
+
+    입력이 같으면 진행 중이거나 끝난 작업을 재사용하고,
+    입력이 바뀌면 이전 작업을 취소한 뒤 새 작업을 시작합니다.
+
+    Args:
+        state: 작업을 보관할 상태 저장소 (st.session_state)
+        inputs: 입력 데이터 딕셔너리
+        calculation_results: 계산 결과 딕셔너리
+        timeout: 생성 제한 시간 (초, None이면 get_insight_timeout())
+
+    Returns:
+        Optional[InsightJob]: 인사이트 작업 (AI 비활성화 시 None)
+    """
+    if not is_ai_enabled():
+        return None
+
+    key = insight_job_key(inputs, calculation_results)
+    job = state.get(INSIGHT_JOB_STATE_KEY)
+    if job is not None:
+        # 같은 입력의 작업은 재사용 (오류로 끝난 작업은 다시 시도)
+        if job.key == key and not job.cancelled and not (job.done and job.error):
+            return job
+        job.cancel()
+
+    job = InsightJob(inputs, calculation_results, timeout)
+    state[INSIGHT_JOB_STATE_KEY] = job
+    return job
+
+
 def _create_summary(inputs: Dict[str, Any], calculation_results: Dict[str, Any]) -> str:
     """
     입력 데이터와 계산 결과를 요약하여 텍스트로 변환
@@ -0,0 +1,598 @@
+"""
+계산 엔진 HTTP/JSON API 서버
+
+Streamlit 페이지 없이 다른 내부 시스템이 modules.calculations 결과를 받을 수 있도록
+표준 라이브러리(http.server)만으로 JSON API를 제공합니다.
+
+엔드포인트:
+    GET  /healthz                     상태 확인
+    GET  /v1/endpoints                계산 엔드포인트와 파라미터 목록
+    GET  /metrics, /metrics.json      modules.metrics 지표
+    POST /v1/<endpoint>               {"inputs": {...}, ...파라미터}
+    POST /v1/<endpoint>/batch         {"items": [{"inputs": {...}, ...}, ...]}
+
+응답 본문은 {"status": 200, "result": ...} 형식이며, 입력 검증(modules.validators)
+실패는 422와 "errors", 잘못된 요청은 400과 "error"로 반환합니다.
+배치 응답은 {"results": [항목별 응답, ...]} 입니다.
+
+- 계산은 작업자 풀(스레드 또는 프로세스)에서 실행
+- 같은 요청의 응답은 메모리 LRU에 인코딩된 JSON으로 보관하고,
+  동시에 들어온 같은 요청은 한 번만 계산 (modules.singleflight)
+- Accept-Encoding: gzip 요청에는 큰 응답을 gzip으로 압축,
+  Content-Encoding: gzip 요청 본문도 처리
+
+실행:
+    python -m modules.api_server --port 8600 --workers 4
+
+환경 변수:
+    API_HOST: 바인딩 주소 (기본값 127.0.0.1)
+    API_PORT: 포트 (기본값 8600)
+    API_WORKERS: 계산 작업자 수 (기본값 CPU 수)
+    API_WORKER_PROCESSES: "1"이면 프로세스 풀 사용 (기본값: 스레드 풀)
+    API_CACHE_ENTRIES: 응답 캐시 최대 항목 수 (기본값 1024, 0이면 사용 안 함)
+    API_MAX_BATCH_ITEMS: 배치 요청 최대 항목 수 (기본값 1000)
+"""
+
+import argparse
+import gzip
+import io
+import json
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from modules.calculations import (
+    calculate_financial_health_grade,
+    cached_calculate_future_assets,
+    cached_calculate_retirement_goal,
+    cached_calculate_risk_score,
+    compare_scenarios,
+    find_optimal_contribution_rate,
+    find_required_return_rate,
+)
+from modules.hashing import fingerprint
+from modules.lazy_imports import load_dotenv_once
+from modules.metrics import get_metrics_registry
+from modules.singleflight import SingleFlight
+from modules.utils import safe_calculate
+from modules.validators import validate_inputs
+
+# 기본 설정값
+DEFAULT_API_PORT = 8600
+DEFAULT_API_CACHE_ENTRIES = 1024
+DEFAULT_API_MAX_BATCH_ITEMS = 1000
+MAX_REQUEST_BYTES = 10 * 1024 * 1024
+
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 이 크기보다 작은 응답은 압축해도 이득이 적음
+GZIP_MIN_BYTES = 1024
+
+_REQUIRED = object()
+
+_registry = get_metrics_registry()
+_registry.describe("api_requests_total", "API 요청 수 (엔드포인트, 상태 코드별)")
+_registry.describe("api_request_duration_seconds", "API 요청 처리 시간")
+_registry.describe("api_response_cache_total", "API 응답 캐시 조회 수 (적중 여부별)")
+
+
+def _future_assets(inputs: Dict[str, Any], years: int, inflation_rate: Optional[float]):
+    if inflation_rate is None:
+        inflation_rate = inputs.get("inflation_rate", 2.5)
+    return cached_calculate_future_assets(inputs, years=years, inflation_rate=inflation_rate)
+
+
+def _required_contribution(
+    inputs: Dict[str, Any], target_return_rate: float, withdrawal_rate: float
+) -> Dict[str, Any]:
+    contribution, result = find_optimal_contribution_rate(
+        inputs, target_return_rate, withdrawal_rate
+    )
+    return {"monthly_contribution": contribution, "result": result}
+
+
+def _required_return_rate(
+    inputs: Dict[str, Any], monthly_contribution: float, withdrawal_rate: float
+) -> Dict[str, Any]:
+    rate, result = find_required_return_rate(inputs, monthly_contribution, withdrawal_rate)
+    return {"annual_return_rate": rate, "result": result}
+
+
+class Endpoint:
+    """
+    계산 엔드포인트 정의
+
+    func는 inputs를 첫 번째 인자로, params에 정의된 파라미터를 키워드 인자로 받습니다.
+    """
+
+    def __init__(self, func: Callable, params: Dict[str, Tuple[type, Any]], description: str):
+        """
+        Args:
+            func: 계산 함수
+            params: 파라미터 이름별 (타입, 기본값) - 기본값이 _REQUIRED면 필수
+            description: 설명
+        """
+        self.func = func
+        self.params = params
+        self.description = description
+
+    def parse_params(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        요청 본문에서 파라미터 추출
+
+        Args:
+            payload: 요청 본문 (inputs 제외 키가 파라미터)
+
+        Returns:
+            Dict[str, Any]: 키워드 인자
+
+        Raises:
+            ValueError: 알 수 없는 파라미터, 필수 파라미터 누락, 타입 오류
+        """
+        unknown = set(payload) - set(self.params) - {"inputs"}
+        if unknown:
+            raise ValueError(f"알 수 없는 파라미터: {', '.join(sorted(unknown))}")
+
+        kwargs = {}
+        for name, (kind, default) in self.params.items():
+            value = payload.get(name)
+            if value is None:
+                if default is _REQUIRED:
+                    raise ValueError(f"필수 파라미터 누락: {name}")
+                kwargs[name] = default
+            elif kind is list:
+                if not isinstance(value, list) or not all(
+                    isinstance(item, str) for item in value
+                ):
+                    raise ValueError(f"{name}은(는) 문자열 목록이어야 합니다.")
+                kwargs[name] = value
+            elif (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or not math.isfinite(value)
+            ):
+                raise ValueError(f"{name}은(는) 숫자여야 합니다.")
+            elif kind is int and value != int(value):
+                raise ValueError(f"{name}은(는) 정수여야 합니다.")
+            else:
+                kwargs[name] = kind(value)
+        return kwargs
+
+    def describe(self) -> Dict[str, Any]:
+        """엔드포인트 설명 (GET /v1/endpoints 응답 항목)"""
+        return {
+            "description": self.description,
+            "params": {
+                name: {
+                    "type": kind.__name__,
+                    "required": default is _REQUIRED,
+                    **({} if default is _REQUIRED else {"default": default}),
+                }
+                for name, (kind, default) in self.params.items()
+            },
+        }
+
+
+ENDPOINTS: Dict[str, Endpoint] = {
+    "future_assets": Endpoint(
+        _future_assets,
+        {"years": (int, 10), "inflation_rate": (float, None)},
+        "미래 자산 추정",
+    ),
+    "grade": Endpoint(calculate_financial_health_grade, {}, "재정 건전성 등급"),
+    "risk_score": Endpoint(cached_calculate_risk_score, {}, "위험도 점수"),
+    "scenarios": Endpoint(
+        compare_scenarios,
+        {"scenarios": (list, _REQUIRED), "years": (int, 10)},
+        "시나리오 비교",
+    ),
+    "retirement_goal": Endpoint(
+        cached_calculate_retirement_goal,
+        {
+            "monthly_contribution": (float, _REQUIRED),
+            "annual_return_rate": (float, _REQUIRED),
+            "withdrawal_rate": (float, 4.0),
+        },
+        "은퇴 자금 목표 계산",
+    ),
+    "required_contribution": Endpoint(
+        _required_contribution,
+        {"target_return_rate": (float, _REQUIRED), "withdrawal_rate": (float, 4.0)},
+        "목표 수익률에 필요한 매달 저축 금액 계산",
+    ),
+    "required_return_rate": Endpoint(
+        _required_return_rate,
+        {"monthly_contribution": (float, _REQUIRED), "withdrawal_rate": (float, 4.0)},
+        "매달 저축 금액에 필요한 수익률 계산",
+    ),
+}
+
+
+def _json_default(value: Any) -> Any:
+    """numpy 값 등 json 모듈이 처리하지 못하는 값 변환"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+def encode_json(value: Any) -> bytes:
+    """
+    응답 JSON 인코딩
+
+    Args:
+        value: 인코딩할 값 (numpy 배열/스칼라 포함 가능)
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
+def run_endpoint(name: str, payload: Any) -> Tuple[int, Dict[str, Any]]:
+    """
+    엔드포인트 한 건 실행 (작업자 풀에서 호출, 예외를 던지지 않음)
+
+    Args:
+        name: 엔드포인트 이름
+        payload: 요청 본문 ({"inputs": {...}, ...파라미터})
+
+    Returns:
+        Tuple[int, Dict[str, Any]]: (상태 코드, 응답 본문)
+    """
+    endpoint = ENDPOINTS.get(name)
+    if endpoint is None:
+        return 404, {"status": 404, "error": f"알 수 없는 엔드포인트: {name}"}
+    if not isinstance(payload, dict) or not isinstance(payload.get("inputs"), dict):
+        return 400, {"status": 400, "error": "요청 본문에 inputs 객체가 필요합니다."}
+
+    try:
+        kwargs = endpoint.parse_params(payload)
+    except ValueError as e:
+        return 400, {"status": 400, "error": str(e)}
+
+    inputs = payload["inputs"]
+    try:
+        is_valid, errors = validate_inputs(inputs)
+    except (TypeError, ValueError):
+        is_valid, errors = False, ["입력값 형식이 올바르지 않습니다. 숫자 항목을 확인해주세요."]
+    if not is_valid:
+        return 422, {"status": 422, "errors": errors}
+
+    result, success, error_msg = safe_calculate(endpoint.func, inputs, **kwargs)
+    if not success:
+        return 500, {"status": 500, "error": error_msg}
+    return 200, {"status": 200, "result": result}
+
+
+class APIService:
+    """
+    HTTP와 무관한 API 처리부 (작업자 풀, 응답 캐시, 동일 요청 합치기)
+
+    응답 캐시는 결과가 입력만으로 정해지는 200/400/404/422 응답만 보관합니다.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        use_processes: Optional[bool] = None,
+        cache_entries: Optional[int] = None,
+        max_batch_items: Optional[int] = None,
+    ):
+        """
+        Args:
+            workers: 계산 작업자 수 (None이면 API_WORKERS 또는 CPU 수)
+            use_processes: 프로세스 풀 사용 여부 (None이면 API_WORKER_PROCESSES)
+            cache_entries: 응답 캐시 최대 항목 수 (0이면 사용 안 함)
+            max_batch_items: 배치 요청 최대 항목 수
+        """
+        load_dotenv_once()
+        self.workers = int(workers or os.getenv("API_WORKERS") or os.cpu_count() or 1)
+        if use_processes is None:
+            use_processes = os.getenv("API_WORKER_PROCESSES", "0").strip().lower() in (
+                "1", "true", "yes"
+            )
+        self.cache_entries = int(
+            cache_entries
+            if cache_entries is not None
+            else os.getenv("API_CACHE_ENTRIES", DEFAULT_API_CACHE_ENTRIES)
+        )
+        self.max_batch_items = int(
+            max_batch_items
+            if max_batch_items is not None
+            else os.getenv("API_MAX_BATCH_ITEMS", DEFAULT_API_MAX_BATCH_ITEMS)
+        )
+
+        if use_processes:
+            # 서버 스레드가 이미 떠 있으므로 fork 대신 spawn
+            self.executor: Executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="api-worker"
+            )
+        self._cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._in_flight = SingleFlight()
+
+    @staticmethod
+    def _make_key(name: str, payload: Any) -> str:
+        return fingerprint(name, payload, length=40)
+
+    def _lookup(self, key: str) -> Optional[Tuple[int, bytes]]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+        _registry.increment("api_response_cache_total", {"result": "hit" if entry else "miss"})
+        return entry
+
+    def _store(self, key: str, status: int, body: Dict[str, Any]) -> Tuple[int, bytes]:
+        entry = (status, encode_json(body))
+        if status != 500 and self.cache_entries > 0:
+            with self._cache_lock:
+                self._cache[key] = entry
+                while len(self._cache) > self.cache_entries:
+                    self._cache.popitem(last=False)
+        return entry
+
+    def _compute(self, key: str, name: str, payload: Any) -> Tuple[int, bytes]:
+        status, body = self.executor.submit(run_endpoint, name, payload).result()
+        return self._store(key, status, body)
+
+    def call(self, name: str, payload: Any) -> Tuple[int, bytes]:
+        """
+        단건 요청 처리
+
+        Args:
+            name: 엔드포인트 이름
+            payload: 요청 본문
+
+        Returns:
+            Tuple[int, bytes]: (상태 코드, 인코딩된 응답 본문)
+        """
+        key = self._make_key(name, payload)
+        entry = self._lookup(key)
+        if entry is None:
+            entry, _ = self._in_flight.do(key, self._compute, key, name, payload)
+        return entry
+
+    def call_batch(self, name: str, payload: Any) -> Tuple[int, bytes]:
+        """
+        배치 요청 처리 (캐시에 없는 항목을 작업자 풀에 한꺼번에 제출)
+
+        Args:
+            name: 엔드포인트 이름
+            payload: {"items": [요청 본문, ...]}
+
+        Returns:
+            Tuple[int, bytes]: (상태 코드, 인코딩된 응답 본문 {"results": [...]})
+        """
+        if name not in ENDPOINTS:
+            return 404, encode_json({"status": 404, "error": f"알 수 없는 엔드포인트: {name}"})
+        items = payload.get("items") if isinstance(payload, dict) else None
+        if not isinstance(items, list):
+            return 400, encode_json({"status": 400, "error": "요청 본문에 items 목록이 필요합니다."})
+        if len(items) > self.max_batch_items:
+            return 413, encode_json(
+                {"status": 413, "error": f"배치 항목은 최대 {self.max_batch_items}개입니다."}
+            )
+
+        keys = [self._make_key(name, item) for item in items]
+        bodies: Dict[str, bytes] = {}
+        pending = {}
+        for key, item in zip(keys, items):
+            if key in bodies or key in pending:
+                continue
+            entry = self._lookup(key)
+            if entry is not None:
+                bodies[key] = entry[1]
+            else:
+                pending[key] = self.executor.submit(run_endpoint, name, item)
+        for key, future in pending.items():
+            bodies[key] = self._store(key, *future.result())[1]
+
+        return 200, b'{"results":[' + b",".join(bodies[key] for key in keys) + b"]}"
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        서비스 상태 반환
+
+        Returns:
+            Dict[str, Any]: 작업자 수, 응답 캐시 항목 수, 동일 요청 합치기 통계
+        """
+        with self._cache_lock:
+            cached_entries = len(self._cache)
+        return {
+            "workers": self.workers,
+            "cache_entries": cached_entries,
+            "in_flight": self._in_flight.stats(),
+        }
+
+    def close(self) -> None:
+        """작업자 풀 종료"""
+        self.executor.shutdown(wait=True)
+
+
+def _make_handler(service: APIService) -> type:
+    """APIService를 사용하는 요청 핸들러 클래스 생성"""
+
+    class APIRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # keep-alive 연결에서 헤더/본문을 나눠 쓸 때 지연 ACK로 40ms씩 늦어지지 않도록
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str = JSON_CONTENT_TYPE):
+            headers = {"Content-Type": content_type}
+            accepts_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            if accepts_gzip and len(body) >= GZIP_MIN_BYTES:
+                body = gzip.compress(body, compresslevel=6)
+                headers["Content-Encoding"] = "gzip"
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_error(self, status: int, message: str):
+            self._send(status, encode_json({"status": status, "error": message}))
+
+        def _read_json(self) -> Any:
+            length = int(self.headers.get("Content-Length") or 0)
+            if length < 0:
+                # 본문 길이를 알 수 없으므로 연결을 재사용하지 않음 (rfile.read(-1)은 EOF까지 대기)
+                self.close_connection = True
+                raise ValueError("Content-Length가 음수입니다.")
+            if length > MAX_REQUEST_BYTES:
+                raise OverflowError
+            body = self.rfile.read(length)
+            if self.headers.get("Content-Encoding", "").lower() == "gzip":
+                # 압축 폭탄 방지: 한도 + 1바이트까지만 풀어서 초과 여부 확인
+                with gzip.GzipFile(fileobj=io.BytesIO(body)) as compressed:
+                    body = compressed.read(MAX_REQUEST_BYTES + 1)
+                if len(body) > MAX_REQUEST_BYTES:
+                    raise OverflowError
+            return json.loads(body or b"null")
+
+        def do_GET(self):
+            path = self.path.split("?")[0].rstrip("/")
+            if path == "/healthz":
+                self._send(200, encode_json({"status": "ok", **service.stats()}))
+            elif path == "/v1/endpoints":
+                endpoints = {name: endpoint.describe() for name, endpoint in ENDPOINTS.items()}
+                self._send(200, encode_json(endpoints))
+            elif path == "/metrics":
+                self._send(200, _registry.to_prometheus().encode("utf-8"), PROMETHEUS_CONTENT_TYPE)
+            elif path == "/metrics.json":
+                self._send(200, _registry.to_json().encode("utf-8"))
+            else:
+                self._send_error(404, "찾을 수 없는 경로입니다.")
+
+        def do_POST(self):
+            start = time.perf_counter()
+            parts = self.path.split("?")[0].strip("/").split("/")
+            batch = len(parts) == 3 and parts[2] == "batch"
+            if parts[0] != "v1" or len(parts) != (3 if batch else 2):
+                self._send_error(404, "찾을 수 없는 경로입니다.")
+                return
+            name = parts[1]
+
+            try:
+                payload = self._read_json()
+            except OverflowError:
+                self.close_connection = True
+                self._send_error(413, "요청 본문이 너무 큽니다.")
+                return
+            except (ValueError, OSError, EOFError):
+                self._send_error(400, "요청 본문이 올바른 JSON이 아닙니다.")
+                return
+
+            if batch:
+                status, body = service.call_batch(name, payload)
+            else:
+                status, body = service.call(name, payload)
+            self._send(status, body)
+
+            endpoint_label = name if name in ENDPOINTS else "unknown"
+            if batch:
+                endpoint_label += "/batch"
+            _registry.increment(
+                "api_requests_total", {"endpoint": endpoint_label, "status": status}
+            )
+            _registry.observe(
+                "api_request_duration_seconds",
+                time.perf_counter() - start,
+                {"endpoint": endpoint_label},
+            )
+
+    return APIRequestHandler
+
+
+def create_api_server(
+    host: str = "127.0.0.1", port: int = DEFAULT_API_PORT, service: Optional[APIService] = None
+) -> ThreadingHTTPServer:
+    """
+    API 서버 생성 (serve_forever()로 실행)
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+        service: 요청 처리부 (None이면 환경 변수 설정으로 생성)
+
+    Returns:
+        ThreadingHTTPServer: 서버 (service 속성으로 처리부 접근)
+    """
+    service = service or APIService()
+    server = ThreadingHTTPServer((host, port), _make_handler(service))
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def start_api_server(
+    host: str = "127.0.0.1", port: int = 0, service: Optional[APIService] = None
+) -> ThreadingHTTPServer:
+    """
+    API 서버를 백그라운드 스레드로 시작
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+        service: 요청 처리부 (None이면 환경 변수 설정으로 생성)
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (server_address로 포트 확인, shutdown()으로 종료)
+    """
+    server = create_api_server(host, port, service)
+    threading.Thread(target=server.serve_forever, name="api-server", daemon=True).start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """명령줄 실행 진입점"""
+    load_dotenv_once()
+    parser = argparse.ArgumentParser(description="계산 엔진 JSON API 서버")
+    parser.add_argument("--host", default=os.getenv("API_HOST", "127.0.0.1"), help="바인딩 주소")
+    parser.add_argument(
+        "--port", type=int, default=int(os.getenv("API_PORT", DEFAULT_API_PORT)), help="포트"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="계산 작업자 수")
+    parser.add_argument(
+        "--processes", action="store_true", default=None, help="프로세스 풀에서 계산"
+    )
+    args = parser.parse_args(argv)
+
+    server = create_api_server(
+        args.host, args.port, APIService(workers=args.workers, use_processes=args.processes)
+    )
+    host, port = server.server_address[:2]
+    print(f"API 서버 실행 중: http://{host}:{port} (작업자 {server.service.workers}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
+
+
+if __name__ == "__main__":
+    main()
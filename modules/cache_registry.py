@@ -0,0 +1,217 @@
+"""
+캐시 관리 모듈
+
+차트 캐시, AI 응답 캐시, 계산 결과 디스크 캐시를 같은 형식으로 조회하고
+비우거나 크기를 바꿀 수 있게 묶습니다. 관리자 페이지(pages/_4_캐시_관리.py)에서 사용합니다.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class CacheAdapter:
+    """
+    캐시 관리 인터페이스
+
+    하위 클래스는 stats/hottest/clear/limits/resize를 구현합니다.
+    stats는 entries, bytes, hits, misses, hit_rate, evictions 키를 반환해야 합니다.
+    """
+
+    name = ""
+    description = ""
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 항목 수, 크기, 적중/미적중/제거 횟수, 적중률
+        """
+        raise NotImplementedError
+
+    def hottest(self, limit: int = 10) -> List[Tuple[str, int, Optional[int]]]:
+        """
+        적중 횟수가 많은 키 목록
+
+        Args:
+            limit: 반환할 최대 개수
+
+        Returns:
+            List[Tuple[str, int, Optional[int]]]: (키, 적중 횟수, 크기) 목록
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        raise NotImplementedError
+
+    def limits(self) -> Dict[str, int]:
+        """
+        현재 크기 제한
+
+        Returns:
+            Dict[str, int]: 제한 이름별 값 (resize 인자 이름과 같음)
+        """
+        raise NotImplementedError
+
+    def resize(self, **limits: int) -> None:
+        """
+        크기 제한 변경 (줄이면 바로 정리)
+
+        Args:
+            **limits: limits()와 같은 이름의 새 값
+        """
+        raise NotImplementedError
+
+
+class FigureCacheAdapter(CacheAdapter):
+    """차트 캐시 (프로세스 메모리)"""
+
+    name = "figure"
+    description = "차트 캐시 (프로세스 메모리)"
+
+    def stats(self) -> Dict[str, Any]:
+        from modules import visualizations
+
+        stats = visualizations.get_figure_cache_stats()
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "entries": stats["entries"],
+            "bytes": visualizations.get_figure_cache_bytes(),
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "evictions": stats["evictions"],
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+        }
+
+    def hottest(self, limit: int = 10) -> List[Tuple[str, int, Optional[int]]]:
+        from modules import visualizations
+
+        return [
+            (key, hits, None) for key, hits in visualizations.get_figure_cache_hottest(limit)
+        ]
+
+    def clear(self) -> None:
+        from modules import visualizations
+
+        visualizations.clear_figure_cache()
+
+    def limits(self) -> Dict[str, int]:
+        from modules import visualizations
+
+        return {"max_entries": visualizations.FIGURE_CACHE_MAX_ENTRIES}
+
+    def resize(self, max_entries: Optional[int] = None, **_: int) -> None:
+        from modules import visualizations
+
+        if max_entries is not None:
+            visualizations.set_figure_cache_max_entries(max_entries)
+
+
+class AIResponseCacheAdapter(CacheAdapter):
+    """AI 응답 캐시 (SQLite)"""
+
+    name = "ai"
+    description = "AI 응답 캐시 (SQLite, 프로세스 공유)"
+
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache: 관리할 AIResponseCache (None이면 기본 캐시)
+        """
+        self._cache = cache
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from modules.ai_cache import get_ai_cache
+
+            self._cache = get_ai_cache()
+        return self._cache
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+    def hottest(self, limit: int = 10) -> List[Tuple[str, int, Optional[int]]]:
+        return self.cache.hottest_keys(limit)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def limits(self) -> Dict[str, int]:
+        return {"max_bytes": self.cache.max_bytes}
+
+    def resize(self, max_bytes: Optional[int] = None, **_: int) -> None:
+        if max_bytes is not None:
+            self.cache.resize(max_bytes)
+
+
+class ComputeCacheAdapter(CacheAdapter):
+    """계산 결과 캐시 (SQLite + 메모리 LRU)"""
+
+    name = "compute"
+    description = "계산 결과 캐시 (SQLite + 메모리 LRU, 적중 통계는 이 프로세스 기준)"
+
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache: 관리할 DiskCache (None이면 기본 캐시)
+        """
+        self._cache = cache
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from modules.disk_cache import get_compute_cache
+
+            self._cache = get_compute_cache()
+        return self._cache
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats()
+        return dict(stats, hits=stats["memory_hits"] + stats["disk_hits"])
+
+    def hottest(self, limit: int = 10) -> List[Tuple[str, int, Optional[int]]]:
+        return self.cache.hottest_keys(limit)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def limits(self) -> Dict[str, int]:
+        return {
+            "max_bytes": self.cache.max_bytes,
+            "memory_entries": self.cache.memory_entries,
+        }
+
+    def resize(
+        self, max_bytes: Optional[int] = None, memory_entries: Optional[int] = None, **_: int
+    ) -> None:
+        self.cache.resize(max_bytes=max_bytes, memory_entries=memory_entries)
+
+
+_registry: Dict[str, CacheAdapter] = {}
+_registry_lock = threading.Lock()
+
+
+def register_cache(adapter: CacheAdapter) -> None:
+    """
+    관리 대상 캐시 등록 (같은 이름이면 교체)
+
+    Args:
+        adapter: 등록할 캐시 어댑터
+    """
+    with _registry_lock:
+        _registry[adapter.name] = adapter
+
+
+def get_registered_caches() -> Dict[str, CacheAdapter]:
+    """
+    등록된 캐시 목록 반환 (처음 호출 시 기본 캐시 등록)
+
+    Returns:
+        Dict[str, CacheAdapter]: 이름별 캐시 어댑터
+    """
+    with _registry_lock:
+        for adapter_class in (FigureCacheAdapter, AIResponseCacheAdapter, ComputeCacheAdapter):
+            _registry.setdefault(adapter_class.name, adapter_class())
+        return dict(_registry)
@@ -4,9 +4,22 @@
 소득, 지출, 자산 기반 계산 로직을 구현합니다.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Sequence
 import math
 
+import numpy as np
+
+from modules.cashflow_schedule import build_cashflow_schedule
+from modules.disk_cache import cached
+from modules.life_events import compile_life_events
+from modules.payroll import calculate_net_income
+from modules.portfolio import (
+    ASSET_CLASSES,
+    PortfolioModel,
+    asset_item_value_and_return,
+    build_portfolio_model,
+)
+
 
 def apply_inflation(value: float, years: int, inflation_rate: float = 2.5) -> float:
     """
@@ -43,74 +56,11 @@ def calculate_portfolio_return_rate(
     if not asset_items or total_assets <= 0:
         return 0.0
 
-    # 총 자산은 이미 원 단위
-    total_assets_won = total_assets
-
     total_weighted_return = 0.0
     total_weight = 0.0
 
     for item in asset_items:
-        asset_type = item.get("type", "")
-        weight = 0.0
-        annual_return = 0.0
-
-        if asset_type == "예금":
-            principal = item.get("amount", 0)  # 원 단위
-            rate = item.get("rate", 0.0)
-            annual_return = rate
-            weight = principal
-
-        elif asset_type == "적금":
-            monthly_amount = item.get("monthly_amount", 0)  # 원 단위
-            months = item.get("months", 0)
-            rate = item.get("rate", 0.0)
-            # 적금 총액 계산 (이자 포함)
-            if monthly_amount > 0 and months > 0 and rate > 0:
-                is_compound = item.get("is_compound", False)
-                if is_compound:
-                    monthly_rate = rate / 100.0 / 12.0
-                    if monthly_rate > 0:
-                        total_value = (
-                            monthly_amount
-                            * ((1 + monthly_rate) ** (months + 1) - (1 + monthly_rate))
-                            / monthly_rate
-                        )
-                    else:
-                        total_value = monthly_amount * months
-                else:
-                    principal_total = monthly_amount * months
-                    interest = (
-                        monthly_amount
-                        * (rate / 100.0)
-                        / 12.0
-                        * months
-                        * (months + 1)
-                        / 2.0
-                    )
-                    total_value = principal_total + interest
-            else:
-                total_value = monthly_amount * months
-            annual_return = rate
-            weight = total_value
-
-        elif asset_type == "부동산":
-            value = item.get("value", 0)  # 원 단위
-            # 부동산은 일반적으로 인플레이션 수준의 수익률 (보수적으로 2.5% 가정)
-            annual_return = 2.5
-            weight = value
-
-        elif asset_type == "주식":
-            amount = item.get("amount", 0)  # 원 단위
-            return_rate = item.get("return_rate", 0.0)
-            annual_return = return_rate
-            weight = amount
-
-        elif asset_type == "기타":
-            amount = item.get("amount", 0)  # 원 단위
-            return_rate = item.get("return_rate", 0.0)
-            annual_return = return_rate if return_rate > 0 else 0.0
-            weight = amount
-
+        weight, annual_return = asset_item_value_and_return(item)
         if weight > 0:
             total_weighted_return += annual_return * weight
             total_weight += weight
@@ -124,6 +74,25 @@ def calculate_portfolio_return_rate(
     return weighted_avg_return
 
 
+def calculate_annual_income(inputs: Dict[str, Any]) -> float:
+    """
+    연간 소득 계산 (연봉 + 보너스)
+
+    use_net_income이 켜져 있으면 4대보험과 소득세/지방소득세를 뺀 실수령액을 사용합니다.
+    (인적공제 인원은 dependents, 없으면 본인 1명)
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+
+    Returns:
+        float: 연간 소득 (원)
+    """
+    gross_income = inputs.get("salary", 0) + inputs.get("bonus", 0)
+    if inputs.get("use_net_income"):
+        return calculate_net_income(gross_income, inputs.get("dependents", 1))
+    return gross_income
+
+
 def calculate_monthly_savings(inputs: Dict[str, Any]) -> float:
     """
     월 저축 가능액 계산
@@ -134,9 +103,6 @@ def calculate_monthly_savings(inputs: Dict[str, Any]) -> float:
     Returns:
         float: 월 저축 가능액 (원)
     """
-    salary = inputs.get("salary", 0)  # 원 단위
-    bonus = inputs.get("bonus", 0)  # 원 단위
-
     # 기존 필드 호환성 (마이그레이션 지원)
     if "monthly_fixed_expense" in inputs and "monthly_variable_expense" in inputs:
         monthly_fixed_expense = inputs.get("monthly_fixed_expense", 0)  # 원 단위
@@ -166,8 +132,8 @@ def calculate_monthly_savings(inputs: Dict[str, Any]) -> float:
     # 월 지출에 대출 상환액 포함
     monthly_total_expense += total_monthly_debt_payment
 
-    # 월 소득 계산
-    monthly_income = (salary + bonus) / 12  # 원 단위
+    # 월 소득 계산 (use_net_income이면 실수령액 기준)
+    monthly_income = calculate_annual_income(inputs) / 12  # 원 단위
 
     # 월 저축 가능액 (원 단위)
     monthly_savings = monthly_income - monthly_total_expense
@@ -192,8 +158,6 @@ def calculate_financial_health_grade(inputs: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: 재정 건전성 등급 및 상세 정보
     """
-    salary = inputs.get("salary", 0)
-    bonus = inputs.get("bonus", 0)
     total_assets = inputs.get("total_assets", 0)
     total_debt = inputs.get("total_debt", 0)
 
@@ -222,7 +186,7 @@ def calculate_financial_health_grade(inputs: Dict[str, Any]) -> Dict[str, Any]:
     monthly_total_expense += total_monthly_debt_payment
 
     # 연간 소득 및 지출 계산
-    annual_income = salary + bonus
+    annual_income = calculate_annual_income(inputs)
     annual_expense = monthly_total_expense * 12
 
     # 소득 대비 지출 비율
@@ -383,12 +347,66 @@ def calculate_future_assets(
     )
     actual_years = min(years, years_to_retirement) if years_to_retirement > 0 else years
 
+    # 예금/적금/청약을 만기 일정으로 계산하면 해당 상품은 가중 평균 수익률에서 빼고
+    # 상품 잔액(scheduled_balance)을 따로 관리 (납입/만기는 일반 자산과의 이동)
+    schedule_totals = None
+    scheduled_balance = 0.0
+    pooled_items = asset_items
+    if inputs.get("use_cashflow_schedule"):
+        schedule = build_cashflow_schedule(asset_items, actual_years)
+        schedule_totals = schedule.yearly()
+        pooled_items = schedule.remaining_items
+        portfolio_return_rate = calculate_portfolio_return_rate(
+            pooled_items, current_assets
+        )
+        scheduled_balance = schedule.opening_balance
+        # 총 자산은 예금/적금을 만기 금액으로 합산하므로 상품 몫(booked_value)을 빼서 일반 자산을 구함
+        assets = current_assets - schedule.booked_value
+
+    # 자산군별 포트폴리오: 가중 평균 수익률 대신 자산군별 잔액을 은퇴 후까지 따로 불리고
+    # 매년 순유입(저축, 상환, 인출 등)을 목표 배분대로 반영
+    portfolio = None
+    if inputs.get("portfolio_model"):
+        portfolio, initial_mix = build_portfolio_model(
+            pooled_items,
+            inputs["portfolio_model"],
+            max(actual_years, life_expectancy - current_age),
+            years_to_retirement,
+        )
+        initial_balances = assets * initial_mix
+        class_balances = initial_balances
+
+    # 생애 이벤트를 은퇴 후 기간까지 연도별 변화량 배열로 변환 (월 지출 변화는 인플레이션 반영)
+    timeline = None
+    property_value = 0.0
+    if inputs.get("life_events"):
+        timeline = compile_life_events(
+            inputs["life_events"],
+            current_age,
+            max(actual_years, life_expectancy - current_age),
+        )
+        event_monthly_expense = timeline.expense * (1 + inflation_rate / 100) ** np.arange(
+            1, timeline.years + 1
+        )
+
+    # 실수령액 기준이면 전체 기간의 연봉을 한 번에 세후 금액으로 변환
+    use_net_income = bool(inputs.get("use_net_income"))
+    if use_net_income:
+        projected_gross = salary * (1 + salary_growth_rate / 100) ** np.arange(
+            1, actual_years + 1
+        ) + bonus
+        projected_net = calculate_net_income(projected_gross, inputs.get("dependents", 1))
+
     for year in range(1, actual_years + 1):
         # 연봉 증가 반영
         current_salary = current_salary * (1 + salary_growth_rate / 100)
 
-        # 연간 소득
+        # 연간 소득 (use_net_income이면 실수령액)
         annual_income = current_salary + bonus
+        if use_net_income:
+            annual_income = float(projected_net[year - 1])
+        if timeline is not None:
+            annual_income = timeline.adjust_income(annual_income, year - 1)
 
         # 인플레이션 반영한 월간 지출
         inflated_monthly_fixed = apply_inflation(
@@ -398,6 +416,10 @@ def calculate_future_assets(
             monthly_variable_expense, year, inflation_rate
         )
         inflated_monthly_total = inflated_monthly_fixed + inflated_monthly_variable
+        if timeline is not None:
+            inflated_monthly_total = max(
+                inflated_monthly_total + event_monthly_expense[year - 1], 0.0
+            )
 
         # 대출 상환액 계산 및 원금 상환 반영
         total_monthly_debt_payment = 0.0
@@ -527,6 +549,8 @@ def calculate_future_assets(
         current_total_debt = sum(
             item["principal"] for item in current_debt_items
         ) + max(0, other_debt)
+        if timeline is not None:
+            current_total_debt += timeline.debt_balance[year - 1]
 
         # 월 지출에 대출 상환액 포함 (인플레이션 반영하지 않음 - 대출은 계약금액 기준)
         # 원리금 상환의 경우 원금+이자가 이미 월 상환액에 포함되어 있음
@@ -572,7 +596,11 @@ def calculate_future_assets(
         total_annual_savings = actual_annual_savings
 
         # 자산 증가 (포트폴리오 수익률 반영)
-        if portfolio_return_rate > 0:
+        year_start_assets = assets
+        if portfolio is not None:
+            # 자산군별 수익률은 순유입을 모두 더한 뒤 한 번에 반영
+            assets = assets + total_annual_savings
+        elif portfolio_return_rate > 0:
             assets = assets * (1 + portfolio_return_rate / 100) + total_annual_savings
         else:
             assets = assets + total_annual_savings
@@ -584,9 +612,29 @@ def calculate_future_assets(
         if total_principal_paid_this_year > 0:
             assets = assets - total_principal_paid_this_year
 
+        # 생애 이벤트의 일회성 자산 변화와 이벤트 부채 원리금 상환
+        if timeline is not None:
+            assets = (
+                assets
+                + timeline.asset[year - 1]
+                - timeline.repayment[year - 1]
+                - timeline.debt_interest[year - 1]
+            )
+            property_value = float(timeline.property[year - 1])
+
+        # 상품 납입액은 일반 자산에서 빠지고 만기 금액은 돌아옴
+        if schedule_totals is not None:
+            assets = assets - schedule_totals["net_flow"][year - 1]
+            scheduled_balance = float(schedule_totals["balance"][year - 1])
+
+        if portfolio is not None:
+            portfolio_flow = assets - year_start_assets
+            class_balances = portfolio.step(class_balances, portfolio_flow, year - 1)
+            assets = float(class_balances.sum())
+
         # 순자산 계산 (자산 - 부채)
         # 부채도 원금 상환으로 감소했으므로 순자산은 정확히 계산됨
-        net_assets = assets - current_total_debt
+        net_assets = assets + scheduled_balance + property_value - current_total_debt
 
         # 연도별 상세 내역 저장
         yearly_breakdown.append(
@@ -599,7 +647,7 @@ def calculate_future_assets(
                 "annual_savings": annual_savings,
                 "annual_investment": annual_investment_total,
                 "total_annual_savings": total_annual_savings,
-                "assets": assets,
+                "assets": assets + scheduled_balance + property_value,
                 "total_debt": current_total_debt,
                 "net_assets": net_assets,
                 "debt_payment": total_monthly_debt_payment * 12,
@@ -607,6 +655,24 @@ def calculate_future_assets(
                 "is_retired": False,
             }
         )
+        if use_net_income:
+            yearly_breakdown[-1]["gross_income"] = current_salary + bonus
+        if timeline is not None:
+            yearly_breakdown[-1]["life_events"] = timeline.labels[year - 1]
+            yearly_breakdown[-1]["property_value"] = property_value
+        if portfolio is not None:
+            yearly_breakdown[-1]["portfolio"] = dict(zip(ASSET_CLASSES, class_balances.tolist()))
+            yearly_breakdown[-1]["portfolio_flow"] = portfolio_flow
+        if schedule_totals is not None:
+            yearly_breakdown[-1]["scheduled_balance"] = scheduled_balance
+            yearly_breakdown[-1]["scheduled_interest"] = float(
+                schedule_totals["interest"][year - 1]
+            )
+
+    # 은퇴 후에는 상품 잔액을 일반 자산에 합침
+    assets = assets + scheduled_balance
+    if portfolio is not None:
+        class_balances = class_balances + scheduled_balance * initial_mix
 
     # 은퇴 후 기간 계산 (평균 수명까지)
     if (
@@ -637,6 +703,7 @@ def calculate_future_assets(
         # 은퇴 후 기간 계산
         for year_after in range(1, years_after_retirement + 1):
             total_year = actual_years + year_after
+            year_start_assets = assets
 
             # 은퇴 후에는 소득 없음
             annual_income = 0
@@ -656,10 +723,34 @@ def calculate_future_assets(
             # 연간 지출
             annual_expense = (monthly_expense_inflated + medical_expense_inflated) * 12
 
+            # 생애 이벤트 (은퇴 후 소득, 지출 변화, 일회성 자산 변화, 이벤트 부채 상환)
+            event_labels = None
+            if timeline is not None and total_year <= timeline.years:
+                index = total_year - 1
+                annual_income = timeline.adjust_income(0.0, index)
+                annual_expense = max(annual_expense + event_monthly_expense[index] * 12, 0.0)
+                assets = (
+                    assets
+                    + timeline.asset[index]
+                    - timeline.repayment[index]
+                    - timeline.debt_interest[index]
+                )
+                property_value = float(timeline.property[index])
+                event_labels = timeline.labels[index]
+
             # 자산 감소
-            annual_savings = -annual_expense  # 음수 (지출)
+            annual_savings = annual_income - annual_expense  # 음수면 지출 초과
             assets = assets + annual_savings
 
+            # 은퇴 후에도 자산군별 수익률 반영
+            portfolio_row = None
+            if portfolio is not None and total_year <= portfolio.years:
+                class_balances = portfolio.step(
+                    class_balances, assets - year_start_assets, total_year - 1
+                )
+                assets = float(class_balances.sum())
+                portfolio_row = dict(zip(ASSET_CLASSES, class_balances.tolist()))
+
             # 자산이 0 이하가 되면 중단
             if assets <= 0:
                 assets = 0
@@ -668,13 +759,18 @@ def calculate_future_assets(
                         "year": total_year,
                         "age": retirement_age + year_after,
                         "salary": 0,
-                        "annual_income": 0,
+                        "annual_income": annual_income,
                         "annual_expense": annual_expense,
                         "annual_savings": annual_savings,
-                        "assets": assets,
+                        "assets": assets + property_value,
                         "is_retired": True,
                     }
                 )
+                if event_labels is not None:
+                    yearly_breakdown[-1]["life_events"] = event_labels
+                    yearly_breakdown[-1]["property_value"] = property_value
+                if portfolio_row is not None:
+                    yearly_breakdown[-1]["portfolio"] = dict.fromkeys(ASSET_CLASSES, 0.0)
                 break
 
             # 연도별 상세 내역 저장
@@ -683,24 +779,39 @@ def calculate_future_assets(
                     "year": total_year,
                     "age": retirement_age + year_after,
                     "salary": 0,
-                    "annual_income": 0,
+                    "annual_income": annual_income,
                     "annual_expense": annual_expense,
                     "annual_savings": annual_savings,
-                    "assets": assets,
+                    "assets": assets + property_value,
                     "is_retired": True,
                 }
             )
+            if event_labels is not None:
+                yearly_breakdown[-1]["life_events"] = event_labels
+                yearly_breakdown[-1]["property_value"] = property_value
+            if portfolio_row is not None:
+                yearly_breakdown[-1]["portfolio"] = portfolio_row
+
+    # 이벤트로 취득한 부동산은 인출하지 않고 미래 자산에만 더함
+    assets = assets + property_value
 
     # 총 저축액 계산
     total_savings = assets - current_assets
 
-    return {
+    result = {
         "current_assets": current_assets,
         "future_assets": assets,
         "total_savings": total_savings,
         "yearly_breakdown": yearly_breakdown,
         "years": years,
     }
+    if portfolio is not None:
+        result["portfolio"] = {
+            "classes": list(ASSET_CLASSES),
+            "initial_balances": initial_balances.tolist(),
+            "class_returns": ((portfolio.growth[0] - 1) * 100).tolist(),
+        }
+    return result
 
 
 def calculate_income_interruption_survival(inputs: Dict[str, Any]) -> Dict[str, Any]:
@@ -985,8 +1096,6 @@ def calculate_risk_score(inputs: Dict[str, Any]) -> Dict[str, Any]:
         debt_ratio_score = 30
 
     # 소득 대비 지출 비율 점수 (20점)
-    salary = inputs.get("salary", 0)
-    bonus = inputs.get("bonus", 0)
 
     # 기존 필드 호환성 (마이그레이션 지원)
     if "monthly_fixed_expense" in inputs and "monthly_variable_expense" in inputs:
@@ -999,7 +1108,7 @@ def calculate_risk_score(inputs: Dict[str, Any]) -> Dict[str, Any]:
         annual_fixed_expense = inputs.get("annual_fixed_expense", 0)
         monthly_total_expense = monthly_expense + (annual_fixed_expense / 12)
 
-    annual_income = salary + bonus
+    annual_income = calculate_annual_income(inputs)
     annual_expense = monthly_total_expense * 12
 
     if annual_income > 0:
@@ -1379,6 +1488,216 @@ def calculate_retirement_goal(
     }
 
 
+def calculate_retirement_goal_grid(
+    inputs: Dict[str, Any],
+    monthly_contributions: Sequence[float],
+    annual_return_rates: Sequence[float],
+    withdrawal_rate: float = 4.0,
+) -> Dict[str, Any]:
+    """
+    여러 저축 금액 × 수익률 조합의 은퇴 자금 목표를 한 번에 계산 (벡터화)
+
+    calculate_retirement_goal과 같은 규칙(만원 단위 호환 변환, 수익률 0 이하 처리,
+    수익률과 저축 증가율이 거의 같을 때의 공식)을 numpy 배열 연산으로 적용합니다.
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        monthly_contributions: 매달 저축 금액 목록 (원, 100만원 미만은 만원 단위로 간주)
+        annual_return_rates: 연간 수익률 목록 (%)
+        withdrawal_rate: 현금화율 (%) - 기본값 4%
+
+    Returns:
+        Dict[str, Any]: 은퇴 자금 목표 계산 결과
+            - projected_assets, is_achievable, shortfall, surplus:
+              (저축 금액 수 × 수익률 수) 배열
+            - monthly_contributions: 원 단위로 변환된 저축 금액 배열
+            - annual_return_rates: 수익률 배열
+            - target_assets 등 조합과 무관한 값은 스칼라
+    """
+    current_age = inputs.get("current_age", 30)
+    retirement_age = inputs.get("retirement_age", 60)
+    current_assets = inputs.get("total_assets", 0)  # 원 단위
+    retirement_monthly_expense = inputs.get("retirement_monthly_expense", 0)  # 원 단위
+    retirement_medical_expense = inputs.get("retirement_medical_expense", 0)  # 원 단위
+    inflation_rate = inputs.get("inflation_rate", 2.5)
+    salary_growth_rate = inputs.get("salary_growth_rate", 3.0)
+
+    # 기존 데이터 호환: 만원 단위로 저장된 기존 데이터 변환
+    if retirement_monthly_expense > 0 and retirement_monthly_expense < 1000000:
+        retirement_monthly_expense = retirement_monthly_expense * 10000
+    if retirement_medical_expense > 0 and retirement_medical_expense < 1000000:
+        retirement_medical_expense = retirement_medical_expense * 10000
+
+    # (저축 금액, 1) × (1, 수익률) 형태로 브로드캐스팅
+    contributions = np.asarray(monthly_contributions, dtype=float).reshape(-1, 1)
+    rates = np.asarray(annual_return_rates, dtype=float).reshape(1, -1)
+
+    # 기존 데이터 호환: 100만원 미만이면 만원 단위로 간주
+    contributions = np.where(contributions < 1000000, contributions * 10000, contributions)
+
+    years_to_retirement = retirement_age - current_age
+    grid_shape = (contributions.shape[0], rates.shape[1])
+
+    if years_to_retirement <= 0:
+        projected_assets = np.full(grid_shape, float(current_assets))
+        return {
+            "target_assets": 0,
+            "projected_assets": projected_assets,
+            "is_achievable": np.zeros(grid_shape, dtype=bool),
+            "shortfall": np.zeros(grid_shape),
+            "surplus": np.zeros(grid_shape),
+            "monthly_contributions": contributions.ravel(),
+            "annual_return_rates": rates.ravel(),
+            "years_to_retirement": 0,
+            "error": "은퇴 나이가 현재 나이보다 작거나 같습니다.",
+        }
+
+    monthly_expense_at_retirement = apply_inflation(
+        retirement_monthly_expense + retirement_medical_expense,
+        years_to_retirement,
+        inflation_rate,
+    )
+    annual_expense_needed = monthly_expense_at_retirement * 12
+    target_assets = annual_expense_needed / (withdrawal_rate / 100)
+
+    monthly_return_rate = rates / 100 / 12
+    months_to_retirement = years_to_retirement * 12
+    monthly_growth_rate = salary_growth_rate / 100 / 12
+
+    growth_factor = (1 + monthly_growth_rate) ** months_to_retirement
+    return_factor = (1 + monthly_return_rate) ** months_to_retirement
+    rate_gap = monthly_return_rate - monthly_growth_rate
+
+    # 수익률 > 0: 현재 자산 복리 + 증가하는 저축액의 복리 합
+    # (수익률과 저축 증가율이 거의 같으면 PMT * n * (1+r)^(n-1))
+    close_rates = np.abs(rate_gap) <= 0.0001
+    safe_gap = np.where(close_rates, 1.0, rate_gap)
+    annuity_factor = np.where(
+        close_rates,
+        months_to_retirement * (1 + monthly_return_rate) ** (months_to_retirement - 1),
+        (return_factor - growth_factor) / safe_gap,
+    )
+    positive_projection = current_assets * return_factor + contributions * annuity_factor
+
+    # 수익률 <= 0: 저축액 증가만 반영한 단순 합
+    if monthly_growth_rate > 0:
+        flat_factor = (growth_factor - 1) / monthly_growth_rate
+    else:
+        flat_factor = months_to_retirement
+    flat_projection = current_assets + contributions * flat_factor
+
+    projected_assets = np.where(
+        monthly_return_rate > 0, positive_projection, flat_projection
+    )
+    projected_assets = np.broadcast_to(projected_assets, grid_shape)
+
+    return {
+        "target_assets": target_assets,
+        "projected_assets": projected_assets,
+        "is_achievable": projected_assets >= target_assets,
+        "shortfall": np.maximum(0, target_assets - projected_assets),
+        "surplus": np.maximum(0, projected_assets - target_assets),
+        "monthly_contributions": contributions.ravel(),
+        "annual_return_rates": rates.ravel(),
+        "years_to_retirement": years_to_retirement,
+        "monthly_expense_at_retirement": monthly_expense_at_retirement,
+        "annual_expense_needed": annual_expense_needed,
+        "withdrawal_rate": withdrawal_rate,
+        "current_assets": current_assets,
+    }
+
+
+def blend_allocation_returns(
+    allocation_mixes: Sequence[Dict[str, float]],
+    class_returns: Dict[str, float],
+) -> np.ndarray:
+    """
+    자산 배분 비중별 기대 수익률 계산 (비중 행렬 × 자산군 수익률 벡터)
+
+    비중 합이 1이 아니면 합으로 나누어 정규화하며,
+    class_returns에 없는 자산군은 수익률 0으로 계산합니다.
+
+    Args:
+        allocation_mixes: 자산군별 비중 딕셔너리 목록 (예: {"예금": 0.3, "주식": 0.7})
+        class_returns: 자산군별 연간 기대 수익률 (%)
+
+    Returns:
+        np.ndarray: 배분별 연간 기대 수익률 (%)
+    """
+    classes = sorted({name for mix in allocation_mixes for name in mix})
+    if not classes:
+        return np.zeros(len(allocation_mixes))
+
+    weights = np.array(
+        [[mix.get(name, 0.0) for name in classes] for mix in allocation_mixes],
+        dtype=float,
+    )
+    totals = weights.sum(axis=1, keepdims=True)
+    weights = np.divide(weights, totals, out=np.zeros_like(weights), where=totals > 0)
+    returns = np.array([class_returns.get(name, 0.0) for name in classes], dtype=float)
+    return weights @ returns
+
+
+def compare_portfolio_allocations(
+    inputs: Dict[str, Any],
+    allocations: Sequence[Dict[str, float]],
+    years: int = 10,
+    inflation_rate: float = 2.5,
+) -> Dict[str, Any]:
+    """
+    목표 배분별 미래 자산 비교 (자산군별 포트폴리오, 은퇴 전 기간)
+
+    연도별 순유입(저축, 상환, 이벤트 등)은 배분과 무관하므로 미래 자산 계산은 한 번만 하고,
+    배분 시나리오는 (시나리오 × 연수 × 자산군) 배열로 쌓아 한 번에 계산합니다.
+    리밸런싱, 글라이드 패스, 자산군별 수익률은 inputs["portfolio_model"] 설정을 따릅니다.
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+        allocations: 비교할 목표 배분 목록 (자산군 → 비중)
+        years: 예측 연수
+        inflation_rate: 인플레이션율 (%)
+
+    Returns:
+        Dict[str, Any]: 배분별 미래 자산 (final_assets)과 연도별 자산 (yearly_assets, 시나리오 × 연수)
+    """
+    settings = dict(inputs.get("portfolio_model") or {})
+    base = calculate_future_assets(
+        dict(inputs, portfolio_model=settings or {"rebalance": True}),
+        years=years,
+        inflation_rate=inflation_rate,
+        include_post_retirement=False,
+    )
+    rows = base["yearly_breakdown"]
+    flows = np.array([row["portfolio_flow"] for row in rows])
+    # 상품 잔액과 이벤트 부동산은 배분과 무관하게 더함
+    scheduled = np.array(
+        [row.get("scheduled_balance", 0.0) + row.get("property_value", 0.0) for row in rows]
+    )
+    years_to_retirement = inputs.get("retirement_age", 60) - inputs.get("current_age", 30)
+
+    # 배분별 (연수 × 자산군) 목표 배분을 앞쪽 차원으로 쌓음
+    weights = np.zeros((len(allocations), len(rows), len(ASSET_CLASSES)))
+    for index, allocation in enumerate(allocations):
+        model, _ = build_portfolio_model(
+            [], dict(settings, target_allocation=allocation), len(rows), years_to_retirement
+        )
+        weights[index] = model.weights
+    model = PortfolioModel(
+        weights, base["portfolio"]["class_returns"], rebalance=settings.get("rebalance", True)
+    )
+    balances = model.simulate(
+        np.broadcast_to(base["portfolio"]["initial_balances"], weights.shape[:1] + weights.shape[2:]),
+        np.broadcast_to(flows, weights.shape[:2]),
+    )
+    yearly_assets = balances.sum(axis=-1) + scheduled
+    return {
+        "allocations": list(allocations),
+        "final_assets": yearly_assets[:, -1] if len(rows) else np.zeros(len(allocations)),
+        "yearly_assets": yearly_assets,
+        "years": len(rows),
+    }
+
+
 def find_optimal_contribution_rate(
     inputs: Dict[str, Any], target_return_rate: float, withdrawal_rate: float = 4.0
 ) -> Tuple[float, Dict[str, Any]]:
@@ -1577,3 +1896,13 @@ def find_required_return_rate(
     )
 
     return required_rate, result
+
+
+# 디스크 캐시를 적용한 계산 (페이지처럼 같은 입력으로 반복 호출되는 곳에서 사용)
+# 키에 이 모듈의 소스 버전이 포함되므로 계산 코드가 바뀌면 자동으로 다시 계산됩니다.
+cached_calculate_future_assets = cached("future_assets")(calculate_future_assets)
+cached_calculate_risk_score = cached("risk_score")(calculate_risk_score)
+cached_calculate_retirement_goal = cached("retirement_goal")(calculate_retirement_goal)
+cached_calculate_retirement_goal_grid = cached("retirement_goal_grid")(
+    calculate_retirement_goal_grid
+)
@@ -0,0 +1,352 @@
+"""
+현금흐름 일정 모듈
+
+예금/적금/청약 같은 저축 상품을 하나의 가중 평균 수익률로 뭉치지 않고,
+상품별로 납입(deposit), 이자 인식(interest), 만기 지급(maturity) 이벤트의
+희소 일정으로 변환한 뒤 연도별 배열로 합칩니다.
+
+- 시간 단위는 월이며 0이 현재입니다. 납입은 해당 월 초, 이자/만기는 해당 시점에 발생합니다.
+  음수 월의 납입은 이미 납입한 내역(현재 잔액)으로 취급합니다.
+- 이자는 상품별 누적 이자 C(t)를 닫힌 식으로 계산합니다.
+  단리: C(t) = i × Σ a_j (t - m_j), 복리: C(t) = Σ a_j ((1 + i)^(t - m_j) - 1)  (m_j < t)
+  모든 상품의 납입을 (상품, 월) 순서의 한 배열로 이어 붙이고 누적합과
+  np.searchsorted로 구간 합을 구하므로, 상품 수와 관계없이 한 번의 배열 연산으로 계산합니다.
+- 이자는 매 예측 연도 말과 만기 시점에 인식하고, 만기 금액은 일반 자산으로 돌아갑니다.
+- 입력 폼의 총 자산(total_assets)은 예금/정기 적금을 만기 금액으로 합산하므로,
+  일반 자산은 총 자산에서 상품별 booked 금액(만기 기준 금액 - 남은 납입액)을 빼서 구합니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# 일정으로 변환하는 자산 타입
+SCHEDULED_ASSET_TYPES = ("예금", "적금", "청약")
+
+# 이벤트 종류
+DEPOSIT = 0
+INTEREST = 1
+MATURITY = 2
+
+
+def _monthly_rate(annual_rate: float, is_compound: bool, yearly_compounding: bool) -> float:
+    """연이율(%)을 월 이율로 변환 (예금 복리는 연 복리와 같은 값이 되도록 변환)"""
+    rate = annual_rate / 100.0
+    if is_compound and yearly_compounding:
+        return (1 + rate) ** (1 / 12) - 1
+    return rate / 12
+
+
+def _booked_value(item: Dict[str, Any], future_deposits: float) -> float:
+    """
+    입력 폼 총 자산에 합산된 상품 금액 중 일정이 관리하는 부분
+
+    입력 폼은 예금을 만기 원리금, 정기 적금을 전체 납입액과 이자를 더한 만기 금액,
+    자유적립식 적금/청약을 현재 잔액으로 합산합니다. 정기 적금의 남은 납입액은
+    납입할 때 일반 자산에서 상품으로 옮기므로 빼고, 나머지(현재 잔액 + 앞으로 받을 이자)를 반환합니다.
+    """
+    asset_type = item.get("type", "")
+    rate = float(item.get("rate", 0.0) or 0.0) / 100.0
+    term = int(item.get("months", 0) or 0)
+    is_compound = bool(item.get("is_compound", False))
+
+    if asset_type == "예금":
+        principal = float(item.get("amount", 0) or 0)
+        if principal <= 0 or term <= 0 or rate <= 0:
+            return principal
+        if is_compound:
+            return principal * (1 + rate) ** (term / 12.0)
+        return principal * (1 + rate * term / 12.0)
+
+    if asset_type == "적금" and item.get("deposit_type") != "자유":
+        monthly_amount = float(item.get("monthly_amount", 0) or 0)
+        total = monthly_amount * term
+        if monthly_amount > 0 and term > 0 and rate > 0:
+            monthly_rate = rate / 12.0
+            if is_compound:
+                total = (
+                    monthly_amount
+                    * ((1 + monthly_rate) ** (term + 1) - (1 + monthly_rate))
+                    / monthly_rate
+                )
+            else:
+                total += monthly_amount * monthly_rate * term * (term + 1) / 2.0
+        return total - future_deposits
+
+    return float(item.get("amount", 0) or 0)
+
+
+def compile_asset_item(item: Dict[str, Any], horizon_months: int) -> Optional[Dict[str, Any]]:
+    """
+    자산 항목 하나를 납입 일정으로 변환
+
+    지원하는 항목:
+        - 예금: amount, months (예치 기간, 0이면 만기 없음), rate, is_compound, elapsed_months
+        - 적금 (정기적립식): monthly_amount, months, rate, is_compound, elapsed_months
+        - 적금 (자유적립식, deposit_type="자유"): amount (현재 잔액), monthly_amount (월 납입액),
+          months (만기, 0이면 없음), deposits ([{"month", "amount"}] 비정기 납입), rate, is_compound
+        - 청약: amount (현재 잔액), monthly_amount (회차당 납입액), rate (만기 없음)
+
+    Args:
+        item: 자산 항목
+        horizon_months: 예측 기간 (개월)
+
+    Returns:
+        Optional[Dict[str, Any]]: rate (월 이율), compound, maturity (개월, 없으면 inf),
+            months/amounts/held (납입 월, 금액, 이미 납입 여부), booked (입력 폼 총 자산에
+            합산된 금액 중 일정이 관리하는 부분). 일정으로 만들 수 없거나 이미 만기가 지난 항목은 None
+    """
+    asset_type = item.get("type", "")
+    if asset_type not in SCHEDULED_ASSET_TYPES:
+        return None
+
+    annual_rate = float(item.get("rate", 0.0) or 0.0)
+    is_compound = bool(item.get("is_compound", False))
+    elapsed = max(int(item.get("elapsed_months", 0) or 0), 0)
+    term = int(item.get("months", 0) or 0)
+    months: List[np.ndarray] = []
+    amounts: List[np.ndarray] = []
+    held: List[np.ndarray] = []
+
+    def add(month_array, amount, is_held):
+        month_array = np.asarray(month_array, dtype=np.int64)
+        months.append(month_array)
+        amounts.append(np.broadcast_to(np.asarray(amount, dtype=float), month_array.shape))
+        held.append(np.broadcast_to(np.asarray(is_held, dtype=bool), month_array.shape))
+
+    if asset_type == "예금":
+        if term <= 0 and annual_rate <= 0:
+            return None
+        maturity = term - elapsed if term > 0 else np.inf
+        add([-elapsed], float(item.get("amount", 0) or 0), True)
+        rate = _monthly_rate(annual_rate, is_compound, yearly_compounding=True)
+
+    elif asset_type == "적금" and item.get("deposit_type") != "자유":
+        if term <= 0:
+            return None
+        maturity = term - elapsed
+        paid = np.arange(-elapsed, term - elapsed)
+        add(paid, float(item.get("monthly_amount", 0) or 0), paid < 0)
+        rate = _monthly_rate(annual_rate, is_compound, yearly_compounding=False)
+
+    else:
+        # 자유적립식 적금과 청약은 현재 잔액 + 정기 납입 + 비정기 납입
+        maturity = term - elapsed if asset_type == "적금" and term > 0 else np.inf
+        last_month = int(min(maturity, horizon_months))
+        add([0], float(item.get("amount", 0) or 0), True)
+        add(np.arange(0, max(last_month, 0)), float(item.get("monthly_amount", 0) or 0), False)
+        extra = [
+            (int(deposit.get("month", 0)), float(deposit.get("amount", 0)))
+            for deposit in item.get("deposits", []) or []
+            if 0 <= int(deposit.get("month", 0)) < last_month
+        ]
+        if extra:
+            add([month for month, _ in extra], [amount for _, amount in extra], False)
+        rate = _monthly_rate(annual_rate, is_compound, yearly_compounding=False)
+
+    if maturity <= 0:
+        return None
+
+    months_array = np.concatenate(months)
+    order = np.argsort(months_array, kind="stable")
+    amounts_array = np.concatenate(amounts)[order]
+    held_array = np.concatenate(held)[order]
+    keep = amounts_array != 0
+    future_deposits = float(amounts_array[~held_array].sum())
+    return {
+        "rate": rate,
+        "compound": is_compound,
+        "maturity": float(maturity),
+        "months": months_array[order][keep],
+        "amounts": amounts_array[keep],
+        "held": held_array[keep],
+        "booked": _booked_value(item, future_deposits),
+    }
+
+
+class CashflowSchedule:
+    """
+    여러 저축 상품의 희소 이벤트 일정
+
+    이벤트는 product (상품 번호), month, kind (DEPOSIT/INTEREST/MATURITY), amount 배열로 보관하며
+    yearly()로 예측 연도별 합계 배열을 만듭니다.
+    """
+
+    def __init__(
+        self,
+        products: List[Dict[str, Any]],
+        years: int,
+        remaining_items: Optional[List[Dict[str, Any]]] = None,
+    ):
+        """
+        Args:
+            products: compile_asset_item() 결과 목록
+            years: 예측 연수
+            remaining_items: 일정으로 변환하지 않은 자산 항목 (가중 평균 수익률 계산용)
+        """
+        self.years = max(int(years), 0)
+        self.horizon_months = self.years * 12
+        self.product_count = len(products)
+        self.remaining_items = list(remaining_items or [])
+        # 입력 폼 총 자산에 합산된 상품 금액 (일반 자산 = 총 자산 - booked_value)
+        self.booked_value = float(sum(product.get("booked", 0.0) for product in products))
+        self._build(products)
+
+    def _build(self, products: List[Dict[str, Any]]) -> None:
+        """모든 상품의 이벤트를 한 번의 배열 연산으로 계산"""
+        horizon = self.horizon_months
+        count = self.product_count
+        empty_int = np.zeros(0, dtype=np.int64)
+        empty_float = np.zeros(0, dtype=float)
+        if count == 0:
+            self.opening_balances = empty_float
+            self.product, self.month, self.kind, self.amount = (
+                empty_int, empty_int, empty_int, empty_float
+            )
+            return
+
+        rate = np.array([product["rate"] for product in products])
+        compound = np.array([product["compound"] for product in products], dtype=bool)
+        maturity = np.array([product["maturity"] for product in products])
+        lengths = [len(product["months"]) for product in products]
+        dep_product = np.repeat(np.arange(count), lengths)
+        dep_month = np.concatenate([product["months"] for product in products])
+        dep_amount = np.concatenate([product["amounts"] for product in products])
+        dep_held = np.concatenate([product["held"] for product in products])
+
+        # 평가 시점: 현재(0), 만기 전 연도 말, 예측 기간 안의 만기
+        year_ends = 12 * np.arange(1, self.years + 1)
+        points = np.column_stack(
+            [
+                np.zeros(count),
+                np.broadcast_to(year_ends, (count, self.years)),
+                np.where(np.isfinite(maturity), maturity, 0),
+            ]
+        )
+        valid = np.column_stack(
+            [
+                np.ones(count, dtype=bool),
+                year_ends[None, :] < maturity[:, None],
+                maturity <= horizon,
+            ]
+        )
+        point_product = np.nonzero(valid)[0]
+        point_month = points[valid].astype(np.int64)
+
+        # (상품, 월) 키로 정렬된 납입 배열의 누적합으로 m_j < t 구간 합 계산
+        shift = max(int(-dep_month.min()), 0) if len(dep_month) else 0
+        key_width = max(horizon, int(dep_month.max()) if len(dep_month) else 0) + shift + 2
+        dep_key = dep_product * key_width + dep_month + shift
+        growth = 1 + rate[dep_product]
+        discounted = np.where(
+            compound[dep_product], dep_amount * growth ** (-dep_month.astype(float)), 0.0
+        )
+
+        def prefix(values):
+            return np.concatenate([[0.0], np.cumsum(values)])
+
+        cum_amount = prefix(dep_amount)
+        cum_weighted = prefix(dep_amount * dep_month)
+        cum_discounted = prefix(discounted)
+        start = np.searchsorted(dep_key, point_product * key_width, side="left")
+        end = np.searchsorted(dep_key, point_product * key_width + point_month + shift, side="left")
+        sum_amount = cum_amount[end] - cum_amount[start]
+        sum_weighted = cum_weighted[end] - cum_weighted[start]
+        sum_discounted = cum_discounted[end] - cum_discounted[start]
+
+        point_rate = rate[point_product]
+        accrued = np.where(
+            compound[point_product],
+            (1 + point_rate) ** point_month * sum_discounted - sum_amount,
+            point_rate * (point_month * sum_amount - sum_weighted),
+        )
+
+        # 첫 시점(현재)은 기존 잔액, 이후 시점은 직전 시점 대비 이자
+        is_opening = point_month == 0
+        held_total = np.bincount(
+            dep_product, weights=np.where(dep_held, dep_amount, 0.0), minlength=count
+        )
+        self.opening_balances = held_total + accrued[is_opening]
+
+        interest = np.diff(accrued, prepend=0.0)[~is_opening]
+        future_product = point_product[~is_opening]
+        future_month = point_month[~is_opening]
+        at_maturity = future_month == maturity[future_product]
+
+        deposit_mask = ~dep_held & (dep_month >= 0) & (dep_month < horizon)
+        self.product = np.concatenate(
+            [dep_product[deposit_mask], future_product, future_product[at_maturity]]
+        )
+        self.month = np.concatenate(
+            [dep_month[deposit_mask], future_month, future_month[at_maturity]]
+        )
+        self.kind = np.concatenate(
+            [
+                np.full(int(deposit_mask.sum()), DEPOSIT),
+                np.full(len(future_product), INTEREST),
+                np.full(int(at_maturity.sum()), MATURITY),
+            ]
+        )
+        self.amount = np.concatenate(
+            [
+                dep_amount[deposit_mask],
+                interest,
+                (sum_amount + accrued)[~is_opening][at_maturity],
+            ]
+        )
+
+    @property
+    def opening_balance(self) -> float:
+        """현재 시점 상품 잔액 합계 (이미 납입한 금액 + 쌓인 이자)"""
+        return float(self.opening_balances.sum())
+
+    def yearly(self) -> Dict[str, np.ndarray]:
+        """
+        예측 연도별 합계
+
+        Returns:
+            Dict[str, np.ndarray]: 길이 years 배열
+                - deposits: 상품 납입액 (일반 자산에서 상품으로 이동)
+                - interest: 인식한 이자
+                - maturities: 만기 지급액 (상품에서 일반 자산으로 이동)
+                - net_flow: deposits - maturities (일반 자산에서 빠져나가는 금액)
+                - balance: 연말 상품 잔액 합계
+        """
+        # 납입은 월 초, 이자/만기는 시점 기준이라 연도 경계가 다름
+        year = np.where(self.kind == DEPOSIT, self.month // 12, (self.month - 1) // 12)
+        totals = {}
+        for name, kind in (("deposits", DEPOSIT), ("interest", INTEREST), ("maturities", MATURITY)):
+            mask = self.kind == kind
+            totals[name] = np.bincount(
+                year[mask], weights=self.amount[mask], minlength=self.years
+            )[: self.years]
+        totals["net_flow"] = totals["deposits"] - totals["maturities"]
+        totals["balance"] = self.opening_balance + np.cumsum(
+            totals["net_flow"] + totals["interest"]
+        )
+        return totals
+
+
+def build_cashflow_schedule(
+    asset_items: Optional[List[Dict[str, Any]]], years: int
+) -> CashflowSchedule:
+    """
+    자산 항목 목록을 하나의 현금흐름 일정으로 변환
+
+    Args:
+        asset_items: 자산 항목 리스트
+        years: 예측 연수
+
+    Returns:
+        CashflowSchedule: 일정으로 변환한 상품의 이벤트와 나머지 항목(remaining_items)
+    """
+    horizon_months = max(int(years), 0) * 12
+    products = []
+    remaining_items = []
+    for item in asset_items or []:
+        product = compile_asset_item(item, horizon_months)
+        if product is None:
+            remaining_items.append(item)
+        else:
+            products.append(product)
+    return CashflowSchedule(products, years, remaining_items)
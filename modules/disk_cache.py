@@ -0,0 +1,440 @@
+"""
+계산 결과 디스크 캐시 모듈
+
+미래 자산 추정, 위험도 점수, 은퇴 목표 그리드처럼 비용이 큰 계산 결과를
+SQLite 파일에 pickle로 저장합니다. 서버를 재시작하거나 배포해도 자주 쓰는 결과가
+남아 있고, 같은 서버의 여러 Streamlit 워커 프로세스가 결과를 공유합니다.
+
+- 키: 함수 이름공간 + 인자 지문(fingerprint) + 계산 엔진(modules.calculations) 소스 버전
+- 프로세스 안에서는 작은 LRU 메모리 캐시가 앞단에서 디스크 조회를 줄임
+- 메모리/디스크 모두 pickle 바이트로 보관하여 호출마다 새 객체를 반환 (수정해도 안전)
+- 전체 크기가 제한을 넘으면 오래 사용하지 않은 항목부터 삭제
+- 여러 프로세스 동시 접근은 SQLite WAL 모드와 잠금 대기로 처리하며,
+  캐시 오류가 나도 계산은 그대로 진행
+
+환경 변수:
+    COMPUTE_CACHE_ENABLED: "0"이면 캐시를 사용하지 않음 (기본값: 사용)
+    COMPUTE_CACHE_DIR: 캐시 디렉토리 (기본값: 프로젝트 루트의 .cache/compute)
+    COMPUTE_CACHE_MAX_BYTES: 디스크 캐시 최대 크기 (bytes, 기본값 200MB)
+    COMPUTE_CACHE_MEMORY_ENTRIES: 메모리 캐시 최대 항목 수 (기본값 256)
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from modules.hashing import fingerprint, get_engine_version
+from modules.lazy_imports import load_dotenv_once
+from modules.singleflight import SingleFlight
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 기본 설정값
+DEFAULT_COMPUTE_CACHE_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_COMPUTE_CACHE_MEMORY_ENTRIES = 256
+
+# 크기 제한 초과 시 이 비율까지 줄임 (매 저장마다 정리하지 않도록)
+EVICTION_TARGET_RATIO = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    engine_version TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access);
+"""
+
+_MISSING = object()
+
+
+class DiskCache:
+    """
+    SQLite 기반 계산 결과 캐시 (메모리 LRU 앞단 포함)
+
+    키에 엔진 버전이 들어가므로 계산 코드가 바뀌면 이전 결과는 조회되지 않고,
+    정리 시 먼저 삭제됩니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        memory_entries: Optional[int] = None,
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (None이면 COMPUTE_CACHE_DIR 환경 변수 또는 .cache/compute)
+            max_bytes: 디스크 캐시 최대 크기 (bytes)
+            memory_entries: 메모리 캐시 최대 항목 수 (0이면 메모리 캐시 사용 안 함)
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv("COMPUTE_CACHE_DIR") or PROJECT_ROOT / ".cache" / "compute"
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / "results.sqlite3"
+        self.max_bytes = int(
+            max_bytes
+            if max_bytes is not None
+            else os.getenv("COMPUTE_CACHE_MAX_BYTES", DEFAULT_COMPUTE_CACHE_MAX_BYTES)
+        )
+        self.memory_entries = int(
+            memory_entries
+            if memory_entries is not None
+            else os.getenv("COMPUTE_CACHE_MEMORY_ENTRIES", DEFAULT_COMPUTE_CACHE_MEMORY_ENTRIES)
+        )
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        # 메모리 적중은 디스크에 기록하지 않으므로 프로세스 안에서 따로 셈
+        self._memory_key_hits: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(_SCHEMA)
+                    columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+                    if "hits" not in columns:
+                        # 적중 횟수 컬럼이 없던 이전 캐시 파일
+                        conn.execute(
+                            "ALTER TABLE entries ADD COLUMN hits INTEGER NOT NULL DEFAULT 0"
+                        )
+                    self._initialized = True
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            self._trim_memory()
+
+    def _trim_memory(self) -> None:
+        """메모리 캐시 최대 항목 수 유지 (self._lock 안에서 호출)"""
+        while len(self._memory) > self.memory_entries:
+            key, _ = self._memory.popitem(last=False)
+            self._memory_key_hits.pop(key, None)
+
+    def make_key(self, namespace: str, *values: Any) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            namespace: 함수 이름 등 구분자
+            *values: 결과를 결정하는 값들 (인자)
+
+        Returns:
+            str: 캐시 키 (엔진 버전 포함)
+        """
+        return f"{namespace}:{get_engine_version()}:{fingerprint(*values, length=40)}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        캐시된 값 조회 (메모리 → 디스크 순)
+
+        Args:
+            key: make_key로 만든 키
+            default: 없을 때 반환할 값
+
+        Returns:
+            Any: 캐시된 값 (새로 복원한 객체) 또는 default
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                self._memory_key_hits[key] = self._memory_key_hits.get(key, 0) + 1
+        if data is not None:
+            return pickle.loads(data)
+
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                        (time.time(), key),
+                    )
+        except sqlite3.Error:
+            self._count("errors")
+            row = None
+
+        if row is None:
+            self._count("misses")
+            return default
+        self._count("disk_hits")
+        self._remember(key, row[0])
+        return pickle.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        값 저장 후 크기 제한에 맞게 정리 (저장 실패 시 메모리 캐시에만 보관)
+
+        Args:
+            key: make_key로 만든 키
+            value: 저장할 값 (pickle 가능해야 함)
+        """
+        self._store(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _store(self, key: str, data: bytes) -> None:
+        """pickle된 값을 메모리와 디스크에 저장"""
+        self._remember(key, data)
+        namespace, engine_version = key.split(":", 2)[:2]
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(key, namespace, engine_version, value, size, created_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (key, namespace, engine_version, data, len(data), now, now),
+                    )
+                    self._evict(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            self._count("errors")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """크기 제한을 넘으면 다른 엔진 버전 항목, 오래 사용하지 않은 항목 순으로 삭제"""
+        total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+
+        evicted = conn.execute(
+            "DELETE FROM entries WHERE engine_version != ?", (get_engine_version(),)
+        ).rowcount
+        total_size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        if total_size > target:
+            stale_keys = []
+            for key, size in conn.execute(
+                "SELECT key, size FROM entries ORDER BY last_access ASC"
+            ).fetchall():
+                if total_size <= target:
+                    break
+                stale_keys.append((key,))
+                total_size -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", stale_keys)
+            evicted += len(stale_keys)
+        self._count("evictions", evicted)
+
+    def hottest_keys(self, limit: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        적중 횟수가 많은 항목 목록 (디스크 적중 + 이 프로세스의 메모리 적중)
+
+        Args:
+            limit: 반환할 최대 개수
+
+        Returns:
+            List[Tuple[str, int, int]]: (키, 적중 횟수, 크기) 목록
+        """
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT key, hits, size FROM entries ORDER BY hits DESC LIMIT ?",
+                    (limit,),
+                ).fetchall()
+                sizes = {key: size for key, _, size in rows}
+                with self._lock:
+                    memory_hits = dict(self._memory_key_hits)
+                for key in memory_hits.keys() - sizes.keys():
+                    row = conn.execute(
+                        "SELECT size FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        rows.append((key, 0, row[0]))
+        except sqlite3.Error:
+            return []
+
+        ranked = [(key, hits + memory_hits.get(key, 0), size) for key, hits, size in rows]
+        return sorted(ranked, key=lambda item: -item[1])[:limit]
+
+    def resize(
+        self, max_bytes: Optional[int] = None, memory_entries: Optional[int] = None
+    ) -> None:
+        """
+        최대 크기 변경 후 바로 정리
+
+        Args:
+            max_bytes: 디스크 캐시 최대 크기 (bytes, None이면 유지)
+            memory_entries: 메모리 캐시 최대 항목 수 (None이면 유지)
+        """
+        if memory_entries is not None:
+            with self._lock:
+                self.memory_entries = max(0, int(memory_entries))
+                self._trim_memory()
+        if max_bytes is not None:
+            self.max_bytes = int(max_bytes)
+            try:
+                with closing(self._connect()) as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    self._evict(conn)
+                    conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._count("errors")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 디스크 항목 수/크기, 메모리 항목 수, 이 프로세스의
+                적중(메모리/디스크)/미적중/제거/오류 횟수, 적중률
+        """
+        try:
+            with closing(self._connect()) as conn:
+                entries, total_size = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()
+        except sqlite3.Error:
+            entries, total_size = 0, 0
+
+        with self._lock:
+            stats = dict(self._stats)
+            memory_entries = len(self._memory)
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        return {
+            "entries": entries,
+            "bytes": total_size,
+            "memory_entries": memory_entries,
+            **stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self, memory_only: bool = False) -> None:
+        """
+        캐시 비우기
+
+        Args:
+            memory_only: True이면 이 프로세스의 메모리 캐시만 비움
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_key_hits.clear()
+            for name in self._stats:
+                self._stats[name] = 0
+        if not memory_only:
+            with closing(self._connect()) as conn:
+                conn.execute("DELETE FROM entries")
+
+
+_default_cache: Optional[DiskCache] = None
+_default_cache_lock = threading.Lock()
+
+# 캐시에 없는 같은 키의 계산이 동시에 요청되면 한 번만 실행
+_in_flight = SingleFlight()
+
+
+def get_compute_cache() -> DiskCache:
+    """
+    환경 변수 설정으로 만든 기본 계산 캐시 반환 (프로세스당 하나)
+
+    Returns:
+        DiskCache: 기본 캐시
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            load_dotenv_once()
+            _default_cache = DiskCache()
+        return _default_cache
+
+
+def get_in_flight_stats() -> Dict[str, int]:
+    """
+    계산 합치기 통계 반환
+
+    Returns:
+        Dict[str, int]: 직접 계산 횟수, 합쳐진 호출 횟수, 계산 중인 키 개수
+    """
+    return _in_flight.stats()
+
+
+def is_compute_cache_enabled() -> bool:
+    """
+    계산 캐시 사용 여부
+
+    Returns:
+        bool: COMPUTE_CACHE_ENABLED가 "0"/"false"가 아니면 True
+    """
+    return os.getenv("COMPUTE_CACHE_ENABLED", "1").strip().lower() not in ("0", "false", "no")
+
+
+def cached(namespace: Optional[str] = None, cache: Optional[DiskCache] = None) -> Callable:
+    """
+    계산 함수 디스크 캐시 데코레이터
+
+    인자의 지문과 계산 엔진 버전이 같으면 저장된 결과를 반환합니다.
+    캐시에 없는 같은 계산이 여러 스레드에서 동시에 요청되면 한 번만 계산하고
+    나머지는 그 결과의 복사본을 받습니다. 예외가 발생한 호출은 저장하지 않습니다.
+
+    Args:
+        namespace: 캐시 키 구분자 (None이면 함수 이름)
+        cache: 사용할 캐시 (None이면 호출 시점의 기본 캐시)
+
+    Returns:
+        Callable: 데코레이터 (적용된 함수의 원본은 .uncached 속성)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = namespace or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not is_compute_cache_enabled():
+                return func(*args, **kwargs)
+            target = cache or get_compute_cache()
+            key = target.make_key(name, args, kwargs)
+            value = target.get(key, _MISSING)
+            if value is _MISSING:
+                (value, data), leader = _in_flight.do(key, compute, target, key, args, kwargs)
+                if not leader:
+                    value = pickle.loads(data)
+            return value
+
+        def compute(target: DiskCache, key: str, args: tuple, kwargs: dict):
+            value = func(*args, **kwargs)
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            target._store(key, data)
+            return value, data
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
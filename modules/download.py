@@ -2,17 +2,52 @@
 다운로드 기능 모듈
 
 계산 결과를 JSON 및 CSV 형식으로 다운로드할 수 있는 기능을 제공합니다.
+
+시나리오 일괄 계산처럼 결과가 큰 경우에는 스트리밍 내보내기 함수
+(write_jsonl, write_csv, write_parquet, write_arrow)를 사용합니다.
+열 단위 결과를 chunk_size 행씩 나누어 기록하므로 사용 메모리가
+전체 행 수가 아니라 청크 크기에 비례합니다.
 """
 
+import csv
+import gzip
+import io
 import json
+import os
+import sys
+import zipfile
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from modules.lazy_imports import optional_import
+
+# pandas, pyarrow(Parquet/Arrow), zstandard(zstd 압축)는 선택 패키지이며
+# 실제로 사용할 때 불러옵니다
+
+# 스트리밍 내보내기 기본 청크 크기 (행)
+DEFAULT_EXPORT_CHUNK_SIZE = 10000
+
+# 스트림 압축 방식 (None: 압축 안 함)
+STREAM_COMPRESSIONS = (None, "gzip", "zstd")
+
+# 압축 방식별 파일 확장자
+COMPRESSION_EXTENSIONS = {None: "", "gzip": ".gz", "zstd": ".zst"}
 
-try:
-    import pandas as pd
-except ImportError:
-    # pandas가 없을 경우를 대비
-    pd = None
+ExportData = Union[Mapping[str, Any], Iterable[Dict[str, Any]]]
+ExportTarget = Union[str, "os.PathLike[str]", BinaryIO]
 
 
 def create_download_data(
@@ -102,6 +137,7 @@ def create_csv_download(
     if not data:
         return ""
     
+    pd = optional_import("pandas")
     if pd is None:
         # pandas가 없을 경우 간단한 CSV 생성
         if isinstance(data[0], dict):
@@ -152,3 +188,340 @@ def get_download_filename(prefix: str, extension: str = "json") -> str:
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     return f"{prefix}_{timestamp}.{extension}"
 
+
+def iter_column_chunks(
+    data: ExportData,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> Iterator[Tuple[List[str], Dict[str, list]]]:
+    """
+    내보낼 데이터를 열 단위 청크로 나누어 반환
+
+    열 단위 데이터(열 이름 → 리스트/numpy 배열, 또는 DataFrame)는 청크 범위만
+    잘라서 변환하고, 행 딕셔너리의 반복자(제너레이터 포함)는 청크 크기만큼씩
+    읽습니다. 행 딕셔너리의 열 순서는 첫 행의 키 순서를 따릅니다.
+
+    Args:
+        data: 열 단위 데이터 또는 행 딕셔너리 반복자
+        chunk_size: 청크당 행 수
+
+    Yields:
+        Tuple[List[str], Dict[str, list]]: (열 이름 목록, 열 이름 → 값 리스트)
+
+    Raises:
+        ValueError: 청크 크기가 0 이하이거나 열 길이가 서로 다른 경우
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+    # DataFrame이 주어졌다면 pandas는 이미 import되어 있음
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(data, pd.DataFrame):
+        data = {str(name): data[name].to_numpy() for name in data.columns}
+
+    if isinstance(data, Mapping):
+        columns = [str(name) for name in data]
+        values = list(data.values())
+        lengths = {len(column) for column in values}
+        if len(lengths) > 1:
+            raise ValueError("모든 열의 길이가 같아야 합니다.")
+        total = lengths.pop() if lengths else 0
+        for start in range(0, total, chunk_size):
+            yield columns, {
+                name: _to_list(column[start:start + chunk_size])
+                for name, column in zip(columns, values)
+            }
+        return
+
+    columns: Optional[List[str]] = None
+    rows = iter(data)
+    while True:
+        chunk_rows = []
+        for row in rows:
+            chunk_rows.append(row)
+            if len(chunk_rows) >= chunk_size:
+                break
+        if not chunk_rows:
+            return
+        if columns is None:
+            columns = [str(name) for name in chunk_rows[0]]
+        yield columns, {
+            name: [row.get(name) for row in chunk_rows] for name in columns
+        }
+
+
+def _to_list(values: Any) -> list:
+    """numpy 배열/Series 조각을 파이썬 값 리스트로 변환"""
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps가 처리하지 못하는 값 (numpy 스칼라/배열, 날짜 등) 변환"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+@contextmanager
+def _open_stream(target: ExportTarget, compression: Optional[str]) -> Iterator[BinaryIO]:
+    """
+    압축 방식에 맞는 바이너리 쓰기 스트림 열기
+
+    경로를 받으면 파일을 직접 열고 닫으며, 파일 객체를 받으면 압축 스트림만
+    닫고 원래 파일 객체는 열어 둡니다 (zip 항목, BytesIO 등에 이어서 쓰기 위함).
+    """
+    if compression not in STREAM_COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+    zstandard = optional_import("zstandard") if compression == "zstd" else None
+    if compression == "zstd" and zstandard is None:
+        raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+
+    owns_file = isinstance(target, (str, os.PathLike))
+    raw = open(target, "wb") if owns_file else target
+    try:
+        if compression == "gzip":
+            # mtime=0: 같은 데이터면 같은 파일이 되도록 고정
+            stream = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0)
+        elif compression == "zstd":
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        else:
+            stream = raw
+        try:
+            yield stream
+        finally:
+            if stream is not raw:
+                stream.close()
+    finally:
+        if owns_file:
+            raw.close()
+
+
+def write_jsonl(
+    data: ExportData,
+    target: ExportTarget,
+    compression: Optional[str] = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> int:
+    """
+    JSON Lines 형식으로 스트리밍 내보내기 (한 줄에 한 행)
+
+    Args:
+        data: 열 단위 데이터 또는 행 딕셔너리 반복자
+        target: 파일 경로 또는 바이너리 파일 객체
+        compression: None, "gzip", "zstd"
+        chunk_size: 청크당 행 수
+
+    Returns:
+        int: 기록한 행 수
+    """
+    written = 0
+    with _open_stream(target, compression) as stream:
+        for columns, chunk in iter_column_chunks(data, chunk_size):
+            lines = [
+                json.dumps(
+                    dict(zip(columns, row)), ensure_ascii=False, default=_json_default
+                )
+                for row in zip(*(chunk[name] for name in columns))
+            ]
+            if lines:
+                stream.write(("\n".join(lines) + "\n").encode("utf-8"))
+                written += len(lines)
+    return written
+
+
+def write_csv(
+    data: ExportData,
+    target: ExportTarget,
+    compression: Optional[str] = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+    encoding: str = "utf-8-sig",
+) -> int:
+    """
+    CSV 형식으로 스트리밍 내보내기
+
+    Args:
+        data: 열 단위 데이터 또는 행 딕셔너리 반복자
+        target: 파일 경로 또는 바이너리 파일 객체
+        compression: None, "gzip", "zstd"
+        chunk_size: 청크당 행 수
+        encoding: 문자 인코딩 (기본값: 엑셀 호환 utf-8-sig)
+
+    Returns:
+        int: 기록한 행 수 (헤더 제외)
+    """
+    written = 0
+    with _open_stream(target, compression) as stream:
+        text = io.TextIOWrapper(stream, encoding=encoding, newline="")
+        writer = csv.writer(text, lineterminator="\n")
+        header_written = False
+        for columns, chunk in iter_column_chunks(data, chunk_size):
+            if not header_written:
+                writer.writerow(columns)
+                header_written = True
+            rows = list(zip(*(chunk[name] for name in columns)))
+            writer.writerows(rows)
+            written += len(rows)
+            text.flush()
+        text.flush()
+        # 래퍼를 닫으면 아래 스트림까지 닫히므로 분리만 함
+        text.detach()
+    return written
+
+
+def _require_pyarrow() -> Any:
+    pa = optional_import("pyarrow")
+    if pa is None:
+        raise ImportError("Parquet/Arrow 내보내기를 사용하려면 pyarrow 패키지가 필요합니다.")
+    return pa
+
+
+def _iter_record_batches(data: ExportData, chunk_size: int) -> Iterator[Any]:
+    """청크를 pyarrow RecordBatch로 변환 (스키마는 첫 청크 기준)"""
+    pa = _require_pyarrow()
+    schema = None
+    for _, chunk in iter_column_chunks(data, chunk_size):
+        if schema is None:
+            batch = pa.RecordBatch.from_pydict(chunk)
+            schema = batch.schema
+        else:
+            batch = pa.RecordBatch.from_pydict(chunk, schema=schema)
+        yield batch
+
+
+def write_parquet(
+    data: ExportData,
+    target: ExportTarget,
+    compression: Optional[str] = "zstd",
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> int:
+    """
+    Parquet 형식으로 스트리밍 내보내기 (청크마다 row group 하나)
+
+    Args:
+        data: 열 단위 데이터 또는 행 딕셔너리 반복자
+        target: 파일 경로 또는 바이너리 파일 객체
+        compression: Parquet 열 압축 방식 ("zstd", "snappy", "gzip", None)
+        chunk_size: 청크(row group)당 행 수
+
+    Returns:
+        int: 기록한 행 수 (데이터가 없으면 0이며 파일을 만들지 않음)
+
+    Raises:
+        ImportError: pyarrow가 설치되지 않은 경우
+    """
+    _require_pyarrow()
+    pq = optional_import("pyarrow.parquet")
+    if isinstance(target, os.PathLike):
+        target = os.fspath(target)
+
+    writer = None
+    written = 0
+    try:
+        for batch in _iter_record_batches(data, chunk_size):
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    target, batch.schema, compression=compression or "none"
+                )
+            writer.write_batch(batch)
+            written += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def write_arrow(
+    data: ExportData,
+    target: ExportTarget,
+    compression: Optional[str] = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+) -> int:
+    """
+    Arrow IPC 스트림 형식으로 스트리밍 내보내기
+
+    Args:
+        data: 열 단위 데이터 또는 행 딕셔너리 반복자
+        target: 파일 경로 또는 바이너리 파일 객체
+        compression: Arrow 버퍼 압축 방식 ("zstd", "lz4", None)
+        chunk_size: 청크(RecordBatch)당 행 수
+
+    Returns:
+        int: 기록한 행 수 (데이터가 없으면 0이며 파일을 만들지 않음)
+
+    Raises:
+        ImportError: pyarrow가 설치되지 않은 경우
+    """
+    pa = _require_pyarrow()
+    if isinstance(target, os.PathLike):
+        target = os.fspath(target)
+
+    writer = None
+    written = 0
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    try:
+        for batch in _iter_record_batches(data, chunk_size):
+            if writer is None:
+                writer = pa.ipc.new_stream(target, batch.schema, options=options)
+            writer.write_batch(batch)
+            written += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def write_zip_bundle(
+    artifacts: Dict[str, Union[str, bytes, Callable[[BinaryIO], Any]]],
+    target: ExportTarget,
+) -> List[str]:
+    """
+    여러 결과물을 하나의 zip 파일로 묶기
+
+    내용이 함수이면 zip 항목 파일 객체를 넘겨 호출하므로 스트리밍 내보내기
+    함수로 항목을 바로 기록할 수 있습니다.
+
+    예:
+        write_zip_bundle({
+            "inputs.json": json_text,
+            "yearly.csv": lambda f: write_csv(rows, f),
+        }, "bundle.zip")
+
+    Args:
+        artifacts: 항목 이름 → 내용 (문자열, bytes, 또는 파일 객체를 받는 함수)
+        target: 파일 경로 또는 바이너리 파일 객체
+
+    Returns:
+        List[str]: 기록한 항목 이름 목록
+    """
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+        for name, content in artifacts.items():
+            if callable(content):
+                with bundle.open(name, "w", force_zip64=True) as entry:
+                    content(entry)
+            else:
+                bundle.writestr(name, content)
+    return list(artifacts)
+
+
+def export_to_bytes(
+    writer: Callable[..., Any],
+    data: Any,
+    **kwargs: Any,
+) -> bytes:
+    """
+    스트리밍 내보내기 결과를 bytes로 반환 (st.download_button 등에 사용)
+
+    Args:
+        writer: write_jsonl, write_csv, write_parquet, write_arrow, write_zip_bundle 중 하나
+        data: writer에 넘길 데이터
+        **kwargs: writer에 넘길 추가 인자
+
+    Returns:
+        bytes: 내보낸 파일 내용
+    """
+    buffer = io.BytesIO()
+    writer(data, buffer, **kwargs)
+    return buffer.getvalue()
@@ -0,0 +1,126 @@
+"""
+해시 유틸리티 모듈
+
+입력 데이터와 계산 결과의 정규화된 해시(지문)와
+계산 엔진 소스 버전을 생성합니다.
+"""
+
+import hashlib
+import importlib.util
+import json
+import math
+from functools import lru_cache
+from typing import Any
+
+
+def _normalize(value: Any) -> Any:
+    """
+    JSON 직렬화가 가능한 정규화된 형태로 변환
+
+    Args:
+        value: 변환할 값
+
+    Returns:
+        Any: 정규화된 값 (dict 키는 문자열, tuple/set은 list)
+    """
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(_normalize(item) for item in value)
+    if isinstance(value, float):
+        # 정수값 float(예: 5000.0)과 int(5000)를 같은 값으로 취급
+        if math.isfinite(value) and value.is_integer():
+            return int(value)
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "Infinity" if value > 0 else "-Infinity"
+        return value
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    # numpy 스칼라 등은 item()으로 파이썬 값으로 변환
+    if hasattr(value, "item"):
+        try:
+            return _normalize(value.item())
+        except (TypeError, ValueError):
+            pass
+    if hasattr(value, "tolist"):
+        return _normalize(value.tolist())
+    return repr(value)
+
+
+def canonical_json(value: Any) -> str:
+    """
+    정규화된 JSON 문자열 생성 (키 정렬, 공백 제거)
+
+    Args:
+        value: 직렬화할 값
+
+    Returns:
+        str: 정규화된 JSON 문자열
+    """
+    return json.dumps(
+        _normalize(value), ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    )
+
+
+def fingerprint(*values: Any, length: int = 16) -> str:
+    """
+    값들의 정규화된 해시(지문) 생성
+
+    같은 내용의 딕셔너리는 키 순서와 관계없이 같은 지문을 갖습니다.
+
+    Args:
+        *values: 해시할 값들
+        length: 반환할 16진수 문자열 길이
+
+    Returns:
+        str: SHA-256 기반 지문
+    """
+    digest = hashlib.sha256(canonical_json(list(values)).encode("utf-8"))
+    return digest.hexdigest()[:length]
+
+
+@lru_cache(maxsize=None)
+def get_source_version(*module_names: str) -> str:
+    """
+    모듈 소스 파일 내용 기반 버전 문자열 생성
+
+    소스 코드가 바뀌면 버전도 바뀌므로 캐시 무효화에 사용합니다.
+
+    Args:
+        *module_names: 모듈 이름 (예: "modules.calculations")
+
+    Returns:
+        str: 소스 내용 해시
+    """
+    digest = hashlib.sha256()
+    for module_name in module_names:
+        spec = importlib.util.find_spec(module_name)
+        digest.update(module_name.encode("utf-8"))
+        if spec is not None and spec.origin and spec.origin.endswith(".py"):
+            with open(spec.origin, "rb") as source_file:
+                digest.update(source_file.read())
+    return digest.hexdigest()[:16]
+
+
+# 계산 엔진 모듈 (계산 결과에 영향을 주는 모듈은 모두 포함해야 캐시가 무효화됨)
+ENGINE_MODULES = (
+    "modules.calculations",
+    "modules.payroll",
+    "modules.cashflow_schedule",
+    "modules.life_events",
+    "modules.portfolio",
+)
+
+
+def get_engine_version() -> str:
+    """
+    계산 엔진(ENGINE_MODULES) 소스 버전 반환
+
+    Returns:
+        str: 계산 엔진 버전 해시
+    """
+    return get_source_version(*ENGINE_MODULES)
@@ -0,0 +1,103 @@
+"""
+지연 import 모듈
+
+plotly, pandas, pyarrow, dotenv처럼 import 비용이 큰 패키지를 모듈 로드 시점이
+아니라 처음 사용할 때 불러옵니다. 페이지 첫 실행과 재실행 시 필요 없는
+패키지를 불러오는 시간을 줄이기 위해 사용합니다.
+
+사용 예:
+    go = LazyModule("plotly.graph_objects")   # 여기서는 import하지 않음
+    fig = go.Figure()                         # 처음 접근할 때 import
+
+    pd = optional_import("pandas")            # 없으면 None
+"""
+
+import importlib
+import threading
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+_dotenv_loaded = False
+_dotenv_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def optional_import(name: str) -> Optional[ModuleType]:
+    """
+    선택 패키지 import (설치되지 않았으면 None)
+
+    결과를 캐시하므로 없는 패키지도 import를 한 번만 시도합니다.
+
+    Args:
+        name: 모듈 이름 (예: "pandas", "pyarrow.parquet")
+
+    Returns:
+        Optional[ModuleType]: 모듈 (없으면 None)
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+class LazyModule:
+    """
+    처음 속성에 접근할 때 모듈을 import하는 대리 객체
+
+    모듈이 없으면 fallback이 만든 객체를 대신 사용합니다.
+    """
+
+    def __init__(self, name: str, fallback: Optional[Callable[[], Any]] = None):
+        """
+        Args:
+            name: 모듈 이름
+            fallback: 모듈이 없을 때 대신 사용할 객체를 만드는 함수
+        """
+        self._name = name
+        self._fallback = fallback
+        self._module: Any = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Any:
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    module = optional_import(self._name)
+                    if module is None:
+                        if self._fallback is None:
+                            raise ImportError(f"{self._name} 모듈을 찾을 수 없습니다.")
+                        module = self._fallback()
+                    self._module = module
+        return self._module
+
+    @property
+    def is_loaded(self) -> bool:
+        """모듈을 이미 불러왔는지 여부"""
+        return self._module is not None
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+def load_dotenv_once() -> None:
+    """
+    .env 파일을 환경 변수로 한 번만 불러오기
+
+    환경 변수를 처음 읽는 곳(AI 활성화 확인, AI 클라이언트/캐시 생성)에서 호출합니다.
+    python-dotenv가 없으면 아무것도 하지 않습니다.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    with _dotenv_lock:
+        if _dotenv_loaded:
+            return
+        dotenv = optional_import("dotenv")
+        if dotenv is not None:
+            dotenv.load_dotenv()
+        _dotenv_loaded = True
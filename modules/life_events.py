@@ -0,0 +1,237 @@
+"""
+생애 이벤트 모듈
+
+결혼, 출산, 주택 구입, 실직처럼 특정 나이에 일어나는 이벤트를
+예측 연도별 변화량 배열로 변환합니다.
+
+- 이벤트는 시작 나이부터 종료 나이까지 소득/지출을 바꾸는 기간 효과와
+  시작 나이에 한 번 자산/부채/부동산을 바꾸는 일회성 효과를 가집니다.
+- 이벤트의 시작/종료 경계를 정렬된 이벤트 큐(heapq)에서 연도 순으로 꺼내면서
+  누적 변화량을 갱신하고, 경계 사이 구간은 np.repeat로 채웁니다.
+  계산 비용은 이벤트 수 × log(이벤트 수) + 연수이며, 예측 루프는 연도별 배열 값만 더합니다.
+- 부동산 취득액은 수익률로 운용하는 유동 자산에 넣지 않고 연 PROPERTY_GROWTH_RATE로
+  평가한 별도 배열로 관리하며, 이벤트 대출은 금리(loan_rate)로 원리금 균등 상환합니다.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# 이벤트로 취득한 부동산의 연간 가치 상승률 (%, 보유 부동산 자산과 같은 가정)
+PROPERTY_GROWTH_RATE = 2.5
+
+# 이벤트 타입별 기본값과 설명 (입력 폼에서 사용, 금액은 원 단위)
+LIFE_EVENT_PRESETS = {
+    "결혼": {
+        "expense_change": 500000,
+        "asset_change": -20000000,
+        "description": "생활비 증가와 결혼 비용 (자산 변화에 축의금을 더할 수 있습니다)",
+    },
+    "출산": {
+        "expense_change": 1000000,
+        "duration": 20,
+        "description": "자녀 양육비 (기간 동안 월 지출 증가)",
+    },
+    "주택 구입": {
+        "property_change": 300000000,
+        "asset_change": -100000000,
+        "debt_change": 200000000,
+        "loan_rate": 4.0,
+        "duration": 30,
+        "description": "부동산 취득 = 주택 가격 (유동 자산과 별도로 연 2.5% 상승 가정), "
+        "자산 변화 = 현금 지출, 부채 증가 = 주택담보대출 (기간 동안 대출 금리로 원리금 균등 상환)",
+    },
+    "실직": {
+        "income_change_rate": -100.0,
+        "duration": 1,
+        "description": "기간 동안 소득 감소 (-100%면 소득 없음)",
+    },
+    "기타": {"description": "소득/지출/자산/부채 변화를 직접 입력"},
+}
+
+# 기간 효과 필드 (시작 나이 ~ 종료 나이, 자산/부채 변화는 시작 나이에 한 번)
+RANGED_FIELDS = ("income_change_rate", "income_change", "expense_change")
+
+
+class LifeEventTimeline:
+    """
+    예측 연도별 생애 이벤트 변화량
+
+    모든 배열은 길이 years이며 인덱스 i는 (current_age + i + 1)세 연도입니다.
+
+    Attributes:
+        income_rate: 소득 변화율 합계 (%)
+        income: 연간 소득 변화액 (원)
+        expense: 월 지출 변화액 (원, 현재 가치)
+        asset: 일회성 자산 변화액 (원)
+        property: 이벤트로 취득한 부동산의 연말 평가액 (원, 유동 자산과 별도)
+        debt_balance: 이벤트 부채 잔액 (원)
+        repayment: 이벤트 부채 원금 상환액 (원)
+        debt_interest: 이벤트 부채 이자 (원)
+        labels: 연도별 시작하는 이벤트 이름 목록
+    """
+
+    def __init__(self, years: int):
+        """
+        Args:
+            years: 예측 연수
+        """
+        self.years = max(int(years), 0)
+        self.income_rate = np.zeros(self.years)
+        self.income = np.zeros(self.years)
+        self.expense = np.zeros(self.years)
+        self.asset = np.zeros(self.years)
+        self.property = np.zeros(self.years)
+        self.debt_balance = np.zeros(self.years)
+        self.repayment = np.zeros(self.years)
+        self.debt_interest = np.zeros(self.years)
+        self.labels: List[List[str]] = [[] for _ in range(self.years)]
+
+    def adjust_income(self, annual_income: float, index: int) -> float:
+        """연간 소득에 index 연도의 소득 변화를 반영 (0 미만이면 0)"""
+        return max(
+            annual_income * (1 + self.income_rate[index] / 100) + self.income[index], 0.0
+        )
+
+
+def _event_range(event: Dict[str, Any], current_age: int, years: int):
+    """이벤트의 (시작 인덱스, 종료 인덱스 + 1, 예측 기간으로 자르기 전 종료 인덱스 + 1) 계산"""
+    start_age = int(event.get("start_age", current_age) or current_age)
+    end_age = event.get("end_age") or None
+    start = max(start_age - current_age - 1, 0)
+    full_stop = years if end_age is None else int(end_age) - current_age
+    stop = min(full_stop, years)
+    if start >= years or stop <= start:
+        return None
+    return start, stop, full_stop
+
+
+def _loan_schedule(debt: float, annual_rate: float, years: int, term: Optional[int]):
+    """
+    이벤트 대출의 연도별 (연초 잔액, 연말 잔액)
+
+    Args:
+        debt: 대출 원금
+        annual_rate: 연 금리 (%)
+        years: 계산할 연수
+        term: 상환 기간 (년, None이면 상환 없이 이자만 납입)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 길이 years인 연초/연말 잔액 (원리금 균등 상환)
+    """
+    rate = annual_rate / 100.0
+    elapsed = np.arange(1, years + 1, dtype=float)
+    if term is None:
+        closing = np.full(years, debt)
+    elif rate > 0:
+        growth = (1 + rate) ** elapsed
+        payment = debt * rate / (1 - (1 + rate) ** -term)
+        closing = debt * growth - payment * (growth - 1) / rate
+    else:
+        closing = debt * (1 - elapsed / term)
+    closing = np.maximum(closing, 0.0)
+    opening = np.concatenate([[debt], closing[:-1]])
+    return opening, closing
+
+
+def compile_life_events(
+    events: Optional[List[Dict[str, Any]]], current_age: int, years: int
+) -> LifeEventTimeline:
+    """
+    생애 이벤트 목록을 연도별 변화량 배열로 변환
+
+    Args:
+        events: 이벤트 리스트. 각 이벤트는
+            - name, type: 이름, 타입 (LIFE_EVENT_PRESETS 키)
+            - start_age: 시작 나이 (현재 나이면 첫 해부터)
+            - end_age: 종료 나이 (포함, 없으면 예측 끝까지)
+            - income_change_rate: 기간 동안 소득 변화율 (%)
+            - income_change: 기간 동안 연간 소득 변화액 (원)
+            - expense_change: 기간 동안 월 지출 변화액 (원, 현재 가치)
+            - asset_change: 시작 연도 유동 자산 변화액 (원)
+            - property_change: 시작 연도 부동산 취득액 (원, 유동 자산과 별도로 평가)
+            - debt_change: 시작 연도 부채 증가액 (원, end_age가 있으면 기간 동안 원리금 균등 상환)
+            - loan_rate: 이벤트 부채 연 금리 (%, 0이면 무이자)
+        current_age: 현재 나이
+        years: 예측 연수
+
+    Returns:
+        LifeEventTimeline: 연도별 변화량
+    """
+    timeline = LifeEventTimeline(years)
+    years = timeline.years
+    if not events or years == 0:
+        return timeline
+
+    # 정렬된 이벤트 큐: (경계 인덱스, 순번, 필드 → 변화량)
+    queue = []
+    property_added = np.zeros(years)
+    for order, event in enumerate(events):
+        span = _event_range(event, current_age, years)
+        if span is None:
+            continue
+        start, stop, full_stop = span
+        # 일회성 효과는 이미 지난 이벤트면 반영하지 않음
+        is_upcoming = int(event.get("start_age", current_age) or current_age) >= current_age
+
+        ranged = {
+            field: float(event.get(field, 0) or 0)
+            for field in RANGED_FIELDS
+            if event.get(field)
+        }
+        if ranged:
+            queue.append((start, order, ranged))
+            queue.append((stop, order, {field: -value for field, value in ranged.items()}))
+
+        if is_upcoming:
+            timeline.asset[start] += float(event.get("asset_change", 0) or 0)
+            property_added[start] += float(event.get("property_change", 0) or 0)
+            timeline.labels[start].append(event.get("name") or event.get("type") or "이벤트")
+
+            # 부채는 이벤트마다 상환 일정이 달라 구간별로 직접 더함 (부채 이벤트는 소수)
+            debt_change = float(event.get("debt_change", 0) or 0)
+            if debt_change > 0:
+                opening, closing = _loan_schedule(
+                    debt_change,
+                    float(event.get("loan_rate", 0) or 0),
+                    stop - start,
+                    full_stop - start if event.get("end_age") else None,
+                )
+                timeline.debt_balance[start:stop] += closing
+                timeline.repayment[start:stop] += opening - closing
+                timeline.debt_interest[start:stop] += opening * float(
+                    event.get("loan_rate", 0) or 0
+                ) / 100
+
+    heapq.heapify(queue)
+    levels = {field: 0.0 for field in RANGED_FIELDS}
+    boundaries = [0]
+    segments = {field: [0.0] for field in levels}
+    while queue:
+        index, _, changes = heapq.heappop(queue)
+        for field, value in changes.items():
+            levels[field] += value
+        # 같은 경계의 변화를 모두 반영한 뒤 다음 구간 값 기록
+        if queue and queue[0][0] == index:
+            continue
+        if index == boundaries[-1]:
+            for field in levels:
+                segments[field][-1] = levels[field]
+        elif index < years:
+            boundaries.append(index)
+            for field in levels:
+                segments[field].append(levels[field])
+
+    lengths = np.diff(boundaries + [years])
+    for field, attribute in (
+        ("income_change_rate", "income_rate"),
+        ("income_change", "income"),
+        ("expense_change", "expense"),
+    ):
+        setattr(timeline, attribute, np.repeat(segments[field], lengths))
+
+    # 부동산 평가액: 취득 시점부터 연 PROPERTY_GROWTH_RATE로 상승 (취득 연도는 취득가)
+    growth = (1 + PROPERTY_GROWTH_RATE / 100) ** np.arange(years)
+    timeline.property = growth * np.cumsum(property_added / growth)
+    return timeline
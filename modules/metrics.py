@@ -0,0 +1,502 @@
+"""
+계산 지표(metrics) 수집 모듈
+
+safe_calculate를 거치는 모든 계산의 소요 시간, 입력 크기(예측 기간, 항목 수),
+성공/실패 여부와 예외 종류를 프로세스 내 레지스트리에 히스토그램/카운터로
+누적합니다. 누적된 지표는 Prometheus 텍스트 또는 JSON으로 내보낼 수 있습니다.
+
+환경 변수:
+    METRICS_ENABLED: "0"이면 수집하지 않음 (기본값: 수집)
+    METRICS_EXPORT_PATH: 지표를 주기적으로 기록할 파일 경로 (.json이면 JSON, 그 외 Prometheus)
+    METRICS_EXPORT_INTERVAL: 파일 기록 주기 (초, 기본값 30)
+    METRICS_PORT: 지표 HTTP 서버 포트 (/metrics, /metrics.json, 설정하지 않으면 사용 안 함)
+    METRICS_HOST: 지표 HTTP 서버 주소 (기본값 127.0.0.1)
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+# 소요 시간 히스토그램 구간 (초)
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+# 입력 크기 히스토그램 구간 (예측 기간 년수, 항목 수)
+DEFAULT_SIZE_BUCKETS = (0, 1, 2, 5, 10, 20, 30, 50, 100, 200, 500)
+
+# 입력 데이터에서 개수를 세는 항목 목록 필드
+ITEM_FIELDS = {
+    "debt": "debt_items",
+    "asset": "asset_items",
+    "fixed_expense": "fixed_expense_items",
+    "variable_expense": "variable_expense_items",
+}
+
+DEFAULT_METRICS_EXPORT_INTERVAL = 30.0
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram과 같은 구조)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        """
+        Args:
+            buckets: 구간 상한 목록 (오름차순, +Inf는 자동 추가)
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        # 값이 상한과 같으면 해당 구간에 포함 (le: less than or equal)
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list:
+        """구간별 누적 개수 (마지막은 +Inf)"""
+        total = 0
+        cumulative = []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    def quantile(self, q: float) -> float:
+        """
+        구간 경계로 추정한 분위수 (구간 내 선형 보간)
+
+        Args:
+            q: 0~1 사이 분위
+
+        Returns:
+            float: 추정값 (관측값이 없으면 0)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        lower = 0.0
+        for upper, cumulative, count in zip(
+            self.buckets, self.cumulative_counts(), self.counts
+        ):
+            if cumulative >= rank and count:
+                return lower + (upper - lower) * (rank - (cumulative - count)) / count
+            lower = upper
+        return self.buckets[-1] if self.buckets else 0.0
+
+
+class MetricsRegistry:
+    """프로세스 내 지표 레지스트리 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self.created_at = time.time()
+
+    @staticmethod
+    def _label_key(labels: Optional[Dict[str, Any]]) -> LabelKey:
+        return tuple(sorted((key, str(value)) for key, value in (labels or {}).items()))
+
+    def describe(self, name: str, help_text: str) -> None:
+        """지표 설명 등록 (Prometheus HELP 줄)"""
+        self._help[name] = help_text
+
+    def increment(
+        self, name: str, labels: Optional[Dict[str, Any]] = None, amount: float = 1
+    ) -> None:
+        """카운터 증가"""
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        labels: Optional[Dict[str, Any]] = None,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """히스토그램에 값 기록"""
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        """모든 지표 삭제"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.created_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 지표를 JSON으로 변환 가능한 딕셔너리로 반환
+
+        Returns:
+            Dict[str, Any]: counters, histograms (레이블, count, sum, 구간별 누적 개수,
+                p50/p95/p99 추정값), created_at, exported_at
+        """
+        with self._lock:
+            counters = {
+                name: [
+                    {"labels": dict(key), "value": value}
+                    for key, value in sorted(series.items())
+                ]
+                for name, series in sorted(self._counters.items())
+            }
+            histograms = {
+                name: [
+                    {
+                        "labels": dict(key),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "buckets": dict(
+                            zip(
+                                [str(bound) for bound in histogram.buckets] + ["+Inf"],
+                                histogram.cumulative_counts(),
+                            )
+                        ),
+                        "p50": histogram.quantile(0.5),
+                        "p95": histogram.quantile(0.95),
+                        "p99": histogram.quantile(0.99),
+                    }
+                    for key, histogram in sorted(series.items())
+                ]
+                for name, series in sorted(self._histograms.items())
+            }
+        return {
+            "created_at": self.created_at,
+            "exported_at": time.time(),
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+    def to_json(self) -> str:
+        """JSON 문자열로 내보내기"""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식(0.0.4)으로 내보내기"""
+        lines = []
+        snapshot = self.snapshot()
+        for name, series in snapshot["counters"].items():
+            self._append_header(lines, name, "counter")
+            for sample in series:
+                lines.append(f"{name}{_format_labels(sample['labels'])} {_format_value(sample['value'])}")
+        for name, series in snapshot["histograms"].items():
+            self._append_header(lines, name, "histogram")
+            for sample in series:
+                for bound, cumulative in sample["buckets"].items():
+                    labels = dict(sample["labels"], le=bound)
+                    lines.append(f"{name}_bucket{_format_labels(labels)} {cumulative}")
+                labels = _format_labels(sample["labels"])
+                lines.append(f"{name}_sum{labels} {_format_value(sample['sum'])}")
+                lines.append(f"{name}_count{labels} {sample['count']}")
+        return "\n".join(lines) + "\n"
+
+    def _append_header(self, lines: list, name: str, metric_type: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+    def write(self, path: Union[str, Path], fmt: Optional[str] = None) -> Path:
+        """
+        지표를 파일로 기록 (임시 파일에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않음)
+
+        Args:
+            path: 파일 경로
+            fmt: "json" 또는 "prometheus" (None이면 확장자로 판단)
+
+        Returns:
+            Path: 기록한 파일 경로
+        """
+        path = Path(path)
+        if fmt is None:
+            fmt = "json" if path.suffix == ".json" else "prometheus"
+        content = self.to_json() if fmt == "json" else self.to_prometheus()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(content, encoding="utf-8")
+        os.replace(temp_path, path)
+        return path
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape_label_value(value)}"' for key, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+_default_registry = MetricsRegistry()
+_default_registry.describe(
+    "calculation_duration_seconds", "safe_calculate를 거친 계산 소요 시간"
+)
+_default_registry.describe(
+    "calculation_calls_total", "safe_calculate 호출 수 (결과, 예외 종류별)"
+)
+_default_registry.describe(
+    "calculation_input_horizon_years", "계산 입력의 예측 기간 (년)"
+)
+_default_registry.describe("calculation_input_items", "계산 입력의 항목 수 (종류별)")
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    기본 지표 레지스트리 반환 (프로세스당 하나)
+
+    Returns:
+        MetricsRegistry: 기본 레지스트리
+    """
+    return _default_registry
+
+
+def is_metrics_enabled() -> bool:
+    """
+    지표 수집 여부
+
+    Returns:
+        bool: METRICS_ENABLED가 "0"/"false"가 아니면 True
+    """
+    return os.getenv("METRICS_ENABLED", "1").strip().lower() not in ("0", "false", "no")
+
+
+def describe_input_size(args: Sequence[Any], kwargs: Dict[str, Any]) -> Dict[str, int]:
+    """
+    계산 인자에서 입력 크기 추출
+
+    첫 번째 입력 딕셔너리(current_age가 있는 dict)의 은퇴까지 기간과 항목 수,
+    years 인자가 있으면 그 값을 예측 기간으로 사용합니다.
+
+    Args:
+        args: 계산 함수 위치 인자
+        kwargs: 계산 함수 키워드 인자
+
+    Returns:
+        Dict[str, int]: horizon (없으면 생략), 항목 종류별 개수
+    """
+    size: Dict[str, int] = {}
+    inputs = next(
+        (
+            value
+            for value in list(args) + list(kwargs.values())
+            if isinstance(value, dict) and "current_age" in value
+        ),
+        None,
+    )
+    if inputs is not None:
+        try:
+            horizon = int(inputs.get("retirement_age", 0)) - int(inputs.get("current_age", 0))
+            size["horizon"] = max(0, horizon)
+        except (TypeError, ValueError):
+            pass
+        for kind, field in ITEM_FIELDS.items():
+            items = inputs.get(field)
+            if isinstance(items, (list, tuple)):
+                size[kind] = len(items)
+
+    years = kwargs.get("years")
+    if isinstance(years, int) and not isinstance(years, bool):
+        size["horizon"] = years
+    return size
+
+
+def record_calculation(
+    function_name: str,
+    duration: float,
+    success: bool,
+    exception_type: Optional[str] = None,
+    input_size: Optional[Dict[str, int]] = None,
+    registry: Optional[MetricsRegistry] = None,
+) -> None:
+    """
+    계산 한 건의 지표 기록
+
+    Args:
+        function_name: 계산 함수 이름
+        duration: 소요 시간 (초)
+        success: 성공 여부
+        exception_type: 실패 시 예외 클래스 이름
+        input_size: describe_input_size 결과
+        registry: 기록할 레지스트리 (None이면 기본 레지스트리)
+    """
+    registry = registry or _default_registry
+    status = "success" if success else "error"
+    registry.observe(
+        "calculation_duration_seconds",
+        duration,
+        {"function": function_name, "status": status},
+    )
+    registry.increment(
+        "calculation_calls_total",
+        {"function": function_name, "status": status, "exception": exception_type or ""},
+    )
+    for kind, value in (input_size or {}).items():
+        if kind == "horizon":
+            registry.observe(
+                "calculation_input_horizon_years",
+                value,
+                {"function": function_name},
+                DEFAULT_SIZE_BUCKETS,
+            )
+        else:
+            registry.observe(
+                "calculation_input_items",
+                value,
+                {"function": function_name, "kind": kind},
+                DEFAULT_SIZE_BUCKETS,
+            )
+
+
+def start_metrics_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    registry: Optional[MetricsRegistry] = None,
+) -> "ThreadingHTTPServer":
+    """
+    지표 HTTP 서버를 백그라운드 스레드로 시작
+
+    GET /metrics: Prometheus 텍스트, GET /metrics.json: JSON
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+        registry: 내보낼 레지스트리 (None이면 기본 레지스트리)
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (server_address로 포트 확인, shutdown()으로 종료)
+    """
+    # http.server는 import 비용이 커서 서버를 켤 때만 불러옴
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    registry = registry or _default_registry
+
+    class MetricsRequestHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            if path == "/metrics.json":
+                body = registry.to_json().encode("utf-8")
+                content_type = "application/json; charset=utf-8"
+            elif path == "/metrics":
+                body = registry.to_prometheus().encode("utf-8")
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name="metrics-server", daemon=True
+    ).start()
+    return server
+
+
+class MetricsFileExporter:
+    """지표를 일정 주기로 파일에 기록하는 백그라운드 스레드"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        interval: float = DEFAULT_METRICS_EXPORT_INTERVAL,
+        fmt: Optional[str] = None,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Args:
+            path: 기록할 파일 경로
+            interval: 기록 주기 (초)
+            fmt: "json" 또는 "prometheus" (None이면 확장자로 판단)
+            registry: 내보낼 레지스트리 (None이면 기본 레지스트리)
+        """
+        self.path = Path(path)
+        self.interval = interval
+        self.fmt = fmt
+        self.registry = registry or _default_registry
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-exporter", daemon=True
+        )
+
+    def start(self) -> "MetricsFileExporter":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """중지하고 마지막으로 한 번 기록"""
+        self._stopped.set()
+        self._thread.join(timeout=5)
+        self.registry.write(self.path, self.fmt)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.registry.write(self.path, self.fmt)
+            except OSError as e:
+                print(f"지표 파일 기록 오류: {e}")
+
+
+_exporters_started = False
+_exporters_lock = threading.Lock()
+
+
+def start_metrics_exporters_from_env() -> Dict[str, Any]:
+    """
+    환경 변수 설정에 따라 파일 기록/HTTP 서버 시작 (프로세스당 한 번)
+
+    Returns:
+        Dict[str, Any]: 시작한 exporter (file_exporter, server), 이미 시작했으면 빈 딕셔너리
+    """
+    global _exporters_started
+    with _exporters_lock:
+        if _exporters_started:
+            return {}
+        _exporters_started = True
+
+    started: Dict[str, Any] = {}
+    export_path = os.getenv("METRICS_EXPORT_PATH")
+    if export_path:
+        interval = float(os.getenv("METRICS_EXPORT_INTERVAL", DEFAULT_METRICS_EXPORT_INTERVAL))
+        started["file_exporter"] = MetricsFileExporter(export_path, interval).start()
+
+    port = os.getenv("METRICS_PORT")
+    if port:
+        started["server"] = start_metrics_server(
+            os.getenv("METRICS_HOST", "127.0.0.1"), int(port)
+        )
+    return started
@@ -0,0 +1,281 @@
+"""
+실수령액 계산 모듈
+
+세전 연봉에서 4대보험(국민연금, 건강보험, 장기요양보험, 고용보험) 근로자 부담분과
+근로소득세, 지방소득세를 빼서 실수령액을 계산합니다.
+
+- 세율/공제 구간은 모듈 로드 시 누적값을 미리 계산한 구간표(BracketTable)로 보관하고,
+  값 하나는 bisect, 배열은 np.searchsorted로 구간을 찾습니다.
+- 같은 함수에 연도별 연봉 배열이나 (프로필 수 × 연도 수) 배열을 넣으면
+  한 번의 배열 연산으로 계산하므로 예측 기간 전체에 적용해도 느려지지 않습니다.
+- 소득세는 간이세액표 대신 연말정산 방식
+  (근로소득공제 → 인적공제, 연금보험료공제(국민연금),
+  특별소득공제(건강/장기요양/고용보험료) → 기본세율 → 근로소득세액공제)으로 계산합니다.
+  보험료 특별소득공제를 받으면 표준세액공제(13만원)는 함께 받을 수 없으므로 적용하지 않으며,
+  자녀/의료비 등 개별 공제는 반영하지 않습니다.
+
+기준: 2025년 요율 (원 단위)
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class BracketTable:
+    """
+    구간별 선형 함수 표
+
+    구간 시작점과 구간별 기울기(세율)로 정의하며, 각 구간 시작점의 누적값을
+    미리 계산해 두고 조회 시 구간만 찾아 한 번의 곱셈/덧셈으로 계산합니다.
+    """
+
+    def __init__(
+        self,
+        breakpoints: Sequence[float],
+        rates: Sequence[float],
+        start_value: float = 0.0,
+        limit: float = float("inf"),
+    ):
+        """
+        Args:
+            breakpoints: 구간 시작점 (오름차순, 첫 값 아래는 첫 구간 시작값으로 계산)
+            rates: 구간별 기울기
+            start_value: 첫 구간 시작점의 값
+            limit: 결과 상한
+        """
+        if len(breakpoints) != len(rates):
+            raise ValueError("구간 시작점과 기울기 개수가 같아야 합니다.")
+        self.breakpoints = [float(value) for value in breakpoints]
+        self.rates = [float(rate) for rate in rates]
+        self.limit = float(limit)
+
+        # 구간 시작점의 누적값
+        self.bases = [float(start_value)]
+        for index in range(1, len(self.breakpoints)):
+            width = self.breakpoints[index] - self.breakpoints[index - 1]
+            self.bases.append(self.bases[-1] + self.rates[index - 1] * width)
+
+        self._breakpoints_array = np.array(self.breakpoints)
+        self._rates_array = np.array(self.rates)
+        self._bases_array = np.array(self.bases)
+
+    @classmethod
+    def from_points(cls, points: Sequence[Sequence[float]]) -> "BracketTable":
+        """
+        꺾이는 점 목록으로 생성 (마지막 점 이후는 값 유지)
+
+        Args:
+            points: (x, y) 목록 (x 오름차순)
+
+        Returns:
+            BracketTable: 점 사이를 선형으로 잇는 표
+        """
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        rates = [(ys[i + 1] - ys[i]) / (xs[i + 1] - xs[i]) for i in range(len(xs) - 1)]
+        return cls(xs, rates + [0.0], start_value=ys[0])
+
+    def __call__(self, value: float) -> float:
+        """값 하나 계산 (bisect)"""
+        value = max(value, self.breakpoints[0])
+        index = bisect_right(self.breakpoints, value) - 1
+        result = self.bases[index] + self.rates[index] * (value - self.breakpoints[index])
+        return min(result, self.limit)
+
+    def evaluate(self, values: ArrayLike) -> np.ndarray:
+        """
+        배열 계산 (np.searchsorted)
+
+        Args:
+            values: 입력 배열 (모양 유지)
+
+        Returns:
+            np.ndarray: 계산 결과
+        """
+        values = np.maximum(np.asarray(values, dtype=float), self.breakpoints[0])
+        index = np.searchsorted(self._breakpoints_array, values, side="right") - 1
+        result = self._bases_array[index] + self._rates_array[index] * (
+            values - self._breakpoints_array[index]
+        )
+        return np.minimum(result, self.limit)
+
+
+# 4대보험 근로자 부담 요율 (2025년)
+NATIONAL_PENSION_RATE = 0.045
+NATIONAL_PENSION_MIN_MONTHLY = 400_000  # 기준소득월액 하한
+NATIONAL_PENSION_MAX_MONTHLY = 6_370_000  # 기준소득월액 상한
+HEALTH_INSURANCE_RATE = 0.03545
+HEALTH_INSURANCE_MIN_MONTHLY = 280_383  # 보수월액 하한
+HEALTH_INSURANCE_MAX_MONTHLY = 127_056_982  # 보수월액 상한
+LONG_TERM_CARE_RATE = 0.1295  # 건강보험료 대비
+EMPLOYMENT_INSURANCE_RATE = 0.009
+
+# 소득 공제/세액 공제
+PERSONAL_DEDUCTION = 1_500_000  # 인적공제 (1인당)
+LOCAL_INCOME_TAX_RATE = 0.1  # 지방소득세 (소득세 대비)
+
+# 근로소득공제 (총급여 기준, 한도 2천만원)
+EARNED_INCOME_DEDUCTION = BracketTable(
+    [0, 5_000_000, 15_000_000, 45_000_000, 100_000_000],
+    [0.70, 0.40, 0.15, 0.05, 0.02],
+    limit=20_000_000,
+)
+
+# 종합소득세 기본세율 (과세표준 기준)
+INCOME_TAX = BracketTable(
+    [0, 14_000_000, 50_000_000, 88_000_000, 150_000_000, 300_000_000, 500_000_000, 1_000_000_000],
+    [0.06, 0.15, 0.24, 0.35, 0.38, 0.40, 0.42, 0.45],
+)
+
+# 근로소득세액공제 (산출세액 기준)
+EARNED_INCOME_TAX_CREDIT = BracketTable([0, 1_300_000], [0.55, 0.30])
+
+# 근로소득세액공제 한도 (총급여 기준)
+EARNED_INCOME_TAX_CREDIT_LIMIT = BracketTable.from_points(
+    [
+        (33_000_000, 740_000),
+        (43_000_000, 660_000),
+        (70_000_000, 660_000),
+        (70_320_000, 500_000),
+        (120_000_000, 500_000),
+        (120_600_000, 200_000),
+    ]
+)
+
+
+def _calculate_scalar(gross_annual: float, dependents: int) -> Dict[str, float]:
+    """연봉 하나의 실수령액 계산 (bisect 구간 조회)"""
+    gross_annual = max(float(gross_annual), 0.0)
+    monthly = gross_annual / 12
+
+    pension = health = 0.0
+    if monthly > 0:
+        pension = NATIONAL_PENSION_RATE * 12 * min(
+            max(monthly, NATIONAL_PENSION_MIN_MONTHLY), NATIONAL_PENSION_MAX_MONTHLY
+        )
+        health = HEALTH_INSURANCE_RATE * 12 * min(
+            max(monthly, HEALTH_INSURANCE_MIN_MONTHLY), HEALTH_INSURANCE_MAX_MONTHLY
+        )
+    long_term_care = health * LONG_TERM_CARE_RATE
+    employment = EMPLOYMENT_INSURANCE_RATE * gross_annual
+
+    earned_income = gross_annual - EARNED_INCOME_DEDUCTION(gross_annual)
+    taxable = max(
+        earned_income
+        - PERSONAL_DEDUCTION * dependents
+        - pension
+        - health
+        - long_term_care
+        - employment,
+        0.0,
+    )
+    computed_tax = INCOME_TAX(taxable)
+    credit = min(
+        EARNED_INCOME_TAX_CREDIT(computed_tax), EARNED_INCOME_TAX_CREDIT_LIMIT(gross_annual)
+    )
+    income_tax = max(computed_tax - credit, 0.0)
+
+    return _summarize(gross_annual, pension, health, long_term_care, employment, income_tax)
+
+
+def _calculate_array(gross_annual: np.ndarray, dependents: Any) -> Dict[str, np.ndarray]:
+    """연봉 배열의 실수령액 계산 (np.searchsorted 구간 조회)"""
+    gross_annual = np.maximum(gross_annual, 0.0)
+    monthly = gross_annual / 12
+    has_income = monthly > 0
+
+    pension = np.where(
+        has_income,
+        NATIONAL_PENSION_RATE
+        * np.clip(monthly, NATIONAL_PENSION_MIN_MONTHLY, NATIONAL_PENSION_MAX_MONTHLY)
+        * 12,
+        0.0,
+    )
+    health = np.where(
+        has_income,
+        HEALTH_INSURANCE_RATE
+        * np.clip(monthly, HEALTH_INSURANCE_MIN_MONTHLY, HEALTH_INSURANCE_MAX_MONTHLY)
+        * 12,
+        0.0,
+    )
+    long_term_care = health * LONG_TERM_CARE_RATE
+    employment = EMPLOYMENT_INSURANCE_RATE * gross_annual
+
+    earned_income = gross_annual - EARNED_INCOME_DEDUCTION.evaluate(gross_annual)
+    taxable = np.maximum(
+        earned_income
+        - PERSONAL_DEDUCTION * np.asarray(dependents)
+        - pension
+        - health
+        - long_term_care
+        - employment,
+        0.0,
+    )
+    computed_tax = INCOME_TAX.evaluate(taxable)
+    credit = np.minimum(
+        EARNED_INCOME_TAX_CREDIT.evaluate(computed_tax),
+        EARNED_INCOME_TAX_CREDIT_LIMIT.evaluate(gross_annual),
+    )
+    income_tax = np.maximum(computed_tax - credit, 0.0)
+
+    return _summarize(gross_annual, pension, health, long_term_care, employment, income_tax)
+
+
+def _summarize(gross_annual, pension, health, long_term_care, employment, income_tax):
+    local_income_tax = income_tax * LOCAL_INCOME_TAX_RATE
+    total_deductions = (
+        pension + health + long_term_care + employment + income_tax + local_income_tax
+    )
+    net_annual = gross_annual - total_deductions
+    return {
+        "gross_annual": gross_annual,
+        "national_pension": pension,
+        "health_insurance": health,
+        "long_term_care": long_term_care,
+        "employment_insurance": employment,
+        "income_tax": income_tax,
+        "local_income_tax": local_income_tax,
+        "total_deductions": total_deductions,
+        "net_annual": net_annual,
+        "net_monthly": net_annual / 12,
+    }
+
+
+def calculate_take_home_pay(gross_annual: ArrayLike, dependents: ArrayLike = 1) -> Dict[str, Any]:
+    """
+    세전 연봉의 공제 항목과 실수령액 계산
+
+    Args:
+        gross_annual: 세전 연간 총급여 (원, 연봉 + 보너스). 값 하나 또는 배열
+            (연도별 연봉, 프로필 × 연도 등 임의 모양)
+        dependents: 인적공제 대상 인원 (본인 포함, 배열이면 gross_annual과 브로드캐스트)
+
+    Returns:
+        Dict[str, Any]: 항목별 연간 금액 (입력이 값 하나면 float, 배열이면 같은 모양의 배열)
+            - gross_annual, national_pension, health_insurance, long_term_care,
+              employment_insurance, income_tax, local_income_tax,
+              total_deductions, net_annual, net_monthly
+    """
+    if np.ndim(gross_annual) == 0 and np.ndim(dependents) == 0:
+        return _calculate_scalar(float(gross_annual), max(int(dependents), 1))
+    return _calculate_array(
+        np.asarray(gross_annual, dtype=float), np.maximum(np.asarray(dependents), 1)
+    )
+
+
+def calculate_net_income(gross_annual: ArrayLike, dependents: ArrayLike = 1) -> Any:
+    """
+    세전 연봉의 연간 실수령액
+
+    Args:
+        gross_annual: 세전 연간 총급여 (원, 값 하나 또는 배열)
+        dependents: 인적공제 대상 인원 (본인 포함)
+
+    Returns:
+        Any: 연간 실수령액 (입력이 값 하나면 float, 배열이면 배열)
+    """
+    return calculate_take_home_pay(gross_annual, dependents)["net_annual"]
@@ -0,0 +1,280 @@
+"""
+자산군별 포트폴리오 모듈
+
+자산을 하나의 가중 평균 수익률로 합치지 않고 자산군(예금, 적금, 주식, 부동산, 기타)별
+잔액과 수익률을 따로 관리합니다.
+
+- 목표 배분과 수익률은 (연수 × 자산군) 배열로 미리 만들어 두고, 매년 한 번의 배열 연산으로
+  자산군별 잔액을 불린 뒤 순유입(저축, 상환, 인출)을 배분합니다.
+- 은퇴 시점 목표 배분을 주면 현재 배분에서 은퇴 시점 배분으로 선형으로 옮겨가는
+  글라이드 패스(은퇴가 가까워질수록 위험 자산 축소)를 만듭니다.
+- 연말 리밸런싱을 켜면 매년 말 목표 배분으로 다시 맞춥니다.
+- simulate()는 배분 시나리오 여러 개를 앞쪽 차원으로 쌓아 한 번에 계산하므로
+  배분 비교(what-if)를 예측 전체를 다시 돌리지 않고 계산할 수 있습니다.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 자산군 (배열 열 순서)
+ASSET_CLASSES = ("예금", "적금", "주식", "부동산", "기타")
+
+# 보유 항목이 없는 자산군의 기본 연간 기대 수익률 (%)
+DEFAULT_CLASS_RETURNS = {"예금": 3.0, "적금": 3.5, "주식": 7.0, "부동산": 2.5, "기타": 4.0}
+
+
+def asset_item_value_and_return(item: Dict[str, Any]) -> Tuple[float, float]:
+    """
+    자산 항목의 평가 금액과 연간 수익률
+
+    Args:
+        item: 자산 항목 (예금, 적금, 청약, 부동산, 주식, 기타)
+
+    Returns:
+        Tuple[float, float]: (금액 (원), 연간 수익률 (%)). 알 수 없는 타입은 (0, 0)
+    """
+    asset_type = item.get("type", "")
+
+    if asset_type == "예금":
+        return item.get("amount", 0), item.get("rate", 0.0)
+
+    if asset_type == "청약" or (asset_type == "적금" and item.get("deposit_type") == "자유"):
+        # 자유적립식 적금/청약은 현재 잔액 기준
+        return item.get("amount", 0), item.get("rate", 0.0)
+
+    if asset_type == "적금":
+        monthly_amount = item.get("monthly_amount", 0)  # 원 단위
+        months = item.get("months", 0)
+        rate = item.get("rate", 0.0)
+        # 적금 총액 계산 (이자 포함)
+        if monthly_amount > 0 and months > 0 and rate > 0:
+            if item.get("is_compound", False):
+                monthly_rate = rate / 100.0 / 12.0
+                total_value = (
+                    monthly_amount
+                    * ((1 + monthly_rate) ** (months + 1) - (1 + monthly_rate))
+                    / monthly_rate
+                )
+            else:
+                principal_total = monthly_amount * months
+                interest = monthly_amount * (rate / 100.0) / 12.0 * months * (months + 1) / 2.0
+                total_value = principal_total + interest
+        else:
+            total_value = monthly_amount * months
+        return total_value, rate
+
+    if asset_type == "부동산":
+        # 부동산은 일반적으로 인플레이션 수준의 수익률 (보수적으로 2.5% 가정)
+        return item.get("value", 0), 2.5
+
+    if asset_type == "주식":
+        return item.get("amount", 0), item.get("return_rate", 0.0)
+
+    if asset_type == "기타":
+        return_rate = item.get("return_rate", 0.0)
+        return item.get("amount", 0), return_rate if return_rate > 0 else 0.0
+
+    return 0.0, 0.0
+
+
+def asset_item_class(item: Dict[str, Any]) -> str:
+    """자산 항목의 자산군 (청약은 적금, 알 수 없는 타입은 기타)"""
+    asset_type = item.get("type", "")
+    if asset_type == "청약":
+        return "적금"
+    return asset_type if asset_type in ASSET_CLASSES else "기타"
+
+
+def allocation_vector(allocation: Optional[Dict[str, float]]) -> np.ndarray:
+    """
+    자산군별 비중 딕셔너리를 합이 1인 벡터로 변환
+
+    Args:
+        allocation: 자산군별 비중 (% 또는 비율, 합으로 나누어 정규화)
+
+    Returns:
+        np.ndarray: ASSET_CLASSES 순서의 비중 (비중이 없으면 0 벡터)
+    """
+    weights = np.array(
+        [max(float((allocation or {}).get(name, 0) or 0), 0.0) for name in ASSET_CLASSES]
+    )
+    total = weights.sum()
+    return weights / total if total > 0 else weights
+
+
+def summarize_holdings(
+    asset_items: Optional[List[Dict[str, Any]]],
+    class_returns: Optional[Dict[str, float]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    보유 자산 항목을 자산군별 금액과 수익률로 요약
+
+    Args:
+        asset_items: 자산 항목 리스트
+        class_returns: 자산군별 수익률 지정값 (%, 보유 항목 기준 값보다 우선)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (자산군별 금액, 자산군별 연간 수익률 (%)).
+            보유 항목이 없는 자산군의 수익률은 DEFAULT_CLASS_RETURNS
+    """
+    values = np.zeros(len(ASSET_CLASSES))
+    weighted = np.zeros(len(ASSET_CLASSES))
+    for item in asset_items or []:
+        value, annual_return = asset_item_value_and_return(item)
+        if value > 0:
+            index = ASSET_CLASSES.index(asset_item_class(item))
+            values[index] += value
+            weighted[index] += value * annual_return
+
+    returns = np.array([DEFAULT_CLASS_RETURNS[name] for name in ASSET_CLASSES])
+    returns = np.divide(weighted, values, out=returns, where=values > 0)
+    for name, rate in (class_returns or {}).items():
+        if name in ASSET_CLASSES:
+            returns[ASSET_CLASSES.index(name)] = float(rate)
+    return values, returns
+
+
+def glide_path(
+    start: np.ndarray, end: Optional[np.ndarray], glide_years: int, years: int
+) -> np.ndarray:
+    """
+    연도별 목표 배분 (연수 × 자산군)
+
+    Args:
+        start: 현재 목표 배분
+        end: 은퇴 시점 목표 배분 (None이면 현재 배분 유지)
+        glide_years: 은퇴까지 남은 연수 (이 해에 end에 도달하고 이후 유지)
+        years: 전체 연수
+
+    Returns:
+        np.ndarray: (years, 자산군 수) 비중 배열
+    """
+    if end is None:
+        return np.tile(start, (years, 1))
+    if glide_years <= 0:
+        return np.tile(end, (years, 1))
+    progress = np.minimum(np.arange(1, years + 1) / glide_years, 1.0)
+    return start + progress[:, None] * (end - start)
+
+
+class PortfolioModel:
+    """
+    자산군별 잔액 계산 모델
+
+    weights와 returns는 (연수 × 자산군) 배열이며, 잔액과 순유입은 앞쪽에
+    임의의 배치 차원(배분 시나리오 등)을 둘 수 있습니다.
+    """
+
+    def __init__(self, weights: np.ndarray, returns: np.ndarray, rebalance: bool = True):
+        """
+        Args:
+            weights: 연도별 목표 배분 (연수 × 자산군, 배치 차원 가능)
+            returns: 자산군별 연간 수익률 (%) (자산군 또는 연수 × 자산군)
+            rebalance: 매년 말 목표 배분으로 리밸런싱할지 여부
+        """
+        self.weights = np.asarray(weights, dtype=float)
+        self.years = self.weights.shape[-2]
+        self.growth = 1 + np.broadcast_to(
+            np.asarray(returns, dtype=float), self.weights.shape[-2:]
+        ) / 100
+        self.rebalance = rebalance
+
+    def allocate(self, amount: Any, index: int) -> np.ndarray:
+        """금액을 index 연도의 목표 배분대로 나눔"""
+        return np.asarray(amount, dtype=float)[..., None] * self.weights[..., index, :]
+
+    def step(self, balances: np.ndarray, flow: Any, index: int) -> np.ndarray:
+        """
+        한 해 진행: 자산군별 수익률로 불린 뒤 순유입 반영
+
+        리밸런싱하면 연말 총액을 목표 배분으로 나누고, 하지 않으면 유입은 목표 배분대로,
+        인출은 남은 잔액 비중대로 나눕니다.
+
+        Args:
+            balances: 연초 자산군별 잔액 (..., 자산군)
+            flow: 올해 순유입 (..., 음수면 인출)
+            index: 연도 인덱스 (0부터)
+
+        Returns:
+            np.ndarray: 연말 자산군별 잔액
+        """
+        grown = balances * self.growth[index]
+        flow = np.asarray(flow, dtype=float)
+        if self.rebalance:
+            return self.allocate(grown.sum(axis=-1) + flow, index)
+
+        positive = np.maximum(grown, 0.0)
+        held = positive.sum(axis=-1, keepdims=True)
+        held_share = np.divide(
+            positive, held, out=np.zeros_like(positive), where=held > 0
+        )
+        share = np.where(
+            (flow[..., None] < 0) & (held > 0), held_share, self.weights[..., index, :]
+        )
+        return grown + flow[..., None] * share
+
+    def simulate(self, initial_balances: np.ndarray, flows: Sequence[float]) -> np.ndarray:
+        """
+        연도별 순유입으로 전체 기간 계산
+
+        Args:
+            initial_balances: 현재 자산군별 잔액 (..., 자산군)
+            flows: 연도별 순유입 (길이 연수 이하, 배치 차원 가능)
+
+        Returns:
+            np.ndarray: 연말 자산군별 잔액 (..., len(flows), 자산군)
+        """
+        flows = np.asarray(flows, dtype=float)
+        balances = np.asarray(initial_balances, dtype=float)
+        history = []
+        for index in range(flows.shape[-1]):
+            balances = self.step(balances, flows[..., index], index)
+            history.append(balances)
+        if not history:
+            return np.zeros(balances.shape[:-1] + (0, len(ASSET_CLASSES)))
+        return np.stack(history, axis=-2)
+
+
+def build_portfolio_model(
+    asset_items: Optional[List[Dict[str, Any]]],
+    settings: Dict[str, Any],
+    years: int,
+    years_to_retirement: int,
+) -> Tuple[PortfolioModel, np.ndarray]:
+    """
+    보유 자산과 포트폴리오 설정으로 모델과 현재 배분 생성
+
+    Args:
+        asset_items: 자산 항목 리스트 (현재 배분과 자산군별 수익률 계산)
+        settings: 포트폴리오 설정
+            - target_allocation: 목표 배분 (자산군 → 비중, 없으면 현재 보유 비중)
+            - retirement_allocation: 은퇴 시점 목표 배분 (있으면 글라이드 패스)
+            - rebalance: 매년 리밸런싱 여부 (기본값: True)
+            - class_returns: 자산군별 수익률 지정 (%)
+        years: 전체 연수 (은퇴 후 포함)
+        years_to_retirement: 은퇴까지 남은 연수
+
+    Returns:
+        Tuple[PortfolioModel, np.ndarray]: (모델, 현재 보유 비중 (보유 항목이 없으면 목표 배분))
+    """
+    values, returns = summarize_holdings(asset_items, settings.get("class_returns"))
+    holdings = values / values.sum() if values.sum() > 0 else values
+
+    start = allocation_vector(settings.get("target_allocation"))
+    if not start.any():
+        start = holdings if holdings.any() else allocation_vector({"예금": 1})
+    end = (
+        allocation_vector(settings["retirement_allocation"])
+        if settings.get("retirement_allocation")
+        else None
+    )
+    if end is not None and not end.any():
+        end = None
+
+    model = PortfolioModel(
+        glide_path(start, end, years_to_retirement, max(int(years), 0)),
+        returns,
+        rebalance=bool(settings.get("rebalance", True)),
+    )
+    return model, holdings if holdings.any() else start
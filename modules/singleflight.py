@@ -0,0 +1,97 @@
+"""
+동일 계산 요청 합치기 (single-flight) 모듈
+
+여러 세션이 같은 계산을 동시에 요청하면 (배포 직후 인기 샘플 조회 등)
+처음 요청한 스레드만 계산하고 나머지는 그 결과를 기다려 함께 사용합니다.
+계산이 끝나면 키를 바로 지우므로 결과를 보관하는 캐시는 아닙니다.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+
+# 첫 요청이 Exception이 아닌 이유(KeyboardInterrupt 등)로 중단되었음을 알리는 값
+_ABANDONED = object()
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나로 합치는 실행기 (스레드 안전)
+
+    - 첫 호출(리더)만 함수를 실행하고, 실행 중 들어온 호출은 같은 Future를 기다림
+    - 리더에서 발생한 예외는 기다리던 호출에도 그대로 전달
+    - 리더가 중단되면 기다리던 호출 중 하나가 새로 계산
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self._stats = {"executions": 0, "coalesced": 0}
+
+    def do(self, key: str, func: Callable, *args: Any, **kwargs: Any) -> Tuple[Any, bool]:
+        """
+        키가 같은 실행 중 호출이 있으면 그 결과를, 없으면 직접 실행한 결과를 반환
+
+        Args:
+            key: 호출 구분 키 (같은 결과를 내는 호출은 같은 키)
+            func: 실행할 함수
+            *args: 함수 위치 인자
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            Tuple[Any, bool]: (결과, 직접 실행 여부). 직접 실행하지 않은 호출은
+                리더와 같은 객체를 받으므로 수정하려면 복사해야 함
+        """
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+                    self._stats["executions"] += 1
+                else:
+                    self._stats["coalesced"] += 1
+
+            if not leader:
+                result = future.result()
+                if result is _ABANDONED:
+                    continue
+                return result, False
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                # 키를 먼저 지워야 다시 시도하는 호출이 끝난 Future를 받지 않음
+                self._forget(key)
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.set_result(_ABANDONED)
+                raise
+            self._forget(key)
+            future.set_result(result)
+            return result, True
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            del self._calls[key]
+
+    def in_flight(self) -> int:
+        """
+        실행 중인 키 개수
+
+        Returns:
+            int: 실행 중인 키 개수
+        """
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        실행 통계 반환
+
+        Returns:
+            Dict[str, int]: 직접 실행 횟수, 합쳐진 호출 횟수, 실행 중인 키 개수
+        """
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
@@ -0,0 +1,564 @@
+"""
+프로필/결과 저장소 모듈
+
+입력 프로필(기본 입력, 대출/자산 항목, 입력 폼 상태), 저장한 시나리오, 계산 결과를
+로컬 SQLite(WAL 모드)에 저장합니다. 계산 결과는 정규화된 입력 해시 + 계산 엔진
+버전을 키로 저장하므로, 같은 플랜을 다시 열면 다시 계산하지 않고 불러올 수 있고
+엔진 소스가 바뀌면 자동으로 다시 계산됩니다.
+
+계산 결과는 저장소를 열 때 다른 엔진 버전의 결과를 삭제하고, 행 수가
+max_results를 넘으면 가장 오래 사용하지 않은 결과부터 삭제합니다.
+일괄 실행(ai_bulk)에는 load_profiles_with_results()로 만든 목록을 넘깁니다.
+
+환경 변수:
+    PROFILE_STORE_PATH: DB 파일 경로 (기본값: 프로젝트 루트의 .cache/store/profiles.sqlite3)
+    PROFILE_STORE_MAX_RESULTS: 저장할 계산 결과 최대 행 수 (기본값 5000)
+
+사용 예:
+    store = get_profile_store()
+    store.save_profile("우리집 플랜", inputs)
+    results = store.get_or_compute_results(inputs, "income", compute_income_results)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from modules.hashing import fingerprint, get_engine_version
+from modules.lazy_imports import load_dotenv_once
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 입력 해시 길이 (16진수 문자 수)
+INPUT_HASH_LENGTH = 32
+
+# 기본 설정값
+DEFAULT_MAX_RESULTS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    inputs TEXT NOT NULL,
+    form_state TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS debt_items (
+    profile_id INTEGER NOT NULL REFERENCES profiles (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    principal REAL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (profile_id, position)
+);
+CREATE TABLE IF NOT EXISTS asset_items (
+    profile_id INTEGER NOT NULL REFERENCES profiles (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    amount REAL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (profile_id, position)
+);
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    profile_id INTEGER NOT NULL REFERENCES profiles (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    input_hash TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    UNIQUE (profile_id, name)
+);
+CREATE TABLE IF NOT EXISTS results (
+    input_hash TEXT NOT NULL,
+    engine_version TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (input_hash, engine_version, kind)
+);
+"""
+
+# last_access 열이 없던 기존 DB 보완 후 만드는 인덱스
+_RESULTS_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_results_last_access ON results (last_access)"
+)
+
+# 자주 쓰는 SQL (문자열이 같으면 연결별 prepared statement 캐시를 재사용)
+_UPSERT_PROFILE = (
+    "INSERT INTO profiles (name, inputs, form_state, input_hash, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(name) DO UPDATE SET inputs = excluded.inputs, "
+    "form_state = excluded.form_state, input_hash = excluded.input_hash, "
+    "updated_at = excluded.updated_at"
+)
+_SELECT_PROFILE_ID = "SELECT id FROM profiles WHERE name = ?"
+_SELECT_PROFILE = (
+    "SELECT id, name, inputs, form_state, input_hash, created_at, updated_at "
+    "FROM profiles WHERE name = ?"
+)
+_INSERT_ITEM = (
+    "INSERT INTO {table} (profile_id, position, name, {amount_column}, data) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_SELECT_ITEMS = "SELECT data FROM {table} WHERE profile_id = ? ORDER BY position"
+_SELECT_RESULTS = (
+    "SELECT payload FROM results WHERE input_hash = ? AND engine_version = ? AND kind = ?"
+)
+_TOUCH_RESULTS = (
+    "UPDATE results SET last_access = ? "
+    "WHERE input_hash = ? AND engine_version = ? AND kind = ?"
+)
+_UPSERT_RESULTS = (
+    "INSERT OR REPLACE INTO results "
+    "(input_hash, engine_version, kind, payload, created_at, last_access) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_EVICT_RESULTS = (
+    "DELETE FROM results WHERE rowid IN "
+    "(SELECT rowid FROM results ORDER BY last_access ASC LIMIT ?)"
+)
+
+# 입력 필드 → (테이블, 금액 열 이름)
+ITEM_TABLES = {
+    "debt_items": ("debt_items", "principal"),
+    "asset_items": ("asset_items", "amount"),
+}
+
+
+def _json_default(value: Any) -> Any:
+    """json.dumps가 처리하지 못하는 값 (numpy 스칼라/배열 등) 변환"""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def make_input_hash(inputs: Dict[str, Any]) -> str:
+    """
+    정규화된 입력 해시 생성 (키 순서, 5000.0/5000 차이와 무관)
+
+    Args:
+        inputs: 입력 데이터 딕셔너리
+
+    Returns:
+        str: 입력 해시
+    """
+    return fingerprint(inputs, length=INPUT_HASH_LENGTH)
+
+
+class ProfileStore:
+    """
+    SQLite 기반 프로필/결과 저장소
+
+    - profiles: 이름별 입력 데이터와 입력 폼 상태 (같은 이름으로 저장하면 덮어씀)
+    - debt_items / asset_items: 프로필의 대출/자산 항목 (행 단위)
+    - scenarios: 프로필별로 저장한 시나리오 입력
+    - results: (입력 해시, 엔진 버전, 결과 종류)별 계산 결과
+      (열 때 다른 엔진 버전 결과 삭제, max_results를 넘으면 오래 사용하지 않은 것부터 삭제)
+    - 스레드마다 연결 하나를 재사용하여 prepared statement 캐시를 활용
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        max_results: Optional[int] = None,
+    ):
+        """
+        Args:
+            db_path: DB 파일 경로 (None이면 PROFILE_STORE_PATH 환경 변수 또는 기본 경로)
+            max_results: 저장할 계산 결과 최대 행 수
+        """
+        if db_path is None:
+            db_path = os.getenv("PROFILE_STORE_PATH") or (
+                PROJECT_ROOT / ".cache" / "store" / "profiles.sqlite3"
+            )
+        self.db_path = Path(db_path)
+        self.max_results = int(
+            max_results
+            if max_results is not None
+            else os.getenv("PROFILE_STORE_MAX_RESULTS", DEFAULT_MAX_RESULTS)
+        )
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=10, cached_statements=256)
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._initialized:
+                with self._lock:
+                    if not self._initialized:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_SCHEMA)
+                        self._migrate(conn)
+                        self._initialized = True
+                        self.purge_stale_results(conn=conn)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """이전 스키마로 만든 DB 보완 (results.last_access 열 추가)"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+        if "last_access" not in columns:
+            with conn:
+                conn.execute(
+                    "ALTER TABLE results ADD COLUMN last_access REAL NOT NULL DEFAULT 0"
+                )
+        conn.execute(_RESULTS_INDEX)
+
+    def close(self) -> None:
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # 프로필
+
+    def save_profile(
+        self,
+        name: str,
+        inputs: Dict[str, Any],
+        form_state: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        프로필 저장 (같은 이름이 있으면 덮어씀)
+
+        Args:
+            name: 프로필 이름
+            inputs: 입력 데이터 딕셔너리 (debt_items, asset_items 포함 가능)
+            form_state: 입력 폼을 그대로 복원하기 위한 위젯 상태
+
+        Returns:
+            int: 프로필 ID
+
+        Raises:
+            ValueError: 이름이 비어 있는 경우
+        """
+        name = name.strip()
+        if not name:
+            raise ValueError("프로필 이름을 입력해주세요.")
+
+        now = time.time()
+        # 항목 목록은 별도 테이블에 저장하고 자리만 남김 (불러올 때 같은 입력 해시가 되도록)
+        base_inputs = {
+            key: [] if key in ITEM_TABLES else value for key, value in inputs.items()
+        }
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                _UPSERT_PROFILE,
+                (
+                    name,
+                    _dumps(base_inputs),
+                    _dumps(form_state or {}),
+                    make_input_hash(inputs),
+                    now,
+                    now,
+                ),
+            )
+            profile_id = conn.execute(_SELECT_PROFILE_ID, (name,)).fetchone()[0]
+            for field, (table, amount_column) in ITEM_TABLES.items():
+                conn.execute(f"DELETE FROM {table} WHERE profile_id = ?", (profile_id,))
+                conn.executemany(
+                    _INSERT_ITEM.format(table=table, amount_column=amount_column),
+                    [
+                        (
+                            profile_id,
+                            position,
+                            item.get("name") or item.get("type"),
+                            item.get(amount_column),
+                            _dumps(item),
+                        )
+                        for position, item in enumerate(inputs.get(field) or [])
+                    ],
+                )
+        return profile_id
+
+    def load_profile(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        프로필 불러오기
+
+        Args:
+            name: 프로필 이름
+
+        Returns:
+            Optional[Dict[str, Any]]: id, name, inputs (항목 포함), form_state,
+                input_hash, created_at, updated_at (없으면 None)
+        """
+        conn = self._conn()
+        row = conn.execute(_SELECT_PROFILE, (name,)).fetchone()
+        if row is None:
+            return None
+        profile_id, name, inputs, form_state, input_hash, created_at, updated_at = row
+        inputs = json.loads(inputs)
+        for field, (table, _) in ITEM_TABLES.items():
+            if field in inputs:
+                inputs[field] = [
+                    json.loads(data)
+                    for (data,) in conn.execute(_SELECT_ITEMS.format(table=table), (profile_id,))
+                ]
+        return {
+            "id": profile_id,
+            "name": name,
+            "inputs": inputs,
+            "form_state": json.loads(form_state),
+            "input_hash": input_hash,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """
+        저장된 프로필 목록 (최근 수정 순)
+
+        Returns:
+            List[Dict[str, Any]]: id, name, input_hash, updated_at
+        """
+        rows = self._conn().execute(
+            "SELECT id, name, input_hash, updated_at FROM profiles ORDER BY updated_at DESC"
+        ).fetchall()
+        return [
+            {"id": row[0], "name": row[1], "input_hash": row[2], "updated_at": row[3]}
+            for row in rows
+        ]
+
+    def delete_profile(self, name: str) -> bool:
+        """
+        프로필과 항목, 시나리오 삭제 (계산 결과는 다른 프로필과 공유되므로 유지)
+
+        Args:
+            name: 프로필 이름
+
+        Returns:
+            bool: 삭제 여부
+        """
+        conn = self._conn()
+        with conn:
+            return conn.execute("DELETE FROM profiles WHERE name = ?", (name,)).rowcount > 0
+
+    # 시나리오
+
+    def save_scenario(
+        self, profile_name: str, scenario_name: str, inputs: Dict[str, Any]
+    ) -> None:
+        """
+        프로필에 시나리오 저장 (같은 이름이 있으면 덮어씀)
+
+        Args:
+            profile_name: 프로필 이름
+            scenario_name: 시나리오 이름
+            inputs: 시나리오 입력 데이터
+
+        Raises:
+            KeyError: 프로필이 없는 경우
+        """
+        conn = self._conn()
+        row = conn.execute(_SELECT_PROFILE_ID, (profile_name,)).fetchone()
+        if row is None:
+            raise KeyError(profile_name)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO scenarios "
+                "(profile_id, name, inputs, input_hash, created_at) VALUES (?, ?, ?, ?, ?)",
+                (row[0], scenario_name, _dumps(inputs), make_input_hash(inputs), time.time()),
+            )
+
+    def list_scenarios(self, profile_name: str) -> List[Dict[str, Any]]:
+        """
+        프로필의 시나리오 목록 (저장 순)
+
+        Args:
+            profile_name: 프로필 이름
+
+        Returns:
+            List[Dict[str, Any]]: name, inputs, input_hash
+        """
+        rows = self._conn().execute(
+            "SELECT s.name, s.inputs, s.input_hash FROM scenarios s "
+            "JOIN profiles p ON p.id = s.profile_id WHERE p.name = ? ORDER BY s.id",
+            (profile_name,),
+        ).fetchall()
+        return [
+            {"name": name, "inputs": json.loads(inputs), "input_hash": input_hash}
+            for name, inputs, input_hash in rows
+        ]
+
+    # 계산 결과
+
+    def get_results(
+        self,
+        inputs: Dict[str, Any],
+        kind: str,
+        engine_version: Optional[str] = None,
+    ) -> Optional[Any]:
+        """
+        저장된 계산 결과 조회
+
+        Args:
+            inputs: 입력 데이터 딕셔너리
+            kind: 결과 종류 (예: "income", "risk")
+            engine_version: 계산 엔진 버전 (None이면 현재 버전)
+
+        Returns:
+            Optional[Any]: 저장된 결과 (없으면 None)
+        """
+        key = (make_input_hash(inputs), engine_version or get_engine_version(), kind)
+        conn = self._conn()
+        row = conn.execute(_SELECT_RESULTS, key).fetchone()
+        if row is None:
+            return None
+        with conn:
+            conn.execute(_TOUCH_RESULTS, (time.time(), *key))
+        return json.loads(row[0])
+
+    def put_results(
+        self,
+        inputs: Dict[str, Any],
+        kind: str,
+        results: Any,
+        engine_version: Optional[str] = None,
+    ) -> None:
+        """
+        계산 결과 저장 후 max_results를 넘으면 오래 사용하지 않은 결과부터 삭제
+
+        Args:
+            inputs: 입력 데이터 딕셔너리
+            kind: 결과 종류
+            results: 저장할 결과 (JSON 직렬화 가능)
+            engine_version: 계산 엔진 버전 (None이면 현재 버전)
+        """
+        now = time.time()
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                _UPSERT_RESULTS,
+                (
+                    make_input_hash(inputs),
+                    engine_version or get_engine_version(),
+                    kind,
+                    _dumps(results),
+                    now,
+                    now,
+                ),
+            )
+            total = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if total > self.max_results:
+                conn.execute(_EVICT_RESULTS, (total - self.max_results,))
+
+    def get_or_compute_results(
+        self,
+        inputs: Dict[str, Any],
+        kind: str,
+        compute: Callable[[Dict[str, Any]], Any],
+    ) -> Any:
+        """
+        저장된 결과가 있으면 반환하고, 없으면 계산 후 저장
+
+        Args:
+            inputs: 입력 데이터 딕셔너리
+            kind: 결과 종류
+            compute: 입력 데이터를 받아 결과를 반환하는 계산 함수
+
+        Returns:
+            Any: 계산 결과 (JSON으로 저장했다가 불러온 형태와 같음)
+        """
+        results = self.get_results(inputs, kind)
+        if results is None:
+            results = compute(inputs)
+            self.put_results(inputs, kind, results)
+            # 저장본과 같은 형태로 반환 (튜플 → 리스트 등)
+            results = json.loads(_dumps(results))
+        return results
+
+    def load_profiles_with_results(self, kind: str) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        저장된 결과가 있는 프로필의 (입력 데이터, 계산 결과) 목록
+
+        ai_bulk.run_bulk_insights 등 일괄 실행에 바로 넘길 수 있는 형태입니다.
+
+        Args:
+            kind: 결과 종류
+
+        Returns:
+            List[Tuple[Dict[str, Any], Any]]: (입력 데이터, 계산 결과) 목록
+        """
+        profiles = []
+        for summary in self.list_profiles():
+            profile = self.load_profile(summary["name"])
+            results = self.get_results(profile["inputs"], kind)
+            if results is not None:
+                profiles.append((profile["inputs"], results))
+        return profiles
+
+    def purge_stale_results(
+        self,
+        engine_version: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
+    ) -> int:
+        """
+        현재 엔진 버전이 아닌 결과 삭제 (저장소를 처음 열 때 자동 실행)
+
+        Args:
+            engine_version: 유지할 엔진 버전 (None이면 현재 버전)
+            conn: 사용할 연결 (None이면 현재 스레드의 연결)
+
+        Returns:
+            int: 삭제한 결과 수
+        """
+        if conn is None:
+            conn = self._conn()
+        with conn:
+            return conn.execute(
+                "DELETE FROM results WHERE engine_version != ?",
+                (engine_version or get_engine_version(),),
+            ).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """
+        저장소 통계
+
+        Returns:
+            Dict[str, int]: 테이블별 행 수
+        """
+        conn = self._conn()
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("profiles", "debt_items", "asset_items", "scenarios", "results")
+        }
+
+
+_default_store: Optional[ProfileStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore:
+    """
+    환경 변수 설정으로 만든 기본 저장소 반환 (프로세스당 하나)
+
+    Returns:
+        ProfileStore: 기본 저장소
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            load_dotenv_once()
+            _default_store = ProfileStore()
+        return _default_store
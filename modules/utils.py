@@ -4,9 +4,12 @@
 에러 처리 및 안전한 계산을 위한 유틸리티 함수를 제공합니다.
 """
 
-from typing import Callable, Any, Dict, Tuple
+from typing import Callable, Any, Dict, Optional, Tuple
+import time
 import traceback
 
+from modules.metrics import describe_input_size, is_metrics_enabled, record_calculation
+
 
 def safe_calculate(
     func: Callable,
@@ -18,6 +21,8 @@ def safe_calculate(
     안전한 계산 래퍼 함수
     
     계산 함수를 실행하고 에러를 안전하게 처리합니다.
+    호출마다 소요 시간, 입력 크기, 성공 여부, 예외 종류를 modules.metrics 레지스트리에
+    기록합니다 (METRICS_ENABLED=0이면 기록하지 않음).
     
     Args:
         func: 실행할 계산 함수
@@ -31,27 +36,51 @@ def safe_calculate(
             - 성공 여부: True (성공) 또는 False (실패)
             - 에러 메시지: 에러 발생 시 사용자 친화적인 메시지
     """
+    if not is_metrics_enabled():
+        return _run_calculation(func, args, kwargs, error_message)[:3]
+
+    start = time.perf_counter()
+    result, success, error_msg, exception_type = _run_calculation(
+        func, args, kwargs, error_message
+    )
+    record_calculation(
+        getattr(func, "__qualname__", repr(func)),
+        time.perf_counter() - start,
+        success,
+        exception_type,
+        describe_input_size(args, kwargs),
+    )
+    return result, success, error_msg
+
+
+def _run_calculation(
+    func: Callable,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    error_message: str,
+) -> Tuple[Any, bool, str, Optional[str]]:
+    """safe_calculate 본체: (결과, 성공 여부, 에러 메시지, 예외 클래스 이름) 반환"""
     try:
         result = func(*args, **kwargs)
-        return result, True, ""
-    except ZeroDivisionError:
+        return result, True, "", None
+    except ZeroDivisionError as e:
         error_msg = "0으로 나누기를 시도했습니다. 입력값을 확인해주세요."
-        return None, False, error_msg
+        return None, False, error_msg, type(e).__name__
     except ValueError as e:
         error_msg = f"입력값 오류: {str(e)}. 올바른 값을 입력해주세요."
-        return None, False, error_msg
+        return None, False, error_msg, type(e).__name__
     except TypeError as e:
         error_msg = f"데이터 타입 오류: {str(e)}. 입력 형식을 확인해주세요."
-        return None, False, error_msg
+        return None, False, error_msg, type(e).__name__
     except KeyError as e:
         error_msg = f"필수 데이터 누락: {str(e)}. 모든 필수 항목을 입력해주세요."
-        return None, False, error_msg
+        return None, False, error_msg, type(e).__name__
     except Exception as e:
         # 예상치 못한 오류
         error_msg = f"{error_message} 오류 내용: {str(e)}"
         # 개발 환경에서만 상세 정보 표시
         # traceback.print_exc()  # 필요시 주석 해제
-        return None, False, error_msg
+        return None, False, error_msg, type(e).__name__
 
 
 def get_user_friendly_error_message(error: Exception) -> str:
@@ -2,9 +2,15 @@
 입력 검증 모듈
 
 사용자 입력 데이터의 유효성을 검증하고, 오류 메시지를 제공합니다.
+
+여러 고객 프로필을 한 번에 검증할 때는 validate_inputs_bulk를 사용합니다.
+규칙을 열 단위 numpy 연산으로 적용하고 행마다 오류/경고 비트 코드만 저장하며,
+메시지는 화면에 표시할 때 만듭니다.
 """
 
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Callable, Iterable, Mapping, Union
+
+import numpy as np
 
 
 def validate_age(age: int) -> Tuple[bool, str]:
@@ -265,3 +271,341 @@ def validate_inputs(inputs: Dict[str, Any]) -> Tuple[bool, List[str]]:
     is_valid = len(errors) == 0
     return is_valid, errors
 
+
+# ---------------------------------------------------------------------------
+# 일괄 검증 (열 단위 벡터화)
+# ---------------------------------------------------------------------------
+
+# 오류 코드 (비트 플래그, validate_inputs의 메시지 순서와 같음)
+ERR_AGE_NEGATIVE = 1 << 0
+ERR_AGE_TOO_HIGH = 1 << 1
+ERR_RETIREMENT_NOT_AFTER_CURRENT = 1 << 2
+ERR_RETIREMENT_TOO_LOW = 1 << 3
+ERR_RETIREMENT_TOO_HIGH = 1 << 4
+ERR_SALARY_NEGATIVE = 1 << 5
+ERR_SALARY_TOO_HIGH = 1 << 6
+ERR_GROWTH_NEGATIVE = 1 << 7
+ERR_GROWTH_TOO_HIGH = 1 << 8
+ERR_BONUS_NEGATIVE = 1 << 9
+ERR_MONTHLY_FIXED_NEGATIVE = 1 << 10
+ERR_MONTHLY_VARIABLE_NEGATIVE = 1 << 11
+ERR_MONTHLY_EXPENSE_NEGATIVE = 1 << 12
+ERR_ANNUAL_FIXED_NEGATIVE = 1 << 13
+ERR_ASSETS_NEGATIVE = 1 << 14
+ERR_DEBT_NEGATIVE = 1 << 15
+
+# 경고 코드 (비트 플래그, validate_logical_consistency의 메시지 순서와 같음)
+WARN_RETIREMENT_NOT_AFTER_CURRENT = 1 << 0
+WARN_EXPENSE_EXCEEDS_INCOME = 1 << 1
+WARN_DEBT_EXCEEDS_ASSETS = 1 << 2
+WARN_ZERO_ASSETS_WITH_DEBT = 1 << 3
+
+# 일괄 검증에 사용하는 숫자 입력 필드
+BULK_VALIDATION_FIELDS = (
+    'current_age',
+    'retirement_age',
+    'salary',
+    'salary_growth_rate',
+    'bonus',
+    'monthly_fixed_expense',
+    'monthly_variable_expense',
+    'monthly_expense',
+    'annual_fixed_expense',
+    'total_assets',
+    'total_debt',
+)
+
+# 코드별 메시지 (format 인자: 행의 원래 입력값)
+_EXPENSE_ERROR = "지출은 0 이상이어야 합니다."
+ERROR_MESSAGES = {
+    ERR_AGE_NEGATIVE: "나이는 0 이상이어야 합니다.",
+    ERR_AGE_TOO_HIGH: "나이는 150 이하여야 합니다.",
+    ERR_RETIREMENT_NOT_AFTER_CURRENT: "은퇴 나이({retirement_age}세)는 현재 나이({current_age}세)보다 커야 합니다.",
+    ERR_RETIREMENT_TOO_LOW: "은퇴 나이는 1 이상이어야 합니다.",
+    ERR_RETIREMENT_TOO_HIGH: "은퇴 나이는 100 이하여야 합니다.",
+    ERR_SALARY_NEGATIVE: "연봉은 0 이상이어야 합니다.",
+    ERR_SALARY_TOO_HIGH: "연봉은 10억원 이하여야 합니다.",
+    ERR_GROWTH_NEGATIVE: "연봉 증가율은 0 이상이어야 합니다.",
+    ERR_GROWTH_TOO_HIGH: "연봉 증가율은 20% 이하여야 합니다.",
+    ERR_BONUS_NEGATIVE: "보너스는 0 이상이어야 합니다.",
+    ERR_MONTHLY_FIXED_NEGATIVE: f"월간 고정비: {_EXPENSE_ERROR}",
+    ERR_MONTHLY_VARIABLE_NEGATIVE: f"월간 변동비: {_EXPENSE_ERROR}",
+    ERR_MONTHLY_EXPENSE_NEGATIVE: f"월 지출: {_EXPENSE_ERROR}",
+    ERR_ANNUAL_FIXED_NEGATIVE: f"연간 고정 지출: {_EXPENSE_ERROR}",
+    ERR_ASSETS_NEGATIVE: "자산은 0 이상이어야 합니다.",
+    ERR_DEBT_NEGATIVE: "부채는 0 이상이어야 합니다.",
+}
+
+WARNING_MESSAGES = {
+    WARN_RETIREMENT_NOT_AFTER_CURRENT: "⚠️ 은퇴 나이({retirement_age}세)가 현재 나이({current_age}세)보다 크지 않습니다.",
+    WARN_EXPENSE_EXCEEDS_INCOME: "⚠️ 월 지출({monthly_total_expense:.0f}만원)이 월 소득({monthly_salary:.0f}만원)보다 큽니다.",
+    WARN_DEBT_EXCEEDS_ASSETS: (
+        "⚠️ 부채({total_debt:,.0f}만원)가 자산({total_assets:,.0f}만원)보다 큽니다. "
+        "순자산: {net_assets:,.0f}만원 (부채 비율: {debt_ratio:.1f}%)"
+    ),
+    WARN_ZERO_ASSETS_WITH_DEBT: "💡 자산이 0인 경우 부채 상환 능력을 재확인해주세요.",
+}
+
+ProfileTable = Union[Mapping[str, Any], Iterable[Dict[str, Any]]]
+
+
+class BulkValidationResult:
+    """
+    일괄 검증 결과
+
+    행마다 오류/경고 비트 코드만 보관하고, 메시지는 error_messages /
+    warning_messages를 호출할 때 해당 행에 대해서만 만듭니다.
+    """
+
+    def __init__(
+        self,
+        error_codes: np.ndarray,
+        warning_codes: np.ndarray,
+        values: Dict[str, np.ndarray],
+        raw_value: Callable[[str, int], Any],
+    ):
+        """
+        Args:
+            error_codes: 행별 오류 코드 (비트 OR)
+            warning_codes: 행별 경고 코드 (비트 OR)
+            values: 메시지에 쓰는 열 단위 숫자 값 (원 단위)
+            raw_value: (필드, 행 번호) → 원래 입력값
+        """
+        self.error_codes = error_codes
+        self.warning_codes = warning_codes
+        self._values = values
+        self._raw_value = raw_value
+
+    def __len__(self) -> int:
+        return len(self.error_codes)
+
+    @property
+    def is_valid(self) -> np.ndarray:
+        """행별 검증 통과 여부 (오류 코드가 없으면 True)"""
+        return self.error_codes == 0
+
+    def invalid_rows(self) -> np.ndarray:
+        """오류가 있는 행 번호 배열"""
+        return np.flatnonzero(self.error_codes)
+
+    def code_counts(self) -> Dict[str, Dict[int, int]]:
+        """
+        코드별 해당 행 수
+
+        Returns:
+            Dict[str, Dict[int, int]]: {"errors": {코드: 행 수}, "warnings": {코드: 행 수}}
+        """
+        return {
+            "errors": _count_codes(self.error_codes, ERROR_MESSAGES),
+            "warnings": _count_codes(self.warning_codes, WARNING_MESSAGES),
+        }
+
+    def error_messages(self, index: int) -> List[str]:
+        """
+        행의 오류 메시지 (validate_inputs와 같은 문구와 순서)
+
+        Args:
+            index: 행 번호
+
+        Returns:
+            List[str]: 오류 메시지 리스트
+        """
+        return self._render(int(self.error_codes[index]), ERROR_MESSAGES, index)
+
+    def warning_messages(self, index: int) -> List[str]:
+        """
+        행의 경고 메시지 (validate_logical_consistency와 같은 문구와 순서)
+
+        Args:
+            index: 행 번호
+
+        Returns:
+            List[str]: 경고 메시지 리스트
+        """
+        return self._render(int(self.warning_codes[index]), WARNING_MESSAGES, index)
+
+    def _render(self, codes: int, messages: Dict[int, str], index: int) -> List[str]:
+        if not codes:
+            return []
+        fields = _MessageFields(self, index)
+        return [
+            template.format_map(fields)
+            for code, template in messages.items()
+            if codes & code
+        ]
+
+
+class _MessageFields(dict):
+    """메시지 템플릿에 필요한 값만 그때그때 계산하는 format_map 인자"""
+
+    def __init__(self, result: BulkValidationResult, index: int):
+        super().__init__()
+        self._result = result
+        self._index = index
+
+    def __missing__(self, name: str) -> Any:
+        values = self._result._values
+        index = self._index
+        if name in ('current_age', 'retirement_age'):
+            value = self._result._raw_value(name, index)
+            return 0 if value is None else value
+        if name in ('monthly_total_expense', 'monthly_salary', 'total_debt', 'total_assets'):
+            # 메시지는 만원 단위로 표시
+            return float(values[name][index]) / 10000
+        if name == 'net_assets':
+            return float(values['total_assets'][index] - values['total_debt'][index]) / 10000
+        if name == 'debt_ratio':
+            total_assets = float(values['total_assets'][index])
+            total_debt = float(values['total_debt'][index])
+            return total_debt / total_assets * 100 if total_assets > 0 else float('inf')
+        raise KeyError(name)
+
+
+def _count_codes(codes: np.ndarray, messages: Dict[int, str]) -> Dict[int, int]:
+    counts = {}
+    for code in messages:
+        count = int(np.count_nonzero(codes & code))
+        if count:
+            counts[code] = count
+    return counts
+
+
+def _table_columns(
+    table: ProfileTable,
+) -> Tuple[int, Dict[str, np.ndarray], Callable[[str, int], Any]]:
+    """
+    프로필 표를 필드별 float 배열로 변환 (없는 값은 NaN)
+
+    Returns:
+        Tuple: (행 수, 필드 → float 배열, (필드, 행 번호) → 원래 입력값 함수)
+    """
+    if hasattr(table, 'columns') and hasattr(table, 'to_dict'):
+        # pandas DataFrame
+        table = {str(name): table[name].to_numpy() for name in table.columns}
+
+    if isinstance(table, Mapping):
+        lengths = {len(column) for column in table.values()}
+        if len(lengths) > 1:
+            raise ValueError("모든 열의 길이가 같아야 합니다.")
+        row_count = lengths.pop() if lengths else 0
+        columns = {
+            name: _to_float_array(table[name])
+            for name in BULK_VALIDATION_FIELDS
+            if name in table
+        }
+
+        def raw_value(name: str, index: int) -> Any:
+            return table[name][index] if name in table else None
+    else:
+        rows = table if isinstance(table, list) else list(table)
+        row_count = len(rows)
+        columns = {
+            name: _to_float_array([row.get(name) for row in rows])
+            for name in BULK_VALIDATION_FIELDS
+        }
+
+        def raw_value(name: str, index: int) -> Any:
+            return rows[index].get(name)
+
+    return row_count, columns, raw_value
+
+
+def _to_float_array(values: Any) -> np.ndarray:
+    """None이 섞인 값 목록을 NaN이 있는 float 배열로 변환"""
+    array = np.asarray(values)
+    if array.dtype == object:
+        array = np.array(
+            [np.nan if value is None else value for value in array], dtype=float
+        )
+    return array.astype(float, copy=False)
+
+
+def validate_inputs_bulk(table: ProfileTable) -> BulkValidationResult:
+    """
+    여러 프로필의 입력 데이터를 한 번에 검증
+
+    validate_inputs의 오류 규칙과 validate_logical_consistency의 경고 규칙을
+    열 단위 numpy 마스크로 적용합니다. 값이 없는(None/NaN) 필드는
+    validate_inputs처럼 검사하지 않고, 경고 계산에서는 0으로 간주합니다.
+
+    Args:
+        table: 프로필 표 (필드 → 값 목록, DataFrame, 또는 입력 딕셔너리 목록)
+
+    Returns:
+        BulkValidationResult: 행별 오류/경고 코드와 지연 메시지 생성기
+
+    Raises:
+        ValueError: 열 길이가 서로 다른 경우
+    """
+    row_count, columns, raw_value = _table_columns(table)
+    missing = np.full(row_count, np.nan)
+
+    def column(name: str) -> np.ndarray:
+        return columns.get(name, missing)
+
+    current_age = column('current_age')
+    retirement_age = column('retirement_age')
+    salary = column('salary')
+    growth_rate = column('salary_growth_rate')
+
+    errors = np.zeros(row_count, dtype=np.uint32)
+
+    def flag(code: int, mask: np.ndarray) -> None:
+        errors[mask] |= code
+
+    # NaN 비교는 항상 False이므로 값이 없는 행은 자동으로 제외됨
+    flag(ERR_AGE_NEGATIVE, current_age < 0)
+    flag(ERR_AGE_TOO_HIGH, current_age > 150)
+
+    # 은퇴 나이 규칙은 validate_retirement_age처럼 첫 번째 해당 오류만 표시
+    both_ages = ~np.isnan(current_age) & ~np.isnan(retirement_age)
+    not_after = both_ages & (retirement_age <= current_age)
+    too_low = both_ages & ~not_after & (retirement_age < 1)
+    too_high = both_ages & ~not_after & ~too_low & (retirement_age > 100)
+    flag(ERR_RETIREMENT_NOT_AFTER_CURRENT, not_after)
+    flag(ERR_RETIREMENT_TOO_LOW, too_low)
+    flag(ERR_RETIREMENT_TOO_HIGH, too_high)
+
+    flag(ERR_SALARY_NEGATIVE, salary < 0)
+    flag(ERR_SALARY_TOO_HIGH, salary > 1000000000)
+    flag(ERR_GROWTH_NEGATIVE, growth_rate < 0)
+    flag(ERR_GROWTH_TOO_HIGH, growth_rate > 20)
+    flag(ERR_BONUS_NEGATIVE, column('bonus') < 0)
+    flag(ERR_MONTHLY_FIXED_NEGATIVE, column('monthly_fixed_expense') < 0)
+    flag(ERR_MONTHLY_VARIABLE_NEGATIVE, column('monthly_variable_expense') < 0)
+    flag(ERR_MONTHLY_EXPENSE_NEGATIVE, column('monthly_expense') < 0)
+    flag(ERR_ANNUAL_FIXED_NEGATIVE, column('annual_fixed_expense') < 0)
+    flag(ERR_ASSETS_NEGATIVE, column('total_assets') < 0)
+    flag(ERR_DEBT_NEGATIVE, column('total_debt') < 0)
+
+    # 논리적 일관성 경고 (없는 값은 0)
+    def filled(name: str) -> np.ndarray:
+        return np.nan_to_num(column(name), nan=0.0)
+
+    monthly_salary = filled('salary') / 12
+    # 새 구조(고정비/변동비)가 모두 있으면 우선 사용
+    use_new_structure = ~np.isnan(column('monthly_fixed_expense')) & ~np.isnan(
+        column('monthly_variable_expense')
+    )
+    monthly_total_expense = np.where(
+        use_new_structure,
+        filled('monthly_fixed_expense') + filled('monthly_variable_expense'),
+        filled('monthly_expense') + filled('annual_fixed_expense') / 12,
+    )
+    total_assets = filled('total_assets')
+    total_debt = filled('total_debt')
+    debt_exceeds_assets = total_debt > total_assets
+
+    warnings = np.zeros(row_count, dtype=np.uint8)
+    warnings[filled('retirement_age') <= filled('current_age')] |= WARN_RETIREMENT_NOT_AFTER_CURRENT
+    warnings[monthly_total_expense > monthly_salary] |= WARN_EXPENSE_EXCEEDS_INCOME
+    warnings[debt_exceeds_assets] |= WARN_DEBT_EXCEEDS_ASSETS
+    warnings[debt_exceeds_assets & (total_assets == 0)] |= WARN_ZERO_ASSETS_WITH_DEBT
+
+    values = {
+        'monthly_salary': monthly_salary,
+        'monthly_total_expense': monthly_total_expense,
+        'total_assets': total_assets,
+        'total_debt': total_debt,
+    }
+    return BulkValidationResult(errors, warnings, values, raw_value)
@@ -2,60 +2,396 @@
 시각화 모듈
 
 Plotly를 사용하여 데이터 시각화 차트를 생성합니다.
+plotly는 처음 차트를 만들 때 불러옵니다 (모듈 import 시점에는 불러오지 않음).
 """
 
-from typing import Dict, Any, List, Optional
+from __future__ import annotations
 
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-except ImportError:
-    # 테스트 환경에서 plotly가 없을 경우를 대비
-    class MockFigure:
+import threading
+from collections import OrderedDict
+from functools import wraps
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+import numpy as np
+
+from modules.hashing import fingerprint
+from modules.lazy_imports import LazyModule
+
+
+# 테스트 환경에서 plotly가 없을 경우를 대비
+class MockFigure:
+    def __init__(self, *args, **kwargs):
+        self.data = []
+        self.layout = {}
+        # add_trace로 추가된 데이터를 저장
+        if args:
+            self.data.append(args[0])
+
+    def add_trace(self, *args, **kwargs):
+        if args:
+            self.data.append(args[0])
+        elif "trace" in kwargs:
+            self.data.append(kwargs["trace"])
+
+    def update_layout(self, *args, **kwargs):
+        if args:
+            self.layout.update(args[0])
+        self.layout.update(kwargs)
+
+    def add_annotation(self, *args, **kwargs):
+        pass
+
+    def add_hline(self, *args, **kwargs):
+        pass
+
+
+class MockGo:
+    class Scatter:
         def __init__(self, *args, **kwargs):
-            self.data = []
-            self.layout = {}
-            # add_trace로 추가된 데이터를 저장
-            if args:
-                self.data.append(args[0])
-
-        def add_trace(self, *args, **kwargs):
-            if args:
-                self.data.append(args[0])
-            elif "trace" in kwargs:
-                self.data.append(kwargs["trace"])
-
-        def update_layout(self, *args, **kwargs):
-            self.layout.update(kwargs)
-
-        def add_annotation(self, *args, **kwargs):
             pass
 
-        def add_hline(self, *args, **kwargs):
+    class Scattergl:
+        def __init__(self, *args, **kwargs):
             pass
 
-    class MockGo:
-        class Scatter:
-            def __init__(self, *args, **kwargs):
-                pass
+    class Bar:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    class Indicator:
+        def __init__(self, *args, **kwargs):
+            pass
+
+    def __init__(self):
+        self.Figure = MockFigure
+        self.Scatter = self.Scatter
+        self.Scattergl = self.Scattergl
+        self.Bar = self.Bar
+        self.Indicator = self.Indicator
+
+
+go = LazyModule("plotly.graph_objects", fallback=MockGo)
+
+
+# 차트 캐시 최대 항목 수 (LRU 방식으로 오래된 차트부터 제거)
+FIGURE_CACHE_MAX_ENTRIES = 128
+
+_figure_cache: "OrderedDict[str, Any]" = OrderedDict()
+_figure_cache_lock = threading.Lock()
+_figure_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_figure_cache_key_hits: Dict[str, int] = {}
+
+
+def cache_figure(builder: Callable) -> Callable:
+    """
+    차트 생성 함수 캐시 데코레이터
+
+    입력 데이터의 지문(fingerprint)을 키로 생성된 차트를 재사용합니다.
+    Streamlit 재실행 시 입력 결과가 같으면 차트를 다시 만들지 않습니다.
+    반환된 차트는 여러 호출에서 공유되므로 수정하지 말고 그대로 표시해야 합니다.
+
+    Args:
+        builder: 차트 생성 함수
+
+    Returns:
+        Callable: 캐시가 적용된 차트 생성 함수 (원본은 .uncached 속성)
+    """
+
+    @wraps(builder)
+    def wrapper(*args, **kwargs):
+        key = f"{builder.__name__}:{fingerprint(args, kwargs)}"
+        with _figure_cache_lock:
+            fig = _figure_cache.get(key)
+            if fig is not None:
+                _figure_cache.move_to_end(key)
+                _figure_cache_stats["hits"] += 1
+                _figure_cache_key_hits[key] = _figure_cache_key_hits.get(key, 0) + 1
+                return fig
+
+        fig = builder(*args, **kwargs)
+
+        with _figure_cache_lock:
+            _figure_cache_stats["misses"] += 1
+            _figure_cache[key] = fig
+            _trim_figure_cache()
+        return fig
+
+    wrapper.uncached = builder
+    return wrapper
+
+
+def _trim_figure_cache() -> None:
+    """최대 항목 수를 넘는 오래된 차트 제거 (_figure_cache_lock 안에서 호출)"""
+    while len(_figure_cache) > FIGURE_CACHE_MAX_ENTRIES:
+        key, _ = _figure_cache.popitem(last=False)
+        _figure_cache_key_hits.pop(key, None)
+        _figure_cache_stats["evictions"] += 1
+
+
+def clear_figure_cache() -> None:
+    """차트 캐시 비우기"""
+    with _figure_cache_lock:
+        _figure_cache.clear()
+        _figure_cache_key_hits.clear()
+        for key in _figure_cache_stats:
+            _figure_cache_stats[key] = 0
+
+
+def set_figure_cache_max_entries(max_entries: int) -> None:
+    """
+    차트 캐시 최대 항목 수 변경 (줄이면 오래된 차트부터 바로 제거)
+
+    Args:
+        max_entries: 최대 항목 수 (0이면 저장하지 않음)
+    """
+    global FIGURE_CACHE_MAX_ENTRIES
+    with _figure_cache_lock:
+        FIGURE_CACHE_MAX_ENTRIES = max(0, int(max_entries))
+        _trim_figure_cache()
+
+
+def get_figure_cache_hottest(limit: int = 10) -> List[Tuple[str, int]]:
+    """
+    적중 횟수가 많은 차트 캐시 키 목록
+
+    Args:
+        limit: 반환할 최대 개수
+
+    Returns:
+        List[Tuple[str, int]]: (키, 적중 횟수) 목록
+    """
+    with _figure_cache_lock:
+        ranked = sorted(_figure_cache_key_hits.items(), key=lambda item: -item[1])
+    return ranked[:limit]
+
+
+def get_figure_cache_bytes() -> int:
+    """
+    캐시된 차트의 직렬화 크기 합계 (차트마다 JSON 변환하므로 관리 화면에서만 사용)
+
+    Returns:
+        int: 전체 크기 (bytes, 크기를 잴 수 없는 차트는 제외)
+    """
+    with _figure_cache_lock:
+        figures = list(_figure_cache.values())
+    return sum(
+        len(fig.to_json().encode("utf-8")) for fig in figures if hasattr(fig, "to_json")
+    )
+
+
+def get_figure_cache_stats() -> Dict[str, int]:
+    """
+    차트 캐시 통계 반환
+
+    Returns:
+        Dict[str, int]: 항목 수, 적중/미적중/제거 횟수
+    """
+    with _figure_cache_lock:
+        return {"entries": len(_figure_cache), **_figure_cache_stats}
+
+
+# 정적 레이아웃 템플릿 (읽기 전용, 사용 시 얕은 복사 후 데이터로 보완)
+_LINE_CHART_LAYOUT = MappingProxyType(
+    {"hovermode": "x unified", "template": "plotly_white"}
+)
+_BAR_CHART_LAYOUT = MappingProxyType({"height": 300, "template": "plotly_white"})
+_GAUGE_LAYOUT = MappingProxyType({"height": 300})
+_LEGEND_TOP_LEFT = MappingProxyType(
+    {"yanchor": "top", "y": 0.99, "xanchor": "left", "x": 0.01}
+)
+_GAUGE_THRESHOLD = MappingProxyType(
+    {"line": {"color": "red", "width": 4}, "thickness": 0.75, "value": 50}
+)
+_GRADE_GAUGE_STEPS = (
+    MappingProxyType({"range": (0, 20), "color": "lightgray"}),
+    MappingProxyType({"range": (20, 40), "color": "gray"}),
+    MappingProxyType({"range": (40, 60), "color": "lightyellow"}),
+    MappingProxyType({"range": (60, 80), "color": "lightgreen"}),
+    MappingProxyType({"range": (80, 100), "color": "green"}),
+)
+_RISK_GAUGE_STEPS = (
+    MappingProxyType({"range": (0, 25), "color": "lightgreen"}),
+    MappingProxyType({"range": (25, 50), "color": "lightyellow"}),
+    MappingProxyType({"range": (50, 75), "color": "lightcoral"}),
+    MappingProxyType({"range": (75, 100), "color": "lightgray"}),
+)
+
+
+def _from_template(template: MappingProxyType, **patch) -> Dict[str, Any]:
+    """
+    레이아웃 템플릿을 얕은 복사하고 데이터로 보완
+
+    Args:
+        template: 읽기 전용 템플릿
+        **patch: 덮어쓸 항목
+
+    Returns:
+        Dict[str, Any]: 새 레이아웃 딕셔너리
+    """
+    layout = dict(template)
+    layout.update(patch)
+    return layout
+
+
+def _gauge_steps(steps: tuple) -> List[Dict[str, Any]]:
+    """게이지 구간 템플릿을 Plotly가 받는 리스트 형태로 복사"""
+    return [{"range": list(step["range"]), "color": step["color"]} for step in steps]
+
+
+# 차트 전체 점 개수가 이 값을 넘으면 SVG(Scatter) 대신 WebGL(Scattergl)로 그림
+WEBGL_POINT_THRESHOLD = 1000
+# 시리즈 하나의 점 개수가 이 값을 넘으면 LTTB로 다운샘플링
+DOWNSAMPLE_THRESHOLD = 2000
+# 다운샘플링 후 목표 점 개수
+DOWNSAMPLE_TARGET_POINTS = 1000
+# 시리즈 점 개수가 이 값을 넘으면 마커를 생략하고 선만 그림
+MARKER_POINT_THRESHOLD = 200
+
+
+def lttb_indices(x: Any, y: Any, n_out: int) -> np.ndarray:
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 다운샘플링 인덱스 계산
+
+    시리즈의 모양(최고점, 최저점, 꺾이는 지점)을 최대한 보존하면서
+    점 개수를 n_out개로 줄입니다. 첫 점과 마지막 점은 항상 유지됩니다.
+
+    Args:
+        x: x 좌표 시퀀스 (단조 증가)
+        y: y 좌표 시퀀스
+        n_out: 남길 점 개수
+
+    Returns:
+        np.ndarray: 선택된 점의 인덱스 (오름차순)
+    """
+    x_arr = np.asarray(x, dtype=float)
+    y_arr = np.asarray(y, dtype=float)
+    n = len(x_arr)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # 첫 점과 마지막 점을 제외한 구간을 (n_out - 2)개 버킷으로 분할
+    bucket_edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = bucket_edges[bucket], bucket_edges[bucket + 1]
+
+        # 다음 버킷의 평균점 (마지막 버킷이면 마지막 점)
+        if bucket + 2 < len(bucket_edges):
+            next_start, next_end = bucket_edges[bucket + 1], bucket_edges[bucket + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x_arr[next_start:next_end].mean()
+        avg_y = y_arr[next_start:next_end].mean()
+
+        # 이전 선택점, 후보점, 다음 버킷 평균점이 이루는 삼각형 넓이가 최대인 점 선택
+        candidate_x = x_arr[start:end]
+        candidate_y = y_arr[start:end]
+        areas = np.abs(
+            (x_arr[previous] - avg_x) * (candidate_y - y_arr[previous])
+            - (x_arr[previous] - candidate_x) * (avg_y - y_arr[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def downsample_lttb(x: Any, y: Any, n_out: int = DOWNSAMPLE_TARGET_POINTS):
+    """
+    LTTB 다운샘플링
+
+    Args:
+        x: x 좌표 시퀀스
+        y: y 좌표 시퀀스
+        n_out: 남길 점 개수
+
+    Returns:
+        Tuple[list, list]: 다운샘플링된 (x, y)
+    """
+    indices = lttb_indices(x, y, n_out)
+    x_arr = np.asarray(x)
+    y_arr = np.asarray(y)
+    return x_arr[indices].tolist(), y_arr[indices].tolist()
+
+
+def _use_webgl(total_points: int) -> bool:
+    """차트 전체 점 개수 기준 WebGL 사용 여부"""
+    return total_points > WEBGL_POINT_THRESHOLD
+
 
-        class Bar:
-            def __init__(self, *args, **kwargs):
-                pass
+def _line_trace(x: Any, y: Any, use_webgl: bool = False, **kwargs):
+    """
+    점 개수에 따라 렌더링 방식을 자동 선택하는 선 그래프 trace 생성
+
+    - 점이 DOWNSAMPLE_THRESHOLD개를 넘으면 LTTB로 다운샘플링
+    - 점이 MARKER_POINT_THRESHOLD개를 넘으면 마커 생략
+    - use_webgl이면 go.Scattergl, 아니면 go.Scatter
+
+    Args:
+        x: x 좌표 시퀀스
+        y: y 좌표 시퀀스
+        use_webgl: WebGL 렌더링 여부 (차트 전체 점 개수로 결정)
+        **kwargs: go.Scatter 인자
 
-        class Indicator:
-            def __init__(self, *args, **kwargs):
-                pass
+    Returns:
+        go.Scatter 또는 go.Scattergl
+    """
+    if len(x) > DOWNSAMPLE_THRESHOLD:
+        x, y = downsample_lttb(x, y, DOWNSAMPLE_TARGET_POINTS)
 
-        def __init__(self):
-            self.Figure = MockFigure
-            self.Scatter = self.Scatter
-            self.Bar = self.Bar
-            self.Indicator = self.Indicator
+    if len(x) > MARKER_POINT_THRESHOLD and kwargs.get("mode") == "lines+markers":
+        kwargs["mode"] = "lines"
+        kwargs.pop("marker", None)
 
-    go = MockGo()
+    trace_class = go.Scattergl if use_webgl else go.Scatter
+    return trace_class(x=x, y=y, **kwargs)
+
+
+def figure_payload_report(fig: go.Figure) -> Dict[str, Any]:
+    """
+    차트가 브라우저로 전송되는 데이터 크기 보고서 생성
+
+    Args:
+        fig: Plotly 그래프 객체
+
+    Returns:
+        Dict[str, Any]: 페이로드 보고서
+            - total_bytes: 직렬화된 전체 차트 크기 (bytes)
+            - trace_count: trace 개수
+            - point_count: 전체 점 개수
+            - webgl_traces: WebGL trace 개수
+            - traces: trace별 이름, 타입, 점 개수, 크기
+    """
+    from plotly.io.json import to_json_plotly
+
+    traces = []
+    for trace in fig.data:
+        x_values = getattr(trace, "x", None)
+        traces.append(
+            {
+                "name": getattr(trace, "name", None),
+                "type": trace.type,
+                "points": len(x_values) if x_values is not None else 0,
+                "bytes": len(to_json_plotly(trace.to_plotly_json()).encode("utf-8")),
+            }
+        )
+
+    return {
+        "total_bytes": len(fig.to_json().encode("utf-8")),
+        "trace_count": len(traces),
+        "point_count": sum(trace["points"] for trace in traces),
+        "webgl_traces": sum(1 for trace in traces if trace["type"] == "scattergl"),
+        "traces": traces,
+    }
 
 
+@cache_figure
 def create_future_assets_chart(
     future_assets_result: Dict[str, Any], current_age: int = None
 ) -> go.Figure:
@@ -112,6 +448,7 @@ def create_future_assets_chart(
         hovertemplate = "%{x}년: %{y:,.0f}만원<extra></extra>"
 
     fig = go.Figure()
+    use_webgl = _use_webgl(len(x_data))
 
     # 은퇴 전/후 구분하여 표시
     if use_age_axis and yearly_breakdown and "is_retired" in yearly_breakdown[0]:
@@ -154,9 +491,10 @@ def create_future_assets_chart(
         # 은퇴 전 구간
         if len(pre_retirement_ages) > 1:
             fig.add_trace(
-                go.Scatter(
-                    x=pre_retirement_ages,
-                    y=pre_retirement_assets,
+                _line_trace(
+                    pre_retirement_ages,
+                    pre_retirement_assets,
+                    use_webgl=use_webgl,
                     mode="lines+markers",
                     name="은퇴 전",
                     line=dict(color="#1f77b4", width=3),
@@ -168,9 +506,10 @@ def create_future_assets_chart(
         # 은퇴 후 구간
         if post_retirement_ages:
             fig.add_trace(
-                go.Scatter(
-                    x=post_retirement_ages,
-                    y=post_retirement_assets,
+                _line_trace(
+                    post_retirement_ages,
+                    post_retirement_assets,
+                    use_webgl=use_webgl,
                     mode="lines+markers",
                     name="은퇴 후",
                     line=dict(color="#d62728", width=3),
@@ -191,9 +530,10 @@ def create_future_assets_chart(
     else:
         # 기존 방식 (은퇴 전/후 구분 없음)
         fig.add_trace(
-            go.Scatter(
-                x=x_data,
-                y=assets,
+            _line_trace(
+                x_data,
+                assets,
+                use_webgl=use_webgl,
                 mode="lines+markers",
                 name="예상 자산",
                 line=dict(color="#1f77b4", width=3),
@@ -203,20 +543,181 @@ def create_future_assets_chart(
         )
 
     fig.update_layout(
-        title="나이별 자산 변화 추이" if use_age_axis else "연도별 자산 변화 추이",
-        xaxis_title=x_title,
-        yaxis_title="자산 (만원)",
-        hovermode="x unified",
-        template="plotly_white",
-        height=400,
-        showlegend=use_age_axis
-        and yearly_breakdown
-        and "is_retired" in yearly_breakdown[0],
+        _from_template(
+            _LINE_CHART_LAYOUT,
+            title="나이별 자산 변화 추이" if use_age_axis else "연도별 자산 변화 추이",
+            xaxis_title=x_title,
+            yaxis_title="자산 (만원)",
+            height=400,
+            showlegend=bool(
+                use_age_axis and yearly_breakdown and "is_retired" in yearly_breakdown[0]
+            ),
+        )
+    )
+
+    return fig
+
+
+# 팬 차트에 표시하는 백분위 (하단 바깥, 하단 안쪽, 중앙값, 상단 안쪽, 상단 바깥)
+FAN_CHART_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def compute_fan_quantiles(paths: Any) -> Dict[int, List[float]]:
+    """
+    몬테카를로 경로에서 팬 차트용 백분위 계산
+
+    모든 백분위를 np.percentile 한 번의 벡터 연산으로 계산합니다.
+
+    Args:
+        paths: (경로 수 × 연도 수) 자산 배열
+
+    Returns:
+        Dict[int, List[float]]: 백분위별 연도별 자산 (키: 5, 25, 50, 75, 95)
+    """
+    paths_arr = np.asarray(paths, dtype=float)
+    if paths_arr.ndim == 1:
+        paths_arr = paths_arr[np.newaxis, :]
+
+    quantile_rows = np.percentile(paths_arr, FAN_CHART_PERCENTILES, axis=0)
+    return {
+        percentile: row.tolist()
+        for percentile, row in zip(FAN_CHART_PERCENTILES, quantile_rows)
+    }
+
+
+def create_fan_chart(
+    paths: Any = None,
+    quantiles: Optional[Dict[int, List[float]]] = None,
+    current_age: Optional[int] = None,
+    retirement_age: Optional[int] = None,
+) -> go.Figure:
+    """
+    몬테카를로 시뮬레이션 결과 팬 차트 생성
+
+    p5~p95, p25~p75 구간을 음영으로, 중앙값을 선으로 표시합니다.
+    차트에는 백분위 5개만 담기므로 경로 수와 관계없이 전송 크기가 같습니다.
+
+    Args:
+        paths: (경로 수 × 연도 수) 자산 배열 (quantiles가 없을 때 사용)
+        quantiles: 미리 계산된 백분위 (compute_fan_quantiles 반환 형식)
+        current_age: 현재 나이 (있으면 나이 축, 없으면 연도 축)
+        retirement_age: 은퇴 나이 (있으면 수직선 표시)
+
+    Returns:
+        go.Figure: Plotly 그래프 객체
+    """
+    if quantiles is None:
+        if paths is None or np.size(paths) == 0:
+            fig = go.Figure()
+            fig.add_annotation(
+                text="데이터가 없습니다",
+                xref="paper",
+                yref="paper",
+                x=0.5,
+                y=0.5,
+                showarrow=False,
+            )
+            return fig
+        quantiles = compute_fan_quantiles(paths)
+
+    # 차트 캐시 키는 경로 배열이 아닌 백분위로 만들어 경로 수와 무관하게 유지
+    return _create_fan_chart_from_quantiles(
+        {int(percentile): list(values) for percentile, values in quantiles.items()},
+        current_age,
+        retirement_age,
+    )
+
+
+@cache_figure
+def _create_fan_chart_from_quantiles(
+    quantiles: Dict[int, List[float]],
+    current_age: Optional[int],
+    retirement_age: Optional[int],
+) -> go.Figure:
+    """백분위로 팬 차트 생성 (create_fan_chart 내부용)"""
+    rows = np.asarray([quantiles[p] for p in FAN_CHART_PERCENTILES], dtype=float)
+    n_years = rows.shape[1]
+
+    use_age_axis = current_age is not None and current_age > 0
+    x_data = np.arange(n_years) + (current_age if use_age_axis else 0)
+    x_title = "나이 (세)" if use_age_axis else "연도"
+    x_unit = "세" if use_age_axis else "년"
+
+    # 긴 시리즈는 중앙값 기준 LTTB 인덱스로 모든 백분위를 함께 줄여 정렬 유지
+    if n_years > DOWNSAMPLE_THRESHOLD:
+        indices = lttb_indices(x_data, rows[2], DOWNSAMPLE_TARGET_POINTS)
+        x_data = x_data[indices]
+        rows = rows[:, indices]
+
+    x_values = x_data.tolist()
+    p5, p25, p50, p75, p95 = rows.tolist()
+    trace_class = go.Scattergl if _use_webgl(len(x_values) * 5) else go.Scatter
+
+    fig = go.Figure()
+
+    # 음영 구간: 상단 경계를 먼저 그리고 하단 경계를 tonexty로 채움
+    for upper, lower, name, color in (
+        (p95, p5, "5~95% 구간", "rgba(31, 119, 180, 0.15)"),
+        (p75, p25, "25~75% 구간", "rgba(31, 119, 180, 0.3)"),
+    ):
+        fig.add_trace(
+            trace_class(
+                x=x_values,
+                y=upper,
+                mode="lines",
+                line=dict(width=0),
+                showlegend=False,
+                hoverinfo="skip",
+            )
+        )
+        fig.add_trace(
+            trace_class(
+                x=x_values,
+                y=lower,
+                mode="lines",
+                line=dict(width=0),
+                fill="tonexty",
+                fillcolor=color,
+                name=name,
+                hoverinfo="skip",
+            )
+        )
+
+    fig.add_trace(
+        trace_class(
+            x=x_values,
+            y=p50,
+            mode="lines",
+            name="중앙값",
+            line=dict(color="#1f77b4", width=3),
+            hovertemplate=f"%{{x}}{x_unit}: %{{y:,.0f}}만원<extra></extra>",
+        )
+    )
+
+    if use_age_axis and retirement_age:
+        fig.add_vline(
+            x=retirement_age,
+            line_dash="dash",
+            line_color="gray",
+            annotation_text="은퇴",
+            annotation_position="top",
+        )
+
+    fig.update_layout(
+        _from_template(
+            _LINE_CHART_LAYOUT,
+            title="자산 변화 전망 (몬테카를로)",
+            xaxis_title=x_title,
+            yaxis_title="자산 (만원)",
+            height=400,
+            legend=dict(_LEGEND_TOP_LEFT),
+        )
     )
 
     return fig
 
 
+@cache_figure
 def create_financial_health_gauge(grade_result: Dict[str, Any]) -> go.Figure:
     """
     재정 건전성 등급 게이지 차트 생성
@@ -255,27 +756,18 @@ def create_financial_health_gauge(grade_result: Dict[str, Any]) -> go.Figure:
             gauge={
                 "axis": {"range": [None, 100]},
                 "bar": {"color": color},
-                "steps": [
-                    {"range": [0, 20], "color": "lightgray"},
-                    {"range": [20, 40], "color": "gray"},
-                    {"range": [40, 60], "color": "lightyellow"},
-                    {"range": [60, 80], "color": "lightgreen"},
-                    {"range": [80, 100], "color": "green"},
-                ],
-                "threshold": {
-                    "line": {"color": "red", "width": 4},
-                    "thickness": 0.75,
-                    "value": 50,
-                },
+                "steps": _gauge_steps(_GRADE_GAUGE_STEPS),
+                "threshold": dict(_GAUGE_THRESHOLD),
             },
         )
     )
 
-    fig.update_layout(height=300)
+    fig.update_layout(_from_template(_GAUGE_LAYOUT))
 
     return fig
 
 
+@cache_figure
 def create_risk_score_chart(risk_result: Dict[str, Any]) -> go.Figure:
     """
     위험도 점수 차트 생성
@@ -309,26 +801,18 @@ def create_risk_score_chart(risk_result: Dict[str, Any]) -> go.Figure:
                         )
                     )
                 },
-                "steps": [
-                    {"range": [0, 25], "color": "lightgreen"},
-                    {"range": [25, 50], "color": "lightyellow"},
-                    {"range": [50, 75], "color": "lightcoral"},
-                    {"range": [75, 100], "color": "lightgray"},
-                ],
-                "threshold": {
-                    "line": {"color": "red", "width": 4},
-                    "thickness": 0.75,
-                    "value": 50,
-                },
+                "steps": _gauge_steps(_RISK_GAUGE_STEPS),
+                "threshold": dict(_GAUGE_THRESHOLD),
             },
         )
     )
 
-    fig.update_layout(height=300)
+    fig.update_layout(_from_template(_GAUGE_LAYOUT))
 
     return fig
 
 
+@cache_figure
 def create_risk_breakdown_chart(risk_result: Dict[str, Any]) -> go.Figure:
     """
     위험도 점수 세부 항목 막대 그래프
@@ -370,17 +854,19 @@ def create_risk_breakdown_chart(risk_result: Dict[str, Any]) -> go.Figure:
     )
 
     fig.update_layout(
-        title="위험도 점수 세부 항목",
-        xaxis_title="항목",
-        yaxis_title="점수",
-        yaxis_range=[0, 50],
-        height=300,
-        template="plotly_white",
+        _from_template(
+            _BAR_CHART_LAYOUT,
+            title="위험도 점수 세부 항목",
+            xaxis_title="항목",
+            yaxis_title="점수",
+            yaxis_range=[0, 50],
+        )
     )
 
     return fig
 
 
+@cache_figure
 def create_scenario_comparison_chart(comparison_result: Dict[str, Any]) -> go.Figure:
     """
     시나리오 비교 차트 생성
@@ -398,6 +884,13 @@ def create_scenario_comparison_chart(comparison_result: Dict[str, Any]) -> go.Fi
     # 기본 시나리오
     base_scenario = comparison_result.get("base_scenario", {})
     base_breakdown = base_scenario.get("yearly_breakdown", [])
+    scenarios = comparison_result.get("scenarios", [])
+
+    # 모든 시나리오의 점 개수 합으로 WebGL 사용 여부 결정
+    total_points = len(base_breakdown) + sum(
+        len(scenario_data.get("yearly_breakdown", [])) for scenario_data in scenarios
+    )
+    use_webgl = _use_webgl(total_points)
 
     if base_breakdown:
         years = [0] + [item["year"] for item in base_breakdown]
@@ -406,9 +899,10 @@ def create_scenario_comparison_chart(comparison_result: Dict[str, Any]) -> go.Fi
         ]
 
         fig.add_trace(
-            go.Scatter(
-                x=years,
-                y=assets,
+            _line_trace(
+                years,
+                assets,
+                use_webgl=use_webgl,
                 mode="lines+markers",
                 name="현재 패턴 유지",
                 line=dict(color="#1f77b4", width=3, dash="dash"),
@@ -417,7 +911,6 @@ def create_scenario_comparison_chart(comparison_result: Dict[str, Any]) -> go.Fi
         )
 
     # 각 시나리오
-    scenarios = comparison_result.get("scenarios", [])
     for i, scenario_data in enumerate(scenarios):
         scenario_name = scenario_data.get("scenario_name", f"시나리오 {i+1}")
         yearly_breakdown = scenario_data.get("yearly_breakdown", [])
@@ -429,9 +922,10 @@ def create_scenario_comparison_chart(comparison_result: Dict[str, Any]) -> go.Fi
             ]
 
             fig.add_trace(
-                go.Scatter(
-                    x=years,
-                    y=assets,
+                _line_trace(
+                    years,
+                    assets,
+                    use_webgl=use_webgl,
                     mode="lines+markers",
                     name=scenario_name,
                     line=dict(color=colors[(i + 1) % len(colors)], width=2),
@@ -440,18 +934,20 @@ def create_scenario_comparison_chart(comparison_result: Dict[str, Any]) -> go.Fi
             )
 
     fig.update_layout(
-        title="시나리오별 자산 변화 비교",
-        xaxis_title="연도",
-        yaxis_title="자산 (만원)",
-        hovermode="x unified",
-        template="plotly_white",
-        height=500,
-        legend=dict(yanchor="top", y=0.99, xanchor="left", x=0.01),
+        _from_template(
+            _LINE_CHART_LAYOUT,
+            title="시나리오별 자산 변화 비교",
+            xaxis_title="연도",
+            yaxis_title="자산 (만원)",
+            height=500,
+            legend=dict(_LEGEND_TOP_LEFT),
+        )
     )
 
     return fig
 
 
+@cache_figure
 def create_survival_chart(income_interruption_result: Dict[str, Any]) -> go.Figure:
     """
     소득 중단 생존 기간 차트 생성
@@ -497,16 +993,18 @@ def create_survival_chart(income_interruption_result: Dict[str, Any]) -> go.Figu
     )
 
     fig.update_layout(
-        title="소득 중단 시 생존 가능 기간",
-        yaxis_title="개월",
-        height=300,
-        template="plotly_white",
-        showlegend=False,
+        _from_template(
+            _BAR_CHART_LAYOUT,
+            title="소득 중단 시 생존 가능 기간",
+            yaxis_title="개월",
+            showlegend=False,
+        )
     )
 
     return fig
 
 
+@cache_figure
 def create_retirement_goal_chart(
     inputs: Dict[str, Any],
     current_monthly_contribution: float,
@@ -640,7 +1138,7 @@ def create_retirement_goal_chart(
         xaxis_title="매달 저축 금액 (만원)",
         yaxis_title="필요한 연간 수익률 (%)",
         hovermode="closest",
-        legend=dict(yanchor="top", y=0.99, xanchor="left", x=0.01),
+        legend=dict(_LEGEND_TOP_LEFT),
         height=500,
     )
 
@@ -16,14 +16,16 @@ if project_root_str not in sys.path:
     sys.path.insert(0, project_root_str)
 
 import streamlit as st
+from shared.perf_panel import start_perf_panel, perf_span, render_perf_panel
 from shared.session_manager import init_session_state
 from shared.page_input_form import render_page_input_form, check_inputs_complete
+from shared.profile_manager import render_profile_manager, render_sample_picker
 from modules.validators import validate_inputs, validate_logical_consistency
 from modules.calculations import (
-    calculate_future_assets,
+    cached_calculate_future_assets,
     calculate_financial_health_grade,
     calculate_monthly_savings,
-    calculate_retirement_goal,
+    cached_calculate_retirement_goal,
     find_optimal_contribution_rate,
     find_required_return_rate,
 )
@@ -31,14 +33,22 @@ from modules.formatters import (
     format_currency,
     format_percentage,
 )
-from modules.ai_insights import is_ai_enabled
+from modules.ai_insights import is_ai_enabled, get_insight_job
 from modules.visualizations import (
     create_future_assets_chart,
     create_financial_health_gauge,
     create_retirement_goal_chart,
 )
-from modules.download import create_json_download, get_download_filename
+from modules.download import (
+    create_json_download,
+    export_to_bytes,
+    get_download_filename,
+    write_csv,
+    write_zip_bundle,
+)
 from modules.utils import safe_calculate, validate_calculation_inputs
+from modules.storage import get_profile_store
+from data.sample_results import get_precomputed_results, load_precomputed_figure
 
 # 페이지 설정
 st.set_page_config(
@@ -68,6 +78,9 @@ st.markdown(
 # 세션 상태 초기화
 init_session_state()
 
+# 성능 패널 기록 시작 (PERF_PANEL=1 또는 ?perf=1 일 때만)
+start_perf_panel("소득 지출 분석")
+
 # 메인 콘텐츠
 st.title("📈 소득 지출 분석")
 st.markdown("현재 소비 패턴을 기반으로 미래 자산을 예측하고 재정 건전성을 평가합니다.")
@@ -87,6 +100,10 @@ required_fields = [
 
 inputs = render_page_input_form("income", required_fields)
 
+# 플랜 저장/불러오기
+render_profile_manager("income", inputs)
+render_sample_picker("income")
+
 # 입력 완료 여부 확인
 inputs_complete = check_inputs_complete(inputs, required_fields)
 
@@ -134,42 +151,66 @@ if run_simulation:
     # 인플레이션율 가져오기 (기본값 2.5%)
     inflation_rate = inputs.get("inflation_rate", 2.5)
 
+    # 적용한 샘플을 수정하지 않았으면 사전 계산된 결과 사용
+    precomputed = None
+    sample_name = st.session_state.get("sample_applied")
+    if sample_name:
+        precomputed, _, _ = safe_calculate(get_precomputed_results, inputs, sample_name)
+    precomputed_results = precomputed["results"] if precomputed else None
+
+    # 저장소에 같은 입력(+ 같은 엔진 버전)의 계산 결과가 있으면 사용
+    stored_results = None
+    if not precomputed_results:
+        stored_results, _, _ = safe_calculate(
+            get_profile_store().get_results, inputs, "income"
+        )
+        precomputed_results = stored_results
+
     # 미래 자산 추정 (은퇴 후 포함, 평균 수명까지)
-    future_assets_result, success1, error1 = safe_calculate(
-        calculate_future_assets,
-        inputs,
-        years_to_retirement,
-        inflation_rate,
-        True,  # include_post_retirement
-        83,  # life_expectancy (한국 평균 기대수명)
-        error_message="미래 자산 추정 중 오류가 발생했습니다.",
-    )
+    if precomputed_results:
+        future_assets_result = precomputed_results["future_assets"]
+    else:
+        future_assets_result, success1, error1 = safe_calculate(
+            cached_calculate_future_assets,
+            inputs,
+            years_to_retirement,
+            inflation_rate,
+            True,  # include_post_retirement
+            83,  # life_expectancy (한국 평균 기대수명)
+            error_message="미래 자산 추정 중 오류가 발생했습니다.",
+        )
 
-    if not success1:
-        st.error(f"⚠️ {error1}")
-        st.stop()
+        if not success1:
+            st.error(f"⚠️ {error1}")
+            st.stop()
 
     # 재정 건전성 등급
-    grade_result, success2, error2 = safe_calculate(
-        calculate_financial_health_grade,
-        inputs,
-        error_message="재정 건전성 등급 계산 중 오류가 발생했습니다.",
-    )
+    if precomputed_results:
+        grade_result = precomputed_results["grade"]
+    else:
+        grade_result, success2, error2 = safe_calculate(
+            calculate_financial_health_grade,
+            inputs,
+            error_message="재정 건전성 등급 계산 중 오류가 발생했습니다.",
+        )
 
-    if not success2:
-        st.error(f"⚠️ {error2}")
-        st.stop()
+        if not success2:
+            st.error(f"⚠️ {error2}")
+            st.stop()
 
     # 월 저축 가능액
-    monthly_savings, success3, error3 = safe_calculate(
-        calculate_monthly_savings,
-        inputs,
-        error_message="월 저축 가능액 계산 중 오류가 발생했습니다.",
-    )
+    if precomputed_results:
+        monthly_savings = precomputed_results["monthly_savings"]
+    else:
+        monthly_savings, success3, error3 = safe_calculate(
+            calculate_monthly_savings,
+            inputs,
+            error_message="월 저축 가능액 계산 중 오류가 발생했습니다.",
+        )
 
-    if not success3:
-        st.error(f"⚠️ {error3}")
-        st.stop()
+        if not success3:
+            st.error(f"⚠️ {error3}")
+            st.stop()
 
     # 계산 완료 상태 저장
     st.session_state.calculation_done_income = True
@@ -179,6 +220,15 @@ if run_simulation:
         "monthly_savings": monthly_savings,
     }
 
+    # 새로 계산한 결과는 저장소에 기록 (플랜을 다시 열 때 재사용)
+    if precomputed_results is None:
+        safe_calculate(
+            get_profile_store().put_results,
+            inputs,
+            "income",
+            st.session_state.results_income,
+        )
+
     # 입력 데이터 요약
     st.header("📋 입력 데이터 요약")
 
@@ -350,14 +400,18 @@ if run_simulation:
 
     with col1:
         st.subheader("나이별 자산 변화")
-        chart = create_future_assets_chart(
-            future_assets_result, current_age=inputs.get("current_age")
-        )
+        chart = load_precomputed_figure(precomputed, "future_assets")
+        if chart is None:
+            chart = create_future_assets_chart(
+                future_assets_result, current_age=inputs.get("current_age")
+            )
         st.plotly_chart(chart, use_container_width=True)
 
     with col2:
         st.subheader("재정 건전성 등급")
-        gauge = create_financial_health_gauge(grade_result)
+        gauge = load_precomputed_figure(precomputed, "financial_health_gauge")
+        if gauge is None:
+            gauge = create_financial_health_gauge(grade_result)
         st.plotly_chart(gauge, use_container_width=True)
 
     st.divider()
@@ -397,77 +451,72 @@ if run_simulation:
     st.header("💡 AI 인사이트")
     st.markdown("현재 재정 상태를 분석하여 맞춤형 조언을 제공합니다.")
 
+    # 인사이트는 나머지 화면을 먼저 그린 뒤 페이지 끝에서 이 자리에 스트리밍으로 채움
+    ai_placeholder = st.empty()
+    insight_job = None
+
     if not is_ai_enabled():
-        st.info(
+        ai_placeholder.info(
             "💡 AI 인사이트를 사용하려면 `.env` 파일에 `OPENAI_API_KEY`를 설정하세요."
         )
-        st.stop()
-
-    # 은퇴 목표 계산을 위한 기본값 설정 (AI 인사이트 생성에 필요)
-    inputs_for_retirement = inputs.copy()
-
-    # 은퇴 후 생활비가 없는 경우, 현재 생활비의 80%를 기본값으로 사용
-    if not inputs_for_retirement.get("retirement_monthly_expense"):
-        if "monthly_fixed_expense" in inputs and "monthly_variable_expense" in inputs:
-            current_monthly_expense = (
-                inputs["monthly_fixed_expense"] + inputs["monthly_variable_expense"]
+    else:
+        # 은퇴 목표 계산을 위한 기본값 설정 (AI 인사이트 생성에 필요)
+        inputs_for_retirement = inputs.copy()
+
+        # 은퇴 후 생활비가 없는 경우, 현재 생활비의 80%를 기본값으로 사용
+        if not inputs_for_retirement.get("retirement_monthly_expense"):
+            if "monthly_fixed_expense" in inputs and "monthly_variable_expense" in inputs:
+                current_monthly_expense = (
+                    inputs["monthly_fixed_expense"] + inputs["monthly_variable_expense"]
+                )
+            else:
+                current_monthly_expense = inputs.get("monthly_expense", 0)
+            inputs_for_retirement["retirement_monthly_expense"] = (
+                current_monthly_expense * 0.8
             )
-        else:
-            current_monthly_expense = inputs.get("monthly_expense", 0)
-        inputs_for_retirement["retirement_monthly_expense"] = (
-            current_monthly_expense * 0.8
-        )
-
-    # 의료비 기본값 설정
-    if not inputs_for_retirement.get("retirement_medical_expense"):
-        inputs_for_retirement["retirement_medical_expense"] = 450000  # 원 단위 (기본값 45만원)
-
-    # 은퇴 목표 계산 (기본값으로) - 원 단위
-    # 월 저축액을 50만원 단위로 반올림 (원 단위 기준)
-    default_monthly_contribution_for_insight = (
-        max(500000, (monthly_savings // 500000) * 500000) if monthly_savings > 0 else 1000000
-    )
 
-    # 기본 수익률(5%)로 은퇴 목표 계산
-    default_retirement_goal, success_retirement_goal, _ = safe_calculate(
-        calculate_retirement_goal,
-        inputs_for_retirement,
-        default_monthly_contribution_for_insight,
-        5.0,  # 기본 수익률 5%
-        4.0,
-        error_message="은퇴 자금 목표 계산 중 오류가 발생했습니다.",
-    )
+        # 의료비 기본값 설정
+        if not inputs_for_retirement.get("retirement_medical_expense"):
+            inputs_for_retirement["retirement_medical_expense"] = 450000  # 원 단위 (기본값 45만원)
 
-    if success_retirement_goal and default_retirement_goal:
-        default_retirement_goal["monthly_contribution"] = (
-            default_monthly_contribution_for_insight
+        # 은퇴 목표 계산 (기본값으로) - 원 단위
+        # 월 저축액을 50만원 단위로 반올림 (원 단위 기준)
+        default_monthly_contribution_for_insight = (
+            max(500000, (monthly_savings // 500000) * 500000) if monthly_savings > 0 else 1000000
         )
-        default_retirement_goal["annual_return_rate"] = 5.0
-
-    # 계산 결과 정리
-    calculation_results = {
-        "future_assets": future_assets_result,
-        "grade": grade_result,
-        "monthly_savings": monthly_savings,
-    }
 
-    # 은퇴 목표 계산 결과가 있는 경우만 추가
-    if success_retirement_goal and default_retirement_goal:
-        calculation_results["retirement_goal"] = default_retirement_goal
-
-    # AI 인사이트 생성 (항상 실행)
-    with st.spinner(
-        "🤖 AI가 맞춤형 인사이트와 실행 가능한 조언을 생성하고 있습니다..."
-    ):
-        from modules.ai_insights import generate_ai_insight
-
-        ai_insight = generate_ai_insight(inputs, calculation_results)
+        # 기본 수익률(5%)로 은퇴 목표 계산
+        default_retirement_goal, success_retirement_goal, _ = safe_calculate(
+            cached_calculate_retirement_goal,
+            inputs_for_retirement,
+            default_monthly_contribution_for_insight,
+            5.0,  # 기본 수익률 5%
+            4.0,
+            error_message="은퇴 자금 목표 계산 중 오류가 발생했습니다.",
+        )
 
-    if ai_insight:
-        st.markdown("### 🤖 AI 맞춤형 인사이트")
-        st.markdown(ai_insight)
-    else:
-        st.warning("⚠️ AI 인사이트 생성 중 오류가 발생했습니다. API 키를 확인해주세요.")
+        if success_retirement_goal and default_retirement_goal:
+            default_retirement_goal["monthly_contribution"] = (
+                default_monthly_contribution_for_insight
+            )
+            default_retirement_goal["annual_return_rate"] = 5.0
+
+        # 계산 결과 정리
+        calculation_results = {
+            "future_assets": future_assets_result,
+            "grade": grade_result,
+            "monthly_savings": monthly_savings,
+        }
+
+        # 은퇴 목표 계산 결과가 있는 경우만 추가
+        if success_retirement_goal and default_retirement_goal:
+            calculation_results["retirement_goal"] = default_retirement_goal
+
+        # AI 인사이트 생성 (백그라운드 실행, 입력이 바뀌면 이전 작업 취소)
+        insight_job = get_insight_job(st.session_state, inputs, calculation_results)
+        ai_placeholder.info(
+            "🤖 AI가 맞춤형 인사이트와 실행 가능한 조언을 생성하고 있습니다..."
+        )
 
     st.divider()
 
@@ -535,7 +584,7 @@ if run_simulation:
 
     # 현재 선택한 값에 대한 계산 결과
     goal_result, success_goal, error_goal = safe_calculate(
-        calculate_retirement_goal,
+        cached_calculate_retirement_goal,
         inputs,
         monthly_contribution,
         annual_return_rate,
@@ -690,3 +739,38 @@ if run_simulation:
         file_name=filename,
         mime="application/json",
     )
+
+    # JSON + 연도별 상세 내역 CSV 묶음 (CSV는 청크 단위로 zip 항목에 바로 기록)
+    yearly_breakdown = (future_assets_result or {}).get("yearly_breakdown", [])
+    bundle_data = export_to_bytes(
+        write_zip_bundle,
+        {
+            "income_analysis.json": json_data,
+            "yearly_breakdown.csv": lambda entry: write_csv(yearly_breakdown, entry),
+        },
+    )
+
+    st.download_button(
+        label="📦 결과 묶음 다운로드 (ZIP)",
+        data=bundle_data,
+        file_name=get_download_filename("income_analysis", "zip"),
+        mime="application/zip",
+    )
+
+    # AI 인사이트 스트리밍 표시 (생성되는 대로 위의 자리에 채움)
+    if insight_job is not None:
+        with perf_span("AI 인사이트 스트리밍"):
+            for insight_text in insight_job.iter_text():
+                ai_placeholder.markdown(f"### 🤖 AI 맞춤형 인사이트\n\n{insight_text}")
+
+        if insight_job.error == "timeout":
+            ai_placeholder.warning(
+                "⏱️ AI 인사이트 생성 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
+            )
+        elif insight_job.error or not insight_job.text.strip():
+            ai_placeholder.warning(
+                "⚠️ AI 인사이트 생성 중 오류가 발생했습니다. API 키를 확인해주세요."
+            )
+
+# 성능 패널 (켜져 있을 때만 표시)
+render_perf_panel()
@@ -16,6 +16,7 @@ if project_root_str not in sys.path:
     sys.path.insert(0, project_root_str)
 
 import streamlit as st
+from shared.perf_panel import start_perf_panel, render_perf_panel
 from shared.session_manager import init_session_state
 from shared.page_input_form import render_page_input_form, check_inputs_complete
 from modules.validators import validate_inputs, validate_logical_consistency
@@ -23,7 +24,7 @@ from modules.calculations import (
     calculate_income_interruption_survival,
     calculate_crisis_scenario,
     calculate_retirement_sustainability,
-    calculate_risk_score
+    cached_calculate_risk_score
 )
 from modules.formatters import (
     format_currency,
@@ -55,6 +56,9 @@ st.set_page_config(
 # 세션 상태 초기화
 init_session_state()
 
+# 성능 패널 기록 시작 (PERF_PANEL=1 또는 ?perf=1 일 때만)
+start_perf_panel("리스크 시나리오")
+
 # 메인 콘텐츠
 st.title("⚠️ 리스크 시나리오")
 st.markdown("다양한 리스크 상황에서의 재정 생존력을 분석합니다.")
@@ -177,7 +181,7 @@ if not success3:
 
 # 종합 위험도 점수
 risk_result, success4, error4 = safe_calculate(
-    calculate_risk_score,
+    cached_calculate_risk_score,
     inputs,
     error_message="위험도 점수 계산 중 오류가 발생했습니다."
 )
@@ -459,3 +463,5 @@ risk_result, success4, error4 = safe_calculate(
     else:
     st.info("계산을 먼저 수행해주세요.")
 
+# 성능 패널 (켜져 있을 때만 표시)
+render_perf_panel()
@@ -16,6 +16,7 @@ if project_root_str not in sys.path:
     sys.path.insert(0, project_root_str)
 
 import streamlit as st
+from shared.perf_panel import start_perf_panel, render_perf_panel
 from shared.session_manager import init_session_state, get_shared_inputs
 from shared.input_form import render_input_form
 from modules.validators import validate_inputs
@@ -40,6 +41,9 @@ st.set_page_config(page_title="시나리오 비교", page_icon="🔄", layout="w
 # 세션 상태 초기화
 init_session_state()
 
+# 성능 패널 기록 시작 (PERF_PANEL=1 또는 ?perf=1 일 때만)
+start_perf_panel("시나리오 비교")
+
 # 사이드바에 입력 폼 표시
 render_input_form()
 
@@ -403,3 +407,6 @@ if st.session_state.get("calculation_done_comparison", False) and comparison_sce
     )
 else:
     st.info("시나리오를 추가하고 계산을 수행해주세요.")
+
+# 성능 패널 (켜져 있을 때만 표시)
+render_perf_panel()
@@ -0,0 +1,129 @@
+"""
+페이지 4: 캐시 관리 (관리자 전용)
+
+차트/AI 응답/계산 결과 캐시의 항목 수, 크기, 적중률, 제거 횟수와
+가장 많이 쓰인 키를 보여주고, 실행 중에 캐시를 비우거나 크기를 바꿉니다.
+
+ADMIN_TOKEN 환경 변수가 설정되어 있고 같은 토큰을 입력해야 사용할 수 있습니다.
+"""
+
+import sys
+import os
+import hmac
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+current_file = Path(__file__).resolve()
+project_root = current_file.parent.parent
+project_root_str = str(project_root)
+if project_root_str not in sys.path:
+    sys.path.insert(0, project_root_str)
+
+import streamlit as st
+from modules.lazy_imports import load_dotenv_once
+from modules.cache_registry import get_registered_caches
+from modules.formatters import format_percentage
+
+# 페이지 설정
+st.set_page_config(page_title="캐시 관리", page_icon="🗄️", layout="wide")
+
+st.title("🗄️ 캐시 관리")
+
+# 관리자 확인
+load_dotenv_once()
+admin_token = os.getenv("ADMIN_TOKEN", "")
+if not admin_token:
+    st.error("ADMIN_TOKEN 환경 변수가 설정되지 않아 캐시 관리 페이지를 사용할 수 없습니다.")
+    st.stop()
+
+entered_token = st.text_input("관리자 토큰", type="password", key="cache_admin_token")
+if not hmac.compare_digest(entered_token.encode("utf-8"), admin_token.encode("utf-8")):
+    if entered_token:
+        st.error("관리자 토큰이 올바르지 않습니다.")
+    st.stop()
+
+
+def _format_bytes(size: int) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GB"
+
+
+def _clear_cache(name: str) -> None:
+    """비우기 버튼 콜백"""
+    get_registered_caches()[name].clear()
+    st.session_state["cache_admin_message"] = f"'{name}' 캐시를 비웠습니다."
+
+
+def _resize_cache(name: str) -> None:
+    """크기 변경 버튼 콜백"""
+    adapter = get_registered_caches()[name]
+    adapter.resize(
+        **{
+            limit: int(st.session_state[f"cache_admin_{name}_{limit}"])
+            for limit in adapter.limits()
+        }
+    )
+    st.session_state["cache_admin_message"] = f"'{name}' 캐시 크기를 변경했습니다."
+
+
+message = st.session_state.pop("cache_admin_message", None)
+if message:
+    st.success(message)
+
+st.caption("통계와 크기 변경은 이 서버 프로세스 기준입니다. SQLite 캐시의 항목/크기는 모든 워커가 공유합니다.")
+st.button("🔄 새로고침", key="cache_admin_refresh")
+
+for name, adapter in get_registered_caches().items():
+    st.divider()
+    st.subheader(adapter.description or name)
+
+    try:
+        stats = adapter.stats()
+        hottest = adapter.hottest(10)
+    except Exception as e:
+        st.warning(f"캐시 상태를 읽을 수 없습니다: {e}")
+        continue
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("항목 수", f"{stats['entries']:,}")
+    col2.metric("크기", _format_bytes(stats["bytes"]))
+    col3.metric(
+        "적중률",
+        format_percentage(stats["hit_rate"] * 100),
+        help=f"적중 {stats['hits']:,} / 미적중 {stats['misses']:,}",
+    )
+    col4.metric("제거 횟수", f"{stats['evictions']:,}")
+
+    if hottest:
+        st.markdown("**가장 많이 쓰인 키**")
+        st.dataframe(
+            [
+                {
+                    "키": key,
+                    "적중 횟수": hits,
+                    "크기": _format_bytes(size) if size is not None else "-",
+                }
+                for key, hits, size in hottest
+            ],
+            width="stretch",
+            hide_index=True,
+        )
+    else:
+        st.caption("적중 기록이 없습니다.")
+
+    limits = adapter.limits()
+    limit_columns = st.columns(len(limits) + 2)
+    for column, (limit, value) in zip(limit_columns, limits.items()):
+        column.number_input(
+            limit, min_value=0, value=int(value), step=1, key=f"cache_admin_{name}_{limit}"
+        )
+    limit_columns[-2].button(
+        "크기 변경", key=f"cache_admin_{name}_resize", on_click=_resize_cache, args=(name,)
+    )
+    limit_columns[-1].button(
+        "🗑️ 비우기", key=f"cache_admin_{name}_clear", on_click=_clear_cache, args=(name,)
+    )
@@ -7,6 +7,9 @@
 import streamlit as st
 from typing import Dict, Any, List, Optional
 from modules.formatters import format_currency
+from modules.life_events import LIFE_EVENT_PRESETS
+from modules.payroll import calculate_take_home_pay
+from modules.portfolio import ASSET_CLASSES, summarize_holdings
 import uuid
 
 # 지출 카테고리 정의 (가계부 앱 기준)
@@ -39,7 +42,10 @@ VARIABLE_EXPENSE_CATEGORIES = [
 ]
 
 # 자산 타입 정의
-ASSET_TYPES = ["예금", "적금", "주식", "부동산", "기타"]
+ASSET_TYPES = ["예금", "적금", "청약", "주식", "부동산", "기타"]
+
+# 적금 적립 방식
+SAVINGS_DEPOSIT_TYPES = ["정기적립식", "자유적립식"]
 
 # 대출 상환 방식 정의
 DEBT_REPAYMENT_TYPES = [
@@ -49,6 +55,49 @@ DEBT_REPAYMENT_TYPES = [
 ]
 
 
+# 페이지별 입력 필드 (세션 상태 키: f"{page_type}_{필드}", 프로필 저장 대상)
+PAGE_INPUT_FIELDS = [
+    "current_age",
+    "retirement_age",
+    "salary",
+    "salary_growth_rate",
+    "bonus",
+    "use_net_income",
+    "dependents",
+    "monthly_fixed_expense",
+    "monthly_variable_expense",
+    "total_assets",
+    "total_debt",
+    "inflation_rate",
+    "marital_status",
+    "retirement_monthly_expense",
+    "retirement_medical_expense",
+    "fixed_expense_items",
+    "variable_expense_items",
+    "asset_items",
+    "use_cashflow_schedule",
+    "use_portfolio_model",
+    *(f"portfolio_target_{name}" for name in ASSET_CLASSES),
+    "portfolio_rebalance",
+    "portfolio_glide_path",
+    "portfolio_retirement_stock",
+    "monthly_investment_items",
+    "debt_items",
+    "other_debt",
+    "life_events",
+]
+
+# 항목 추가 중 여부 등 화면 상태 필드 (초기화만 하고 저장하지 않음)
+PAGE_FORM_FLAG_FIELDS = [
+    "adding_fixed",
+    "adding_variable",
+    "adding_asset",
+    "adding_monthly_investment",
+    "adding_debt",
+    "adding_life_event",
+]
+
+
 def calculate_deposit_interest(
     principal: float, months: int, annual_rate: float, is_compound: bool = False
 ) -> float:
@@ -138,30 +187,7 @@ def clear_page_inputs(page_type: str):
     """
     # 해당 페이지의 모든 입력 필드 키 목록
     page_input_keys = [
-        f"{page_type}_current_age",
-        f"{page_type}_retirement_age",
-        f"{page_type}_salary",
-        f"{page_type}_salary_growth_rate",
-        f"{page_type}_bonus",
-        f"{page_type}_monthly_fixed_expense",
-        f"{page_type}_monthly_variable_expense",
-        f"{page_type}_total_assets",
-        f"{page_type}_total_debt",
-        f"{page_type}_inflation_rate",
-        f"{page_type}_marital_status",
-        f"{page_type}_retirement_monthly_expense",
-        f"{page_type}_retirement_medical_expense",
-        f"{page_type}_fixed_expense_items",
-        f"{page_type}_variable_expense_items",
-        f"{page_type}_asset_items",
-        f"{page_type}_monthly_investment_items",
-        f"{page_type}_debt_items",
-        f"{page_type}_other_debt",
-        f"{page_type}_adding_fixed",
-        f"{page_type}_adding_variable",
-        f"{page_type}_adding_asset",
-        f"{page_type}_adding_monthly_investment",
-        f"{page_type}_adding_debt",
+        f"{page_type}_{field}" for field in PAGE_INPUT_FIELDS + PAGE_FORM_FLAG_FIELDS
     ]
 
     # 해당 페이지의 입력 필드만 초기화
@@ -311,6 +337,33 @@ def render_page_input_form(
         # 원 단위로 저장
         inputs["bonus"] = bonus
 
+        use_net_income = st.checkbox(
+            "실수령액 기준으로 계산",
+            value=st.session_state.get(f"{page_type}_use_net_income", False),
+            key=f"{page_type}_use_net_income",
+            help="4대보험과 소득세/지방소득세를 뺀 실수령액으로 저축 가능액과 미래 자산을 계산합니다",
+        )
+        # 체크한 경우에만 추가 (기존 입력의 지문이 바뀌지 않도록)
+        if use_net_income:
+            inputs["use_net_income"] = True
+            dependents = st.number_input(
+                "부양가족 수 (본인 포함)",
+                min_value=1,
+                max_value=20,
+                value=st.session_state.get(f"{page_type}_dependents", 1),
+                step=1,
+                key=f"{page_type}_dependents",
+                help="소득세 인적공제(1인당 150만원) 대상 인원입니다",
+            )
+            inputs["dependents"] = dependents
+            gross_income = inputs["salary"] + bonus
+            if gross_income > 0:
+                take_home = calculate_take_home_pay(gross_income, dependents)
+                st.caption(
+                    f"예상 실수령액: 월 {take_home['net_monthly']:,.0f}원 "
+                    f"(연간 공제 {take_home['total_deductions']:,.0f}원)"
+                )
+
     with col3:
         st.subheader("소비 정보")
 
@@ -513,6 +566,9 @@ def render_page_input_form(
                 assets_total += calculate_deposit_interest(
                     principal, months, rate, is_compound
                 )
+            elif asset_type == "청약" or item.get("deposit_type") == "자유":
+                # 자유적립식 적금/청약은 현재 잔액
+                assets_total += item.get("amount", 0)
             elif asset_type == "적금":
                 monthly_amount = item.get("monthly_amount", 0)
                 months = item.get("months", 0)
@@ -551,6 +607,20 @@ def render_page_input_form(
                     st.text(
                         f"{principal:,}원, {months}개월, {rate:.2f}% ({interest_type}) → {total:,.0f}원"
                     )
+                elif asset_type == "청약":
+                    st.text(
+                        f"잔액 {item.get('amount', 0):,}원 ({item.get('paid_count', 0)}회차), "
+                        f"월 {item.get('monthly_amount', 0):,}원, {item.get('rate', 0.0):.2f}%"
+                    )
+                elif item.get("deposit_type") == "자유":
+                    months = item.get("months", 0)
+                    interest_type = "복리" if item.get("is_compound", False) else "단리"
+                    term_text = f"{months}개월" if months > 0 else "만기 없음"
+                    st.text(
+                        f"자유적립: 잔액 {item.get('amount', 0):,}원, "
+                        f"월 {item.get('monthly_amount', 0):,}원, {term_text}, "
+                        f"{item.get('rate', 0.0):.2f}% ({interest_type})"
+                    )
                 elif asset_type == "적금":
                     monthly_amount = item.get("monthly_amount", 0)
                     months = item.get("months", 0)
@@ -653,12 +723,27 @@ def render_page_input_form(
                     )
 
                 elif asset_type == "적금":
+                    deposit_type = st.selectbox(
+                        "적립 방식",
+                        SAVINGS_DEPOSIT_TYPES,
+                        key=f"{page_type}_new_savings_deposit_type",
+                        help="자유적립식은 현재 잔액과 월 평균 납입액으로 입력합니다",
+                    )
+                    is_free = deposit_type == "자유적립식"
+                    if is_free:
+                        balance = st.number_input(
+                            "현재 잔액 (원)",
+                            min_value=0,
+                            value=0,
+                            step=10000,
+                            key=f"{page_type}_new_savings_balance",
+                        )
                     col_amt, col_mon, col_rate, col_interest = st.columns(
                         [2, 1.5, 1.5, 1]
                     )
                     with col_amt:
                         monthly_amount = st.number_input(
-                            "매달 금액 (원)",
+                            "월 평균 납입액 (원)" if is_free else "매달 금액 (원)",
                             min_value=0,
                             value=0,
                             step=10000,
@@ -666,11 +751,12 @@ def render_page_input_form(
                         )
                     with col_mon:
                         months = st.number_input(
-                            "개월 수",
+                            "만기 개월 수" if is_free else "개월 수",
                             min_value=0,
                             value=0,
                             step=1,
                             key=f"{page_type}_new_savings_months",
+                            help="0이면 만기 없음" if is_free else None,
                         )
                     with col_rate:
                         rate = st.number_input(
@@ -697,6 +783,54 @@ def render_page_input_form(
                             "is_compound": is_compound == "복리",
                         }
                     )
+                    if is_free:
+                        new_item.update({"deposit_type": "자유", "amount": balance})
+
+                elif asset_type == "청약":
+                    col_amt, col_count = st.columns(2)
+                    with col_amt:
+                        balance = st.number_input(
+                            "현재 잔액 (원)",
+                            min_value=0,
+                            value=0,
+                            step=10000,
+                            key=f"{page_type}_new_subscription_balance",
+                        )
+                    with col_count:
+                        paid_count = st.number_input(
+                            "납입 회차",
+                            min_value=0,
+                            value=0,
+                            step=1,
+                            key=f"{page_type}_new_subscription_paid_count",
+                        )
+                    col_monthly, col_rate = st.columns(2)
+                    with col_monthly:
+                        monthly_amount = st.number_input(
+                            "회차당 납입액 (원)",
+                            min_value=0,
+                            value=0,
+                            step=10000,
+                            key=f"{page_type}_new_subscription_monthly_amount",
+                        )
+                    with col_rate:
+                        rate = st.number_input(
+                            "금리 (%)",
+                            min_value=0.0,
+                            max_value=20.0,
+                            value=0.0,
+                            step=0.1,
+                            format="%.2f",
+                            key=f"{page_type}_new_subscription_rate",
+                        )
+                    new_item.update(
+                        {
+                            "amount": balance,
+                            "paid_count": paid_count,
+                            "monthly_amount": monthly_amount,
+                            "rate": rate,
+                        }
+                    )
 
                 elif asset_type == "부동산":
                     value = st.number_input(
@@ -796,6 +930,18 @@ def render_page_input_form(
         inputs["total_assets"] = total_assets_value
         inputs["asset_items"] = asset_items
 
+        use_cashflow_schedule = st.checkbox(
+            "예금/적금/청약 만기 일정 반영",
+            value=st.session_state.get(f"{page_type}_use_cashflow_schedule", False),
+            key=f"{page_type}_use_cashflow_schedule",
+            help="예금/적금/청약을 평균 수익률에 합치지 않고 상품별 납입, 이자, 만기 일정으로 계산합니다",
+        )
+        # 체크한 경우에만 추가 (기존 입력의 지문이 바뀌지 않도록)
+        if use_cashflow_schedule:
+            inputs["use_cashflow_schedule"] = True
+
+        render_portfolio_section(page_type, inputs, asset_items)
+
         st.divider()
 
         # 월 저축/투자 계획 섹션
@@ -828,7 +974,7 @@ def render_page_input_form(
                 if asset_type == "예금":
                     rate = item.get("rate", 0.0)
                     st.text(f"월 {monthly_amount:,}원, 예상 금리 {rate:.2f}%")
-                elif asset_type == "적금":
+                elif asset_type in ["적금", "청약"]:
                     rate = item.get("rate", 0.0)
                     st.text(f"월 {monthly_amount:,}원, 예상 금리 {rate:.2f}%")
                 elif asset_type == "부동산":
@@ -886,7 +1032,7 @@ def render_page_input_form(
                     )
                     new_item["monthly_amount"] = monthly_amount
 
-                    if investment_type in ["예금", "적금"]:
+                    if investment_type in ["예금", "적금", "청약"]:
                         rate = st.number_input(
                             "예상 금리 (%)",
                             min_value=0.0,
@@ -1317,6 +1463,8 @@ def render_page_input_form(
         inputs["debt_items"] = debt_items
         inputs["total_monthly_debt_payment"] = total_monthly_debt_payment
 
+    render_life_event_section(page_type, inputs)
+
     # 추가 설정 (인플레이션율, 은퇴 후 생활비)
     st.divider()
     st.subheader("⚙️ 추가 설정")
@@ -1452,6 +1600,206 @@ def render_page_input_form(
     return inputs
 
 
+def _describe_life_event(event: Dict[str, Any]) -> str:
+    """생애 이벤트 한 줄 요약"""
+    end_age = event.get("end_age")
+    period = f"{event['start_age']}세~{end_age}세" if end_age else f"{event['start_age']}세~"
+    parts = []
+    if event.get("income_change_rate"):
+        parts.append(f"소득 {event['income_change_rate']:+.0f}%")
+    if event.get("income_change"):
+        parts.append(f"연 소득 {event['income_change'] / 10000:+,.0f}만원")
+    if event.get("expense_change"):
+        parts.append(f"월 지출 {event['expense_change'] / 10000:+,.0f}만원")
+    if event.get("asset_change"):
+        parts.append(f"자산 {event['asset_change'] / 10000:+,.0f}만원")
+    if event.get("property_change"):
+        parts.append(f"부동산 {event['property_change'] / 10000:+,.0f}만원")
+    if event.get("debt_change"):
+        loan_rate = event.get("loan_rate") or 0
+        parts.append(
+            f"부채 {event['debt_change'] / 10000:+,.0f}만원 "
+            + (f"(금리 {loan_rate:.1f}%)" if loan_rate else "(무이자)")
+        )
+    return f"{period} | " + (", ".join(parts) if parts else "변화 없음")
+
+
+def render_life_event_section(page_type: str, inputs: Dict[str, Any]) -> None:
+    """
+    생애 이벤트(결혼, 출산, 주택 구입, 실직 등) 입력 섹션
+
+    Args:
+        page_type: 페이지 타입
+        inputs: 입력 데이터 딕셔너리 (이벤트가 있으면 life_events 추가)
+    """
+    st.divider()
+    st.subheader("📅 생애 이벤트")
+    st.caption("특정 나이에 소득, 지출, 자산, 부채가 바뀌는 이벤트를 미래 자산 계산에 반영합니다.")
+
+    events_key = f"{page_type}_life_events"
+    if events_key not in st.session_state:
+        st.session_state[events_key] = []
+    life_events = st.session_state[events_key]
+
+    for event in sorted(life_events, key=lambda item: item.get("start_age", 0)):
+        col_type, col_info, col_del = st.columns([2, 6, 1])
+        with col_type:
+            st.text(event.get("name") or event.get("type", ""))
+        with col_info:
+            st.text(_describe_life_event(event))
+        with col_del:
+            if st.button(
+                "삭제",
+                key=f"{page_type}_life_event_del_{event['id']}",
+                use_container_width=True,
+            ):
+                st.session_state[events_key] = [
+                    item for item in life_events if item["id"] != event["id"]
+                ]
+                st.rerun()
+
+    if st.button(
+        "➕ 이벤트 추가", key=f"{page_type}_add_life_event", use_container_width=True
+    ):
+        st.session_state[f"{page_type}_adding_life_event"] = True
+
+    if st.session_state.get(f"{page_type}_adding_life_event", False):
+        with st.container():
+            col_kind, col_name, col_start, col_end = st.columns(4)
+            with col_kind:
+                event_type = st.selectbox(
+                    "이벤트 타입",
+                    list(LIFE_EVENT_PRESETS),
+                    key=f"{page_type}_new_life_event_type",
+                )
+            preset = LIFE_EVENT_PRESETS[event_type]
+            st.caption(f"💡 {preset['description']}")
+            current_age = int(inputs.get("current_age", 30))
+            with col_name:
+                name = st.text_input(
+                    "이름",
+                    value=event_type,
+                    key=f"{page_type}_new_life_event_name_{event_type}",
+                )
+            with col_start:
+                start_age = st.number_input(
+                    "시작 나이",
+                    min_value=0,
+                    max_value=120,
+                    value=current_age + 1,
+                    step=1,
+                    key=f"{page_type}_new_life_event_start_age",
+                )
+            with col_end:
+                duration = st.number_input(
+                    "기간 (년)",
+                    min_value=0,
+                    max_value=80,
+                    value=int(preset.get("duration", 0)),
+                    step=1,
+                    key=f"{page_type}_new_life_event_duration_{event_type}",
+                    help="0이면 시작 나이부터 계속 적용",
+                )
+
+            # 타입별 기본값이 바뀌도록 위젯 키에 타입을 포함
+            col_rate, col_income, col_expense, col_asset, col_debt = st.columns(5)
+            with col_rate:
+                income_change_rate = st.number_input(
+                    "소득 변화율 (%)",
+                    min_value=-100.0,
+                    max_value=200.0,
+                    value=float(preset.get("income_change_rate", 0.0)),
+                    step=10.0,
+                    key=f"{page_type}_new_life_event_income_rate_{event_type}",
+                )
+            with col_income:
+                income_change = st.number_input(
+                    "연 소득 변화 (원)",
+                    value=int(preset.get("income_change", 0)),
+                    step=1000000,
+                    key=f"{page_type}_new_life_event_income_{event_type}",
+                )
+            with col_expense:
+                expense_change = st.number_input(
+                    "월 지출 변화 (원)",
+                    value=int(preset.get("expense_change", 0)),
+                    step=100000,
+                    key=f"{page_type}_new_life_event_expense_{event_type}",
+                    help="현재 가치 기준 (인플레이션 반영)",
+                )
+            with col_asset:
+                asset_change = st.number_input(
+                    "자산 변화 (원)",
+                    value=int(preset.get("asset_change", 0)),
+                    step=1000000,
+                    key=f"{page_type}_new_life_event_asset_{event_type}",
+                    help="시작 나이에 한 번 유동 자산(예금/주식 등)에 반영 (현금 지출은 음수)",
+                )
+            with col_debt:
+                debt_change = st.number_input(
+                    "부채 증가 (원)",
+                    min_value=0,
+                    value=int(preset.get("debt_change", 0)),
+                    step=1000000,
+                    key=f"{page_type}_new_life_event_debt_{event_type}",
+                    help="기간을 입력하면 기간 동안 대출 금리로 원리금 균등 상환하고, 기간이 0이면 이자만 납입합니다",
+                )
+
+            col_property, col_loan_rate = st.columns(2)
+            with col_property:
+                property_change = st.number_input(
+                    "부동산 취득 (원)",
+                    min_value=0,
+                    value=int(preset.get("property_change", 0)),
+                    step=10000000,
+                    key=f"{page_type}_new_life_event_property_{event_type}",
+                    help="주택 가격 등 (유동 자산과 별도로 연 2.5% 상승 가정, 은퇴 후 생활비로 인출하지 않음)",
+                )
+            with col_loan_rate:
+                loan_rate = st.number_input(
+                    "대출 금리 (%)",
+                    min_value=0.0,
+                    max_value=30.0,
+                    value=float(preset.get("loan_rate", 0.0)),
+                    step=0.1,
+                    key=f"{page_type}_new_life_event_loan_rate_{event_type}",
+                    help="부채 증가분의 연 금리 (0이면 무이자)",
+                )
+
+            col_save, col_cancel = st.columns(2)
+            with col_save:
+                if st.button(
+                    "저장", key=f"{page_type}_save_life_event", use_container_width=True
+                ):
+                    new_event = {
+                        "id": str(uuid.uuid4()),
+                        "type": event_type,
+                        "name": name.strip() or event_type,
+                        "start_age": int(start_age),
+                        "end_age": int(start_age + duration - 1) if duration > 0 else None,
+                        "income_change_rate": income_change_rate,
+                        "income_change": income_change,
+                        "expense_change": expense_change,
+                        "asset_change": asset_change,
+                        "property_change": property_change,
+                        "debt_change": debt_change,
+                        "loan_rate": loan_rate,
+                    }
+                    st.session_state[events_key].append(new_event)
+                    st.session_state[f"{page_type}_adding_life_event"] = False
+                    st.rerun()
+            with col_cancel:
+                if st.button(
+                    "취소", key=f"{page_type}_cancel_life_event", use_container_width=True
+                ):
+                    st.session_state[f"{page_type}_adding_life_event"] = False
+                    st.rerun()
+
+    # 이벤트가 있는 경우에만 추가 (기존 입력의 지문이 바뀌지 않도록)
+    if life_events:
+        inputs["life_events"] = life_events
+
+
 def check_inputs_complete(inputs: Dict[str, Any], required_fields: List[str]) -> bool:
     """
     필수 입력 필드가 모두 채워졌는지 확인
@@ -1487,3 +1835,82 @@ def check_inputs_complete(inputs: Dict[str, Any], required_fields: List[str]) ->
             return False
 
     return True
+
+
+def render_portfolio_section(
+    page_type: str, inputs: Dict[str, Any], asset_items: List[Dict[str, Any]]
+) -> None:
+    """
+    자산군별 포트폴리오(목표 배분, 리밸런싱, 글라이드 패스) 입력 섹션
+
+    Args:
+        page_type: 페이지 타입
+        inputs: 입력 데이터 딕셔너리 (사용하면 portfolio_model 추가)
+        asset_items: 자산 항목 리스트 (목표 배분 기본값 계산)
+    """
+    use_portfolio = st.checkbox(
+        "자산군별 포트폴리오로 계산",
+        value=st.session_state.get(f"{page_type}_use_portfolio_model", False),
+        key=f"{page_type}_use_portfolio_model",
+        help="자산을 평균 수익률 하나로 합치지 않고 예금/적금/주식/부동산/기타별 잔액과 수익률로 계산합니다. 은퇴 후에도 수익률이 반영됩니다.",
+    )
+    if not use_portfolio:
+        return
+
+    # 목표 배분 기본값: 현재 보유 비중
+    values, _ = summarize_holdings(asset_items)
+    total = values.sum()
+    st.markdown("**목표 배분 (%)** - 매년 저축/인출이 이 비중대로 나뉩니다")
+    target_allocation = {}
+    for column, name, value in zip(st.columns(len(ASSET_CLASSES)), ASSET_CLASSES, values):
+        key = f"{page_type}_portfolio_target_{name}"
+        default = round(value / total * 100) if total > 0 else (100 if name == "예금" else 0)
+        with column:
+            target_allocation[name] = st.number_input(
+                name,
+                min_value=0,
+                max_value=100,
+                value=st.session_state.get(key, int(default)),
+                step=5,
+                key=key,
+            )
+    allocation_total = sum(target_allocation.values())
+    if allocation_total != 100:
+        st.caption(f"비중 합계 {allocation_total}% (합계 기준으로 정규화해 계산합니다)")
+
+    rebalance = st.checkbox(
+        "매년 리밸런싱",
+        value=st.session_state.get(f"{page_type}_portfolio_rebalance", True),
+        key=f"{page_type}_portfolio_rebalance",
+        help="매년 말 자산군별 잔액을 목표 배분으로 다시 맞춥니다",
+    )
+    glide_path = st.checkbox(
+        "은퇴가 가까워질수록 주식 비중 축소 (글라이드 패스)",
+        value=st.session_state.get(f"{page_type}_portfolio_glide_path", False),
+        key=f"{page_type}_portfolio_glide_path",
+    )
+
+    settings = {"target_allocation": target_allocation, "rebalance": rebalance}
+    if glide_path:
+        retirement_stock = st.number_input(
+            "은퇴 시 주식 비중 (%)",
+            min_value=0,
+            max_value=100,
+            value=st.session_state.get(f"{page_type}_portfolio_retirement_stock", 30),
+            step=5,
+            key=f"{page_type}_portfolio_retirement_stock",
+            help="은퇴 시점까지 주식 비중을 이 값으로 선형으로 줄이고, 나머지 자산군은 현재 비율대로 채웁니다",
+        )
+        others = {name: weight for name, weight in target_allocation.items() if name != "주식"}
+        others_total = sum(others.values())
+        remainder = 100 - retirement_stock
+        retirement_allocation = {
+            name: (weight / others_total * remainder if others_total > 0 else 0)
+            for name, weight in others.items()
+        }
+        if others_total == 0:
+            retirement_allocation["예금"] = remainder
+        retirement_allocation["주식"] = retirement_stock
+        settings["retirement_allocation"] = retirement_allocation
+
+    inputs["portfolio_model"] = settings
@@ -0,0 +1,374 @@
+"""
+개발자용 성능 패널
+
+Streamlit 실행(rerun) 한 번 동안 modules/ 와 shared/ 의 함수 호출을 프로파일러
+훅(sys.setprofile)으로 기록하여 다음을 보여줍니다.
+
+- 실행 타임라인: 페이지 코드가 직접 호출한 함수와 명시적 구간(span)
+- 함수별 호출 수와 누적 시간
+- 한 실행 안에서 같은 인자로 반복된 호출 (중복 계산)
+- 입력 폼(render_page_input_form) 렌더링 시간과 분류별(계산/차트/AI) 시간
+
+기본으로 꺼져 있으며, 환경 변수 PERF_PANEL=1 또는 URL 쿼리 ?perf=1 로 켭니다.
+"""
+
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from inspect import CO_ASYNC_GENERATOR, CO_COROUTINE, CO_GENERATOR, CO_VARARGS, CO_VARKEYWORDS
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import streamlit as st
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 호출을 기록할 디렉토리
+TRACKED_DIRS = (str(PROJECT_ROOT / "modules"), str(PROJECT_ROOT / "shared"))
+
+# 시간 분류 (모듈 이름 접두어 → 분류)
+CATEGORY_PREFIXES = (
+    ("shared.", "입력 폼"),
+    ("modules.visualizations", "차트"),
+    ("modules.ai_", "AI"),
+    ("modules.calculations", "계산"),
+    ("modules.advanced_insights", "계산"),
+    ("modules.validators", "검증"),
+    ("modules.download", "다운로드"),
+)
+
+INPUT_FORM_FUNCTIONS = ("render_page_input_form", "render_input_form")
+
+# 중복 호출로 표시할 최소 낭비 시간 (밀리초, 작은 헬퍼의 반복은 제외)
+DUPLICATE_MIN_WASTED_MS = 1.0
+
+SESSION_KEY = "_perf_profiler"
+
+_SKIP_FLAGS = CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR
+_UNSET = object()
+
+
+def _freeze(value: Any) -> Any:
+    """
+    중복 호출 판별용 해시 가능한 값으로 변환
+
+    dict/list/스칼라는 값으로 비교하고, 그 외 객체(차트, 배열 등)는 직렬화 비용을
+    피하기 위해 객체 식별자로 비교합니다.
+    """
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, dict):
+        return ("dict", tuple((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze(item) for item in value))
+    return (type(value).__name__, id(value))
+
+
+class RerunProfiler:
+    """실행 한 번의 함수 호출 기록기"""
+
+    def __init__(self, page_name: str, tracked_dirs: Tuple[str, ...] = TRACKED_DIRS):
+        """
+        Args:
+            page_name: 페이지 이름 (패널 표시용)
+            tracked_dirs: 호출을 기록할 소스 디렉토리
+        """
+        self.page_name = page_name
+        self.tracked_dirs = tracked_dirs
+        self.started_at = 0.0
+        self.finished_at: Optional[float] = None
+        self.timeline: List[Dict[str, Any]] = []
+        self.call_counts: Dict[str, int] = defaultdict(int)
+        self.call_seconds: Dict[str, float] = defaultdict(float)
+        self.argument_counts: Dict[Tuple[str, Any], List[float]] = defaultdict(list)
+        self._names: Dict[Any, Optional[str]] = {}
+        self._stack: List[Tuple[Any, str, float, Any]] = []
+        self._previous_profile = None
+
+    def start(self) -> "RerunProfiler":
+        """현재 스레드에서 기록 시작"""
+        self._previous_profile = sys.getprofile()
+        self.started_at = time.perf_counter()
+        sys.setprofile(self._profile)
+        return self
+
+    def stop(self) -> None:
+        """기록 종료 (이미 종료했으면 무시)"""
+        if self.finished_at is not None:
+            return
+        self.finished_at = time.perf_counter()
+        if sys.getprofile() == self._profile:
+            sys.setprofile(self._previous_profile)
+        self._stack.clear()
+
+    @property
+    def is_running(self) -> bool:
+        return self.finished_at is None and bool(self.started_at)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """
+        명시적 구간 기록
+
+        Args:
+            name: 구간 이름
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timeline.append(
+                {
+                    "name": name,
+                    "kind": "span",
+                    "start_ms": (start - self.started_at) * 1000,
+                    "duration_ms": (time.perf_counter() - start) * 1000,
+                }
+            )
+
+    def _describe(self, code: Any, frame: Any) -> Optional[str]:
+        """기록 대상 함수면 "모듈.함수" 이름, 아니면 None"""
+        if code.co_flags & _SKIP_FLAGS or code.co_name.startswith("<"):
+            return None
+        if not code.co_filename.startswith(self.tracked_dirs):
+            return None
+        return f"{frame.f_globals.get('__name__', '?')}.{code.co_qualname}"
+
+    @staticmethod
+    def _argument_key(code: Any, frame: Any) -> Any:
+        count = (
+            code.co_argcount
+            + code.co_kwonlyargcount
+            + bool(code.co_flags & CO_VARARGS)
+            + bool(code.co_flags & CO_VARKEYWORDS)
+        )
+        local_values = frame.f_locals
+        try:
+            return _freeze([local_values.get(name) for name in code.co_varnames[:count]])
+        except RecursionError:
+            return None
+
+    def _profile(self, frame: Any, event: str, arg: Any) -> None:
+        if event == "call":
+            code = frame.f_code
+            name = self._names.get(code, _UNSET)
+            if name is _UNSET:
+                name = self._names[code] = self._describe(code, frame)
+            if name is not None:
+                self._stack.append(
+                    (frame, name, time.perf_counter(), self._argument_key(code, frame))
+                )
+        elif event == "return" and self._stack and self._stack[-1][0] is frame:
+            _, name, start, argument_key = self._stack.pop()
+            duration = time.perf_counter() - start
+            self.call_counts[name] += 1
+            self.call_seconds[name] += duration
+            if argument_key is not None:
+                self.argument_counts[(name, argument_key)].append(duration)
+            if not self._stack:
+                # 페이지 코드가 직접 호출한 함수만 타임라인에 표시
+                self.timeline.append(
+                    {
+                        "name": name,
+                        "kind": "call",
+                        "start_ms": (start - self.started_at) * 1000,
+                        "duration_ms": duration * 1000,
+                    }
+                )
+
+    def duplicate_calls(self, min_wasted_ms: float = DUPLICATE_MIN_WASTED_MS) -> List[Dict[str, Any]]:
+        """
+        같은 인자로 두 번 이상 실행된 호출
+
+        Args:
+            min_wasted_ms: 표시할 최소 낭비 시간 (밀리초)
+
+        Returns:
+            List[Dict[str, Any]]: function, calls, wasted_ms (첫 호출 이후 시간 합),
+                낭비 시간이 큰 순
+        """
+        duplicates = [
+            {
+                "function": name,
+                "calls": len(durations),
+                "wasted_ms": sum(durations[1:]) * 1000,
+            }
+            for (name, _), durations in self.argument_counts.items()
+            if len(durations) > 1
+        ]
+        duplicates = [item for item in duplicates if item["wasted_ms"] >= min_wasted_ms]
+        return sorted(duplicates, key=lambda item: -item["wasted_ms"])
+
+    def category_seconds(self) -> Dict[str, float]:
+        """
+        분류별 시간 (타임라인 최상위 호출 기준, 하위 호출은 부모 분류에 포함)
+
+        Returns:
+            Dict[str, float]: 분류 이름 → 초
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        for entry in self.timeline:
+            if entry["kind"] != "call":
+                continue
+            category = next(
+                (label for prefix, label in CATEGORY_PREFIXES if entry["name"].startswith(prefix)),
+                "기타",
+            )
+            totals[category] += entry["duration_ms"] / 1000
+        return dict(totals)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        패널 표시용 요약
+
+        Returns:
+            Dict[str, Any]: page, total_ms, input_form_ms, categories_ms, timeline,
+                calls (호출 수/누적 시간 순), duplicates
+        """
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        input_form_ms = sum(
+            entry["duration_ms"]
+            for entry in self.timeline
+            if entry["kind"] == "call"
+            and entry["name"].rsplit(".", 1)[-1] in INPUT_FORM_FUNCTIONS
+        )
+        calls = [
+            {
+                "function": name,
+                "calls": count,
+                "total_ms": self.call_seconds[name] * 1000,
+            }
+            for name, count in self.call_counts.items()
+        ]
+        return {
+            "page": self.page_name,
+            "total_ms": (end - self.started_at) * 1000,
+            "input_form_ms": input_form_ms,
+            "categories_ms": {
+                label: seconds * 1000 for label, seconds in self.category_seconds().items()
+            },
+            "timeline": sorted(self.timeline, key=lambda entry: entry["start_ms"]),
+            "calls": sorted(calls, key=lambda item: -item["total_ms"]),
+            "duplicates": self.duplicate_calls(),
+        }
+
+
+def is_perf_panel_enabled() -> bool:
+    """
+    성능 패널 사용 여부 (환경 변수 PERF_PANEL=1 또는 쿼리 ?perf=1)
+
+    Returns:
+        bool: 사용 여부
+    """
+    if os.getenv("PERF_PANEL", "").strip().lower() in ("1", "true", "yes"):
+        return True
+    try:
+        return st.query_params.get("perf", "") in ("1", "true")
+    except Exception:
+        # 스크립트 실행 컨텍스트 밖 (테스트 등)
+        return False
+
+
+def start_perf_panel(page_name: str) -> Optional[RerunProfiler]:
+    """
+    이번 실행의 기록 시작 (페이지 맨 위에서 호출)
+
+    st.stop()으로 중단되어 끝나지 않은 이전 기록이 남아 있으면 먼저 종료합니다.
+
+    Args:
+        page_name: 페이지 이름
+
+    Returns:
+        Optional[RerunProfiler]: 기록기 (패널이 꺼져 있으면 None)
+    """
+    previous = st.session_state.get(SESSION_KEY)
+    if previous is not None:
+        previous.stop()
+        st.session_state[SESSION_KEY] = None
+
+    if not is_perf_panel_enabled():
+        return None
+    profiler = RerunProfiler(page_name).start()
+    st.session_state[SESSION_KEY] = profiler
+    return profiler
+
+
+@contextmanager
+def perf_span(name: str) -> Iterator[None]:
+    """
+    페이지 코드의 구간 기록 (패널이 꺼져 있으면 아무것도 하지 않음)
+
+    Args:
+        name: 구간 이름
+    """
+    profiler = st.session_state.get(SESSION_KEY)
+    if profiler is None or not profiler.is_running:
+        yield
+        return
+    with profiler.span(name):
+        yield
+
+
+def render_perf_panel() -> None:
+    """기록을 끝내고 성능 패널 표시 (페이지 맨 아래에서 호출)"""
+    profiler = st.session_state.get(SESSION_KEY)
+    if profiler is None:
+        return
+    profiler.stop()
+    st.session_state[SESSION_KEY] = None
+    summary = profiler.summary()
+
+    st.divider()
+    with st.expander(f"⏱️ 성능 패널 ({summary['page']})", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("전체 실행", f"{summary['total_ms']:.1f}ms")
+        col2.metric("입력 폼 렌더링", f"{summary['input_form_ms']:.1f}ms")
+        col3.metric("중복 호출", f"{len(summary['duplicates'])}건")
+
+        if summary["categories_ms"]:
+            st.caption(
+                " · ".join(
+                    f"{label} {ms:.1f}ms"
+                    for label, ms in sorted(summary["categories_ms"].items(), key=lambda item: -item[1])
+                )
+            )
+
+        if summary["duplicates"]:
+            st.warning(
+                "같은 인자로 반복 실행된 함수가 있습니다:\n\n"
+                + "\n".join(
+                    f"- `{item['function']}` {item['calls']}회 (낭비 {item['wasted_ms']:.1f}ms)"
+                    for item in summary["duplicates"][:10]
+                )
+            )
+
+        st.markdown("**실행 타임라인**")
+        st.dataframe(
+            [
+                {
+                    "구간": entry["name"],
+                    "종류": "구간" if entry["kind"] == "span" else "호출",
+                    "시작 (ms)": round(entry["start_ms"], 1),
+                    "소요 (ms)": round(entry["duration_ms"], 1),
+                }
+                for entry in summary["timeline"]
+            ],
+            width="stretch",
+            hide_index=True,
+        )
+
+        st.markdown("**함수별 호출 수**")
+        st.dataframe(
+            [
+                {
+                    "함수": item["function"],
+                    "호출 수": item["calls"],
+                    "누적 (ms)": round(item["total_ms"], 1),
+                }
+                for item in summary["calls"]
+            ],
+            width="stretch",
+            hide_index=True,
+        )
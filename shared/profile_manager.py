@@ -0,0 +1,157 @@
+"""
+저장된 플랜(프로필) 관리 컴포넌트
+
+입력 폼 상태를 modules.storage 저장소에 이름을 붙여 저장하고, 새로고침 후에도
+다시 불러올 수 있게 합니다. 불러온 플랜은 바로 시뮬레이션 결과를 표시하며,
+같은 입력의 계산 결과가 저장되어 있으면 다시 계산하지 않습니다.
+
+샘플 시나리오도 같은 방식으로 입력 폼에 적용하며, 적용한 샘플 이름을
+session_state['sample_applied']에 기록해 사전 계산 결과 번들을 찾는 데 사용합니다.
+"""
+
+import sqlite3
+from typing import Any, Dict
+
+import streamlit as st
+
+from data.sample_data import get_sample_form_state, get_sample_scenarios
+from modules.storage import get_profile_store
+from shared.page_input_form import PAGE_INPUT_FIELDS
+
+
+def get_form_state(page_type: str) -> Dict[str, Any]:
+    """
+    페이지 입력 폼 상태 수집
+
+    Args:
+        page_type: 페이지 타입 ("income", "risk", "comparison")
+
+    Returns:
+        Dict[str, Any]: 필드 이름별 위젯 값 (입력한 필드만)
+    """
+    return {
+        field: st.session_state[f"{page_type}_{field}"]
+        for field in PAGE_INPUT_FIELDS
+        if st.session_state.get(f"{page_type}_{field}") is not None
+    }
+
+
+def _save_profile(page_type: str, inputs: Dict[str, Any]) -> None:
+    """저장 버튼 콜백"""
+    name = st.session_state.get(f"{page_type}_profile_name", "")
+    try:
+        get_profile_store().save_profile(name, inputs, get_form_state(page_type))
+        st.session_state[f"{page_type}_profile_message"] = ("success", f"'{name.strip()}' 플랜을 저장했습니다.")
+    except (ValueError, OSError, sqlite3.Error) as e:
+        st.session_state[f"{page_type}_profile_message"] = ("error", f"플랜 저장 실패: {e}")
+
+
+def _apply_form_state(page_type: str, form_state: Dict[str, Any]) -> None:
+    """입력 폼 상태를 세션 상태에 적용 (없는 필드는 지움) 후 결과를 바로 표시"""
+    for field in PAGE_INPUT_FIELDS:
+        key = f"{page_type}_{field}"
+        if field in form_state:
+            st.session_state[key] = form_state[field]
+        elif key in st.session_state:
+            del st.session_state[key]
+    st.session_state["_current_page"] = page_type
+    st.session_state[f"calculation_done_{page_type}"] = True
+
+
+def _apply_sample(page_type: str) -> None:
+    """샘플 적용 버튼 콜백 (위젯 생성 전에 실행되므로 입력 필드 값을 바꿀 수 있음)"""
+    name = st.session_state.get(f"{page_type}_sample_select")
+    if name not in get_sample_scenarios():
+        return
+    _apply_form_state(page_type, get_sample_form_state(name))
+    st.session_state["sample_applied"] = name
+    st.session_state[f"{page_type}_sample_message"] = f"'{name}' 샘플을 적용했습니다."
+
+
+def _load_profile(page_type: str) -> None:
+    """불러오기 버튼 콜백 (위젯 생성 전에 실행되므로 입력 필드 값을 바꿀 수 있음)"""
+    name = st.session_state.get(f"{page_type}_profile_select")
+    profile = get_profile_store().load_profile(name) if name else None
+    if profile is None:
+        st.session_state[f"{page_type}_profile_message"] = ("error", "플랜을 찾을 수 없습니다.")
+        return
+
+    _apply_form_state(page_type, profile["form_state"])
+    st.session_state[f"{page_type}_profile_name"] = profile["name"]
+    st.session_state[f"{page_type}_profile_message"] = ("success", f"'{profile['name']}' 플랜을 불러왔습니다.")
+
+
+def _delete_profile(page_type: str) -> None:
+    """삭제 버튼 콜백"""
+    name = st.session_state.get(f"{page_type}_profile_select")
+    if name and get_profile_store().delete_profile(name):
+        st.session_state[f"{page_type}_profile_message"] = ("success", f"'{name}' 플랜을 삭제했습니다.")
+
+
+def render_profile_manager(page_type: str, inputs: Dict[str, Any]) -> None:
+    """
+    플랜 저장/불러오기/삭제 UI 렌더링 (입력 폼 아래에서 호출)
+
+    Args:
+        page_type: 페이지 타입 ("income", "risk", "comparison")
+        inputs: 현재 입력 데이터 딕셔너리
+    """
+    with st.expander("💾 플랜 저장 / 불러오기"):
+        message = st.session_state.pop(f"{page_type}_profile_message", None)
+        if message:
+            getattr(st, message[0])(message[1])
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.text_input("플랜 이름", key=f"{page_type}_profile_name", placeholder="예: 우리집 기본 플랜")
+            st.button(
+                "저장",
+                key=f"{page_type}_profile_save",
+                on_click=_save_profile,
+                args=(page_type, inputs),
+            )
+
+        with col2:
+            try:
+                names = [profile["name"] for profile in get_profile_store().list_profiles()]
+            except (OSError, sqlite3.Error) as e:
+                st.warning(f"저장소를 열 수 없습니다: {e}")
+                return
+            if not names:
+                st.caption("저장된 플랜이 없습니다.")
+                return
+            st.selectbox("저장된 플랜", names, key=f"{page_type}_profile_select")
+            load_col, delete_col = st.columns(2)
+            load_col.button(
+                "불러오기", key=f"{page_type}_profile_load", on_click=_load_profile, args=(page_type,)
+            )
+            delete_col.button(
+                "삭제", key=f"{page_type}_profile_delete", on_click=_delete_profile, args=(page_type,)
+            )
+
+
+def render_sample_picker(page_type: str) -> None:
+    """
+    샘플 시나리오 적용 UI 렌더링 (입력 폼 아래에서 호출)
+
+    적용한 샘플을 수정하지 않고 시뮬레이션하면 사전 계산된 결과를 사용합니다.
+
+    Args:
+        page_type: 페이지 타입 ("income", "risk", "comparison")
+    """
+    with st.expander("🎯 샘플 데이터"):
+        message = st.session_state.pop(f"{page_type}_sample_message", None)
+        if message:
+            st.success(message)
+
+        names = list(get_sample_scenarios())
+        applied = st.session_state.get("sample_applied")
+        st.selectbox(
+            "샘플 데이터 선택",
+            names,
+            index=names.index(applied) if applied in names else 0,
+            key=f"{page_type}_sample_select",
+        )
+        st.button(
+            "샘플 데이터 적용", key=f"{page_type}_sample_apply", on_click=_apply_sample, args=(page_type,)
+        )
@@ -0,0 +1,175 @@
+"""
+OpenAI Chat Completions API 로컬 스텁 서버
+
+테스트에서 실제 API 대신 사용합니다. stream=True 요청에는
+SSE(Server-Sent Events) 형식으로 텍스트 조각을 하나씩 보내고,
+일반 요청에는 전체 텍스트를 한 번에 반환합니다.
+
+사용 예:
+    with OpenAIStubServer(chunks=["안녕", "하세요"]) as stub:
+        os.environ["OPENAI_BASE_URL"] = stub.base_url
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+
+class OpenAIStubServer:
+    """스트리밍 Chat Completions API를 흉내 내는 로컬 서버"""
+
+    def __init__(
+        self,
+        chunks: Optional[List[str]] = None,
+        chunk_delay: float = 0.0,
+        status: int = 200,
+        fail_first: int = 0,
+        response_delay: float = 0.0,
+    ):
+        """
+        Args:
+            chunks: 응답 텍스트 조각 목록
+            chunk_delay: 조각 사이 지연 시간 (초)
+            status: HTTP 응답 코드 (200이 아니면 오류 응답)
+            fail_first: 처음 몇 번의 요청을 status 오류로 응답할지 (0이면 status를 항상 사용)
+            response_delay: 응답 전 지연 시간 (초)
+        """
+        self.chunks = chunks if chunks is not None else ["## 📊 재정 상태 분석\n", "양호합니다."]
+        self.chunk_delay = chunk_delay
+        self.status = status
+        self.fail_first = fail_first
+        self.response_delay = response_delay
+        self.requests: List[dict] = []
+        self.sent_chunks = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._counter_lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """OpenAI 클라이언트에 넘길 base_url"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "OpenAIStubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "OpenAIStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                with stub._counter_lock:
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                try:
+                    self._handle_post()
+                finally:
+                    with stub._counter_lock:
+                        stub.in_flight -= 1
+
+            def _handle_post(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with stub._counter_lock:
+                    stub.requests.append(body)
+                    request_number = len(stub.requests)
+
+                if stub.response_delay:
+                    time.sleep(stub.response_delay)
+
+                failing = stub.status != 200 and (
+                    stub.fail_first == 0 or request_number <= stub.fail_first
+                )
+                if failing:
+                    self._send_json(
+                        stub.status,
+                        {"error": {"message": "stub error", "type": "server_error"}},
+                    )
+                    return
+
+                if body.get("stream"):
+                    self._send_stream(body.get("model", ""))
+                else:
+                    self._send_json(200, _completion(body.get("model", ""), "".join(stub.chunks)))
+
+            def _send_json(self, status, payload):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_stream(self, model):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                try:
+                    for chunk in stub.chunks:
+                        if stub.chunk_delay:
+                            time.sleep(stub.chunk_delay)
+                        self._send_event(_chunk(model, chunk))
+                        stub.sent_chunks += 1
+                    self._send_event(_chunk(model, None, finish_reason="stop"))
+                    self.wfile.write(b"data: [DONE]\n\n")
+                    self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    # 클라이언트가 스트림을 닫은 경우 (취소)
+                    pass
+
+            def _send_event(self, payload):
+                data = json.dumps(payload, ensure_ascii=False)
+                self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+        return Handler
+
+
+def _chunk(model: str, content: Optional[str], finish_reason: Optional[str] = None) -> dict:
+    delta = {"content": content} if content is not None else {}
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def _completion(model: str, content: str) -> dict:
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
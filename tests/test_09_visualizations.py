@@ -10,6 +10,8 @@ import sys
 from pathlib import Path
 import unittest
 
+import numpy as np
+
 # 프로젝트 루트 디렉토리를 경로에 추가
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -147,6 +149,122 @@ class TestVisualizations(unittest.TestCase):
         self.assertIsInstance(fig, go.Figure)
         self.assertIsNotNone(fig.data)
         print("[OK] 소득 중단 생존 기간 차트 생성 테스트 통과")
+    
+    def test_figure_cache_reuses_unchanged_chart(self):
+        """같은 결과 데이터에 대한 차트 캐시 재사용 테스트"""
+        visualizations.clear_figure_cache()
+        
+        fig1 = visualizations.create_risk_score_chart(self.sample_risk_result)
+        fig2 = visualizations.create_risk_score_chart(dict(self.sample_risk_result))
+        
+        self.assertIs(fig1, fig2)
+        stats = visualizations.get_figure_cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        print("[OK] 차트 캐시 재사용 테스트 통과")
+    
+    def test_figure_cache_misses_on_changed_data(self):
+        """결과 데이터가 바뀌면 차트를 다시 생성하는지 테스트"""
+        visualizations.clear_figure_cache()
+        
+        fig1 = visualizations.create_financial_health_gauge(self.sample_grade_result)
+        changed = dict(self.sample_grade_result, grade='D')
+        fig2 = visualizations.create_financial_health_gauge(changed)
+        
+        self.assertIsNot(fig1, fig2)
+        self.assertEqual(visualizations.get_figure_cache_stats()['misses'], 2)
+        print("[OK] 데이터 변경 시 차트 재생성 테스트 통과")
+    
+    def test_layout_templates_are_not_mutated(self):
+        """정적 레이아웃 템플릿이 차트 생성 후에도 그대로인지 테스트"""
+        visualizations.clear_figure_cache()
+        
+        visualizations.create_risk_breakdown_chart(self.sample_risk_result)
+        visualizations.create_survival_chart(self.sample_income_interruption)
+        
+        self.assertEqual(
+            dict(visualizations._BAR_CHART_LAYOUT),
+            {'height': 300, 'template': 'plotly_white'}
+        )
+        with self.assertRaises(TypeError):
+            visualizations._GAUGE_LAYOUT['height'] = 500
+        print("[OK] 레이아웃 템플릿 불변 테스트 통과")
+    
+    def test_lttb_keeps_endpoints_and_size(self):
+        """LTTB 다운샘플링 테스트"""
+        x = list(range(5000))
+        y = [(i % 97) * (1 if i % 2 else -1) for i in x]
+        
+        down_x, down_y = visualizations.downsample_lttb(x, y, 500)
+        
+        self.assertEqual(len(down_x), 500)
+        self.assertEqual(len(down_y), 500)
+        self.assertEqual(down_x[0], 0)
+        self.assertEqual(down_x[-1], 4999)
+        self.assertEqual(down_x, sorted(down_x))
+        
+        # 점이 적으면 그대로 유지
+        small_x, _ = visualizations.downsample_lttb([0, 1, 2], [5, 6, 7], 500)
+        self.assertEqual(small_x, [0, 1, 2])
+        print("[OK] LTTB 다운샘플링 테스트 통과")
+    
+    def test_dense_series_uses_webgl(self):
+        """점이 많은 차트의 WebGL 전환 테스트"""
+        breakdown = [{'year': i, 'assets': 1000 + i} for i in range(1, 5001)]
+        fig = visualizations.create_future_assets_chart(
+            {'current_assets': 1000, 'yearly_breakdown': breakdown}
+        )
+        
+        report = visualizations.figure_payload_report(fig)
+        self.assertEqual(report['webgl_traces'], 1)
+        self.assertLessEqual(
+            report['point_count'], visualizations.DOWNSAMPLE_TARGET_POINTS
+        )
+        self.assertEqual(fig.data[0].mode, 'lines')
+        
+        # 기존 크기의 차트는 SVG 유지
+        small_fig = visualizations.create_future_assets_chart(
+            self.sample_future_assets
+        )
+        small_report = visualizations.figure_payload_report(small_fig)
+        self.assertEqual(small_report['webgl_traces'], 0)
+        self.assertGreater(small_report['total_bytes'], 0)
+        self.assertEqual(small_report['trace_count'], len(small_fig.data))
+        print("[OK] WebGL 전환 및 페이로드 보고서 테스트 통과")
+    
+    def test_fan_chart_quantiles(self):
+        """팬 차트 백분위 계산 테스트"""
+        paths = np.tile(np.arange(101, dtype=float)[:, np.newaxis], (1, 4))
+        quantiles = visualizations.compute_fan_quantiles(paths)
+        
+        self.assertEqual(sorted(quantiles), [5, 25, 50, 75, 95])
+        self.assertEqual(quantiles[50], [50.0] * 4)
+        self.assertEqual(quantiles[5], [5.0] * 4)
+        
+        fig = visualizations.create_fan_chart(quantiles=quantiles, current_age=40)
+        self.assertEqual(len(fig.data), 5)
+        self.assertEqual(list(fig.data[-1].x), [40, 41, 42, 43])
+        print("[OK] 팬 차트 백분위 계산 테스트 통과")
+    
+    def test_fan_chart_payload_independent_of_paths(self):
+        """팬 차트 전송 크기가 경로 수와 무관한지 테스트"""
+        rng = np.random.default_rng(0)
+        growth = np.cumprod(1 + rng.normal(0.05, 0.1, size=(5000, 30)), axis=1)
+        
+        small = visualizations.create_fan_chart(paths=growth[:100] * 1000)
+        large = visualizations.create_fan_chart(paths=growth * 1000)
+        
+        small_report = visualizations.figure_payload_report(small)
+        large_report = visualizations.figure_payload_report(large)
+        self.assertEqual(small_report['point_count'], large_report['point_count'])
+        self.assertEqual(large_report['point_count'], 5 * 30)
+        print("[OK] 팬 차트 전송 크기 테스트 통과")
+    
+    def test_fan_chart_empty(self):
+        """빈 데이터 팬 차트 테스트"""
+        fig = visualizations.create_fan_chart()
+        self.assertEqual(len(fig.data), 0)
+        print("[OK] 빈 팬 차트 테스트 통과")
 
 
 def run_all_tests():
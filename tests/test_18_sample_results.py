@@ -0,0 +1,160 @@
+"""
+샘플 시나리오 사전 계산 결과 번들 테스트
+
+테스트 항목:
+1. 번들 생성 및 로드 테스트
+2. 버전 불일치 시 무효화 테스트
+3. 입력 지문 기반 조회 테스트
+4. 페이지 입력 폼에 적용한 샘플 조회 테스트
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data import sample_results
+from data.sample_data import (
+    get_sample_data,
+    get_sample_form_state,
+    get_sample_page_inputs,
+    get_sample_scenarios,
+)
+from modules.calculations import calculate_future_assets
+from modules.hashing import fingerprint
+
+
+class TestSampleResults(unittest.TestCase):
+    """샘플 결과 번들 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.bundle_path = Path(self.temp_dir.name) / "bundle.json"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_build_and_load_bundle(self):
+        """번들 생성 후 로드 테스트"""
+        bundle = sample_results.build_sample_results_bundle(self.bundle_path)
+
+        self.assertEqual(set(bundle["scenarios"]), set(get_sample_scenarios()))
+        loaded = sample_results.load_sample_results_bundle(self.bundle_path)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded["version"], sample_results.get_bundle_version())
+
+        entry = loaded["scenarios"]["일반 직장인"]
+        self.assertIn("future_assets", entry["results"])
+        self.assertIn("risk", entry["results"])
+        self.assertIn("retirement_goal", entry["figures"])
+        print("[OK] 번들 생성 및 로드 테스트 통과")
+
+    def test_results_match_direct_calculation(self):
+        """사전 계산 결과가 직접 계산 결과와 같은지 테스트"""
+        entry = sample_results.compute_sample_results("은퇴 준비 중")
+        inputs = get_sample_page_inputs("은퇴 준비 중")
+        direct = calculate_future_assets(
+            inputs, inputs["retirement_age"] - inputs["current_age"], 2.5, True, 83
+        )
+
+        self.assertAlmostEqual(
+            entry["results"]["future_assets"]["future_assets"],
+            direct["future_assets"],
+        )
+        self.assertEqual(entry["input_hash"], fingerprint(inputs))
+        print("[OK] 사전 계산 결과 일치 테스트 통과")
+
+    def test_stale_bundle_is_rejected(self):
+        """버전이 다른 번들 무효화 테스트"""
+        sample_results.build_sample_results_bundle(self.bundle_path)
+        with open(self.bundle_path, "r", encoding="utf-8") as bundle_file:
+            bundle = json.load(bundle_file)
+        bundle["version"] = "stale"
+        with open(self.bundle_path, "w", encoding="utf-8") as bundle_file:
+            json.dump(bundle, bundle_file)
+
+        self.assertIsNone(sample_results.load_sample_results_bundle(self.bundle_path))
+
+        # 계산 엔진 의존 모듈(급여, 일정, 이벤트 등)이 바뀌어도 번들 버전이 바뀜
+        sample_results.build_sample_results_bundle(self.bundle_path)
+        with mock.patch("data.sample_results.get_engine_version", return_value="changed"):
+            self.assertIsNone(sample_results.load_sample_results_bundle(self.bundle_path))
+        self.assertIsNotNone(sample_results.load_sample_results_bundle(self.bundle_path))
+        print("[OK] 오래된 번들 무효화 테스트 통과")
+
+    def test_missing_bundle_returns_none(self):
+        """번들 파일이 없을 때 테스트"""
+        self.assertIsNone(
+            sample_results.load_sample_results_bundle(self.bundle_path)
+        )
+        print("[OK] 번들 파일 없음 테스트 통과")
+
+    def test_get_precomputed_results(self):
+        """입력 지문으로 사전 계산 결과 조회 테스트"""
+        inputs = get_sample_page_inputs("일반 직장인")
+        entry = sample_results.get_precomputed_results(inputs)
+        self.assertIsNotNone(entry)
+        self.assertIs(sample_results.get_precomputed_results(inputs, "일반 직장인"), entry)
+        self.assertIsNone(sample_results.get_precomputed_results(inputs, "중년 직장인"))
+
+        # 샘플 데이터(만원 단위)를 그대로 넘기면 페이지 입력과 달라 찾지 않음
+        self.assertIsNone(sample_results.get_precomputed_results(get_sample_data("일반 직장인")))
+
+        inputs["salary"] += 1
+        self.assertIsNone(sample_results.get_precomputed_results(inputs))
+        self.assertIsNone(sample_results.get_precomputed_results(inputs, "일반 직장인"))
+
+        figure = sample_results.load_precomputed_figure(entry, "future_assets")
+        self.assertIsNotNone(figure)
+        print("[OK] 사전 계산 결과 조회 테스트 통과")
+
+    def test_applied_sample_matches_page_form(self):
+        """페이지 입력 폼에 적용한 샘플 조회 테스트"""
+        # 소득 지출 분석 페이지에서 '일반 직장인' 샘플을 적용했을 때 입력 폼이 반환하는 값
+        # (키 순서와 정수/실수 표기는 입력 지문에 영향 없음)
+        inputs = {
+            "current_age": 30, "retirement_age": 60, "marital_status": "부부(2인 가구)",
+            "salary": 50000000, "salary_growth_rate": 3.0, "bonus": 0,
+            "monthly_fixed_expense": 1200000, "monthly_variable_expense": 800000,
+            "fixed_expense_items": [
+                {"id": "sample_fixed", "category": "주거/통신", "amount": 1200000},
+            ],
+            "variable_expense_items": [
+                {"id": "sample_variable", "category": "생활", "amount": 800000},
+            ],
+            "total_assets": 10000000,
+            "asset_items": [
+                {"id": "sample_assets", "type": "기타", "other_type": "보유 자산",
+                 "amount": 10000000, "return_rate": 0.0},
+            ],
+            "monthly_investment_items": [], "monthly_investment_total": 0,
+            "total_debt": 0, "debt_items": [], "total_monthly_debt_payment": 0,
+            "inflation_rate": 2.5, "retirement_monthly_expense": 3180000.0,
+            "retirement_medical_expense": 450000,
+        }
+        state = get_sample_form_state("일반 직장인")
+        self.assertEqual(state["salary"], inputs["salary"])
+        self.assertEqual(state["asset_items"], inputs["asset_items"])
+
+        entry = sample_results.get_precomputed_results(inputs, "일반 직장인")
+        self.assertIsNotNone(entry)
+
+        # 결과 단위도 페이지 계산과 같음 (원 단위)
+        direct = calculate_future_assets(inputs, 30, 2.5, True, 83)
+        self.assertAlmostEqual(
+            entry["results"]["future_assets"]["future_assets"], direct["future_assets"]
+        )
+
+        # 적용 후 입력을 바꾸면 사전 계산 결과를 쓰지 않음
+        edited = dict(inputs, monthly_variable_expense=900000)
+        self.assertIsNone(sample_results.get_precomputed_results(edited, "일반 직장인"))
+        print("[OK] 페이지 입력 폼 샘플 조회 테스트 통과")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+AI 인사이트 백그라운드 스트리밍 생성 테스트
+
+로컬 스텁 서버(tests/openai_stub.py)로 스트리밍 API를 흉내 냅니다.
+
+테스트 항목:
+1. 스트리밍 텍스트 수신 테스트
+2. 백그라운드 작업 재사용/취소 테스트
+3. 제한 시간 초과 테스트
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules import ai_cache, ai_client, ai_insights
+from tests.openai_stub import OpenAIStubServer
+
+
+class TestAIInsightStream(unittest.TestCase):
+    """AI 인사이트 스트리밍 테스트"""
+
+    def setUp(self):
+        self.inputs = {'current_age': 35, 'retirement_age': 60, 'salary': 5000}
+        self.results = {'monthly_savings': 100}
+
+        # 테스트마다 빈 응답 캐시 사용
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        patcher = mock.patch.object(
+            ai_cache, '_default_cache', ai_cache.AIResponseCache(temp_dir.name)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # 재시도 대기 시간을 줄인 클라이언트 관리자 사용
+        patcher = mock.patch.object(
+            ai_client, '_default_manager', ai_client.AIClientManager(backoff_base=0.01)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _use_stub(self, stub):
+        patcher = mock.patch.dict(
+            os.environ,
+            {'OPENAI_API_KEY': 'test-key', 'OPENAI_BASE_URL': stub.base_url},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stream_yields_chunks(self):
+        """스트리밍 텍스트 조각 수신 테스트"""
+        with OpenAIStubServer(chunks=['가', '나', '다']) as stub:
+            self._use_stub(stub)
+            chunks = list(ai_insights.stream_ai_insight(self.inputs, self.results))
+
+        self.assertEqual(chunks, ['가', '나', '다'])
+        self.assertTrue(stub.requests[0]['stream'])
+        print("[OK] 스트리밍 텍스트 수신 테스트 통과")
+
+    def test_generate_ai_insight_uses_stub(self):
+        """동기 인사이트 생성 테스트"""
+        with OpenAIStubServer(chunks=['전체 ', '응답']) as stub:
+            self._use_stub(stub)
+            insight = ai_insights.generate_ai_insight(self.inputs, self.results)
+
+        self.assertEqual(insight, '전체 응답')
+        print("[OK] 동기 인사이트 생성 테스트 통과")
+
+    def test_job_streams_progressively(self):
+        """백그라운드 작업 누적 텍스트 테스트"""
+        with OpenAIStubServer(chunks=['a', 'b', 'c'], chunk_delay=0.05) as stub:
+            self._use_stub(stub)
+            job = ai_insights.InsightJob(self.inputs, self.results, timeout=10)
+            snapshots = list(job.iter_text(poll_interval=0.01))
+
+        self.assertEqual(snapshots[-1], 'abc')
+        self.assertGreater(len(snapshots), 1)
+        self.assertEqual(job.result(), 'abc')
+        self.assertIsNone(job.error)
+        print("[OK] 백그라운드 작업 누적 텍스트 테스트 통과")
+
+    def test_job_reused_for_same_inputs_and_cancelled_on_change(self):
+        """같은 입력이면 재사용, 바뀌면 취소 테스트"""
+        state = {}
+        with OpenAIStubServer(chunks=['x'] * 50, chunk_delay=0.02) as stub:
+            self._use_stub(stub)
+            first = ai_insights.get_insight_job(state, self.inputs, self.results)
+            again = ai_insights.get_insight_job(state, dict(self.inputs), self.results)
+            self.assertIs(first, again)
+
+            changed = dict(self.inputs, salary=6000)
+            second = ai_insights.get_insight_job(state, changed, self.results)
+            self.assertIsNot(first, second)
+            self.assertTrue(first.cancelled)
+            self.assertIsNone(first.result())
+
+            second.cancel()
+
+        self.assertIs(state[ai_insights.INSIGHT_JOB_STATE_KEY], second)
+        print("[OK] 작업 재사용/취소 테스트 통과")
+
+    def test_job_timeout(self):
+        """제한 시간 초과 테스트"""
+        with OpenAIStubServer(chunks=['느린 '] * 20, chunk_delay=0.1) as stub:
+            self._use_stub(stub)
+            job = ai_insights.InsightJob(self.inputs, self.results, timeout=0.3)
+            started = time.monotonic()
+            for _ in job.iter_text(poll_interval=0.01):
+                pass
+
+        self.assertEqual(job.error, 'timeout')
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertIsNone(job.result())
+        print("[OK] 제한 시간 초과 테스트 통과")
+
+    def test_job_error_is_reported(self):
+        """API 오류 처리 테스트"""
+        with OpenAIStubServer(status=500) as stub:
+            self._use_stub(stub)
+            with mock.patch.object(ai_insights, 'print', create=True):
+                job = ai_insights.InsightJob(self.inputs, self.results, timeout=30)
+                self.assertIsNone(job.result())
+
+        self.assertIsNotNone(job.error)
+        print("[OK] API 오류 처리 테스트 통과")
+
+    def test_disabled_returns_no_job(self):
+        """AI 비활성화 시 작업 없음 테스트"""
+        with mock.patch.dict(os.environ, {'OPENAI_API_KEY': ''}):
+            self.assertIsNone(ai_insights.get_insight_job({}, self.inputs, self.results))
+        print("[OK] AI 비활성화 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
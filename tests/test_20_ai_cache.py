@@ -0,0 +1,137 @@
+"""
+AI 응답 캐시 테스트
+
+테스트 항목:
+1. 저장/조회 및 키 정규화 테스트
+2. 유효 기간(TTL) 및 크기 제한 테스트
+3. 숫자 반올림(버킷) 테스트
+4. 인사이트 생성 캐시 연동 테스트
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules import ai_cache, ai_insights
+from modules.ai_cache import AIResponseCache, bucket_numbers
+from tests.openai_stub import OpenAIStubServer
+
+
+class TestAIResponseCache(unittest.TestCase):
+    """AI 응답 캐시 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = AIResponseCache(self.temp_dir.name)
+        self.payload = {'inputs': {'salary': 52340000, 'current_age': 35}}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_set_and_get(self):
+        """저장 후 조회 테스트"""
+        self.assertIsNone(self.cache.get(self.payload, 'model-a'))
+        self.cache.set(self.payload, 'model-a', '응답')
+
+        # 키 순서가 달라도 같은 항목
+        reordered = {'inputs': {'current_age': 35, 'salary': 52340000.0}}
+        self.assertEqual(self.cache.get(reordered, 'model-a'), '응답')
+        # 모델이 다르면 다른 항목
+        self.assertIsNone(self.cache.get(self.payload, 'model-b'))
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertAlmostEqual(stats['hit_rate'], 1 / 3)
+        print("[OK] 저장/조회 테스트 통과")
+
+    def test_ttl_expiry(self):
+        """유효 기간 만료 테스트"""
+        cache = AIResponseCache(self.temp_dir.name, ttl=60)
+        with mock.patch('modules.ai_cache.time.time', return_value=1000.0):
+            cache.set(self.payload, 'model', '오래된 응답')
+        with mock.patch('modules.ai_cache.time.time', return_value=1030.0):
+            self.assertEqual(cache.get(self.payload, 'model'), '오래된 응답')
+        with mock.patch('modules.ai_cache.time.time', return_value=1100.0):
+            self.assertIsNone(cache.get(self.payload, 'model'))
+        print("[OK] 유효 기간 만료 테스트 통과")
+
+    def test_size_eviction_removes_least_recently_used(self):
+        """크기 제한 초과 시 오래 사용하지 않은 항목 삭제 테스트"""
+        cache = AIResponseCache(self.temp_dir.name, max_bytes=25)
+        cache.set({'id': 1}, 'model', 'a' * 10)
+        time.sleep(0.01)
+        cache.set({'id': 2}, 'model', 'b' * 10)
+        time.sleep(0.01)
+        cache.get({'id': 1}, 'model')
+        time.sleep(0.01)
+        cache.set({'id': 3}, 'model', 'c' * 10)
+
+        self.assertEqual(cache.get({'id': 1}, 'model'), 'a' * 10)
+        self.assertIsNone(cache.get({'id': 2}, 'model'))
+        self.assertEqual(cache.get({'id': 3}, 'model'), 'c' * 10)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        print("[OK] 크기 제한 삭제 테스트 통과")
+
+    def test_bucket_numbers(self):
+        """숫자 반올림 테스트"""
+        self.assertEqual(bucket_numbers(52340000, 2), 52000000)
+        self.assertEqual(bucket_numbers(3.25, 2), 3.2)
+        self.assertEqual(bucket_numbers(35, 2), 35)
+        self.assertEqual(bucket_numbers(True, 2), True)
+        self.assertEqual(bucket_numbers({'a': [1234]}, 2), {'a': [1200]})
+        self.assertEqual(bucket_numbers(52340000, 0), 52340000)
+        print("[OK] 숫자 반올림 테스트 통과")
+
+    def test_bucketed_profiles_share_entries(self):
+        """비슷한 입력이 같은 항목을 공유하는지 테스트"""
+        cache = AIResponseCache(self.temp_dir.name, bucket_digits=2)
+        cache.set(self.payload, 'model', '공유 응답')
+        similar = {'inputs': {'salary': 52100000, 'current_age': 35}}
+        self.assertEqual(cache.get(similar, 'model'), '공유 응답')
+        print("[OK] 버킷 공유 테스트 통과")
+
+    def test_clear(self):
+        """캐시 비우기 테스트"""
+        self.cache.set(self.payload, 'model', '응답')
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        self.assertEqual(self.cache.stats()['hits'], 0)
+        print("[OK] 캐시 비우기 테스트 통과")
+
+    def test_insight_generation_uses_cache(self):
+        """인사이트 생성 시 캐시 사용 테스트"""
+        inputs = {'current_age': 35, 'salary': 5000}
+        results = {'monthly_savings': 100}
+        compact = mock.Mock(wraps=ai_insights.build_prompt_payload)
+        with mock.patch.object(ai_cache, '_default_cache', self.cache), \
+                mock.patch.object(ai_insights, 'build_prompt_payload', compact), \
+                OpenAIStubServer(chunks=['캐시', ' 응답']) as stub:
+            with mock.patch.dict(
+                os.environ,
+                {'OPENAI_API_KEY': 'test-key', 'OPENAI_BASE_URL': stub.base_url},
+            ):
+                first = ai_insights.generate_ai_insight(inputs, results)
+                second = ai_insights.generate_ai_insight(inputs, results)
+                streamed = list(ai_insights.stream_ai_insight(inputs, results))
+
+        self.assertEqual(first, '캐시 응답')
+        self.assertEqual(second, '캐시 응답')
+        self.assertEqual(streamed, ['캐시 응답'])
+        self.assertEqual(len(stub.requests), 1)
+        # 캐시 키와 프롬프트가 같은 압축 데이터를 사용 (요청당 한 번만 압축)
+        self.assertEqual(compact.call_count, 3)
+        print("[OK] 인사이트 캐시 연동 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+AI 프롬프트 압축 데이터 테스트
+
+테스트 항목:
+1. 토큰 추정 테스트
+2. 연도별 추이 체크포인트 및 중복 필드 제거 테스트
+3. 토큰 예산 적용 테스트
+"""
+
+import json
+import sys
+from pathlib import Path
+import unittest
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data.sample_data import get_sample_data
+from modules.ai_insights import build_prompt_payload, estimate_tokens, _build_messages
+from modules.calculations import calculate_financial_health_grade, calculate_future_assets
+
+
+class TestPromptPayload(unittest.TestCase):
+    """프롬프트 압축 데이터 테스트"""
+
+    def setUp(self):
+        self.inputs = get_sample_data("일반 직장인")
+        self.inputs['asset_items'] = [
+            {'id': 'a1', 'type': '주식', 'amount': 30000000, 'return_rate': 5.0},
+            {'id': 'a2', 'type': '주식', 'amount': 10000000, 'return_rate': 7.0},
+            {'id': 'a3', 'type': '부동산', 'value': 200000000},
+        ]
+        self.inputs['fixed_expense_items'] = [
+            {'id': 'f1', 'category': '주거', 'amount': 1200000},
+        ]
+        self.inputs['debt_items'] = [
+            {
+                'id': 'd1', 'name': '대출 (24개월)', 'principal': 15000000,
+                'interest_rate': 4.5, 'repayment_type': '원리금 균등 상환',
+                'monthly_payment': 654321.123, 'remaining_months': 24,
+                'total_months': 24, 'is_jeonse': False, '_normalized': True,
+            }
+        ]
+        future_assets = calculate_future_assets(self.inputs, 30, 2.5, True, 83)
+        self.results = {
+            'future_assets': future_assets,
+            'grade': calculate_financial_health_grade(self.inputs),
+            'monthly_savings': 216.66666666666669,
+        }
+
+    def test_estimate_tokens(self):
+        """토큰 추정 테스트"""
+        self.assertEqual(estimate_tokens(''), 0)
+        self.assertEqual(estimate_tokens('abcd'), 1)
+        self.assertEqual(estimate_tokens('자산'), 2)
+        print("[OK] 토큰 추정 테스트 통과")
+
+    def test_compaction(self):
+        """체크포인트 추출 및 중복 필드 제거 테스트"""
+        payload, report = build_prompt_payload(self.inputs, self.results, token_budget=100000)
+        breakdown = payload['calculation_results']['future_assets']['yearly_breakdown']
+        full_breakdown = self.results['future_assets']['yearly_breakdown']
+
+        years = [item['year'] for item in breakdown]
+        self.assertLess(len(breakdown), len(full_breakdown))
+        self.assertEqual(years[0], full_breakdown[0]['year'])
+        self.assertEqual(years[-1], full_breakdown[-1]['year'])
+        self.assertIn(30, years)
+        self.assertIn(31, years)  # 은퇴 전환 시점
+        self.assertNotIn('net_assets', breakdown[0])
+
+        text = json.dumps(payload, ensure_ascii=False)
+        self.assertNotIn('_normalized', text)
+        self.assertNotIn('"id"', text)
+        self.assertNotIn('details', payload['calculation_results']['grade'])
+        self.assertEqual(payload['calculation_results']['monthly_savings'], 217)
+        self.assertEqual(payload['inputs']['inflation_rate'], 2.5)
+        self.assertEqual(payload['inputs']['debt_items'][0]['monthly_payment'], 654321)
+
+        self.assertEqual(report['reductions'], [])
+        self.assertLess(report['tokens_after'], report['tokens_before'] / 3)
+        print("[OK] 압축 테스트 통과")
+
+    def test_inputs_not_mutated(self):
+        """원본 입력이 바뀌지 않는지 테스트"""
+        build_prompt_payload(self.inputs, self.results, token_budget=10)
+        self.assertIn('_normalized', self.inputs['debt_items'][0])
+        self.assertEqual(len(self.inputs['asset_items']), 3)
+        self.assertIn('details', self.results['grade'])
+        print("[OK] 원본 불변 테스트 통과")
+
+    def test_token_budget_applies_reductions(self):
+        """토큰 예산 초과 시 추가 축약 테스트"""
+        _, loose = build_prompt_payload(self.inputs, self.results, token_budget=100000)
+        payload, tight = build_prompt_payload(
+            self.inputs, self.results, token_budget=loose['tokens_after'] - 50
+        )
+
+        self.assertIn('expense_items', tight['reductions'])
+        self.assertNotIn('fixed_expense_items', payload['inputs'])
+        self.assertLess(tight['tokens_after'], loose['tokens_after'])
+        self.assertTrue(tight['within_budget'])
+
+        payload, tightest = build_prompt_payload(self.inputs, self.results, token_budget=10)
+        self.assertFalse(tightest['within_budget'])
+        self.assertEqual(payload['inputs']['asset_items'], {'주식': 40000000, '부동산': 200000000})
+        print("[OK] 토큰 예산 적용 테스트 통과")
+
+    def test_prompt_uses_compact_payload(self):
+        """프롬프트가 압축 데이터를 사용하는지 테스트"""
+        prompt = _build_messages(self.inputs, self.results)[1]['content']
+        self.assertNotIn('"net_assets"', prompt)
+        self.assertNotIn('\n  "inputs"', prompt)
+        print("[OK] 프롬프트 압축 데이터 사용 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
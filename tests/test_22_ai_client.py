@@ -0,0 +1,176 @@
+"""
+AI API 클라이언트 관리자 테스트
+
+로컬 스텁 서버(tests/openai_stub.py)로 API를 흉내 냅니다.
+
+테스트 항목:
+1. 클라이언트 재사용 테스트
+2. 재시도 및 백오프 테스트
+3. 동시 호출 제한 테스트
+4. 토큰 버킷 속도 제한 테스트
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import openai
+
+from modules.ai_client import AIClientManager, AIRateLimitTimeout, TokenBucket
+from tests.openai_stub import OpenAIStubServer
+
+MESSAGES = [{'role': 'user', 'content': '안녕하세요'}]
+
+
+class FakeClock:
+    """테스트용 시계 (sleep 호출 시 시간이 흐름)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestAIClientManager(unittest.TestCase):
+    """AI API 클라이언트 관리자 테스트"""
+
+    def _use_stub(self, stub):
+        patcher = mock.patch.dict(
+            os.environ,
+            {'OPENAI_API_KEY': 'test-key', 'OPENAI_BASE_URL': stub.base_url},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_is_reused(self):
+        """클라이언트 재사용 테스트"""
+        manager = AIClientManager()
+        with OpenAIStubServer(chunks=['응답']) as stub:
+            self._use_stub(stub)
+            first = manager.get_client()
+            for _ in range(3):
+                response = manager.chat_completion(model='stub', messages=MESSAGES)
+            self.assertIs(manager.get_client(), first)
+
+        self.assertEqual(response.choices[0].message.content, '응답')
+        metrics = manager.get_metrics()
+        self.assertEqual(metrics['clients_created'], 1)
+        self.assertEqual(metrics['requests'], 3)
+        self.assertEqual(metrics['successes'], 3)
+        print("[OK] 클라이언트 재사용 테스트 통과")
+
+    def test_retries_transient_errors(self):
+        """일시적 오류 재시도 테스트"""
+        manager = AIClientManager(max_retries=3, backoff_base=0.01)
+        with OpenAIStubServer(chunks=['성공'], status=500, fail_first=2) as stub:
+            self._use_stub(stub)
+            response = manager.chat_completion(model='stub', messages=MESSAGES)
+
+        self.assertEqual(response.choices[0].message.content, '성공')
+        self.assertEqual(len(stub.requests), 3)
+        self.assertEqual(manager.get_metrics()['retries'], 2)
+        print("[OK] 재시도 테스트 통과")
+
+    def test_does_not_retry_client_errors(self):
+        """요청 오류(4xx)는 재시도하지 않는지 테스트"""
+        manager = AIClientManager(max_retries=3, backoff_base=0.01)
+        with OpenAIStubServer(status=400) as stub:
+            self._use_stub(stub)
+            with self.assertRaises(openai.BadRequestError):
+                manager.chat_completion(model='stub', messages=MESSAGES)
+
+        self.assertEqual(len(stub.requests), 1)
+        self.assertEqual(manager.get_metrics()['failures'], 1)
+        print("[OK] 요청 오류 재시도 안 함 테스트 통과")
+
+    def test_backoff_delay_is_capped(self):
+        """백오프 대기 시간 상한 테스트"""
+        manager = AIClientManager(backoff_base=1.0, backoff_max=4.0)
+        for attempt in range(10):
+            delay = manager.backoff_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4.0, 2 ** attempt))
+        print("[OK] 백오프 상한 테스트 통과")
+
+    def test_concurrency_limit(self):
+        """동시 호출 제한 테스트"""
+        manager = AIClientManager(max_concurrency=2, rate_limit_burst=100)
+        with OpenAIStubServer(chunks=['a', 'b'], response_delay=0.1) as stub:
+            self._use_stub(stub)
+
+            def call():
+                list(manager.stream_chat_completion(model='stub', messages=MESSAGES))
+
+            threads = [threading.Thread(target=call) for _ in range(6)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(stub.requests), 6)
+        self.assertLessEqual(stub.max_in_flight, 2)
+        metrics = manager.get_metrics()
+        self.assertLessEqual(metrics['max_in_flight'], 2)
+        self.assertEqual(metrics['in_flight'], 0)
+        self.assertEqual(metrics['successes'], 6)
+        print("[OK] 동시 호출 제한 테스트 통과")
+
+    def test_stream_releases_slot_when_closed(self):
+        """스트림을 중간에 닫으면 슬롯이 반환되는지 테스트"""
+        manager = AIClientManager(max_concurrency=1)
+        with OpenAIStubServer(chunks=['a'] * 10) as stub:
+            self._use_stub(stub)
+            stream = manager.stream_chat_completion(model='stub', messages=MESSAGES)
+            next(stream)
+            self.assertEqual(manager.get_metrics()['in_flight'], 1)
+            stream.close()
+
+        self.assertEqual(manager.get_metrics()['in_flight'], 0)
+        print("[OK] 스트림 슬롯 반환 테스트 통과")
+
+
+class TestTokenBucket(unittest.TestCase):
+    """토큰 버킷 테스트"""
+
+    def test_burst_then_refill(self):
+        """순간 최대 호출 후 충전 속도만큼 대기하는지 테스트"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(clock.now, 0.5)
+        print("[OK] 토큰 버킷 충전 테스트 통과")
+
+    def test_acquire_timeout(self):
+        """대기 시간 초과 테스트"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.1, capacity=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        with self.assertRaises(AIRateLimitTimeout):
+            bucket.acquire(timeout=1)
+        print("[OK] 토큰 버킷 대기 시간 초과 테스트 통과")
+
+    def test_rate_limit_per_api_key(self):
+        """API 키별 속도 제한 테스트"""
+        manager = AIClientManager(rate_limit_per_minute=60, rate_limit_burst=1)
+        self.assertIs(manager._bucket('key-a'), manager._bucket('key-a'))
+        self.assertIsNot(manager._bucket('key-a'), manager._bucket('key-b'))
+        self.assertEqual(manager._bucket('key-a').rate, 1.0)
+        print("[OK] API 키별 속도 제한 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
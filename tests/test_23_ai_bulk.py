@@ -0,0 +1,152 @@
+"""
+AI 인사이트 일괄 생성 테스트
+
+테스트 항목:
+1. 중복 프롬프트 제거 테스트
+2. 동시 요청 수 제한 테스트
+3. 체크포인트 이어받기 테스트
+4. 스텁 서버 연동 테스트
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules import ai_cache, ai_client
+from modules.ai_bulk import generate_insights_bulk, load_checkpoint, run_bulk_insights
+from tests.openai_stub import OpenAIStubServer
+
+
+def make_profile(salary):
+    return ({'current_age': 35, 'retirement_age': 60, 'salary': salary}, {'monthly_savings': 100})
+
+
+class RecordingGenerator:
+    """호출 기록과 동시 실행 수를 기록하는 가짜 인사이트 생성 함수"""
+
+    def __init__(self, delay=0.0, fail_salaries=()):
+        self.delay = delay
+        self.fail_salaries = set(fail_salaries)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, inputs, results):
+        with self._lock:
+            self.calls.append(inputs['salary'])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if inputs['salary'] in self.fail_salaries:
+                raise RuntimeError('실패')
+            return f"인사이트 {inputs['salary']}"
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestAIBulk(unittest.TestCase):
+    """AI 인사이트 일괄 생성 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint = Path(self.temp_dir.name) / 'checkpoint.jsonl'
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, profiles, generator, concurrency=4, checkpoint=None):
+        return asyncio.run(
+            generate_insights_bulk(
+                profiles, concurrency=concurrency, checkpoint_path=checkpoint, generate=generator
+            )
+        )
+
+    def test_deduplicates_identical_prompts(self):
+        """같은 프롬프트 중복 제거 테스트"""
+        profiles = [make_profile(5000), make_profile(6000), make_profile(5000)]
+        generator = RecordingGenerator()
+        report = self._run(profiles, generator)
+
+        self.assertEqual(sorted(generator.calls), [5000, 6000])
+        self.assertEqual(report['stats']['duplicates'], 1)
+        self.assertEqual(report['results'][2]['source'], 'duplicate')
+        self.assertEqual(report['results'][2]['insight'], '인사이트 5000')
+        self.assertEqual([item['index'] for item in report['results']], [0, 1, 2])
+        print("[OK] 중복 프롬프트 제거 테스트 통과")
+
+    def test_concurrency_is_bounded(self):
+        """동시 요청 수 제한 테스트"""
+        profiles = [make_profile(salary) for salary in range(1000, 1012)]
+        generator = RecordingGenerator(delay=0.05)
+        report = self._run(profiles, generator, concurrency=3)
+
+        self.assertEqual(len(generator.calls), 12)
+        self.assertLessEqual(generator.max_in_flight, 3)
+        self.assertGreater(generator.max_in_flight, 1)
+        self.assertGreater(report['stats']['requests_per_second'], 0)
+        print("[OK] 동시 요청 수 제한 테스트 통과")
+
+    def test_checkpoint_resume(self):
+        """중단 후 이어받기 테스트"""
+        profiles = [make_profile(salary) for salary in (1000, 2000, 3000)]
+        first = self._run(
+            profiles, RecordingGenerator(fail_salaries={2000}), checkpoint=self.checkpoint
+        )
+        self.assertEqual(first['stats']['failed'], 1)
+        self.assertEqual(len(load_checkpoint(self.checkpoint)), 2)
+
+        # 실행 중 종료되어 마지막 줄이 끊긴 경우도 무시
+        with open(self.checkpoint, 'a', encoding='utf-8') as checkpoint_file:
+            checkpoint_file.write('{"key": "broken')
+
+        generator = RecordingGenerator()
+        second = self._run(profiles, generator, checkpoint=self.checkpoint)
+        self.assertEqual(generator.calls, [2000])
+        self.assertEqual(second['stats']['resumed'], 2)
+        self.assertEqual(second['results'][0]['source'], 'checkpoint')
+        self.assertTrue(all(item['insight'] for item in second['results']))
+
+        # 끊긴 줄 뒤에 추가한 기록도 다음 실행에서 이어받음 (끊긴 줄에 붙지 않음)
+        self.assertEqual(len(load_checkpoint(self.checkpoint)), 3)
+        third_generator = RecordingGenerator()
+        third = self._run(profiles, third_generator, checkpoint=self.checkpoint)
+        self.assertEqual(third_generator.calls, [])
+        self.assertEqual(third['stats']['resumed'], 3)
+        print("[OK] 체크포인트 이어받기 테스트 통과")
+
+    def test_run_against_stub(self):
+        """스텁 서버 연동 테스트"""
+        profiles = [make_profile(salary) for salary in (1000, 2000, 1000)]
+        with OpenAIStubServer(chunks=['일괄 ', '응답']) as stub, \
+                mock.patch.dict(os.environ, {'OPENAI_API_KEY': 'k', 'OPENAI_BASE_URL': stub.base_url}), \
+                mock.patch.object(ai_cache, '_default_cache', ai_cache.AIResponseCache(self.temp_dir.name)), \
+                mock.patch.object(ai_client, '_default_manager', ai_client.AIClientManager()):
+            report = run_bulk_insights(profiles, concurrency=2)
+
+        self.assertEqual(len(stub.requests), 2)
+        self.assertEqual([item['insight'] for item in report['results']], ['일괄 응답'] * 3)
+        print("[OK] 스텁 서버 연동 테스트 통과")
+
+    def test_requires_ai_enabled(self):
+        """AI 비활성화 시 오류 테스트"""
+        with mock.patch.dict(os.environ, {'OPENAI_API_KEY': ''}):
+            with self.assertRaises(RuntimeError):
+                run_bulk_insights([make_profile(1000)])
+        print("[OK] AI 비활성화 오류 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+"""
+은퇴 자금 목표 벡터화 계산 테스트
+
+테스트 항목:
+1. 저축 금액 × 수익률 그리드가 단건 계산과 일치하는지 테스트
+2. 자산 배분 기대 수익률 계산 테스트
+3. 투자 시나리오 인사이트 테스트
+"""
+
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.advanced_insights import (
+    DEFAULT_RETURN_SCENARIOS,
+    _analyze_savings_and_investment,
+    generate_actionable_insights,
+)
+from modules.calculations import (
+    blend_allocation_returns,
+    calculate_retirement_goal,
+    calculate_retirement_goal_grid,
+)
+
+
+class TestRetirementGoalGrid(unittest.TestCase):
+    """은퇴 자금 목표 그리드 계산 테스트"""
+
+    def setUp(self):
+        self.inputs = {
+            'current_age': 35,
+            'retirement_age': 60,
+            'total_assets': 50000000,
+            'retirement_monthly_expense': 300,
+            'retirement_medical_expense': 30,
+            'inflation_rate': 2.5,
+            'salary_growth_rate': 3.0,
+        }
+
+    def test_grid_matches_scalar(self):
+        """그리드 결과와 단건 계산 일치 테스트"""
+        contributions = [0, 50, 150, 2000000]
+        # 음수/0 수익률, 저축 증가율과 같은 수익률 포함
+        rates = [-2.0, 0.0, 3.0, 3.05, 7.0]
+        grid = calculate_retirement_goal_grid(self.inputs, contributions, rates)
+
+        self.assertEqual(grid['projected_assets'].shape, (4, 5))
+        for i, contribution in enumerate(contributions):
+            for j, rate in enumerate(rates):
+                expected = calculate_retirement_goal(
+                    self.inputs, contribution, rate, 4.0
+                )
+                self.assertAlmostEqual(
+                    grid['projected_assets'][i, j] / expected['projected_assets'],
+                    1.0,
+                    places=10,
+                )
+                self.assertEqual(
+                    bool(grid['is_achievable'][i, j]), expected['is_achievable']
+                )
+                self.assertAlmostEqual(
+                    grid['shortfall'][i, j], expected['shortfall'], delta=1e-3
+                )
+        self.assertAlmostEqual(
+            grid['target_assets'],
+            calculate_retirement_goal(self.inputs, 0, 0.0)['target_assets'],
+        )
+        print("[OK] 그리드/단건 계산 일치 테스트 통과")
+
+    def test_grid_no_years_left(self):
+        """은퇴 시점이 지난 경우 테스트"""
+        inputs = dict(self.inputs, current_age=60)
+        grid = calculate_retirement_goal_grid(inputs, [100, 200], [5.0])
+
+        self.assertIn('error', grid)
+        self.assertEqual(grid['projected_assets'].shape, (2, 1))
+        self.assertFalse(grid['is_achievable'].any())
+        print("[OK] 은퇴 시점 경과 테스트 통과")
+
+    def test_blend_allocation_returns(self):
+        """자산 배분 기대 수익률 테스트"""
+        returns = blend_allocation_returns(
+            [
+                {'예금': 0.5, '주식': 0.5},
+                {'예금': 1, '주식': 3},  # 합이 1이 아니면 정규화
+                {},
+            ],
+            {'예금': 3.0, '주식': 7.0},
+        )
+
+        np.testing.assert_allclose(returns, [5.0, 6.0, 0.0])
+        print("[OK] 자산 배분 기대 수익률 테스트 통과")
+
+
+class TestInvestmentScenarios(unittest.TestCase):
+    """투자 시나리오 인사이트 테스트"""
+
+    def setUp(self):
+        self.inputs = {
+            'current_age': 30,
+            'retirement_age': 60,
+            'inflation_rate': 2.5,
+            'salary_growth_rate': 3.0,
+        }
+        self.results = {'monthly_savings': 150}
+
+    def test_default_scenarios(self):
+        """기본 수익률 시나리오 테스트"""
+        insight = _analyze_savings_and_investment(self.inputs, self.results)[0]
+
+        rates = [simulation['return_rate'] for simulation in insight['simulations']]
+        self.assertEqual(rates, list(DEFAULT_RETURN_SCENARIOS))
+        self.assertEqual(insight['simulations'][0]['scenario'], 'CMA/예금')
+        self.assertNotIn('allocation_simulations', insight)
+
+        for simulation in insight['simulations']:
+            expected = calculate_retirement_goal(
+                self.inputs, 150, simulation['return_rate'], 4.0
+            )['projected_assets']
+            self.assertAlmostEqual(simulation['projected_assets'] / expected, 1.0, places=10)
+            self.assertLess(simulation['real_value'], simulation['projected_assets'])
+
+        baseline = calculate_retirement_goal(self.inputs, 150, 0.0, 4.0)
+        self.assertAlmostEqual(
+            insight['baseline']['value'] / baseline['projected_assets'], 1.0, places=10
+        )
+        print("[OK] 기본 수익률 시나리오 테스트 통과")
+
+    def test_custom_scenarios_and_allocations(self):
+        """사용자 지정 수익률/자산 배분 시나리오 테스트"""
+        insights = generate_actionable_insights(
+            self.inputs,
+            self.results,
+            return_scenarios=[4.0, 6.0],
+            allocation_mixes={
+                '안정형': {'예금': 0.7, '주식': 0.3},
+                '공격형': {'주식': 0.6, '고위험': 0.4},
+            },
+        )
+        insight = next(item for item in insights if item['category'] == 'investment')
+
+        self.assertEqual(
+            [simulation['scenario'] for simulation in insight['simulations']],
+            ['4.0% 투자', '6.0% 투자'],
+        )
+        allocations = insight['allocation_simulations']
+        self.assertEqual([item['scenario'] for item in allocations], ['안정형', '공격형'])
+        self.assertAlmostEqual(allocations[0]['return_rate'], 4.2)
+        self.assertAlmostEqual(allocations[1]['return_rate'], 8.2)
+        self.assertGreater(
+            allocations[1]['projected_assets'], allocations[0]['projected_assets']
+        )
+        print("[OK] 사용자 지정 시나리오 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+스트리밍 내보내기 테스트
+
+테스트 항목:
+1. 청크 분할 테스트
+2. JSON Lines / CSV 내보내기 및 압축 테스트
+3. Parquet / Arrow 내보내기 테스트
+4. zip 묶음 테스트
+5. 청크 크기에 비례하는 메모리 사용 테스트
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+import zipfile
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.download import (
+    export_to_bytes,
+    iter_column_chunks,
+    write_arrow,
+    write_csv,
+    write_jsonl,
+    write_parquet,
+    write_zip_bundle,
+)
+from modules.lazy_imports import optional_import
+
+
+class TestStreamingExport(unittest.TestCase):
+    """스트리밍 내보내기 테스트"""
+
+    def setUp(self):
+        self.columns = {
+            'age': np.arange(30, 40),
+            'net_assets': np.linspace(0, 9e8, 10),
+            'label': [f'{age}세' for age in range(30, 40)],
+        }
+
+    def test_iter_column_chunks(self):
+        """열 단위 / 행 단위 데이터 청크 분할 테스트"""
+        chunks = list(iter_column_chunks(self.columns, chunk_size=4))
+        self.assertEqual([len(chunk['age']) for _, chunk in chunks], [4, 4, 2])
+        self.assertEqual(chunks[0][0], ['age', 'net_assets', 'label'])
+        self.assertIsInstance(chunks[0][1]['age'][0], int)
+
+        rows = ({'x': i, 'y': i * 2} for i in range(5))
+        chunks = list(iter_column_chunks(rows, chunk_size=2))
+        self.assertEqual([chunk['x'] for _, chunk in chunks], [[0, 1], [2, 3], [4]])
+
+        with self.assertRaises(ValueError):
+            list(iter_column_chunks({'a': [1, 2], 'b': [1]}))
+        print("[OK] 청크 분할 테스트 통과")
+
+    def test_jsonl_compression(self):
+        """JSON Lines 내보내기 및 gzip 압축 테스트"""
+        plain = export_to_bytes(write_jsonl, self.columns, chunk_size=3)
+        compressed = export_to_bytes(
+            write_jsonl, self.columns, compression='gzip', chunk_size=3
+        )
+
+        self.assertEqual(gzip.decompress(compressed), plain)
+        rows = [json.loads(line) for line in plain.decode('utf-8').splitlines()]
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[0], {'age': 30, 'net_assets': 0.0, 'label': '30세'})
+
+        with self.assertRaises(ValueError):
+            export_to_bytes(write_jsonl, self.columns, compression='bz2')
+        print("[OK] JSON Lines 내보내기 테스트 통과")
+
+    def test_zstd_requires_package(self):
+        """zstandard 미설치 시 zstd 압축 오류 테스트"""
+        zstandard = optional_import('zstandard')
+        if zstandard is not None:
+            data = export_to_bytes(write_jsonl, self.columns, compression='zstd')
+            plain = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+            self.assertEqual(plain, export_to_bytes(write_jsonl, self.columns))
+        else:
+            with self.assertRaises(ImportError):
+                export_to_bytes(write_jsonl, self.columns, compression='zstd')
+        print("[OK] zstd 압축 테스트 통과")
+
+    def test_csv_to_file(self):
+        """CSV 파일 내보내기 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'yearly.csv.gz'
+            count = write_csv(self.columns, path, compression='gzip', chunk_size=4)
+            with gzip.open(path, 'rt', encoding='utf-8-sig', newline='') as csv_file:
+                rows = list(csv.reader(csv_file))
+
+        self.assertEqual(count, 10)
+        self.assertEqual(rows[0], ['age', 'net_assets', 'label'])
+        self.assertEqual(len(rows), 11)
+        self.assertEqual(rows[-1][2], '39세')
+        print("[OK] CSV 파일 내보내기 테스트 통과")
+
+    def test_parquet_and_arrow(self):
+        """Parquet / Arrow 내보내기 테스트"""
+        pa = optional_import('pyarrow')
+        if pa is None:
+            self.skipTest("pyarrow가 설치되지 않음")
+        pq = optional_import('pyarrow.parquet')
+
+        data = export_to_bytes(write_parquet, self.columns, chunk_size=4)
+        parquet_file = pq.ParquetFile(io.BytesIO(data))
+        self.assertEqual(parquet_file.num_row_groups, 3)
+        self.assertEqual(parquet_file.read().column('label').to_pylist()[-1], '39세')
+
+        data = export_to_bytes(write_arrow, self.columns, chunk_size=4)
+        table = pa.ipc.open_stream(data).read_all()
+        self.assertEqual(table.column('age').to_pylist(), list(range(30, 40)))
+        print("[OK] Parquet / Arrow 내보내기 테스트 통과")
+
+    def test_zip_bundle(self):
+        """zip 묶음 테스트"""
+        data = export_to_bytes(
+            write_zip_bundle,
+            {
+                'inputs.json': '{"current_age": 30}',
+                'yearly.jsonl.gz': lambda entry: write_jsonl(
+                    self.columns, entry, compression='gzip'
+                ),
+            },
+        )
+
+        with zipfile.ZipFile(io.BytesIO(data)) as bundle:
+            self.assertEqual(bundle.namelist(), ['inputs.json', 'yearly.jsonl.gz'])
+            lines = gzip.decompress(bundle.read('yearly.jsonl.gz')).splitlines()
+        self.assertEqual(len(lines), 10)
+        print("[OK] zip 묶음 테스트 통과")
+
+    def test_memory_bounded_by_chunk_size(self):
+        """청크 크기에 비례하는 메모리 사용 테스트"""
+        row_count = 100000
+        columns = {
+            'age': np.arange(row_count),
+            'net_assets': np.random.default_rng(0).random(row_count) * 1e9,
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'large.jsonl')
+            tracemalloc.start()
+            try:
+                write_jsonl(columns, path, chunk_size=1000)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            file_size = os.path.getsize(path)
+
+        # 전체 결과를 메모리에 만들면 파일 크기 이상 필요
+        self.assertGreater(file_size, 2 * 1024 * 1024)
+        self.assertLess(peak, file_size / 10)
+        print(f"[OK] 메모리 사용 테스트 통과 (최대 {peak / 1024:.0f}KB, 파일 {file_size / 1024:.0f}KB)")
+
+
+if __name__ == '__main__':
+    unittest.main()
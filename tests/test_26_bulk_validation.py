@@ -0,0 +1,126 @@
+"""
+프로필 일괄 검증 테스트
+
+테스트 항목:
+1. 단건 검증(validate_inputs / validate_logical_consistency)과 결과 일치 테스트
+2. 오류/경고 코드 테스트
+3. 열 단위 입력 및 누락 값 테스트
+"""
+
+import random
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.validators import (
+    ERR_AGE_NEGATIVE,
+    ERR_RETIREMENT_NOT_AFTER_CURRENT,
+    ERR_RETIREMENT_TOO_HIGH,
+    ERR_SALARY_NEGATIVE,
+    WARN_DEBT_EXCEEDS_ASSETS,
+    WARN_EXPENSE_EXCEEDS_INCOME,
+    WARN_RETIREMENT_NOT_AFTER_CURRENT,
+    WARN_ZERO_ASSETS_WITH_DEBT,
+    validate_inputs,
+    validate_inputs_bulk,
+    validate_logical_consistency,
+)
+
+
+def _random_profile(rng: random.Random) -> dict:
+    profile = {}
+    ranges = [
+        ('current_age', -5, 160),
+        ('retirement_age', -5, 120),
+        ('salary', -10 ** 7, 12 * 10 ** 8),
+        ('salary_growth_rate', -2, 25),
+        ('bonus', -10, 10),
+        ('monthly_expense', -10, 5 * 10 ** 6),
+        ('annual_fixed_expense', -10, 10 ** 7),
+        ('total_assets', -10, 10 ** 8),
+        ('total_debt', -10, 10 ** 8),
+    ]
+    for field, low, high in ranges:
+        if rng.random() < 0.9:
+            profile[field] = rng.choice([rng.randint(low, high), 0])
+    if rng.random() < 0.5:
+        profile['monthly_fixed_expense'] = rng.randint(-10, 3 * 10 ** 6)
+        profile['monthly_variable_expense'] = rng.randint(-10, 3 * 10 ** 6)
+    return profile
+
+
+class TestBulkValidation(unittest.TestCase):
+    """프로필 일괄 검증 테스트"""
+
+    def test_matches_scalar_validation(self):
+        """단건 검증과 메시지 일치 테스트"""
+        rng = random.Random(0)
+        profiles = [_random_profile(rng) for _ in range(2000)]
+        result = validate_inputs_bulk(profiles)
+
+        self.assertEqual(len(result), len(profiles))
+        for index, profile in enumerate(profiles):
+            is_valid, errors = validate_inputs(profile)
+            self.assertEqual(result.error_messages(index), errors)
+            self.assertEqual(bool(result.is_valid[index]), is_valid)
+            self.assertEqual(
+                result.warning_messages(index), validate_logical_consistency(profile)
+            )
+        print("[OK] 단건 검증 일치 테스트 통과")
+
+    def test_codes(self):
+        """오류/경고 코드 테스트"""
+        result = validate_inputs_bulk([
+            {'current_age': 30, 'retirement_age': 60, 'salary': 60000000,
+             'monthly_expense': 2000000, 'total_assets': 1000, 'total_debt': 0},
+            {'current_age': -1, 'retirement_age': 120, 'salary': -1},
+            {'current_age': 50, 'retirement_age': 40, 'salary': 12000000,
+             'monthly_expense': 2000000, 'total_assets': 0, 'total_debt': 100},
+        ])
+
+        self.assertEqual(result.error_codes[0], 0)
+        self.assertEqual(
+            result.error_codes[1],
+            ERR_AGE_NEGATIVE | ERR_RETIREMENT_TOO_HIGH | ERR_SALARY_NEGATIVE,
+        )
+        self.assertEqual(result.error_codes[2], ERR_RETIREMENT_NOT_AFTER_CURRENT)
+        self.assertEqual(
+            result.warning_codes[2],
+            WARN_RETIREMENT_NOT_AFTER_CURRENT
+            | WARN_EXPENSE_EXCEEDS_INCOME
+            | WARN_DEBT_EXCEEDS_ASSETS
+            | WARN_ZERO_ASSETS_WITH_DEBT,
+        )
+        np.testing.assert_array_equal(result.invalid_rows(), [1, 2])
+        self.assertEqual(
+            result.code_counts()['errors'][ERR_RETIREMENT_NOT_AFTER_CURRENT], 1
+        )
+        self.assertIn("은퇴 나이(40세)", result.error_messages(2)[0])
+        print("[OK] 오류/경고 코드 테스트 통과")
+
+    def test_columnar_input_with_missing_values(self):
+        """열 단위 입력 및 누락 값 테스트"""
+        columns = {
+            'current_age': np.array([30, 40, np.nan]),
+            'retirement_age': [60, None, 65],
+            'salary': np.array([50000000, -5, 0]),
+        }
+        result = validate_inputs_bulk(columns)
+
+        # 나이가 없는 행은 은퇴 나이 규칙을 검사하지 않음
+        np.testing.assert_array_equal(result.error_codes, [0, ERR_SALARY_NEGATIVE, 0])
+        self.assertEqual(result.error_messages(1), ["연봉은 0 이상이어야 합니다."])
+
+        with self.assertRaises(ValueError):
+            validate_inputs_bulk({'current_age': [30], 'salary': [1, 2]})
+        print("[OK] 열 단위 입력 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
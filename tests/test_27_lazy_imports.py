@@ -0,0 +1,71 @@
+"""
+지연 import 테스트
+
+테스트 항목:
+1. -X importtime 출력 분석 테스트
+2. 모듈 import 시 무거운 패키지를 불러오지 않는지 테스트
+3. LazyModule / optional_import 테스트
+"""
+
+import sys
+from pathlib import Path
+import unittest
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.import_time import measure_import, parse_importtime
+from modules.lazy_imports import LazyModule, optional_import
+
+
+class TestLazyImports(unittest.TestCase):
+    """지연 import 테스트"""
+
+    def test_parse_importtime(self):
+        """-X importtime 출력 분석 테스트"""
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   json.decoder\n"
+            "import time:       300 |        420 | json\n"
+            "other output\n"
+        )
+        records = parse_importtime(stderr)
+
+        self.assertEqual([record['name'] for record in records], ['json.decoder', 'json'])
+        self.assertEqual([record['depth'] for record in records], [1, 0])
+        self.assertEqual(records[1]['cumulative_us'], 420)
+        print("[OK] importtime 출력 분석 테스트 통과")
+
+    def test_modules_do_not_load_heavy_packages(self):
+        """모듈 import 시 plotly/pandas/openai/dotenv/pyarrow 미사용 테스트"""
+        for module in (
+            'modules.visualizations',
+            'modules.download',
+            'modules.ai_insights',
+            'modules.formatters',
+        ):
+            with self.subTest(module=module):
+                result = measure_import(module)
+                self.assertEqual(result['lazy_packages_loaded'], [])
+                self.assertGreater(result['cumulative_ms'], 0)
+        print("[OK] 무거운 패키지 지연 import 테스트 통과")
+
+    def test_lazy_module(self):
+        """LazyModule 테스트"""
+        lazy_json = LazyModule('json')
+        self.assertFalse(lazy_json.is_loaded)
+        self.assertEqual(lazy_json.dumps([1]), '[1]')
+        self.assertTrue(lazy_json.is_loaded)
+
+        fallback = LazyModule('no_such_module_for_test', fallback=lambda: 'fallback')
+        self.assertEqual(fallback.upper(), 'FALLBACK')
+
+        with self.assertRaises(ImportError):
+            LazyModule('no_such_module_for_test').anything
+        self.assertIsNone(optional_import('no_such_module_for_test'))
+        print("[OK] LazyModule 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+계산 엔진 벤치마크 테스트
+
+테스트 항목:
+1. 벤치마크 입력 생성 테스트
+2. 축소 그리드 실행 및 결과 형식 테스트
+3. 기준값 저장/비교 테스트
+"""
+
+import copy
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.bench_calculations import (
+    BENCHMARKS,
+    GRIDS,
+    compare_to_baseline,
+    load_baseline,
+    make_inputs,
+    make_scenarios,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+class TestBenchCalculations(unittest.TestCase):
+    """계산 엔진 벤치마크 테스트"""
+
+    def test_make_inputs(self):
+        """벤치마크 입력 생성 테스트"""
+        inputs = make_inputs(horizon=20, debt_items=3, asset_items=4, repayment_type="전세자금 대출")
+
+        self.assertEqual(inputs['retirement_age'] - inputs['current_age'], 20)
+        self.assertEqual(len(inputs['debt_items']), 3)
+        self.assertTrue(all(item['is_jeonse'] for item in inputs['debt_items']))
+        self.assertEqual(inputs['total_assets'], sum(a['amount'] for a in inputs['asset_items']))
+        self.assertEqual(len(set(make_scenarios(9))), 9)
+        self.assertEqual(set(GRIDS['full']), set(BENCHMARKS))
+        print("[OK] 벤치마크 입력 생성 테스트 통과")
+
+    def test_run_quick_grid(self):
+        """축소 그리드 실행 테스트"""
+        report = run_benchmarks("quick", name_filter="retirement_goal[", min_time=0, max_calls=3)
+
+        self.assertEqual(len(report['cases']), len(GRIDS['quick']['retirement_goal']['horizon']))
+        case = next(iter(report['cases'].values()))
+        self.assertEqual(case['benchmark'], 'retirement_goal')
+        self.assertEqual(case['calls'], 3)
+        self.assertGreater(case['throughput_per_s'], 0)
+        self.assertLessEqual(case['min_ms'], case['median_ms'])
+        self.assertIn('engine_version', report['meta'])
+        print("[OK] 축소 그리드 실행 테스트 통과")
+
+    def test_baseline_comparison(self):
+        """기준값 저장/비교 테스트"""
+        report = run_benchmarks("quick", name_filter="risk_score", min_time=0, max_calls=3)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'baselines' / 'calculations.json'
+            save_baseline(report, path)
+            baseline = load_baseline(path)
+
+        rows = compare_to_baseline(report, baseline)
+        self.assertTrue(all(row['status'] == 'ok' for row in rows))
+
+        slower = copy.deepcopy(report)
+        first_case = next(iter(slower['cases']))
+        slower['cases'][first_case]['median_ms'] *= 2
+        slower['cases']['new_case[x=1]'] = dict(slower['cases'][first_case])
+        statuses = {row['case']: row['status'] for row in compare_to_baseline(slower, baseline, 0.2)}
+
+        self.assertEqual(statuses[first_case], 'regression')
+        self.assertEqual(statuses['new_case[x=1]'], 'new')
+        print("[OK] 기준값 저장/비교 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+계산 지표 수집 테스트
+
+테스트 항목:
+1. 히스토그램/레지스트리 내보내기 테스트
+2. safe_calculate 지표 기록 테스트
+3. 파일/HTTP 내보내기 테스트
+"""
+
+import json
+import os
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.calculations import calculate_future_assets
+from modules.metrics import (
+    Histogram,
+    MetricsRegistry,
+    describe_input_size,
+    get_metrics_registry,
+    start_metrics_server,
+)
+from modules.utils import safe_calculate
+
+
+def _series(snapshot, kind, name, **labels):
+    """스냅샷에서 레이블이 일치하는 시계열 하나 찾기"""
+    for sample in snapshot[kind].get(name, []):
+        if all(sample['labels'].get(key) == value for key, value in labels.items()):
+            return sample
+    return None
+
+
+class TestMetrics(unittest.TestCase):
+    """계산 지표 수집 테스트"""
+
+    def setUp(self):
+        get_metrics_registry().reset()
+
+    def test_histogram_and_export(self):
+        """히스토그램/레지스트리 내보내기 테스트"""
+        histogram = Histogram((1, 5, 10))
+        for value in (0.5, 1, 3, 7, 20):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative_counts(), [2, 3, 4, 5])
+        self.assertEqual(histogram.count, 5)
+        self.assertAlmostEqual(histogram.sum, 31.5)
+
+        registry = MetricsRegistry()
+        registry.describe('demo_seconds', '데모')
+        registry.observe('demo_seconds', 0.002, {'function': 'f"x'})
+        registry.increment('demo_total', {'status': 'success'}, 2)
+
+        text = registry.to_prometheus()
+        self.assertIn('# TYPE demo_seconds histogram', text)
+        self.assertIn('demo_seconds_bucket{function="f\\"x",le="+Inf"} 1', text)
+        self.assertIn('demo_seconds_count{function="f\\"x"} 1', text)
+        self.assertIn('demo_total{status="success"} 2', text)
+
+        snapshot = json.loads(registry.to_json())
+        self.assertEqual(snapshot['counters']['demo_total'][0]['value'], 2)
+        self.assertEqual(snapshot['histograms']['demo_seconds'][0]['count'], 1)
+        print("[OK] 히스토그램/레지스트리 내보내기 테스트 통과")
+
+    def test_safe_calculate_records_metrics(self):
+        """safe_calculate 지표 기록 테스트"""
+        inputs = {
+            'current_age': 30,
+            'retirement_age': 55,
+            'monthly_income': 500,
+            'monthly_expense': 300,
+            'total_assets': 5000,
+            'total_debt': 0,
+            'inflation_rate': 2.5,
+            'salary_growth_rate': 3.0,
+            'investment_return_rate': 5.0,
+            'debt_items': [],
+            'asset_items': [{'amount': 5000}],
+        }
+        self.assertEqual(
+            describe_input_size((inputs,), {}),
+            {'horizon': 25, 'debt': 0, 'asset': 1},
+        )
+
+        _, success, _ = safe_calculate(calculate_future_assets, inputs)
+        self.assertTrue(success)
+        result, success, message = safe_calculate(lambda: {}['missing'])
+        self.assertIsNone(result)
+        self.assertFalse(success)
+        self.assertIn('필수 데이터 누락', message)
+
+        snapshot = get_metrics_registry().snapshot()
+        duration = _series(
+            snapshot, 'histograms', 'calculation_duration_seconds',
+            function='calculate_future_assets', status='success',
+        )
+        self.assertEqual(duration['count'], 1)
+        failure = _series(
+            snapshot, 'counters', 'calculation_calls_total',
+            status='error', exception='KeyError',
+        )
+        self.assertEqual(failure['value'], 1)
+        horizon = _series(
+            snapshot, 'histograms', 'calculation_input_horizon_years',
+            function='calculate_future_assets',
+        )
+        self.assertEqual(horizon['sum'], 25)
+
+        with mock.patch.dict(os.environ, {'METRICS_ENABLED': '0'}):
+            get_metrics_registry().reset()
+            self.assertEqual(safe_calculate(lambda: 1), (1, True, ""))
+            self.assertEqual(get_metrics_registry().snapshot()['counters'], {})
+        print("[OK] safe_calculate 지표 기록 테스트 통과")
+
+    def test_file_and_http_export(self):
+        """파일/HTTP 내보내기 테스트"""
+        safe_calculate(lambda: 1)
+        registry = get_metrics_registry()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = registry.write(Path(temp_dir) / 'metrics.json')
+            prom_path = registry.write(Path(temp_dir) / 'metrics.prom')
+            self.assertIn('calculation_calls_total', json.loads(json_path.read_text(encoding='utf-8'))['counters'])
+            self.assertIn('# TYPE calculation_calls_total counter', prom_path.read_text(encoding='utf-8'))
+            self.assertEqual(sorted(p.name for p in Path(temp_dir).iterdir()), ['metrics.json', 'metrics.prom'])
+
+        server = start_metrics_server(port=0)
+        try:
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{base_url}/metrics", timeout=5) as response:
+                self.assertIn('text/plain', response.headers['Content-Type'])
+                self.assertIn('calculation_duration_seconds_bucket', response.read().decode('utf-8'))
+            with urllib.request.urlopen(f"{base_url}/metrics.json", timeout=5) as response:
+                self.assertIn('histograms', json.loads(response.read()))
+        finally:
+            server.shutdown()
+            server.server_close()
+        print("[OK] 파일/HTTP 내보내기 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+성능 패널 테스트
+
+테스트 항목:
+1. 호출 수/타임라인 기록 테스트
+2. 같은 인자 중복 호출 감지 테스트
+3. 기록 종료 후 프로파일러 해제 테스트
+"""
+
+import sys
+from pathlib import Path
+import unittest
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data.sample_data import get_sample_data
+from modules.calculations import calculate_retirement_sustainability, calculate_risk_score
+from shared.perf_panel import RerunProfiler, _freeze
+
+
+class TestPerfPanel(unittest.TestCase):
+    """성능 패널 테스트"""
+
+    def setUp(self):
+        self.inputs = get_sample_data("일반 직장인")
+
+    def _profile(self, func):
+        profiler = RerunProfiler("테스트").start()
+        try:
+            func()
+        finally:
+            profiler.stop()
+        return profiler
+
+    def test_call_counts_and_timeline(self):
+        """호출 수/타임라인 기록 테스트"""
+        profiler = RerunProfiler("테스트").start()
+        try:
+            with profiler.span("계산 구간"):
+                calculate_risk_score(self.inputs)
+        finally:
+            profiler.stop()
+        summary = profiler.summary()
+
+        calls = {item['function']: item['calls'] for item in summary['calls']}
+        self.assertEqual(calls['modules.calculations.calculate_risk_score'], 1)
+        self.assertEqual(calls['modules.calculations.calculate_retirement_sustainability'], 1)
+
+        # 타임라인에는 최상위 호출과 명시적 구간만 표시
+        names = [entry['name'] for entry in summary['timeline']]
+        self.assertIn('modules.calculations.calculate_risk_score', names)
+        self.assertIn('계산 구간', names)
+        self.assertNotIn('modules.calculations.calculate_retirement_sustainability', names)
+        self.assertEqual(summary['categories_ms'].keys(), {'계산'})
+        self.assertGreaterEqual(summary['total_ms'], summary['categories_ms']['계산'])
+        print("[OK] 호출 수/타임라인 기록 테스트 통과")
+
+    def test_duplicate_detection(self):
+        """같은 인자 중복 호출 감지 테스트"""
+        other_inputs = dict(self.inputs, retirement_age=self.inputs['retirement_age'] + 5)
+
+        def run():
+            calculate_retirement_sustainability(self.inputs)
+            calculate_risk_score(self.inputs)  # 내부에서 같은 인자로 다시 호출
+            calculate_retirement_sustainability(other_inputs)
+
+        profiler = self._profile(run)
+        duplicates = {item['function']: item for item in profiler.duplicate_calls(min_wasted_ms=0)}
+
+        self.assertEqual(
+            duplicates['modules.calculations.calculate_retirement_sustainability']['calls'], 2
+        )
+        self.assertNotIn('modules.calculations.calculate_risk_score', duplicates)
+        self.assertEqual(_freeze({'a': [1, 2]}), _freeze({'a': [1, 2]}))
+        self.assertNotEqual(_freeze({'a': [1, 2]}), _freeze({'a': [1, 3]}))
+        print("[OK] 중복 호출 감지 테스트 통과")
+
+    def test_stop_restores_profiler(self):
+        """기록 종료 후 프로파일러 해제 테스트"""
+        previous = sys.getprofile()
+        profiler = self._profile(lambda: calculate_retirement_sustainability(self.inputs))
+
+        self.assertIs(sys.getprofile(), previous)
+        self.assertFalse(profiler.is_running)
+        count = profiler.call_counts['modules.calculations.calculate_retirement_sustainability']
+        calculate_retirement_sustainability(self.inputs)
+        self.assertEqual(
+            profiler.call_counts['modules.calculations.calculate_retirement_sustainability'], count
+        )
+        profiler.stop()  # 두 번 호출해도 안전
+        print("[OK] 프로파일러 해제 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+프로필/결과 저장소 테스트
+
+테스트 항목:
+1. 프로필 저장/불러오기/삭제 테스트
+2. 시나리오 저장 테스트
+3. 입력 해시 + 엔진 버전 기반 결과 저장 테스트
+4. 결과 행 수 제한 및 엔진 버전 정리 테스트
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+import unittest
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data.sample_data import get_sample_data
+from modules.calculations import calculate_financial_health_grade
+from modules.storage import ProfileStore, make_input_hash
+
+
+class TestProfileStore(unittest.TestCase):
+    """프로필/결과 저장소 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ProfileStore(Path(self.temp_dir.name) / 'store' / 'profiles.sqlite3')
+        self.inputs = get_sample_data("일반 직장인")
+        self.inputs['debt_items'] = [
+            {'name': '전세자금대출', 'principal': 100000000, 'interest_rate': 3.5},
+        ]
+        self.inputs['asset_items'] = [
+            {'type': '예금', 'amount': 20000000, 'return_rate': 3.0},
+            {'type': '주식', 'amount': 10000000, 'return_rate': 7.0},
+        ]
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_profile_round_trip(self):
+        """프로필 저장/불러오기/삭제 테스트"""
+        form_state = {'salary': 5000, 'asset_items': self.inputs['asset_items']}
+        self.store.save_profile("  우리집 플랜 ", self.inputs, form_state)
+
+        profile = self.store.load_profile("우리집 플랜")
+        self.assertEqual(profile['inputs'], self.inputs)
+        self.assertEqual(profile['form_state'], form_state)
+        self.assertEqual(profile['input_hash'], make_input_hash(self.inputs))
+        self.assertEqual(self.store.stats()['asset_items'], 2)
+
+        # 같은 이름으로 저장하면 항목까지 덮어씀
+        self.inputs['asset_items'] = self.inputs['asset_items'][:1]
+        self.store.save_profile("우리집 플랜", self.inputs)
+        self.assertEqual(len(self.store.load_profile("우리집 플랜")['inputs']['asset_items']), 1)
+        self.assertEqual([p['name'] for p in self.store.list_profiles()], ["우리집 플랜"])
+
+        self.assertTrue(self.store.delete_profile("우리집 플랜"))
+        self.assertIsNone(self.store.load_profile("우리집 플랜"))
+        self.assertEqual(self.store.stats()['asset_items'], 0)
+        with self.assertRaises(ValueError):
+            self.store.save_profile("  ", self.inputs)
+        print("[OK] 프로필 저장/불러오기/삭제 테스트 통과")
+
+    def test_scenarios(self):
+        """시나리오 저장 테스트"""
+        self.store.save_profile("플랜", self.inputs)
+        early_retirement = dict(self.inputs, retirement_age=50)
+        self.store.save_scenario("플랜", "조기 은퇴", early_retirement)
+        self.store.save_scenario("플랜", "조기 은퇴", early_retirement)
+
+        scenarios = self.store.list_scenarios("플랜")
+        self.assertEqual(len(scenarios), 1)
+        self.assertEqual(scenarios[0]['inputs']['retirement_age'], 50)
+        with self.assertRaises(KeyError):
+            self.store.save_scenario("없는 플랜", "조기 은퇴", early_retirement)
+        print("[OK] 시나리오 저장 테스트 통과")
+
+    def test_results_keyed_by_hash_and_engine_version(self):
+        """입력 해시 + 엔진 버전 기반 결과 저장 테스트"""
+        calls = []
+
+        def compute(inputs):
+            calls.append(1)
+            return calculate_financial_health_grade(inputs)
+
+        first = self.store.get_or_compute_results(self.inputs, "grade", compute)
+        # 키 순서가 달라도 같은 입력
+        reordered = dict(reversed(list(self.inputs.items())))
+        second = self.store.get_or_compute_results(reordered, "grade", compute)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first, second)
+
+        self.assertIsNone(self.store.get_results(self.inputs, "grade", engine_version="old"))
+        self.store.put_results(self.inputs, "grade", {'grade': 'X'}, engine_version="old")
+        self.assertEqual(self.store.purge_stale_results(), 1)
+
+        self.store.save_profile("플랜", self.inputs)
+        profiles = self.store.load_profiles_with_results("grade")
+        self.assertEqual(len(profiles), 1)
+        self.assertEqual(profiles[0][1], first)
+        print("[OK] 결과 저장 테스트 통과")
+
+    def test_results_bounded(self):
+        """결과 행 수 제한 및 엔진 버전 정리 테스트"""
+        path = Path(self.temp_dir.name) / 'bounded.sqlite3'
+        # 이전 스키마 (last_access 열 없음)로 만든 DB도 그대로 사용
+        with closing(sqlite3.connect(path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE results (input_hash TEXT NOT NULL, engine_version TEXT NOT NULL, "
+                "kind TEXT NOT NULL, payload TEXT NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (input_hash, engine_version, kind))"
+            )
+            conn.execute("INSERT INTO results VALUES ('h', 'old', 'grade', '{}', 0)")
+
+        store = ProfileStore(path, max_results=2)
+        # 열 때 다른 엔진 버전 결과 삭제
+        self.assertEqual(store.stats()['results'], 0)
+
+        plans = [dict(self.inputs, salary=salary) for salary in (1, 2, 3)]
+        store.put_results(plans[0], "grade", {'grade': 'A'})
+        store.put_results(plans[1], "grade", {'grade': 'B'})
+        time.sleep(0.01)
+        self.assertEqual(store.get_results(plans[0], "grade"), {'grade': 'A'})
+        store.put_results(plans[2], "grade", {'grade': 'C'})
+
+        # 가장 오래 사용하지 않은 결과부터 삭제
+        self.assertEqual(store.stats()['results'], 2)
+        self.assertIsNone(store.get_results(plans[1], "grade"))
+        self.assertEqual(store.get_results(plans[0], "grade"), {'grade': 'A'})
+        self.assertEqual(store.get_results(plans[2], "grade"), {'grade': 'C'})
+        store.close()
+        print("[OK] 결과 행 수 제한 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
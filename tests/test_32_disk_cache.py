@@ -0,0 +1,168 @@
+"""
+계산 결과 디스크 캐시 테스트
+
+테스트 항목:
+1. 메모리/디스크 적중 및 재시작 후 유지 테스트
+2. 엔진 버전 변경 시 무효화 테스트
+   (엔진 의존 모듈 소스 변경 시 버전 변경 포함)
+3. 크기 제한 정리 테스트
+4. 여러 프로세스 동시 접근 테스트
+5. 캐시 적용 계산 함수 테스트
+"""
+
+import importlib.util
+import multiprocessing
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data.sample_data import get_sample_data
+from modules.calculations import calculate_risk_score, cached_calculate_risk_score
+from modules.disk_cache import DiskCache, cached
+from modules.hashing import ENGINE_MODULES, get_engine_version, get_source_version
+
+
+def _write_and_read(cache_dir: str, worker: int) -> int:
+    """다른 프로세스에서 같은 캐시 파일에 쓰고 읽기"""
+    cache = DiskCache(Path(cache_dir), memory_entries=0)
+    for index in range(20):
+        key = cache.make_key("worker", index % 5)
+        if cache.get(key) is None:
+            cache.set(key, {"index": index % 5, "worker": worker})
+    return cache.stats()["errors"]
+
+
+class TestDiskCache(unittest.TestCase):
+    """계산 결과 디스크 캐시 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_memory_and_disk_hits(self):
+        """메모리/디스크 적중 및 재시작 후 유지 테스트"""
+        calls = []
+
+        cache = DiskCache(self.cache_dir)
+
+        @cached("square", cache=cache)
+        def square(values):
+            calls.append(1)
+            return {"values": [value * value for value in values]}
+
+        first = square([1, 2, 3])
+        first["values"].append(100)  # 반환값을 수정해도 캐시에 영향 없음
+        self.assertEqual(square([1, 2, 3]), {"values": [1, 4, 9]})
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats()["memory_hits"], 1)
+
+        # 새 인스턴스 (서버 재시작) 에서도 디스크에서 조회
+        restarted = DiskCache(self.cache_dir)
+        key = restarted.make_key("square", ([1, 2, 3],), {})
+        self.assertEqual(restarted.get(key), {"values": [1, 4, 9]})
+        self.assertEqual(restarted.stats()["disk_hits"], 1)
+        self.assertEqual(restarted.get(key), {"values": [1, 4, 9]})
+        self.assertEqual(restarted.stats()["memory_hits"], 1)
+        print("[OK] 메모리/디스크 적중 테스트 통과")
+
+    def test_engine_version_invalidation(self):
+        """엔진 버전 변경 시 무효화 테스트"""
+        cache = DiskCache(self.cache_dir, memory_entries=0)
+        cache.set(cache.make_key("ns", 1), "old")
+
+        with mock.patch("modules.disk_cache.get_engine_version", return_value="changed"):
+            self.assertIsNone(cache.get(cache.make_key("ns", 1)))
+        self.assertEqual(cache.get(cache.make_key("ns", 1)), "old")
+        print("[OK] 엔진 버전 무효화 테스트 통과")
+
+    def test_engine_version_tracks_dependencies(self):
+        """엔진 의존 모듈 소스 변경 시 버전 변경 테스트"""
+        for module_name in (
+            "modules.payroll",
+            "modules.cashflow_schedule",
+            "modules.life_events",
+            "modules.portfolio",
+        ):
+            self.assertIn(module_name, ENGINE_MODULES)
+        # 세율표 등 payroll.py 소스만 바뀐 경우
+        edited = self.cache_dir / "payroll.py"
+        edited.write_bytes(
+            Path(importlib.util.find_spec("modules.payroll").origin).read_bytes()
+            + "\n# 세율표 변경\n".encode("utf-8")
+        )
+        real_find_spec = importlib.util.find_spec
+
+        def find_spec(name, *args):
+            if name == "modules.payroll":
+                return SimpleNamespace(origin=str(edited))
+            return real_find_spec(name, *args)
+
+        get_source_version.cache_clear()
+        try:
+            before = get_engine_version()
+            with mock.patch("importlib.util.find_spec", side_effect=find_spec):
+                get_source_version.cache_clear()
+                after = get_engine_version()
+        finally:
+            get_source_version.cache_clear()
+        self.assertNotEqual(before, after)
+        self.assertEqual(get_engine_version(), before)
+        print("[OK] 엔진 의존 모듈 버전 테스트 통과")
+
+    def test_size_bounded_eviction(self):
+        """크기 제한 정리 테스트"""
+        cache = DiskCache(self.cache_dir, max_bytes=20_000, memory_entries=0)
+        for index in range(30):
+            cache.set(cache.make_key("blob", index), b"x" * 1000)
+
+        stats = cache.stats()
+        self.assertLessEqual(stats["bytes"], 20_000)
+        self.assertGreater(stats["evictions"], 0)
+        # 가장 최근 항목은 남고 오래된 항목부터 삭제
+        self.assertIsNotNone(cache.get(cache.make_key("blob", 29)))
+        self.assertIsNone(cache.get(cache.make_key("blob", 0)))
+        print("[OK] 크기 제한 정리 테스트 통과")
+
+    def test_concurrent_processes(self):
+        """여러 프로세스 동시 접근 테스트"""
+        # 테스트 프로세스에 다른 스레드가 있을 수 있으므로 fork 대신 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=4, mp_context=context) as executor:
+            errors = list(
+                executor.map(_write_and_read, [str(self.cache_dir)] * 4, range(4))
+            )
+
+        self.assertEqual(errors, [0, 0, 0, 0])
+        cache = DiskCache(self.cache_dir)
+        self.assertEqual(cache.stats()["entries"], 5)
+        self.assertEqual(cache.get(cache.make_key("worker", 3))["index"], 3)
+        print("[OK] 여러 프로세스 동시 접근 테스트 통과")
+
+    def test_cached_calculation(self):
+        """캐시 적용 계산 함수 테스트"""
+        inputs = get_sample_data("일반 직장인")
+        with mock.patch.dict("os.environ", {"COMPUTE_CACHE_DIR": str(self.cache_dir)}), \
+                mock.patch("modules.disk_cache._default_cache", None):
+            first = cached_calculate_risk_score(inputs)
+            second = cached_calculate_risk_score(inputs)
+
+        self.assertEqual(first, calculate_risk_score(inputs))
+        self.assertEqual(first, second)
+        self.assertIs(cached_calculate_risk_score.uncached, calculate_risk_score)
+        self.assertEqual(cached_calculate_risk_score.__name__, "calculate_risk_score")
+        print("[OK] 캐시 적용 계산 함수 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
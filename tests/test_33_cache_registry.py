@@ -0,0 +1,131 @@
+"""
+캐시 관리 테스트
+
+테스트 항목:
+1. 차트 캐시 통계/적중 키/크기 변경 테스트
+2. AI 응답 캐시 적중 키/크기 변경 테스트
+3. 계산 결과 캐시 적중 키/크기 변경 테스트
+4. 기본 캐시 등록 테스트
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules import visualizations
+from modules.ai_cache import AIResponseCache
+from modules.cache_registry import (
+    AIResponseCacheAdapter,
+    ComputeCacheAdapter,
+    FigureCacheAdapter,
+    get_registered_caches,
+)
+from modules.disk_cache import DiskCache
+
+STAT_KEYS = {"entries", "bytes", "hits", "misses", "evictions", "hit_rate"}
+
+
+class TestCacheRegistry(unittest.TestCase):
+    """캐시 관리 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        self.original_max_entries = visualizations.FIGURE_CACHE_MAX_ENTRIES
+        visualizations.clear_figure_cache()
+
+    def tearDown(self):
+        visualizations.set_figure_cache_max_entries(self.original_max_entries)
+        visualizations.clear_figure_cache()
+        self.temp_dir.cleanup()
+
+    def test_figure_cache(self):
+        """차트 캐시 통계/적중 키/크기 변경 테스트"""
+        adapter = FigureCacheAdapter()
+        for grade in ("A", "B", "C"):
+            visualizations.create_financial_health_gauge({"grade": grade})
+        visualizations.create_financial_health_gauge({"grade": "C"})
+        visualizations.create_financial_health_gauge({"grade": "C"})
+
+        stats = adapter.stats()
+        self.assertTrue(STAT_KEYS <= stats.keys())
+        self.assertEqual(stats["entries"], 3)
+        self.assertEqual(stats["hits"], 2)
+        self.assertGreater(stats["bytes"], 0)
+        self.assertEqual(adapter.hottest(1)[0][1], 2)
+
+        adapter.resize(max_entries=1)
+        self.assertEqual(adapter.limits(), {"max_entries": 1})
+        stats = adapter.stats()
+        self.assertEqual(stats["entries"], 1)
+        self.assertEqual(stats["evictions"], 2)
+
+        adapter.clear()
+        self.assertEqual(adapter.stats()["entries"], 0)
+        self.assertEqual(adapter.hottest(), [])
+        print("[OK] 차트 캐시 관리 테스트 통과")
+
+    def test_ai_response_cache(self):
+        """AI 응답 캐시 적중 키/크기 변경 테스트"""
+        cache = AIResponseCache(self.cache_dir, max_bytes=10_000)
+        adapter = AIResponseCacheAdapter(cache)
+        for index in range(5):
+            cache.set({"index": index}, "model", "x" * 1000)
+        for _ in range(3):
+            cache.get({"index": 4}, "model")
+        cache.get({"index": 0}, "model")
+
+        self.assertTrue(STAT_KEYS <= adapter.stats().keys())
+        hottest = adapter.hottest(2)
+        self.assertEqual(hottest[0][1:], (3, 1000))
+        self.assertEqual(hottest[0][0], cache.make_key({"index": 4}, "model"))
+
+        adapter.resize(max_bytes=2500)
+        stats = adapter.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 3)
+        self.assertEqual(adapter.limits(), {"max_bytes": 2500})
+        print("[OK] AI 응답 캐시 관리 테스트 통과")
+
+    def test_compute_cache(self):
+        """계산 결과 캐시 적중 키/크기 변경 테스트"""
+        cache = DiskCache(self.cache_dir, memory_entries=4)
+        adapter = ComputeCacheAdapter(cache)
+        keys = [cache.make_key("ns", index) for index in range(4)]
+        for key in keys:
+            cache.set(key, b"x" * 1000)
+        for _ in range(2):
+            cache.get(keys[1])
+
+        # 다른 프로세스 (새 인스턴스) 의 디스크 적중도 합산
+        DiskCache(self.cache_dir, memory_entries=0).get(keys[1])
+        self.assertEqual(adapter.hottest(1)[0][:2], (keys[1], 3))
+        stats = adapter.stats()
+        self.assertTrue(STAT_KEYS <= stats.keys())
+        self.assertEqual(stats["hits"], 2)
+
+        adapter.resize(memory_entries=1, max_bytes=2500)
+        stats = adapter.stats()
+        self.assertEqual(stats["memory_entries"], 1)
+        self.assertLessEqual(stats["bytes"], 2500)
+        self.assertEqual(adapter.limits(), {"max_bytes": 2500, "memory_entries": 1})
+
+        adapter.clear()
+        self.assertEqual(adapter.stats()["entries"], 0)
+        print("[OK] 계산 결과 캐시 관리 테스트 통과")
+
+    def test_registered_caches(self):
+        """기본 캐시 등록 테스트"""
+        caches = get_registered_caches()
+        self.assertEqual(list(caches), ["figure", "ai", "compute"])
+        self.assertIs(get_registered_caches()["figure"], caches["figure"])
+        print("[OK] 기본 캐시 등록 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+동일 계산 요청 합치기 테스트
+
+테스트 항목:
+1. 동시 호출 시 한 번만 실행 테스트
+2. 예외 전달 및 키 정리 테스트
+3. 첫 요청 중단 시 다시 계산 테스트
+4. 계산 캐시 데코레이터 합치기 테스트
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import unittest
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.disk_cache import DiskCache, cached
+from modules.singleflight import SingleFlight
+
+WORKERS = 8
+
+
+class TestSingleFlight(unittest.TestCase):
+    """동일 계산 요청 합치기 테스트"""
+
+    def _run_together(self, call):
+        """WORKERS개 스레드에서 동시에 call 실행"""
+        barrier = threading.Barrier(WORKERS)
+
+        def run(_):
+            barrier.wait()
+            return call()
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            return list(executor.map(run, range(WORKERS)))
+
+    def test_concurrent_calls_share_one_execution(self):
+        """동시 호출 시 한 번만 실행 테스트"""
+        flight = SingleFlight()
+        calls = []
+
+        def slow_square(value):
+            calls.append(value)
+            time.sleep(0.2)
+            return value * value
+
+        results = self._run_together(lambda: flight.do("square:7", slow_square, 7))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([value for value, _ in results], [49] * WORKERS)
+        self.assertEqual(sum(leader for _, leader in results), 1)
+        self.assertEqual(flight.stats(), {"executions": 1, "coalesced": WORKERS - 1, "in_flight": 0})
+
+        # 끝난 뒤 호출은 다시 실행 (결과를 보관하지 않음)
+        self.assertEqual(flight.do("square:7", slow_square, 7), (49, True))
+        self.assertEqual(len(calls), 2)
+        print("[OK] 동시 호출 합치기 테스트 통과")
+
+    def test_exception_shared_and_key_released(self):
+        """예외 전달 및 키 정리 테스트"""
+        flight = SingleFlight()
+        calls = []
+
+        def failing():
+            calls.append(1)
+            time.sleep(0.2)
+            raise ValueError("계산 실패")
+
+        def call():
+            try:
+                flight.do("fail", failing)
+            except ValueError as e:
+                return str(e)
+
+        self.assertEqual(self._run_together(call), ["계산 실패"] * WORKERS)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.in_flight(), 0)
+        print("[OK] 예외 전달 테스트 통과")
+
+    def test_abandoned_leader_is_retried(self):
+        """첫 요청 중단 시 다시 계산 테스트"""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def interrupted():
+            started.set()
+            time.sleep(0.2)
+            raise KeyboardInterrupt
+
+        def leader():
+            try:
+                flight.do("key", interrupted)
+            except KeyboardInterrupt:
+                return "interrupted"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(leader)
+            started.wait()
+            second = executor.submit(flight.do, "key", lambda: "recomputed")
+            self.assertEqual(first.result(), "interrupted")
+            self.assertEqual(second.result(), ("recomputed", True))
+        print("[OK] 첫 요청 중단 시 다시 계산 테스트 통과")
+
+    def test_cached_decorator_coalesces_misses(self):
+        """계산 캐시 데코레이터 합치기 테스트"""
+        calls = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DiskCache(Path(temp_dir))
+
+            @cached("grid", cache=cache)
+            def expensive_grid(size):
+                calls.append(size)
+                time.sleep(0.2)
+                return {"rows": [[row * col for col in range(size)] for row in range(size)]}
+
+            results = self._run_together(lambda: expensive_grid(3))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result == results[0] for result in results))
+        # 기다린 호출도 각자 복사본을 받으므로 수정해도 서로 영향 없음
+        self.assertEqual(len({id(result) for result in results}), WORKERS)
+        print("[OK] 계산 캐시 데코레이터 합치기 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+계산 API 서버 테스트
+
+테스트 항목:
+1. 단건 계산 엔드포인트 테스트
+2. 입력 검증/잘못된 요청 테스트
+3. 배치 엔드포인트 테스트
+4. gzip 응답/요청 테스트
+5. 응답 캐시 및 상태 엔드포인트 테스트
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+from pathlib import Path
+import unittest
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from data.sample_data import get_sample_data, get_sample_scenarios
+from modules import api_server
+from modules.api_server import APIService, encode_json, start_api_server
+from modules.calculations import (
+    calculate_financial_health_grade,
+    calculate_future_assets,
+    find_required_return_rate,
+)
+
+
+class TestAPIServer(unittest.TestCase):
+    """계산 API 서버 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.env = mock.patch.dict(os.environ, {"COMPUTE_CACHE_DIR": cls.temp_dir.name})
+        cls.env.start()
+        cls.server = start_api_server(service=APIService(workers=2, cache_entries=16))
+        cls.base_url = "http://%s:%d" % cls.server.server_address[:2]
+        cls.inputs = get_sample_data("일반 직장인")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server.service.close()
+        cls.env.stop()
+        cls.temp_dir.cleanup()
+
+    def _request(self, path, payload=None, headers=None, raw_body=None):
+        """요청을 보내고 (상태 코드, 응답 헤더, JSON 본문) 반환"""
+        data = raw_body if raw_body is not None else (
+            None if payload is None else json.dumps(payload).encode("utf-8")
+        )
+        request = urllib.request.Request(self.base_url + path, data=data, headers=headers or {})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                status, response_headers, body = response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            status, response_headers, body = e.code, e.headers, e.read()
+        if response_headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return status, response_headers, json.loads(body)
+
+    @staticmethod
+    def _as_json(value):
+        """직접 계산한 결과를 API 응답과 같은 형태로 변환"""
+        return json.loads(encode_json(value))
+
+    def test_single_endpoints(self):
+        """단건 계산 엔드포인트 테스트"""
+        status, _, body = self._request("/v1/grade", {"inputs": self.inputs})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["result"], self._as_json(calculate_financial_health_grade(self.inputs)))
+
+        status, _, body = self._request("/v1/future_assets", {"inputs": self.inputs, "years": 20})
+        self.assertEqual(status, 200)
+        expected = calculate_future_assets(
+            self.inputs, years=20, inflation_rate=self.inputs.get("inflation_rate", 2.5)
+        )
+        self.assertEqual(body["result"], self._as_json(expected))
+
+        status, _, body = self._request(
+            "/v1/required_return_rate", {"inputs": self.inputs, "monthly_contribution": 1000000}
+        )
+        self.assertEqual(status, 200)
+        rate, _ = find_required_return_rate(self.inputs, 1000000)
+        self.assertAlmostEqual(body["result"]["annual_return_rate"], rate)
+
+        status, _, body = self._request(
+            "/v1/scenarios", {"inputs": self.inputs, "scenarios": ["지출 10% 감소"]}
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(body["result"]["scenarios"][0]["scenario_name"], "지출 10% 감소")
+        print("[OK] 단건 계산 엔드포인트 테스트 통과")
+
+    def test_validation_and_bad_requests(self):
+        """입력 검증/잘못된 요청 테스트"""
+        invalid = dict(self.inputs, current_age=200)
+        status, _, body = self._request("/v1/risk_score", {"inputs": invalid})
+        self.assertEqual(status, 422)
+        self.assertTrue(body["errors"])
+
+        status, _, body = self._request("/v1/risk_score", {"inputs": dict(self.inputs, salary="많음")})
+        self.assertEqual(status, 422)
+
+        cases = [
+            ("/v1/retirement_goal", {"inputs": self.inputs}),  # 필수 파라미터 누락
+            ("/v1/future_assets", {"inputs": self.inputs, "years": "10"}),
+            ("/v1/future_assets", {"inputs": self.inputs, "years": 10.5}),
+            ("/v1/future_assets", {"inputs": self.inputs, "unknown": 1}),
+            ("/v1/grade", {"salary": 1}),
+        ]
+        for path, payload in cases:
+            status, _, body = self._request(path, payload)
+            self.assertEqual(status, 400, (path, payload))
+            self.assertIn("error", body)
+
+        self.assertEqual(self._request("/v1/grade", raw_body=b"{not json")[0], 400)
+        self.assertEqual(self._request("/v1/unknown", {"inputs": self.inputs})[0], 404)
+        self.assertEqual(self._request("/v2/grade", {"inputs": self.inputs})[0], 404)
+        print("[OK] 입력 검증/잘못된 요청 테스트 통과")
+
+    def test_batch(self):
+        """배치 엔드포인트 테스트"""
+        other = get_sample_data(list(get_sample_scenarios())[-1])
+        items = [{"inputs": self.inputs}, {"inputs": other}, {"inputs": self.inputs}, {"salary": 1}]
+        status, _, body = self._request("/v1/grade/batch", {"items": items})
+        self.assertEqual(status, 200)
+        results = body["results"]
+        self.assertEqual([result["status"] for result in results], [200, 200, 200, 400])
+        self.assertEqual(results[0], results[2])
+        self.assertEqual(results[1]["result"], self._as_json(calculate_financial_health_grade(other)))
+
+        self.assertEqual(self._request("/v1/grade/batch", {"inputs": self.inputs})[0], 400)
+        too_many = {"items": [{"inputs": self.inputs}] * (self.server.service.max_batch_items + 1)}
+        self.assertEqual(self._request("/v1/grade/batch", too_many)[0], 413)
+        print("[OK] 배치 엔드포인트 테스트 통과")
+
+    def test_gzip(self):
+        """gzip 응답/요청 테스트"""
+        payload = json.dumps({"inputs": self.inputs, "years": 30}).encode("utf-8")
+        status, headers, body = self._request(
+            "/v1/future_assets",
+            raw_body=gzip.compress(payload),
+            headers={"Content-Encoding": "gzip", "Accept-Encoding": "gzip"},
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(headers.get("Content-Encoding"), "gzip")
+        self.assertIn("future_assets", body["result"])
+
+        _, headers, _ = self._request("/v1/future_assets", raw_body=payload)
+        self.assertIsNone(headers.get("Content-Encoding"))
+
+        # 압축 해제 후 한도를 넘으면 413 (압축 폭탄)
+        with mock.patch.object(api_server, "MAX_REQUEST_BYTES", 1024):
+            bomb = gzip.compress(b" " * 4096 + payload)
+            self.assertLess(len(bomb), 1024)
+            status, _, _ = self._request(
+                "/v1/future_assets", raw_body=bomb, headers={"Content-Encoding": "gzip"}
+            )
+        self.assertEqual(status, 413)
+
+        # 음수 Content-Length는 400
+        status, _, body = self._request(
+            "/v1/grade", raw_body=b"{}", headers={"Content-Length": "-1"}
+        )
+        self.assertEqual(status, 400)
+        self.assertIn("error", body)
+        print("[OK] gzip 테스트 통과")
+
+    def test_response_cache_and_status(self):
+        """응답 캐시 및 상태 엔드포인트 테스트"""
+        service = APIService(workers=1, cache_entries=2)
+        try:
+            payload = {"inputs": self.inputs}
+            with mock.patch.object(
+                api_server, "run_endpoint", wraps=api_server.run_endpoint
+            ) as run:
+                first = service.call("grade", payload)
+                second = service.call("grade", dict(reversed(list(payload.items()))))
+            self.assertEqual(first, second)
+            self.assertEqual(run.call_count, 1)
+
+            for years in (5, 6, 7):
+                service.call("future_assets", {"inputs": self.inputs, "years": years})
+            self.assertEqual(service.stats()["cache_entries"], 2)
+        finally:
+            service.close()
+
+        self._request("/v1/grade", {"inputs": self.inputs})
+        status, _, body = self._request("/healthz")
+        self.assertEqual((status, body["status"]), (200, "ok"))
+        status, _, body = self._request("/v1/endpoints")
+        self.assertTrue(body["retirement_goal"]["params"]["monthly_contribution"]["required"])
+        with urllib.request.urlopen(self.base_url + "/metrics", timeout=30) as response:
+            self.assertIn("api_requests_total", response.read().decode("utf-8"))
+        print("[OK] 응답 캐시 및 상태 엔드포인트 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
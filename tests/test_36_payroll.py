@@ -0,0 +1,159 @@
+"""
+실수령액 계산 테스트
+
+테스트 항목:
+1. 구간표 계산 테스트
+2. 공제 항목 및 실수령액 테스트
+   (2025년 기준 연말정산 결정세액 고정값 포함)
+3. 배열 계산 일치 테스트
+4. 실수령액 기준 계산 반영 테스트
+"""
+
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.calculations import (
+    calculate_future_assets,
+    calculate_monthly_savings,
+)
+from modules.payroll import (
+    INCOME_TAX,
+    EARNED_INCOME_DEDUCTION,
+    EARNED_INCOME_TAX_CREDIT_LIMIT,
+    BracketTable,
+    calculate_net_income,
+    calculate_take_home_pay,
+)
+
+
+class TestPayroll(unittest.TestCase):
+    """실수령액 계산 테스트"""
+
+    def setUp(self):
+        self.inputs = {
+            "current_age": 30,
+            "retirement_age": 60,
+            "salary": 50000000,
+            "salary_growth_rate": 3.0,
+            "bonus": 5000000,
+            "monthly_fixed_expense": 1200000,
+            "monthly_variable_expense": 800000,
+            "total_assets": 30000000,
+            "total_debt": 0,
+            "inflation_rate": 2.5,
+        }
+
+    def test_bracket_tables(self):
+        """구간표 계산 테스트"""
+        # 누진공제액 방식과 같은 결과
+        self.assertAlmostEqual(INCOME_TAX(14_000_000), 840_000)
+        self.assertAlmostEqual(INCOME_TAX(50_000_000), 50_000_000 * 0.15 - 1_260_000)
+        self.assertAlmostEqual(INCOME_TAX(100_000_000), 100_000_000 * 0.35 - 15_440_000)
+        self.assertAlmostEqual(EARNED_INCOME_DEDUCTION(50_000_000), 12_250_000)
+        self.assertEqual(EARNED_INCOME_DEDUCTION(1_000_000_000), 20_000_000)
+        self.assertEqual(EARNED_INCOME_TAX_CREDIT_LIMIT(10_000_000), 740_000)
+        self.assertAlmostEqual(EARNED_INCOME_TAX_CREDIT_LIMIT(38_000_000), 700_000)
+        self.assertEqual(EARNED_INCOME_TAX_CREDIT_LIMIT(500_000_000), 200_000)
+
+        table = BracketTable([0, 10], [1.0, 0.5], limit=12)
+        np.testing.assert_allclose(table.evaluate([-5, 5, 10, 12, 100]), [0, 5, 10, 11, 12])
+        with self.assertRaises(ValueError):
+            BracketTable([0, 10], [1.0])
+        print("[OK] 구간표 계산 테스트 통과")
+
+    def test_take_home_pay(self):
+        """공제 항목 및 실수령액 테스트"""
+        result = calculate_take_home_pay(50_000_000)
+        self.assertAlmostEqual(result["national_pension"], 50_000_000 * 0.045)
+        self.assertAlmostEqual(result["long_term_care"], result["health_insurance"] * 0.1295)
+        self.assertAlmostEqual(result["local_income_tax"], result["income_tax"] * 0.1)
+        self.assertAlmostEqual(
+            result["net_annual"], result["gross_annual"] - result["total_deductions"]
+        )
+        # 연봉 5천만원의 월 실수령액은 350만원 안팎
+        self.assertTrue(3_400_000 < result["net_monthly"] < 3_650_000)
+
+        # 국민연금 기준소득월액 상한
+        high = calculate_take_home_pay(200_000_000)
+        self.assertAlmostEqual(high["national_pension"], 6_370_000 * 0.045 * 12)
+        # 부양가족이 많으면 세금이 줄어듦
+        self.assertLess(
+            calculate_take_home_pay(50_000_000, dependents=4)["income_tax"], result["income_tax"]
+        )
+        self.assertEqual(calculate_net_income(0), 0)
+        print("[OK] 공제 항목 및 실수령액 테스트 통과")
+
+    def test_year_end_settlement_figure(self):
+        """연말정산 결정세액 고정값 테스트 (총급여 5천만원, 본인 1명)"""
+        result = calculate_take_home_pay(50_000_000)
+        # 국민연금 4.5%, 건강보험 3.545%, 장기요양 12.95%, 고용보험 0.9%
+        self.assertAlmostEqual(result["national_pension"], 2_250_000)
+        self.assertAlmostEqual(result["health_insurance"], 1_772_500)
+        self.assertAlmostEqual(result["long_term_care"], 229_538.75)
+        self.assertAlmostEqual(result["employment_insurance"], 450_000)
+        # 근로소득금액 5,000만 - 1,225만 = 3,775만
+        # 과세표준 3,775만 - 인적 150만 - 연금 225만 - 보험료 245만2,038.75 = 31,547,961.25
+        # 산출세액 84만 + (31,547,961.25 - 1,400만) × 15% = 3,472,194.19
+        # 근로소득세액공제 한도 66만 (총급여 4,300만 ~ 7,000만), 표준세액공제 없음
+        self.assertAlmostEqual(result["income_tax"], 2_812_194.19, places=2)
+        self.assertAlmostEqual(result["local_income_tax"], 281_219.42, places=2)
+        self.assertAlmostEqual(result["net_annual"], 42_204_547.64, places=2)
+        print("[OK] 연말정산 결정세액 고정값 테스트 통과")
+
+    def test_vectorized_matches_scalar(self):
+        """배열 계산 일치 테스트"""
+        salaries = np.array([0, 3_000_000, 14_000_000, 33_000_000, 50_000_000, 70_100_000,
+                             88_000_000, 120_300_000, 400_000_000, 2_000_000_000])
+        vectorized = calculate_take_home_pay(salaries)
+        for index, salary in enumerate(salaries):
+            scalar = calculate_take_home_pay(float(salary))
+            for key, value in scalar.items():
+                self.assertAlmostEqual(vectorized[key][index], value, places=4, msg=(salary, key))
+
+        # (프로필 수 × 연도 수) 배열과 프로필별 부양가족 수
+        grid = np.outer([30_000_000, 60_000_000], 1.03 ** np.arange(40))
+        net = calculate_net_income(grid, dependents=np.array([[1], [3]]))
+        self.assertEqual(net.shape, (2, 40))
+        self.assertAlmostEqual(net[1, 5], calculate_net_income(grid[1, 5], 3), places=4)
+        print("[OK] 배열 계산 일치 테스트 통과")
+
+    def test_net_income_in_projection(self):
+        """실수령액 기준 계산 반영 테스트"""
+        net_inputs = dict(self.inputs, use_net_income=True)
+        gross = calculate_future_assets(self.inputs, years=30, include_post_retirement=False)
+        net = calculate_future_assets(net_inputs, years=30, include_post_retirement=False)
+
+        self.assertLess(net["future_assets"], gross["future_assets"])
+        first_year = net["yearly_breakdown"][0]
+        self.assertAlmostEqual(first_year["gross_income"], 50_000_000 * 1.03 + 5_000_000)
+        self.assertAlmostEqual(
+            first_year["annual_income"], calculate_net_income(first_year["gross_income"])
+        )
+        self.assertNotIn("gross_income", gross["yearly_breakdown"][0])
+
+        # 입력 폼의 부양가족 수가 인적공제에 반영됨
+        family = calculate_future_assets(
+            dict(net_inputs, dependents=4), years=30, include_post_retirement=False
+        )
+        self.assertAlmostEqual(
+            family["yearly_breakdown"][0]["annual_income"],
+            calculate_net_income(first_year["gross_income"], 4),
+        )
+        self.assertGreater(family["future_assets"], net["future_assets"])
+
+        self.assertAlmostEqual(
+            calculate_monthly_savings(net_inputs),
+            calculate_net_income(55_000_000) / 12 - 2_000_000,
+        )
+        print("[OK] 실수령액 기준 계산 반영 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
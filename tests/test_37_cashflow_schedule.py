@@ -0,0 +1,253 @@
+"""
+현금흐름 일정 테스트
+
+테스트 항목:
+1. 정기 예금/적금 만기 금액 테스트
+2. 자유적립식 적금/청약 이자 테스트
+3. 여러 상품 합산 및 연도별 배열 테스트
+4. 미래 자산 계산 반영 테스트
+5. 입력 폼 총 자산 기준 이자/납입 중복 없음 테스트
+"""
+
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.calculations import calculate_future_assets
+from modules.cashflow_schedule import (
+    DEPOSIT,
+    INTEREST,
+    MATURITY,
+    build_cashflow_schedule,
+    compile_asset_item,
+)
+
+
+def brute_force_balance(deposits, monthly_rate, is_compound, month):
+    """월 단위로 직접 계산한 month 시점 잔액 (검증용)"""
+    balance = 0.0
+    for deposit_month, amount in deposits:
+        if deposit_month < month:
+            periods = month - deposit_month
+            if is_compound:
+                balance += amount * (1 + monthly_rate) ** periods
+            else:
+                balance += amount * (1 + monthly_rate * periods)
+    return balance
+
+
+class TestCashflowSchedule(unittest.TestCase):
+    """현금흐름 일정 테스트"""
+
+    def test_fixed_term_products(self):
+        """정기 예금/적금 만기 금액 테스트"""
+        items = [
+            {"type": "적금", "monthly_amount": 100000, "months": 12, "rate": 4.0},
+            {"type": "적금", "monthly_amount": 100000, "months": 24, "rate": 4.0, "is_compound": True},
+            {"type": "예금", "amount": 10000000, "months": 36, "rate": 3.5, "is_compound": True},
+            {"type": "예금", "amount": 10000000, "months": 18, "rate": 3.5},
+        ]
+        schedule = build_cashflow_schedule(items, 5)
+        maturity = schedule.kind == MATURITY
+        np.testing.assert_array_equal(schedule.month[maturity], [12, 24, 36, 18])
+
+        monthly_rate = 0.04 / 12
+        expected = [
+            100000 * 12 + 100000 * monthly_rate * 12 * 13 / 2,
+            100000 * ((1 + monthly_rate) ** 25 - (1 + monthly_rate)) / monthly_rate,
+            10000000 * 1.035 ** 3,
+            10000000 * (1 + 0.035 * 18 / 12),
+        ]
+        np.testing.assert_allclose(schedule.amount[maturity], expected)
+        # 예금 원금은 이미 보유한 금액
+        self.assertAlmostEqual(schedule.opening_balance, 20000000)
+
+        # 납입 6개월이 지난 적금은 남은 6개월만 납입
+        elapsed = compile_asset_item(dict(items[0], elapsed_months=6), 60)
+        self.assertEqual(elapsed["maturity"], 6)
+        partial = build_cashflow_schedule([dict(items[0], elapsed_months=6)], 5)
+        self.assertEqual(int((partial.kind == DEPOSIT).sum()), 6)
+        self.assertAlmostEqual(partial.amount[partial.kind == MATURITY][0], expected[0])
+        self.assertAlmostEqual(
+            partial.opening_balance, brute_force_balance(
+                [(m, 100000) for m in range(-6, 0)], monthly_rate, False, 0
+            )
+        )
+
+        # 만기가 지난 상품과 일정이 없는 자산은 기존 방식으로 계산
+        matured = build_cashflow_schedule(
+            [dict(items[3], elapsed_months=18), {"type": "주식", "amount": 1}], 5
+        )
+        self.assertEqual(matured.product_count, 0)
+        self.assertEqual(len(matured.remaining_items), 2)
+        print("[OK] 정기 예금/적금 만기 금액 테스트 통과")
+
+    def test_free_deposit_and_subscription(self):
+        """자유적립식 적금/청약 이자 테스트"""
+        free_item = {
+            "type": "적금",
+            "deposit_type": "자유",
+            "amount": 1000000,
+            "monthly_amount": 200000,
+            "deposits": [{"month": 5, "amount": 3000000}, {"month": 40, "amount": 500000}],
+            "months": 30,
+            "rate": 3.0,
+            "is_compound": True,
+        }
+        schedule = build_cashflow_schedule([free_item], 4)
+        deposits = [(0, 1000000)] + [(m, 200000) for m in range(30)] + [(5, 3000000)]
+        payout = schedule.amount[schedule.kind == MATURITY]
+        self.assertAlmostEqual(payout[0], brute_force_balance(deposits, 0.0025, True, 30))
+        # 만기 이후의 비정기 납입은 무시
+        self.assertEqual(int((schedule.kind == DEPOSIT).sum()), 31)
+
+        subscription = {"type": "청약", "amount": 3000000, "monthly_amount": 100000, "rate": 2.4}
+        yearly = build_cashflow_schedule([subscription], 10).yearly()
+        deposits = [(0, 3000000)] + [(m, 100000) for m in range(120)]
+        for year in (1, 5, 10):
+            self.assertAlmostEqual(
+                yearly["balance"][year - 1],
+                brute_force_balance(deposits, 0.002, False, 12 * year),
+                places=4,
+            )
+        self.assertTrue(np.all(yearly["maturities"] == 0))
+        print("[OK] 자유적립식 적금/청약 이자 테스트 통과")
+
+    def test_merge_and_yearly(self):
+        """여러 상품 합산 및 연도별 배열 테스트"""
+        rng = np.random.default_rng(7)
+        items = []
+        for index in range(200):
+            kind = index % 4
+            if kind == 0:
+                items.append({"type": "예금", "amount": float(rng.integers(1, 100)) * 100000,
+                              "months": int(rng.integers(1, 60)), "rate": 3.0,
+                              "is_compound": bool(index % 8)})
+            elif kind == 1:
+                items.append({"type": "적금", "monthly_amount": 50000, "rate": 4.0,
+                              "months": int(rng.integers(6, 48)),
+                              "elapsed_months": int(rng.integers(0, 6))})
+            elif kind == 2:
+                items.append({"type": "청약", "amount": 1000000, "monthly_amount": 20000,
+                              "rate": 2.0})
+            else:
+                items.append({"type": "적금", "deposit_type": "자유", "amount": 500000,
+                              "monthly_amount": 10000, "months": 0, "rate": 3.0,
+                              "deposits": [{"month": int(rng.integers(0, 60)), "amount": 70000}]})
+
+        years = 6
+        merged = build_cashflow_schedule(items, years).yearly()
+        separate = [build_cashflow_schedule([item], years).yearly() for item in items]
+        for name in ("deposits", "interest", "maturities", "balance"):
+            np.testing.assert_allclose(
+                merged[name], np.sum([result[name] for result in separate], axis=0)
+            )
+        # 연말 잔액 = 기존 잔액 + 누적(납입 + 이자 - 만기)
+        schedule = build_cashflow_schedule(items, years)
+        flows = np.where(schedule.kind == MATURITY, -schedule.amount, schedule.amount)
+        self.assertAlmostEqual(
+            merged["balance"][-1], schedule.opening_balance + flows.sum(), places=2
+        )
+        self.assertTrue(np.all(schedule.amount[schedule.kind == INTEREST] >= 0))
+
+        empty = build_cashflow_schedule([], 3).yearly()
+        np.testing.assert_array_equal(empty["balance"], np.zeros(3))
+        print("[OK] 여러 상품 합산 및 연도별 배열 테스트 통과")
+
+    def test_schedule_in_projection(self):
+        """미래 자산 계산 반영 테스트"""
+        inputs = {
+            "current_age": 30,
+            "retirement_age": 60,
+            "salary": 0,
+            "bonus": 0,
+            "monthly_fixed_expense": 0,
+            "monthly_variable_expense": 0,
+            "total_assets": 10000000,
+            "total_debt": 0,
+            "asset_items": [{"type": "예금", "amount": 10000000, "months": 0, "rate": 4.0,
+                             "is_compound": True}],
+        }
+        legacy = calculate_future_assets(inputs, years=10, include_post_retirement=False)
+        scheduled = calculate_future_assets(
+            dict(inputs, use_cashflow_schedule=True), years=10, include_post_retirement=False
+        )
+        # 만기 없는 복리 예금만 있으면 기존 가중 평균 수익률 계산과 같음
+        self.assertAlmostEqual(scheduled["future_assets"], legacy["future_assets"], places=2)
+        self.assertAlmostEqual(scheduled["future_assets"], 10000000 * 1.04 ** 10, places=2)
+        self.assertIn("scheduled_balance", scheduled["yearly_breakdown"][0])
+        self.assertNotIn("scheduled_balance", legacy["yearly_breakdown"][0])
+
+        # 만기 후에는 나머지 자산의 수익률로 운용 (총 자산은 입력 폼처럼 예금 만기 금액 기준)
+        mixed = dict(
+            inputs,
+            total_assets=20400000,
+            use_cashflow_schedule=True,
+            asset_items=[
+                {"type": "예금", "amount": 10000000, "months": 12, "rate": 4.0},
+                {"type": "주식", "amount": 10000000, "return_rate": 6.0},
+            ],
+        )
+        result = calculate_future_assets(mixed, years=2, include_post_retirement=False)
+        first, second = result["yearly_breakdown"]
+        self.assertAlmostEqual(first["assets"], 10000000 * 1.06 + 10400000)
+        self.assertEqual(first["scheduled_balance"], 0)
+        self.assertAlmostEqual(second["assets"], (10000000 * 1.06 + 10400000) * 1.06)
+        print("[OK] 미래 자산 계산 반영 테스트 통과")
+
+    def test_form_totals_not_double_counted(self):
+        """입력 폼 총 자산 기준 이자/납입 중복 없음 테스트"""
+        from shared.page_input_form import (
+            calculate_deposit_interest,
+            calculate_savings_interest,
+        )
+
+        base = {
+            "current_age": 30,
+            "retirement_age": 60,
+            "salary": 0,
+            "bonus": 0,
+            "monthly_fixed_expense": 0,
+            "monthly_variable_expense": 0,
+            "total_debt": 0,
+            "use_cashflow_schedule": True,
+        }
+        cases = [
+            # (자산 항목, 입력 폼이 합산하는 총 자산)
+            (
+                {"type": "예금", "amount": 10000000, "months": 12, "rate": 5.0},
+                calculate_deposit_interest(10000000, 12, 5.0),
+            ),
+            (
+                {"type": "적금", "monthly_amount": 1000000, "months": 12, "rate": 5.0},
+                calculate_savings_interest(1000000, 12, 5.0),
+            ),
+            (
+                {"type": "적금", "monthly_amount": 1000000, "months": 24, "rate": 5.0,
+                 "is_compound": True, "elapsed_months": 6},
+                calculate_savings_interest(1000000, 24, 5.0, True),
+            ),
+        ]
+        self.assertAlmostEqual(cases[0][1], 10500000)
+        self.assertAlmostEqual(cases[1][1], 12325000)
+        for item, total_assets in cases:
+            result = calculate_future_assets(
+                dict(base, total_assets=total_assets, asset_items=[item]),
+                years=5,
+                include_post_retirement=False,
+            )
+            # 만기 이후에는 만기 금액만 남음 (이자/납입을 두 번 더하지 않음)
+            for row in result["yearly_breakdown"][2:]:
+                self.assertAlmostEqual(row["assets"], total_assets, places=2, msg=item)
+            self.assertAlmostEqual(result["future_assets"], total_assets, places=2)
+        print("[OK] 입력 폼 총 자산 중복 없음 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+생애 이벤트 테스트
+
+테스트 항목:
+1. 이벤트 구간 변환 테스트
+2. 부채 이벤트 상환 테스트
+3. 이벤트 순서 무관/대량 이벤트 테스트
+4. 미래 자산 계산 반영 테스트
+"""
+
+import random
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.calculations import calculate_future_assets
+from modules.life_events import compile_life_events
+
+
+def brute_force_expense(events, current_age, years):
+    """연도마다 모든 이벤트를 확인해 월 지출 변화 계산 (검증용)"""
+    totals = np.zeros(years)
+    for index in range(years):
+        age = current_age + index + 1
+        for event in events:
+            end_age = event.get("end_age") or float("inf")
+            if event["start_age"] <= age <= end_age or (
+                event["start_age"] <= current_age and age <= end_age
+            ):
+                totals[index] += event.get("expense_change", 0)
+    return totals
+
+
+class TestLifeEvents(unittest.TestCase):
+    """생애 이벤트 테스트"""
+
+    def setUp(self):
+        self.inputs = {
+            "current_age": 30,
+            "retirement_age": 60,
+            "salary": 50000000,
+            "salary_growth_rate": 3.0,
+            "bonus": 0,
+            "monthly_fixed_expense": 1200000,
+            "monthly_variable_expense": 800000,
+            "total_assets": 30000000,
+            "total_debt": 0,
+            "inflation_rate": 2.5,
+        }
+
+    def test_event_ranges(self):
+        """이벤트 구간 변환 테스트"""
+        events = [
+            {"name": "결혼", "start_age": 32, "expense_change": 500000, "asset_change": -20000000},
+            {"name": "출산", "start_age": 34, "end_age": 53, "expense_change": 1000000},
+            {"name": "실직", "start_age": 40, "end_age": 40, "income_change_rate": -100},
+            {"name": "과거", "start_age": 25, "end_age": 31, "expense_change": 300000,
+             "asset_change": 999},
+        ]
+        timeline = compile_life_events(events, 30, 30)
+
+        np.testing.assert_allclose(timeline.expense, brute_force_expense(events, 30, 30))
+        self.assertEqual(timeline.expense[0], 300000)  # 31세: 진행 중인 과거 이벤트
+        self.assertEqual(timeline.expense[1], 500000)  # 32세: 결혼
+        self.assertEqual(timeline.expense[22], 1500000)  # 53세: 출산 기간 마지막 해
+        self.assertEqual(timeline.expense[23], 500000)
+        self.assertEqual(timeline.income_rate[9], -100)
+        self.assertEqual(timeline.adjust_income(60000000, 9), 0)
+        self.assertEqual(timeline.adjust_income(60000000, 10), 60000000)
+        # 일회성 효과는 시작 연도에 한 번, 지난 이벤트는 제외
+        self.assertEqual(timeline.asset.sum(), -20000000)
+        self.assertEqual(timeline.labels[1], ["결혼"])
+        self.assertEqual(timeline.labels[0], [])
+
+        self.assertEqual(compile_life_events([], 30, 10).expense.tolist(), [0.0] * 10)
+        self.assertEqual(compile_life_events(events, 30, 0).years, 0)
+        print("[OK] 이벤트 구간 변환 테스트 통과")
+
+    def test_debt_event(self):
+        """부채 이벤트 상환 테스트"""
+        events = [{"name": "주택 구입", "start_age": 35, "end_age": 64,
+                   "asset_change": 300000000, "debt_change": 300000000}]
+        timeline = compile_life_events(events, 30, 20)
+        self.assertEqual(timeline.asset[4], 300000000)
+        # 30년 동안 원금 균등 상환 (예측 기간이 짧아도 상환액은 같음)
+        self.assertAlmostEqual(timeline.repayment[4], 10000000)
+        self.assertAlmostEqual(timeline.debt_balance[4], 290000000)
+        self.assertAlmostEqual(timeline.debt_balance[-1], 300000000 - 16 * 10000000)
+
+        # 기간이 없으면 상환 없이 잔액 유지
+        open_ended = compile_life_events([dict(events[0], end_age=None)], 30, 20)
+        self.assertEqual(open_ended.repayment.sum(), 0)
+        self.assertEqual(open_ended.debt_balance[-1], 300000000)
+
+        # 금리가 있으면 원리금 균등 상환 (매년 원금 + 이자가 같음)
+        loan = dict(events[0], asset_change=0, loan_rate=4.0)
+        amortized = compile_life_events([loan], 30, 40)
+        payment = 300000000 * 0.04 / (1 - 1.04 ** -30)
+        paid = (amortized.repayment + amortized.debt_interest)[4:34]
+        np.testing.assert_allclose(paid, payment)
+        self.assertAlmostEqual(amortized.debt_interest[4], 300000000 * 0.04)
+        self.assertAlmostEqual(amortized.repayment.sum(), 300000000, places=2)
+        self.assertAlmostEqual(amortized.debt_balance[33], 0, places=2)
+        self.assertEqual(amortized.debt_interest[34:].sum(), 0)
+        # 기간이 없으면 이자만 납입
+        interest_only = compile_life_events([dict(loan, end_age=None)], 30, 20)
+        self.assertEqual(interest_only.repayment.sum(), 0)
+        self.assertAlmostEqual(interest_only.debt_interest[-1], 300000000 * 0.04)
+        print("[OK] 부채 이벤트 상환 테스트 통과")
+
+    def test_order_independent_and_many_events(self):
+        """이벤트 순서 무관/대량 이벤트 테스트"""
+        rng = random.Random(3)
+        events = []
+        for _ in range(2000):
+            start_age = rng.randint(20, 90)
+            events.append({
+                "start_age": start_age,
+                "end_age": start_age + rng.randint(0, 15) if rng.random() < 0.7 else None,
+                "expense_change": rng.choice([-50000, 10000, 200000]),
+                "income_change": rng.choice([0, 1000000]),
+            })
+        timeline = compile_life_events(events, 30, 60)
+        np.testing.assert_allclose(
+            timeline.expense, brute_force_expense(events, 30, 60), atol=1e-6
+        )
+
+        shuffled = list(events)
+        rng.shuffle(shuffled)
+        np.testing.assert_allclose(
+            compile_life_events(shuffled, 30, 60).income, timeline.income, atol=1e-6
+        )
+        print("[OK] 이벤트 순서 무관/대량 이벤트 테스트 통과")
+
+    def test_events_in_projection(self):
+        """미래 자산 계산 반영 테스트"""
+        base = calculate_future_assets(self.inputs, years=30, include_post_retirement=False)
+        self.assertNotIn("life_events", base["yearly_breakdown"][0])
+
+        job_loss = dict(self.inputs, life_events=[
+            {"name": "실직", "start_age": 33, "end_age": 33, "income_change_rate": -100}
+        ])
+        result = calculate_future_assets(job_loss, years=30, include_post_retirement=False)
+        rows = result["yearly_breakdown"]
+        self.assertEqual(rows[2]["annual_income"], 0)
+        self.assertEqual(rows[2]["life_events"], ["실직"])
+        self.assertAlmostEqual(rows[3]["annual_income"], base["yearly_breakdown"][3]["annual_income"])
+        self.assertLess(result["future_assets"], base["future_assets"])
+
+        house = dict(self.inputs, life_events=[
+            {"name": "주택 구입", "start_age": 35, "end_age": 44,
+             "asset_change": 100000000, "debt_change": 100000000}
+        ])
+        rows = calculate_future_assets(house, years=30, include_post_retirement=False)[
+            "yearly_breakdown"
+        ]
+        self.assertAlmostEqual(rows[4]["total_debt"], 90000000)
+        self.assertEqual(rows[14]["total_debt"], 0)
+        # 부채와 자산이 같이 늘어나므로 순자산은 상환 원금만큼만 달라짐
+        base_rows = base["yearly_breakdown"]
+        self.assertAlmostEqual(
+            rows[4]["net_assets"] - base_rows[4]["net_assets"],
+            rows[4]["assets"] - base_rows[4]["assets"] - 90000000,
+        )
+
+        # 은퇴 후 이벤트 (은퇴 후 소득)
+        pension = dict(self.inputs, life_events=[
+            {"name": "연금", "start_age": 65, "income_change": 12000000}
+        ])
+        retired = calculate_future_assets(pension, years=30)["yearly_breakdown"]
+        row_65 = next(row for row in retired if row["age"] == 65)
+        self.assertEqual(row_65["annual_income"], 12000000)
+        self.assertTrue(row_65["is_retired"])
+
+        # 취득한 부동산은 유동 자산 수익률/인출과 무관하게 연 2.5%로 평가
+        invested = dict(self.inputs, asset_items=[
+            {"type": "주식", "amount": 30000000, "return_rate": 7.0}
+        ])
+        property_event = [{"name": "주택 구입", "start_age": 35, "property_change": 300000000}]
+        base_rows = calculate_future_assets(invested, years=30)["yearly_breakdown"]
+        result = calculate_future_assets(dict(invested, life_events=property_event), years=30)
+        rows = result["yearly_breakdown"]
+        self.assertEqual(len(rows), len(base_rows))
+        for index in (4, 10, 29, len(rows) - 1):
+            expected = 300000000 * 1.025 ** (index - 4)
+            self.assertAlmostEqual(rows[index]["property_value"], expected, places=2)
+            self.assertAlmostEqual(
+                rows[index]["assets"] - base_rows[index]["assets"], expected, places=2
+            )
+        self.assertAlmostEqual(
+            result["future_assets"], base_rows[-1]["assets"] + rows[-1]["property_value"],
+            places=2,
+        )
+        print("[OK] 미래 자산 계산 반영 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+자산군별 포트폴리오 테스트
+
+테스트 항목:
+1. 보유 자산 요약 및 가중 평균 수익률 테스트
+2. 글라이드 패스/리밸런싱 계산 테스트
+3. 배분 시나리오 일괄 계산 테스트
+4. 미래 자산 계산 반영 테스트
+"""
+
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.calculations import (
+    calculate_future_assets,
+    calculate_portfolio_return_rate,
+    compare_portfolio_allocations,
+)
+from modules.portfolio import (
+    ASSET_CLASSES,
+    PortfolioModel,
+    allocation_vector,
+    glide_path,
+    summarize_holdings,
+)
+
+ASSET_ITEMS = [
+    {"type": "예금", "amount": 20000000, "rate": 3.0},
+    {"type": "적금", "monthly_amount": 500000, "months": 12, "rate": 4.0},
+    {"type": "청약", "amount": 4000000, "rate": 2.0},
+    {"type": "주식", "amount": 30000000, "return_rate": 8.0},
+    {"type": "부동산", "value": 100000000},
+]
+
+
+class TestPortfolio(unittest.TestCase):
+    """자산군별 포트폴리오 테스트"""
+
+    def setUp(self):
+        self.inputs = {
+            "current_age": 40,
+            "retirement_age": 50,
+            "salary": 0,
+            "bonus": 0,
+            "monthly_fixed_expense": 0,
+            "monthly_variable_expense": 0,
+            "total_assets": 100000000,
+            "total_debt": 0,
+            "asset_items": [
+                {"type": "예금", "amount": 40000000, "rate": 3.0},
+                {"type": "주식", "amount": 60000000, "return_rate": 8.0},
+            ],
+        }
+
+    def test_holdings_summary(self):
+        """보유 자산 요약 및 가중 평균 수익률 테스트"""
+        values, returns = summarize_holdings(ASSET_ITEMS)
+        total = values.sum()
+        # 자산군별 합계의 가중 평균은 기존 가중 평균 수익률과 같음
+        self.assertAlmostEqual(
+            calculate_portfolio_return_rate(ASSET_ITEMS, total), (values @ returns) / total
+        )
+        # 청약은 적금 자산군으로 묶임
+        saving = ASSET_CLASSES.index("적금")
+        self.assertGreater(values[saving], 4000000 + 500000 * 12)
+        self.assertEqual(values[ASSET_CLASSES.index("기타")], 0)
+        self.assertEqual(returns[ASSET_CLASSES.index("부동산")], 2.5)
+
+        _, overridden = summarize_holdings(ASSET_ITEMS, {"주식": 5.0})
+        self.assertEqual(overridden[ASSET_CLASSES.index("주식")], 5.0)
+        np.testing.assert_allclose(allocation_vector({"예금": 30, "주식": 70}).sum(), 1.0)
+        self.assertFalse(allocation_vector({}).any())
+        print("[OK] 보유 자산 요약 및 가중 평균 수익률 테스트 통과")
+
+    def test_glide_path_and_rebalance(self):
+        """글라이드 패스/리밸런싱 계산 테스트"""
+        start = allocation_vector({"예금": 20, "주식": 80})
+        end = allocation_vector({"예금": 70, "주식": 30})
+        weights = glide_path(start, end, 10, 15)
+        self.assertEqual(weights.shape, (15, len(ASSET_CLASSES)))
+        np.testing.assert_allclose(weights[9], end)
+        np.testing.assert_allclose(weights[-1], end)
+        np.testing.assert_allclose(weights[4], (start + end) / 2)
+        np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+
+        returns = np.array([3.0, 3.5, 8.0, 2.5, 4.0])
+        model = PortfolioModel(glide_path(start, None, 0, 3), returns)
+        balances = np.array([20.0, 0, 80.0, 0, 0])
+        after = model.step(balances, 10.0, 0)
+        np.testing.assert_allclose(after.sum(), 20 * 1.03 + 80 * 1.08 + 10)
+        np.testing.assert_allclose(after, after.sum() * start)
+
+        # 리밸런싱하지 않으면 유입만 목표 배분대로, 인출은 보유 비중대로
+        drift = PortfolioModel(model.weights, returns, rebalance=False)
+        grown = balances * (1 + returns / 100)
+        np.testing.assert_allclose(drift.step(balances, 10.0, 0), grown + 10.0 * start)
+        np.testing.assert_allclose(
+            drift.step(balances, -10.0, 0), grown * (1 - 10.0 / grown.sum())
+        )
+        print("[OK] 글라이드 패스/리밸런싱 계산 테스트 통과")
+
+    def test_batched_simulation(self):
+        """배분 시나리오 일괄 계산 테스트"""
+        returns = np.array([3.0, 3.5, 8.0, 2.5, 4.0])
+        mixes = [{"예금": 100}, {"주식": 100}, {"예금": 40, "주식": 40, "부동산": 20}]
+        flows = np.linspace(-5, 10, 12)
+        initial = np.array([10.0, 5.0, 30.0, 0, 5.0])
+        for rebalance in (True, False):
+            paths = np.stack([glide_path(allocation_vector(mix), None, 0, 12) for mix in mixes])
+            batched = PortfolioModel(paths, returns, rebalance).simulate(
+                np.tile(initial, (3, 1)), np.tile(flows, (3, 1))
+            )
+            self.assertEqual(batched.shape, (3, 12, len(ASSET_CLASSES)))
+            for index, path in enumerate(paths):
+                single = PortfolioModel(path, returns, rebalance).simulate(initial, flows)
+                np.testing.assert_allclose(batched[index], single)
+
+        # 예금 100%면 연 3% 복리
+        deposit_only = PortfolioModel(paths[0], returns).simulate(
+            np.array([100.0, 0, 0, 0, 0]), np.zeros(12)
+        )
+        self.assertAlmostEqual(deposit_only[-1].sum(), 100 * 1.03 ** 12)
+        print("[OK] 배분 시나리오 일괄 계산 테스트 통과")
+
+    def test_portfolio_in_projection(self):
+        """미래 자산 계산 반영 테스트"""
+        legacy = calculate_future_assets(self.inputs, years=10, include_post_retirement=False)
+        holdings = calculate_future_assets(
+            dict(self.inputs, portfolio_model={"rebalance": True}),
+            years=10,
+            include_post_retirement=False,
+        )
+        # 현재 보유 비중으로 리밸런싱하면 가중 평균 수익률 복리와 같음
+        self.assertAlmostEqual(
+            holdings["future_assets"], legacy["future_assets"], places=2
+        )
+        self.assertAlmostEqual(holdings["future_assets"], 100000000 * 1.06 ** 10, places=2)
+        row = holdings["yearly_breakdown"][0]
+        self.assertAlmostEqual(sum(row["portfolio"].values()), row["assets"])
+        self.assertAlmostEqual(row["portfolio"]["주식"] / row["assets"], 0.6)
+        self.assertNotIn("portfolio", legacy["yearly_breakdown"][0])
+
+        # 리밸런싱하지 않으면 자산군별로 따로 불어남
+        drift = calculate_future_assets(
+            dict(self.inputs, portfolio_model={"rebalance": False}),
+            years=10,
+            include_post_retirement=False,
+        )
+        self.assertAlmostEqual(
+            drift["future_assets"], 40000000 * 1.03 ** 10 + 60000000 * 1.08 ** 10, places=2
+        )
+
+        # 은퇴 후에도 수익률 반영 (기존 계산은 은퇴 후 수익률 없음)
+        retired = calculate_future_assets(
+            dict(self.inputs, portfolio_model={"rebalance": True}), years=10, life_expectancy=60
+        )["yearly_breakdown"]
+        legacy_retired = calculate_future_assets(self.inputs, years=10, life_expectancy=60)[
+            "yearly_breakdown"
+        ]
+        self.assertTrue(retired[-1]["is_retired"])
+        self.assertAlmostEqual(
+            retired[10]["assets"],
+            retired[9]["assets"] * 1.06 + retired[10]["annual_savings"],
+            places=2,
+        )
+        self.assertGreater(retired[-1]["assets"], legacy_retired[-1]["assets"])
+
+        # 배분 비교는 같은 설정의 미래 자산 계산 결과와 같음
+        mixes = [{"예금": 100}, {"주식": 100}, {"예금": 40, "주식": 60}]
+        settings = {"retirement_allocation": {"예금": 100}}
+        comparison = compare_portfolio_allocations(
+            dict(self.inputs, salary=60000000, portfolio_model=settings), mixes, years=10
+        )
+        for mix, final_assets in zip(mixes, comparison["final_assets"]):
+            single = calculate_future_assets(
+                dict(
+                    self.inputs,
+                    salary=60000000,
+                    portfolio_model=dict(settings, target_allocation=mix),
+                ),
+                years=10,
+                include_post_retirement=False,
+            )
+            self.assertAlmostEqual(final_assets, single["future_assets"], places=2)
+        self.assertEqual(comparison["yearly_assets"].shape, (3, 10))
+        print("[OK] 미래 자산 계산 반영 테스트 통과")
+
+
+if __name__ == '__main__':
+    unittest.main()